@@ -296,8 +296,17 @@ void enkf_linalg_lowrankE(const matrix_type * S , /* (nrobs x nrens) */
 void enkf_linalg_Cee(matrix_type * B, int nrens , const matrix_type * R , const matrix_type * U0 , const double * inv_sig0) {
   const int nrmin = matrix_get_rows( B );
   {
-    matrix_type * X0 = matrix_alloc( nrmin , matrix_get_rows( R ));
-    matrix_dgemm(X0 , U0 , R  , true  , false , 1.0 , 0.0);  /* X0 = U0^T * R */
+    const int nrobs = matrix_get_rows( R );
+    matrix_type * X0 = matrix_alloc( nrmin , nrobs );
+    if (matrix_get_columns( R ) == 1) {
+      /* R is diagonal and only the diagonal is stored: X0 = U0^T * diag(R) */
+      for (int j=0; j < nrobs; j++) {
+        double Rjj = matrix_iget( R , j , 0 );
+        for (int i=0; i < nrmin; i++)
+          matrix_iset( X0 , i , j , matrix_iget( U0 , j , i ) * Rjj );
+      }
+    } else
+      matrix_dgemm(X0 , U0 , R  , true  , false , 1.0 , 0.0);  /* X0 = U0^T * R */
     matrix_dgemm(B  , X0 , U0 , false , false , 1.0 , 0.0);  /* B = X0 * U0 */
     matrix_free( X0 );
   }
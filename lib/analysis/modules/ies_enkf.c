@@ -281,7 +281,7 @@ void ies_enkf_updateA( void * module_data,
    matrix_type * Y   = matrix_alloc( nrobs    , ens_size );
    matrix_type * E   = matrix_alloc( nrobs    , ens_size );
    matrix_type * D   = matrix_alloc( nrobs    , ens_size );
-   matrix_type * R   = matrix_alloc( nrobs    , nrobs );
+   matrix_type * R   = matrix_alloc( nrobs    , (matrix_get_columns( Rin ) == 1) ? 1 : nrobs );  // Rin may be only the diagonal
    matrix_type * D0  = matrix_alloc_copy( Din );
 
 /* Subtract new measurement perturbations              D=D-E    */
@@ -459,7 +459,8 @@ void ies_enkf_linalg_extract_active(const ies_enkf_data_type * data,
    int m_nrobs      = util_int_min(nrobs     -1,7);
    int m_ens_size   = util_int_min(ens_size  -1,16);
 
-   matrix_type * Rtmp= matrix_alloc( nrobs    , nrobs_inp );
+   bool diagonal_R   = (matrix_get_columns( Rin ) == 1);
+   matrix_type * Rtmp= diagonal_R ? NULL : matrix_alloc( nrobs    , nrobs_inp );
 
    int j=-1;  // counter for initial mask0
    int k=-1;  // counter for current mask
@@ -486,12 +487,17 @@ void ies_enkf_linalg_extract_active(const ies_enkf_data_type * data,
 
          matrix_copy_row(D,D0,m,k);
          matrix_copy_row(Y,Yin,m,k);
-         matrix_copy_row(Rtmp,Rin,m,k);
-         matrix_copy_column(R,Rtmp,m,k);
+         if (diagonal_R)
+            matrix_iset(R,m,0,matrix_iget(Rin,k,0));
+         else {
+            matrix_copy_row(Rtmp,Rin,m,k);
+            matrix_copy_column(R,Rtmp,m,k);
+         }
       }
    }
 
-   matrix_free( Rtmp);
+   if (Rtmp)
+      matrix_free( Rtmp);
 
    if (ens_size_msk == ens_size && nrobs == nrobs_inp){
       fprintf(log_fp,"data->E copied exactly to E: %d\n",matrix_equal(dataE,E)) ;
@@ -506,8 +512,8 @@ void ies_enkf_linalg_extract_active(const ies_enkf_data_type * data,
    if (dbg) matrix_pretty_fprint_submat(Yin,"Yin","%11.5f",log_fp,0,m_nrobs,0,m_ens_size) ;
    if (dbg) matrix_pretty_fprint_submat(Y,"Y","%11.5f",log_fp,0,m_nrobs,0,m_ens_size) ;
 
-   if (dbg) matrix_pretty_fprint_submat(Rin,"Rin","%11.5f",log_fp,0,m_nrobs,0,m_nrobs) ;
-   if (dbg) matrix_pretty_fprint_submat(R,"R","%11.5f",log_fp,0,m_nrobs,0,m_nrobs) ;
+   if (dbg) matrix_pretty_fprint_submat(Rin,"Rin","%11.5f",log_fp,0,m_nrobs,0,diagonal_R ? 0 : m_nrobs) ;
+   if (dbg) matrix_pretty_fprint_submat(R,"R","%11.5f",log_fp,0,m_nrobs,0,diagonal_R ? 0 : m_nrobs) ;
 }
 
 
@@ -673,7 +679,7 @@ void ies_enkf_linalg_subspace_inversion(matrix_type * W0,
    } else if (ies_inversion == IES_INVERSION_SUBSPACE_EXACT_R){
       fprintf(log_fp,"Subspace inversion using 'exact' full R. (ies_inversion=%d)\n",ies_inversion);
       matrix_scale(R,nsc*nsc); // since enkf_linalg_lowrankCinv solves (SS' + (N-1) R)^{-1}
-      if (dbg) matrix_pretty_fprint_submat(R,"R","%11.5f",log_fp,0,m_nrobs,0,m_nrobs) ;
+      if (dbg) matrix_pretty_fprint_submat(R,"R","%11.5f",log_fp,0,m_nrobs,0,(matrix_get_columns(R) == 1) ? 0 : m_nrobs) ;
       enkf_linalg_lowrankCinv( S , R , X1 , eig , truncation , subspace_dimension);
    }
 
@@ -70,7 +70,7 @@ rml_enkf_config_type * rml_enkf_config_alloc() {
   rml_enkf_config_set_truncation( config , DEFAULT_ENKF_TRUNCATION_);
   rml_enkf_config_set_subspace_dimension( config , DEFAULT_SUBSPACE_DIMENSION);
   rml_enkf_config_set_use_prior( config , DEFAULT_USE_PRIOR );
-  rml_enkf_config_set_option_flags( config , ANALYSIS_NEED_ED + ANALYSIS_UPDATE_A + ANALYSIS_ITERABLE + ANALYSIS_SCALE_DATA);
+  rml_enkf_config_set_option_flags( config , ANALYSIS_NEED_ED + ANALYSIS_UPDATE_A + ANALYSIS_ITERABLE + ANALYSIS_SCALE_DATA + ANALYSIS_DIAGONAL_R);
 
   rml_enkf_config_set_lambda_min( config , DEFAULT_LAMBDA_MIN );
   rml_enkf_config_set_lambda0( config , DEFAULT_LAMBDA0 );
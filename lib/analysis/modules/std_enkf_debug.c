@@ -176,6 +176,7 @@ long std_enkf_debug_get_options( void * arg , long flag ) {
   const std_enkf_debug_data_type * module_data = std_enkf_debug_data_safe_cast_const( arg );
   long options = std_enkf_get_options( module_data->std_data , flag );
   options |= ANALYSIS_USE_A;
+  options &= ~ANALYSIS_DIAGONAL_R;   /* The full R matrix is saved to R.csv. */
   return options;
 }
 
@@ -56,7 +56,7 @@ void * sqrt_enkf_data_alloc( ) {
 
   data->std_data = (std_enkf_data_type*)std_enkf_data_alloc( );
   data->randrot  = NULL;
-  data->options  = ANALYSIS_SCALE_DATA;
+  data->options  = ANALYSIS_SCALE_DATA + ANALYSIS_DIAGONAL_R;
 
   return data;
 }
@@ -132,7 +132,7 @@ void * std_enkf_data_alloc( ) {
 
   std_enkf_set_truncation( data , DEFAULT_ENKF_TRUNCATION_ );
   std_enkf_set_subspace_dimension( data , DEFAULT_SUBSPACE_DIMENSION );
-  data->option_flags = ANALYSIS_NEED_ED;
+  data->option_flags = ANALYSIS_NEED_ED + ANALYSIS_DIAGONAL_R;
   data->use_EE = DEFAULT_USE_EE;
   data->use_GE = DEFAULT_USE_GE;
   data->analysis_scale_data = DEFAULT_ANALYSIS_SCALE_DATA;
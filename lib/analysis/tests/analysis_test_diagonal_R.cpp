@@ -0,0 +1,172 @@
+/*
+  Copyright (C) 2019  Equinor ASA, Norway.
+
+  The file 'analysis_test_diagonal_R.cpp' is part of ERT - Ensemble based Reservoir Tool.
+
+  ERT is free software: you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation, either version 3 of the License, or
+  (at your option) any later version.
+
+  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+  WARRANTY; without even the implied warranty of MERCHANTABILITY or
+  FITNESS FOR A PARTICULAR PURPOSE.
+
+  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+  for more details.
+*/
+
+#include <stdlib.h>
+
+#include <ert/util/util.hpp>
+#include <ert/util/test_util.hpp>
+#include <ert/util/rng.hpp>
+#include <ert/util/test_work_area.hpp>
+
+#include <ert/res_util/matrix.hpp>
+
+#include <ert/analysis/analysis_module.hpp>
+
+/*
+  The X matrix from a module with the ANALYSIS_DIAGONAL_R option should
+  be the same whether R is given as the full matrix, or as an nrobs x 1
+  matrix with only the diagonal. For a module which updates A directly,
+  like IES_ENKF, the updated A matrices should be the same.
+*/
+
+void test_module( const char * module_name , rng_type * rng) {
+  analysis_module_type * module = analysis_module_alloc_internal( module_name );
+  const int ens_size = 10;
+  const int obs_size = 25;
+
+  matrix_type * S = matrix_alloc( obs_size , ens_size );
+  matrix_type * E = matrix_alloc( obs_size , ens_size );
+  matrix_type * D = matrix_alloc( obs_size , ens_size );
+  matrix_type * dObs = matrix_alloc( obs_size , 2 );
+  matrix_type * R = matrix_alloc( obs_size , obs_size );
+  matrix_type * diagR = matrix_alloc( obs_size , 1 );
+  matrix_type * X1 = matrix_alloc( ens_size , ens_size );
+  matrix_type * X2 = matrix_alloc( ens_size , ens_size );
+  bool_vector_type * ens_mask = bool_vector_alloc( ens_size , true );
+  bool_vector_type * obs_mask = bool_vector_alloc( obs_size , true );
+
+  test_assert_true( analysis_module_check_option( module , ANALYSIS_DIAGONAL_R ));
+
+  matrix_random_init( S , rng );
+  matrix_random_init( E , rng );
+  matrix_random_init( D , rng );
+  matrix_random_init( dObs , rng );
+  for (int iobs = 0; iobs < obs_size; iobs++) {
+    double var = 0.5 + rng_get_double( rng );
+    matrix_iset( R , iobs , iobs , var );
+    matrix_iset( diagR , iobs , 0 , var );
+  }
+
+  /* SQRT_ENKF draws a random rotation; both updates get the same random numbers. */
+  {
+    rng_type * update_rng = rng_alloc( MZRAN , INIT_DEFAULT );
+    analysis_module_init_update( module , ens_mask , obs_mask , S , R , dObs , E , D , update_rng );
+    analysis_module_initX( module , X1 , NULL , S , R , dObs , E , D , update_rng );
+    rng_free( update_rng );
+  }
+
+  {
+    rng_type * update_rng = rng_alloc( MZRAN , INIT_DEFAULT );
+    analysis_module_init_update( module , ens_mask , obs_mask , S , diagR , dObs , E , D , update_rng );
+    analysis_module_initX( module , X2 , NULL , S , diagR , dObs , E , D , update_rng );
+    rng_free( update_rng );
+  }
+
+  for (int i = 0; i < ens_size; i++)
+    for (int j = 0; j < ens_size; j++)
+      test_assert_double_equal( matrix_iget( X1 , i , j ) , matrix_iget( X2 , i , j ));
+
+  bool_vector_free( ens_mask );
+  bool_vector_free( obs_mask );
+  matrix_free( S );
+  matrix_free( E );
+  matrix_free( D );
+  matrix_free( dObs );
+  matrix_free( R );
+  matrix_free( diagR );
+  matrix_free( X1 );
+  matrix_free( X2 );
+  analysis_module_free( module );
+}
+
+
+void test_updateA_module( const char * module_lib , rng_type * rng) {
+  ecl::util::TestArea ta("diagonal_R");
+  const int ens_size = 10;
+  const int obs_size = 25;
+  const int state_size = 15;
+
+  matrix_type * S = matrix_alloc( obs_size , ens_size );
+  matrix_type * E = matrix_alloc( obs_size , ens_size );
+  matrix_type * D = matrix_alloc( obs_size , ens_size );
+  matrix_type * dObs = matrix_alloc( obs_size , 2 );
+  matrix_type * R = matrix_alloc( obs_size , obs_size );
+  matrix_type * diagR = matrix_alloc( obs_size , 1 );
+  matrix_type * A1 = matrix_alloc( state_size , ens_size );
+  matrix_type * A2;
+  bool_vector_type * ens_mask = bool_vector_alloc( ens_size , true );
+  bool_vector_type * obs_mask = bool_vector_alloc( obs_size , true );
+
+  matrix_random_init( S , rng );
+  matrix_random_init( E , rng );
+  matrix_random_init( D , rng );
+  matrix_random_init( dObs , rng );
+  matrix_random_init( A1 , rng );
+  A2 = matrix_alloc_copy( A1 );
+  for (int iobs = 0; iobs < obs_size; iobs++) {
+    double var = 0.5 + rng_get_double( rng );
+    matrix_iset( R , iobs , iobs , var );
+    matrix_iset( diagR , iobs , 0 , var );
+  }
+
+  /* The module keeps state between iterations; a fresh module is used for each update. */
+  {
+    analysis_module_type * module = analysis_module_alloc_external( module_lib );
+    rng_type * update_rng = rng_alloc( MZRAN , INIT_DEFAULT );
+    test_assert_true( analysis_module_check_option( module , ANALYSIS_DIAGONAL_R ));
+    analysis_module_init_update( module , ens_mask , obs_mask , S , R , dObs , E , D , update_rng );
+    analysis_module_updateA( module , A1 , S , R , dObs , E , D , NULL , update_rng );
+    rng_free( update_rng );
+    analysis_module_free( module );
+  }
+
+  {
+    analysis_module_type * module = analysis_module_alloc_external( module_lib );
+    rng_type * update_rng = rng_alloc( MZRAN , INIT_DEFAULT );
+    analysis_module_init_update( module , ens_mask , obs_mask , S , diagR , dObs , E , D , update_rng );
+    analysis_module_updateA( module , A2 , S , diagR , dObs , E , D , NULL , update_rng );
+    rng_free( update_rng );
+    analysis_module_free( module );
+  }
+
+  for (int i = 0; i < state_size; i++)
+    for (int j = 0; j < ens_size; j++)
+      test_assert_double_equal( matrix_iget( A1 , i , j ) , matrix_iget( A2 , i , j ));
+
+  bool_vector_free( ens_mask );
+  bool_vector_free( obs_mask );
+  matrix_free( S );
+  matrix_free( E );
+  matrix_free( D );
+  matrix_free( dObs );
+  matrix_free( R );
+  matrix_free( diagR );
+  matrix_free( A1 );
+  matrix_free( A2 );
+}
+
+
+int main(int argc , char ** argv) {
+  const char * ies_lib = argv[1];
+  rng_type * rng = rng_alloc( MZRAN , INIT_DEFAULT );
+  test_module( "STD_ENKF" , rng );
+  test_module( "SQRT_ENKF" , rng );
+  test_updateA_module( ies_lib , rng );
+  rng_free( rng );
+  exit(0);
+}
@@ -104,6 +104,36 @@ void active_list_copy( active_list_type * target , const active_list_type * src)
 }
 
 
+/**
+   Will allocate a new PARTLY_ACTIVE list with the @size active
+   indices starting at position @offset of @src; if @src is ALL_ACTIVE
+   the indices will be offset, offset + 1, ..., offset + size - 1.
+
+   The indices are appended directly, without the duplicate check in
+   active_list_add_index(), so allocating all the blocks of a large
+   list is linear in the list size.
+*/
+
+active_list_type * active_list_alloc_block( const active_list_type * src , int offset , int size) {
+  active_list_type * block = active_list_alloc( );
+  if (src->mode == INACTIVE)
+    util_abort("%s: can not take a block of an INACTIVE list \n",__func__);
+
+  if ((src->mode == PARTLY_ACTIVE) && ((offset + size) > int_vector_size( src->index_list )))
+    util_abort("%s: block [%d,%d) is outside the active list with %d elements \n",__func__ , offset , offset + size , int_vector_size( src->index_list ));
+
+  block->mode = PARTLY_ACTIVE;
+  int_vector_resize( block->index_list , size , 0 );
+  for (int i = 0; i < size; i++) {
+    if (src->mode == PARTLY_ACTIVE)
+      int_vector_iset( block->index_list , i , int_vector_iget( src->index_list , offset + i ));
+    else
+      int_vector_iset( block->index_list , i , offset + i );
+  }
+  return block;
+}
+
+
 void active_list_free( active_list_type * active_list ) {
   int_vector_free(active_list->index_list);
   free(active_list);
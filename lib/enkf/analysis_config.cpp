@@ -67,6 +67,8 @@ struct analysis_config_struct {
   bool                            stop_long_running;
   bool                            std_scale_correlated_obs;
   int                             max_runtime;
+  int                             max_update_memory;           /* Upper limit (in MB) for the A matrix in the update; 0 means no limit. */
+  int                             update_threads;              /* Number of threads used in the update; 0 means one per available core. */
   double                          global_std_scaling;
 };
 
@@ -168,6 +170,22 @@ int analysis_config_get_max_runtime( const analysis_config_type * config ) {
   return config->max_runtime;
 }
 
+void analysis_config_set_max_update_memory( analysis_config_type * config , int max_update_memory ) {
+  config->max_update_memory = max_update_memory;
+}
+
+int analysis_config_get_max_update_memory( const analysis_config_type * config ) {
+  return config->max_update_memory;
+}
+
+void analysis_config_set_update_threads( analysis_config_type * config , int update_threads ) {
+  config->update_threads = update_threads;
+}
+
+int analysis_config_get_update_threads( const analysis_config_type * config ) {
+  return config->update_threads;
+}
+
 void analysis_config_set_max_runtime( analysis_config_type * config, int max_runtime ) {
   config->max_runtime = max_runtime;
 }
@@ -523,6 +541,12 @@ void analysis_config_init( analysis_config_type * analysis , const config_conten
     analysis_config_set_max_runtime( analysis, config_content_get_value_as_int( config, MAX_RUNTIME_KEY ));
   }
 
+  if (config_content_has_item( config, MAX_UPDATE_MEMORY_KEY))
+    analysis_config_set_max_update_memory( analysis, config_content_get_value_as_int( config, MAX_UPDATE_MEMORY_KEY ));
+
+  if (config_content_has_item( config, UPDATE_THREADS_KEY))
+    analysis_config_set_update_threads( analysis, config_content_get_value_as_int( config, UPDATE_THREADS_KEY ));
+
 
   /* Loading external modules */
   analysis_config_load_all_external_modules_from_config(analysis, config);
@@ -629,6 +653,8 @@ analysis_config_type * analysis_config_alloc_default(void) {
   analysis_config_set_min_realisations( config         , DEFAULT_ANALYSIS_MIN_REALISATIONS );
   analysis_config_set_stop_long_running( config        , DEFAULT_ANALYSIS_STOP_LONG_RUNNING );
   analysis_config_set_max_runtime( config              , DEFAULT_MAX_RUNTIME );
+  analysis_config_set_max_update_memory( config        , DEFAULT_MAX_UPDATE_MEMORY );
+  analysis_config_set_update_threads( config           , DEFAULT_UPDATE_THREADS );
 
   config->analysis_module      = NULL;
   config->iter_config          = analysis_iter_config_alloc();
@@ -704,6 +730,8 @@ void analysis_config_add_config_items( config_parser_type * config ) {
   config_add_key_value( config , UPDATE_LOG_PATH_KEY         , false , CONFIG_STRING);
   config_add_key_value( config , MIN_REALIZATIONS_KEY        , false , CONFIG_STRING );
   config_add_key_value( config , MAX_RUNTIME_KEY             , false , CONFIG_INT );
+  config_add_key_value( config , MAX_UPDATE_MEMORY_KEY       , false , CONFIG_INT );
+  config_add_key_value( config , UPDATE_THREADS_KEY          , false , CONFIG_INT );
   config_add_key_value( config , STD_SCALE_CORRELATED_OBS_KEY, false , CONFIG_BOOL );
 
   item = config_add_key_value( config , STOP_LONG_RUNNING_KEY, false,  CONFIG_BOOL );
@@ -281,6 +281,63 @@ static void block_fs_driver_load_vector(void * _driver , const char * node_key ,
   }
 }
 
+
+static void block_fs_driver_load_vector_range(void * _driver , const char * node_key , int iens , int offset , int size , buffer_type * buffer) {
+  block_fs_driver_type * driver = block_fs_driver_safe_cast( _driver );
+  {
+    char * key          = block_fs_driver_alloc_vector_key( driver , node_key , iens );
+    bfs_type      * bfs = block_fs_driver_get_fs( driver , iens );
+
+    block_fs_fread_range( bfs->block_fs , key , offset , size , buffer);
+    free( key );
+  }
+}
+
+/*
+  The view functions return buffers which, when mmap reading is
+  enabled, wrap the stored data directly without copying; see
+  block_fs_alloc_buffer_view().
+*/
+
+static buffer_type * block_fs_driver_alloc_node_view(void * _driver , const char * node_key , int report_step , int iens) {
+  block_fs_driver_type * driver = block_fs_driver_safe_cast( _driver );
+  {
+    char * key          = block_fs_driver_alloc_node_key( driver , node_key , report_step , iens );
+    bfs_type      * bfs = block_fs_driver_get_fs( driver , iens );
+    buffer_type * view  = block_fs_alloc_buffer_view( bfs->block_fs , key );
+
+    free( key );
+    return view;
+  }
+}
+
+
+static buffer_type * block_fs_driver_alloc_vector_view(void * _driver , const char * node_key , int iens) {
+  block_fs_driver_type * driver = block_fs_driver_safe_cast( _driver );
+  {
+    char * key          = block_fs_driver_alloc_vector_key( driver , node_key , iens );
+    bfs_type      * bfs = block_fs_driver_get_fs( driver , iens );
+    buffer_type * view  = block_fs_alloc_buffer_view( bfs->block_fs , key );
+
+    free( key );
+    return view;
+  }
+}
+
+
+static void block_fs_driver_free_view(void * _driver , int iens , buffer_type * view) {
+  block_fs_driver_type * driver = block_fs_driver_safe_cast( _driver );
+  bfs_type * bfs = block_fs_driver_get_fs( driver , iens );
+  block_fs_free_buffer_view( bfs->block_fs , view );
+}
+
+
+static void block_fs_driver_set_mmap(void * _driver , bool use_mmap) {
+  block_fs_driver_type * driver = block_fs_driver_safe_cast( _driver );
+  for (int driver_nr = 0; driver_nr < driver->num_fs; driver_nr++)
+    block_fs_set_mmap( driver->fs_list[driver_nr]->block_fs , use_mmap );
+}
+
 /*****************************************************************/
 
 static void block_fs_driver_save_node(void * _driver , const char * node_key , int report_step , int iens ,  buffer_type * buffer) {
@@ -415,6 +472,12 @@ static block_fs_driver_type * block_fs_driver_alloc(int num_fs) {
   driver->unlink_vector = block_fs_driver_unlink_vector;
   driver->has_vector    = block_fs_driver_has_vector;
 
+  driver->alloc_node_view   = block_fs_driver_alloc_node_view;
+  driver->alloc_vector_view = block_fs_driver_alloc_vector_view;
+  driver->free_view         = block_fs_driver_free_view;
+  driver->set_mmap          = block_fs_driver_set_mmap;
+  driver->load_vector_range = block_fs_driver_load_vector_range;
+
   driver->free_driver   = block_fs_driver_free;
   driver->fsync_driver  = block_fs_driver_fsync;
   driver->__id          = BLOCK_FS_DRIVER_ID;
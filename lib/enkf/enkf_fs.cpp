@@ -20,16 +20,23 @@
 #include <string.h>
 #include <errno.h>
 #include <sys/stat.h>
+#include <time.h>
 #include <fcntl.h>
 #include <stdlib.h>
 #include <pthread.h>
 #include <dirent.h>
 #include <unistd.h>
 
+#include <string>
+#include <unordered_map>
+
 #include <ert/util/util.h>
 #include <ert/util/type_macros.h>
 #include <ert/res_util/arg_pack.hpp>
 #include <ert/util/stringlist.h>
+#include <ert/util/hash.hpp>
+#include <ert/util/bool_vector.h>
+#include <ert/util/vector.h>
 #include <ert/res_util/arg_pack.hpp>
 
 #include <ert/res_util/path_fmt.hpp>
@@ -48,6 +55,7 @@
 #include <ert/enkf/misfit_ensemble.hpp>
 #include <ert/enkf/cases_config.hpp>
 #include <ert/enkf/custom_kw_config_set.hpp>
+#include <ert/enkf/vector_block.hpp>
 
 /**
 
@@ -228,12 +236,24 @@ struct enkf_fs_struct {
   fs_driver_type         * index ;
 
   bool                        read_only;             /* Whether this filesystem has been mounted read-only. */
+  bool                        use_mmap;              /* Whether the block_fs drivers serve reads from a memory mapping. */
+  double                      mount_time;            /* Wall time in seconds spent mounting the filesystem. */
   time_map_type             * time_map;
   cases_config_type         * cases_config;
   state_map_type            * state_map;
   summary_key_set_type      * summary_key_set;
   misfit_ensemble_type      * misfit_ensemble;
   custom_kw_config_set_type * custom_kw_config_set;
+
+  enkf_fs_type              * parameter_source;      /* Parameters shared copy-on-write from this filesystem; see enkf_fs_share_parameters(). */
+  hash_type                 * shared_parameters;     /* node_key -> bool_vector of the realizations still read from parameter_source. */
+  pthread_mutex_t             share_mutex;
+
+  vector_type               * vector_blocks;         /* iens -> index of the stored vector_block; see enkf_fs_fwrite_vector_block(). */
+  vector_type               * vector_block_edits;    /* iens -> hash of node_key -> buffer with vectors replaced in the block, not yet written. */
+  bool_vector_type          * vector_block_absent;   /* iens -> true when it is known that no vector_block has been stored. */
+  pthread_mutex_t             vector_block_mutex;
+  pthread_rwlock_t            vector_block_lock;    /* Held for reading across a range lookup and read in a stored block, and for writing when the block is rewritten. */
   /*
      The variables below here are for storing arbitrary files within
      the enkf_fs storage directory, but not as serialized enkf_nodes.
@@ -302,14 +322,24 @@ static enkf_fs_type * enkf_fs_alloc_empty( const char * mount_point ) {
   fs->summary_key_set        = summary_key_set_alloc();
   fs->custom_kw_config_set   = custom_kw_config_set_alloc();
   fs->misfit_ensemble        = misfit_ensemble_alloc();
+  fs->parameter_source       = NULL;
+  fs->shared_parameters      = NULL;
   fs->index                  = NULL;
   fs->parameter              = NULL;
   fs->dynamic_forecast       = NULL;
   fs->read_only              = true;
+  fs->use_mmap               = false;
+  fs->mount_time             = 0;
   fs->mount_point            = util_alloc_string_copy( mount_point );
   fs->refcount               = 0;
   fs->runcount               = 0;
   fs->lock_fd                = 0;
+  pthread_mutex_init( &fs->share_mutex , NULL );
+  fs->vector_blocks          = vector_alloc_new( );
+  fs->vector_block_edits     = vector_alloc_new( );
+  fs->vector_block_absent    = bool_vector_alloc( 0 , false );
+  pthread_mutex_init( &fs->vector_block_mutex , NULL );
+  pthread_rwlock_init( &fs->vector_block_lock , NULL );
 
   if (mount_point == NULL)
     util_abort("%s: fatal internal error: mount_point == NULL \n",__func__);
@@ -570,11 +600,116 @@ static void enkf_fs_fread_custom_kw_config_set(enkf_fs_type * fs) {
   free( filename );
 }
 
+/*
+  The readonly state and time maps are used when listing cases, and the
+  same files are typically read many times; the maps read from disk are
+  therefore kept in a process wide cache and the callers get a copy. A
+  cached map is used as long as the file has the same inode, size and
+  modification time as when it was read. The maps are written to a new
+  file which is renamed into place, see state_map_fwrite() and
+  time_map_fwrite(), so all updates give a new stamp.
+*/
+
+typedef struct {
+  ino_t   inode;
+  off_t   size;
+  time_t  mtime;
+  long    mtime_nsec;
+} file_stamp_type;
+
+
+template <typename map_type>
+struct readonly_map_entry {
+  file_stamp_type   stamp;
+  map_type        * map;
+};
+
+static pthread_mutex_t readonly_map_lock = PTHREAD_MUTEX_INITIALIZER;
+static std::unordered_map<std::string, readonly_map_entry<state_map_type>> readonly_state_maps;
+static std::unordered_map<std::string, readonly_map_entry<time_map_type>> readonly_time_maps;
+
+
+static bool enkf_fs_stat_file_stamp( const char * filename , file_stamp_type * stamp ) {
+  struct stat stat_buffer;
+  if (stat( filename , &stat_buffer ) != 0)
+    return false;
+
+  stamp->inode = stat_buffer.st_ino;
+  stamp->size  = stat_buffer.st_size;
+  stamp->mtime = stat_buffer.st_mtime;
+#ifdef __APPLE__
+  stamp->mtime_nsec = stat_buffer.st_mtimespec.tv_nsec;
+#else
+  stamp->mtime_nsec = stat_buffer.st_mtim.tv_nsec;
+#endif
+  return true;
+}
+
+
+static bool enkf_fs_file_stamp_equal( const file_stamp_type * stamp1 , const file_stamp_type * stamp2 ) {
+  return (stamp1->inode == stamp2->inode) &&
+         (stamp1->size == stamp2->size) &&
+         (stamp1->mtime == stamp2->mtime) &&
+         (stamp1->mtime_nsec == stamp2->mtime_nsec);
+}
+
+
+/*
+  If the file is replaced between the stat() call and the read the new
+  content is cached with the old stamp; that entry will then just be
+  replaced on the next call.
+*/
+
+template <typename map_type>
+static map_type * enkf_fs_alloc_readonly_map( std::unordered_map<std::string, readonly_map_entry<map_type>>& cache ,
+                                              const char * filename ,
+                                              map_type * (*fread_alloc)( const char * ),
+                                              map_type * (*alloc_copy)( const map_type * ),
+                                              void (*map_free)( map_type * )) {
+  file_stamp_type stamp;
+  map_type * map = NULL;
+
+  /* A missing file gives an empty map; that is not cached. */
+  if (!enkf_fs_stat_file_stamp( filename , &stamp ))
+    return fread_alloc( filename );
+
+  pthread_mutex_lock( &readonly_map_lock );
+  {
+    auto iter = cache.find( filename );
+    if ((iter != cache.end()) && enkf_fs_file_stamp_equal( &iter->second.stamp , &stamp ))
+      map = alloc_copy( iter->second.map );
+  }
+  pthread_mutex_unlock( &readonly_map_lock );
+
+  if (map == NULL) {
+    map = fread_alloc( filename );
+
+    pthread_mutex_lock( &readonly_map_lock );
+    {
+      auto result = cache.insert( std::make_pair( std::string( filename ) , readonly_map_entry<map_type>() ));
+      readonly_map_entry<map_type>& entry = result.first->second;
+      if (!result.second)
+        map_free( entry.map );
+
+      entry.stamp = stamp;
+      entry.map = alloc_copy( map );
+    }
+    pthread_mutex_unlock( &readonly_map_lock );
+  }
+
+  return map;
+}
+
+
 state_map_type * enkf_fs_alloc_readonly_state_map( const char * mount_point ) {
   path_fmt_type * path_fmt = path_fmt_alloc_directory_fmt( DEFAULT_CASE_PATH );
   char * filename = path_fmt_alloc_file( path_fmt , false , mount_point , STATE_MAP_FILE);
 
-  state_map_type * state_map = state_map_fread_alloc_readonly( filename );
+  state_map_type * state_map = enkf_fs_alloc_readonly_map( readonly_state_maps ,
+                                                           filename ,
+                                                           state_map_fread_alloc_readonly ,
+                                                           state_map_alloc_readonly_copy ,
+                                                           state_map_free );
 
   path_fmt_free( path_fmt );
   free( filename );
@@ -596,7 +731,11 @@ time_map_type * enkf_fs_alloc_readonly_time_map( const char * mount_point ) {
   path_fmt_type * path_fmt = path_fmt_alloc_directory_fmt( DEFAULT_CASE_PATH );
   char * filename = path_fmt_alloc_file( path_fmt , false , mount_point , TIME_MAP_FILE);
 
-  time_map_type * time_map = time_map_fread_alloc_readonly( filename );
+  time_map_type * time_map = enkf_fs_alloc_readonly_map( readonly_time_maps ,
+                                                         filename ,
+                                                         time_map_fread_alloc_readonly ,
+                                                         time_map_alloc_readonly_copy ,
+                                                         time_map_free );
 
   path_fmt_free( path_fmt );
   free( filename );
@@ -614,11 +753,20 @@ static void enkf_fs_fread_misfit( enkf_fs_type * fs ) {
 }
 
 
+/*
+  A misfit ensemble which has been invalidated by new data is removed
+  from disk, so that it is not reused when the case is mounted again.
+*/
+
 static void enkf_fs_fwrite_misfit( enkf_fs_type * fs ) {
   if (misfit_ensemble_initialized( fs->misfit_ensemble )) {
     FILE * stream = enkf_fs_open_case_file( fs , MISFIT_ENSEMBLE_FILE , "w");
     misfit_ensemble_fwrite( fs->misfit_ensemble , stream );
     fclose( stream );
+  } else {
+    char * filename = enkf_fs_alloc_case_filename( fs , MISFIT_ENSEMBLE_FILE );
+    util_unlink_existing( filename );
+    free( filename );
   }
 }
 
@@ -659,6 +807,9 @@ enkf_fs_type * enkf_fs_mount(const char * mount_point) {
   if (!stream)
     return NULL;
 
+  struct timespec start_time, end_time;
+  clock_gettime( CLOCK_MONOTONIC , &start_time );
+
   enkf_fs_type * fs = NULL;
   fs_driver_assert_magic(stream);
   fs_driver_assert_version(stream, mount_point);
@@ -687,11 +838,25 @@ enkf_fs_type * enkf_fs_mount(const char * mount_point) {
   enkf_fs_fread_custom_kw_config_set(fs);
   enkf_fs_fread_misfit(fs);
 
+  clock_gettime( CLOCK_MONOTONIC , &end_time );
+  fs->mount_time = (end_time.tv_sec - start_time.tv_sec) + 1e-9 * (end_time.tv_nsec - start_time.tv_nsec);
+  res_log_finfo("Mounted %s in %.3f seconds.", mount_point, fs->mount_time);
+
   enkf_fs_get_ref(fs);
   return fs;
 }
 
 
+/*
+  The wall time in seconds spent in enkf_fs_mount(), this is dominated
+  by loading the storage indices.
+*/
+
+double enkf_fs_get_mount_time( const enkf_fs_type * fs ) {
+  return fs->mount_time;
+}
+
+
 bool enkf_fs_exists( const char * mount_point ) {
   bool exists   = false;
 
@@ -717,6 +882,9 @@ static void enkf_fs_free_driver(fs_driver_type * driver) {
 
 
 static void enkf_fs_umount(enkf_fs_type * fs) {
+  if (fs->parameter_source != NULL)
+    enkf_fs_unshare_parameters( fs );
+
   if (!fs->read_only) {
     enkf_fs_fsync(fs);
     enkf_fs_fwrite_misfit(fs);
@@ -754,6 +922,12 @@ static void enkf_fs_umount(enkf_fs_type * fs) {
   time_map_free(fs->time_map);
   cases_config_free(fs->cases_config);
   misfit_ensemble_free(fs->misfit_ensemble);
+  pthread_mutex_destroy( &fs->share_mutex );
+  vector_free( fs->vector_blocks );
+  vector_free( fs->vector_block_edits );
+  bool_vector_free( fs->vector_block_absent );
+  pthread_mutex_destroy( &fs->vector_block_mutex );
+  pthread_rwlock_destroy( &fs->vector_block_lock );
   free(fs);
 }
 
@@ -785,6 +959,8 @@ static void * enkf_fs_select_driver(enkf_fs_type * fs , enkf_var_type var_type,
 /* Exported functions for enkf_node instances . */
 
 
+static void enkf_fs_flush_vector_blocks( enkf_fs_type * fs );
+
 static void enkf_fs_fsync_driver( fs_driver_type * driver ) {
   if (driver->fsync_driver != NULL)
     driver->fsync_driver( driver );
@@ -793,6 +969,7 @@ static void enkf_fs_fsync_driver( fs_driver_type * driver ) {
 
 
 void enkf_fs_fsync( enkf_fs_type * fs ) {
+  enkf_fs_flush_vector_blocks( fs );
   enkf_fs_fsync_driver( fs->parameter );
   enkf_fs_fsync_driver( fs->dynamic_forecast );
   enkf_fs_fsync_driver( fs->index );
@@ -807,12 +984,141 @@ void enkf_fs_fsync( enkf_fs_type * fs ) {
 
 
 
+/*
+  Copy-on-write sharing of parameters
+  -----------------------------------
+
+  When an update writes to a new case, all the parameters of the
+  source case used to be copied node by node to the target case before
+  the update started. With enkf_fs_share_parameters() the target case
+  will instead serve the parameter reads from the source case, for the
+  listed keys and realizations, until the node is written to the target
+  case; i.e. the nodes which are updated are never copied.
+
+  The remaining shared nodes are copied as raw buffers, without any
+  deserialization, when enkf_fs_unshare_parameters() is called - or at
+  the latest when the target case is unmounted, so the cases on disk
+  are always self contained. The source filesystem is held with a
+  reference while it is shared.
+
+  The underlying block_fs files are not hard linked, or reflinked,
+  between the cases; the block_fs files are appended to in place, and
+  a shared inode would then modify the source case as well.
+*/
+
+static enkf_fs_type * enkf_fs_get_parameter_source( enkf_fs_type * fs , const char * node_key , enkf_var_type var_type , int iens) {
+  enkf_fs_type * source_fs = NULL;
+
+  if ((var_type == PARAMETER) && (fs->parameter_source != NULL)) {
+    pthread_mutex_lock( &fs->share_mutex );
+    {
+      if (hash_has_key( fs->shared_parameters , node_key )) {
+        bool_vector_type * shared = (bool_vector_type *) hash_get( fs->shared_parameters , node_key );
+        if (bool_vector_safe_iget( shared , iens ))
+          source_fs = fs->parameter_source;
+      }
+    }
+    pthread_mutex_unlock( &fs->share_mutex );
+  }
+
+  return source_fs;
+}
+
+
+static void enkf_fs_unshare_node( enkf_fs_type * fs , const char * node_key , int iens) {
+  pthread_mutex_lock( &fs->share_mutex );
+  {
+    if (hash_has_key( fs->shared_parameters , node_key )) {
+      bool_vector_type * shared = (bool_vector_type *) hash_get( fs->shared_parameters , node_key );
+      if (iens < bool_vector_size( shared ))
+        bool_vector_iset( shared , iens , false );
+    }
+  }
+  pthread_mutex_unlock( &fs->share_mutex );
+}
+
+
+void enkf_fs_share_parameters( enkf_fs_type * fs , enkf_fs_type * source_fs , const stringlist_type * keys , const bool_vector_type * iens_mask) {
+  if (fs == source_fs)
+    return;
+
+  if (fs->read_only)
+    util_abort("%s: attempt to share parameters into read_only filesystem mounted at:%s - aborting. \n",__func__ , fs->mount_point);
+
+  if (fs->parameter_source != NULL)
+    enkf_fs_unshare_parameters( fs );
+
+  fs->parameter_source = enkf_fs_get_ref( source_fs );
+  fs->shared_parameters = hash_alloc();
+  for (int i = 0; i < stringlist_get_size( keys ); i++) {
+    const char * node_key = stringlist_iget( keys , i );
+    bool_vector_type * shared = bool_vector_alloc_copy( iens_mask );
+    hash_insert_hash_owned_ref( fs->shared_parameters , node_key , shared , bool_vector_free__ );
+  }
+}
+
+
+/*
+  Copies the nodes which are still shared from the source filesystem
+  and releases it. Returns the number of nodes copied.
+*/
+
+int enkf_fs_unshare_parameters( enkf_fs_type * fs ) {
+  int copy_count = 0;
+  enkf_fs_type * source_fs = fs->parameter_source;
+
+  if (source_fs == NULL)
+    return 0;
+
+  {
+    stringlist_type * keys = hash_alloc_stringlist( fs->shared_parameters );
+    buffer_type * buffer = buffer_alloc( 1024 );
+
+    for (int i = 0; i < stringlist_get_size( keys ); i++) {
+      const char * node_key = stringlist_iget( keys , i );
+      const bool_vector_type * shared = (const bool_vector_type *) hash_get( fs->shared_parameters , node_key );
+
+      for (int iens = 0; iens < bool_vector_size( shared ); iens++) {
+        if (bool_vector_iget( shared , iens ) && enkf_fs_has_node( source_fs , node_key , PARAMETER , 0 , iens )) {
+          enkf_fs_fread_node( source_fs , buffer , node_key , PARAMETER , 0 , iens );
+          fs->parameter->save_node( fs->parameter , node_key , 0 , iens , buffer );
+          copy_count++;
+        }
+      }
+    }
+
+    buffer_free( buffer );
+    stringlist_free( keys );
+  }
+
+  hash_free( fs->shared_parameters );
+  fs->shared_parameters = NULL;
+  fs->parameter_source = NULL;
+  enkf_fs_decref( source_fs );
+
+  res_log_fdebug("Copied %d shared parameter nodes to %s", copy_count, fs->mount_point);
+  return copy_count;
+}
+
+
+bool enkf_fs_has_shared_parameters( const enkf_fs_type * fs ) {
+  return (fs->parameter_source != NULL);
+}
+
+
+
 void enkf_fs_fread_node(enkf_fs_type * enkf_fs , buffer_type * buffer ,
                         const char * node_key ,
                         enkf_var_type var_type ,
                         int report_step,
                         int iens) {
 
+  enkf_fs_type * source_fs = enkf_fs_get_parameter_source( enkf_fs , node_key , var_type , iens );
+  if (source_fs != NULL) {
+    enkf_fs_fread_node( source_fs , buffer , node_key , var_type , report_step , iens );
+    return;
+  }
+
   fs_driver_type * driver = (fs_driver_type * ) enkf_fs_select_driver(enkf_fs , var_type , node_key );
   if (var_type == PARAMETER)
     /* Parameters are *ONLY* stored at report_step == 0 */
@@ -823,11 +1129,321 @@ void enkf_fs_fread_node(enkf_fs_type * enkf_fs , buffer_type * buffer ,
 }
 
 
+/*
+  Vector blocks
+  -------------
+
+  The summary vectors of one realization can be stored together as one
+  vector_block record, instead of one record per key; see
+  enkf_fs_fwrite_vector_block(). The index of the stored block is
+  cached per realization, and the vector functions below will first
+  look for the key in the block, and then fall back to a record stored
+  separately for the key - i.e. cases written with one record per
+  vector can still be read.
+*/
+
+#define VECTOR_BLOCK_KEY "__VECTOR_BLOCK__"
+
+
+static vector_block_type * enkf_fs_get_vector_block_index__( enkf_fs_type * fs , int iens ) {
+  vector_block_type * block = (vector_block_type *) vector_safe_iget( fs->vector_blocks , iens );
+  if ((block == NULL) && !bool_vector_safe_iget( fs->vector_block_absent , iens )) {
+    fs_driver_type * driver = fs->dynamic_forecast;
+
+    if (driver->has_vector( driver , VECTOR_BLOCK_KEY , iens )) {
+      buffer_type * buffer = buffer_alloc( 1024 );
+
+      if (driver->load_vector_range != NULL) {
+        driver->load_vector_range( driver , VECTOR_BLOCK_KEY , iens , 0 , VECTOR_BLOCK_HEADER_SIZE , buffer );
+        {
+          int index_size = vector_block_fread_index_size( buffer );
+          driver->load_vector_range( driver , VECTOR_BLOCK_KEY , iens , 0 , index_size , buffer );
+        }
+      } else
+        driver->load_vector( driver , VECTOR_BLOCK_KEY , iens , buffer );
+
+      buffer_rewind( buffer );
+      block = vector_block_fread_alloc_index( buffer );
+      vector_iset_owned_ref( fs->vector_blocks , iens , block , vector_block_free__ );
+      buffer_free( buffer );
+    } else
+      bool_vector_iset( fs->vector_block_absent , iens , true );
+  }
+  return block;
+}
+
+
+static bool enkf_fs_get_vector_block_range( enkf_fs_type * fs , const char * node_key , enkf_var_type var_type , int iens , int * offset , int * size) {
+  bool has_key = false;
+  if (var_type == DYNAMIC_RESULT) {
+    pthread_mutex_lock( &fs->vector_block_mutex );
+    {
+      const vector_block_type * block = enkf_fs_get_vector_block_index__( fs , iens );
+      if ((block != NULL) && vector_block_has_key( block , node_key )) {
+        vector_block_get_range( block , node_key , offset , size );
+        has_key = true;
+      }
+    }
+    pthread_mutex_unlock( &fs->vector_block_mutex );
+  }
+  return has_key;
+}
+
+
+static void enkf_fs_fread_vector_block_range( enkf_fs_type * fs , int iens , int offset , int size , buffer_type * buffer) {
+  fs_driver_type * driver = fs->dynamic_forecast;
+
+  if (driver->load_vector_range != NULL)
+    driver->load_vector_range( driver , VECTOR_BLOCK_KEY , iens , offset , size , buffer );
+  else {
+    buffer_type * record = buffer_alloc( offset + size );
+    driver->load_vector( driver , VECTOR_BLOCK_KEY , iens , record );
+    buffer_clear( buffer );
+    buffer_fwrite( buffer , buffer_iget_data( record , offset ) , 1 , size );
+    buffer_free( record );
+  }
+  buffer_rewind( buffer );
+}
+
+
+/*
+  Will load the complete vector block stored for realization @iens
+  directly from the driver, or return NULL if no block has been stored.
+*/
+
+static vector_block_type * enkf_fs_alloc_vector_block__( enkf_fs_type * fs , int iens ) {
+  fs_driver_type * driver = fs->dynamic_forecast;
+
+  if (driver->has_vector( driver , VECTOR_BLOCK_KEY , iens )) {
+    buffer_type * buffer = buffer_alloc( 1024 );
+    vector_block_type * block;
+
+    driver->load_vector( driver , VECTOR_BLOCK_KEY , iens , buffer );
+    buffer_rewind( buffer );
+    block = vector_block_fread_alloc( buffer );
+    buffer_free( buffer );
+    return block;
+  } else
+    return NULL;
+}
+
+
+static void enkf_fs_free_edit__( void * arg ) {
+  buffer_free( (buffer_type *) arg );
+}
+
+
+/*
+  Must be called with the vector_block_mutex held.
+*/
+
+static void enkf_fs_fwrite_vector_block__( enkf_fs_type * fs , vector_block_type * block , int iens ) {
+  fs_driver_type * driver = fs->dynamic_forecast;
+  buffer_type * buffer = buffer_alloc( 1024 );
+
+  vector_block_fwrite( block , buffer );
+  driver->save_vector( driver , VECTOR_BLOCK_KEY , iens , buffer );
+
+  buffer_rewind( buffer );
+  vector_iset_owned_ref( fs->vector_blocks , iens , vector_block_fread_alloc_index( buffer ) , vector_block_free__ );
+  if (vector_safe_iget( fs->vector_block_edits , iens ) != NULL)
+    vector_iset_ref( fs->vector_block_edits , iens , NULL );
+  bool_vector_iset( fs->vector_block_absent , iens , false );
+
+  buffer_free( buffer );
+}
+
+
+/*
+  A vector which is written separately while it is also present in the
+  stored vector block must replace the value in the block, otherwise
+  the old value in the block would shadow the new record. Rewriting
+  the complete block for every vector would make a save of all the
+  vectors of a realization quadratic in the number of vectors, so the
+  replaced vectors are instead kept in memory, and the block is
+  rewritten once when the filesystem is synced, or when the complete
+  block is requested with enkf_fs_alloc_vector_block().
+*/
+
+static void enkf_fs_add_vector_block_edit( enkf_fs_type * fs , buffer_type * buffer , const char * node_key , int iens) {
+  buffer_type * edit = buffer_alloc( buffer_get_size( buffer ));
+  buffer_fwrite( edit , buffer_get_data( buffer ) , 1 , buffer_get_size( buffer ));
+
+  pthread_mutex_lock( &fs->vector_block_mutex );
+  {
+    hash_type * edits = (hash_type *) vector_safe_iget( fs->vector_block_edits , iens );
+    if (edits == NULL) {
+      edits = hash_alloc( );
+      vector_iset_owned_ref( fs->vector_block_edits , iens , edits , hash_free__ );
+    }
+    hash_insert_hash_owned_ref( edits , node_key , edit , enkf_fs_free_edit__ );
+  }
+  pthread_mutex_unlock( &fs->vector_block_mutex );
+}
+
+
+/*
+  Will return a copy of the vector @node_key replaced in the vector
+  block of realization @iens, or NULL if there is no such vector.
+*/
+
+static buffer_type * enkf_fs_alloc_vector_block_edit( enkf_fs_type * fs , const char * node_key , enkf_var_type var_type , int iens) {
+  buffer_type * buffer = NULL;
+  if (var_type == DYNAMIC_RESULT) {
+    pthread_mutex_lock( &fs->vector_block_mutex );
+    {
+      hash_type * edits = (hash_type *) vector_safe_iget( fs->vector_block_edits , iens );
+      if ((edits != NULL) && hash_has_key( edits , node_key )) {
+        buffer_type * edit = (buffer_type *) hash_get( edits , node_key );
+        buffer = buffer_alloc( buffer_get_size( edit ));
+        buffer_fwrite( buffer , buffer_get_data( edit ) , 1 , buffer_get_size( edit ));
+        buffer_rewind( buffer );
+      }
+    }
+    pthread_mutex_unlock( &fs->vector_block_mutex );
+  }
+  return buffer;
+}
+
+
+/*
+  Rewrites the vector block of realization @iens once with all the
+  replaced vectors; must be called with the vector_block_mutex held.
+*/
+
+static void enkf_fs_flush_vector_block__( enkf_fs_type * fs , int iens ) {
+  hash_type * edits = (hash_type *) vector_safe_iget( fs->vector_block_edits , iens );
+  if (edits == NULL)
+    return;
+
+  {
+    vector_block_type * stored_block = enkf_fs_alloc_vector_block__( fs , iens );
+    if (stored_block == NULL)
+      util_abort("%s: vectors replaced in the vector block for realization:%d, but no block is stored - aborting.\n",__func__ , iens);
+    {
+      vector_block_type * block = vector_block_alloc( );
+      buffer_type * vector_buffer = buffer_alloc( 1024 );
+
+      for (int i = 0; i < vector_block_get_size( stored_block ); i++) {
+        const char * key = vector_block_iget_key( stored_block , i );
+        if (hash_has_key( edits , key ))
+          vector_block_add( block , key , (buffer_type *) hash_get( edits , key ));
+        else {
+          vector_block_copy_buffer( stored_block , key , vector_buffer );
+          vector_block_add( block , key , vector_buffer );
+        }
+      }
+      enkf_fs_fwrite_vector_block__( fs , block , iens );
+
+      buffer_free( vector_buffer );
+      vector_block_free( block );
+    }
+    vector_block_free( stored_block );
+  }
+}
+
+
+static void enkf_fs_flush_vector_blocks( enkf_fs_type * fs ) {
+  pthread_rwlock_wrlock( &fs->vector_block_lock );
+  pthread_mutex_lock( &fs->vector_block_mutex );
+  for (int iens = 0; iens < vector_get_size( fs->vector_block_edits ); iens++)
+    enkf_fs_flush_vector_block__( fs , iens );
+  pthread_mutex_unlock( &fs->vector_block_mutex );
+  pthread_rwlock_unlock( &fs->vector_block_lock );
+}
+
+
+/*
+  Will load the complete vector block stored for realization @iens, or
+  return NULL if no block has been stored. The block must be freed by
+  the caller.
+*/
+
+vector_block_type * enkf_fs_alloc_vector_block( enkf_fs_type * fs , int iens ) {
+  vector_block_type * block = NULL;
+  bool absent;
+
+  pthread_rwlock_wrlock( &fs->vector_block_lock );
+  pthread_mutex_lock( &fs->vector_block_mutex );
+  enkf_fs_flush_vector_block__( fs , iens );
+  absent = bool_vector_safe_iget( fs->vector_block_absent , iens );
+  pthread_mutex_unlock( &fs->vector_block_mutex );
+
+  if (!absent) {
+    block = enkf_fs_alloc_vector_block__( fs , iens );
+    if (block == NULL) {
+      pthread_mutex_lock( &fs->vector_block_mutex );
+      bool_vector_iset( fs->vector_block_absent , iens , true );
+      pthread_mutex_unlock( &fs->vector_block_mutex );
+    }
+  }
+  pthread_rwlock_unlock( &fs->vector_block_lock );
+  return block;
+}
+
+
+/*
+  Stores all the vectors in @block as one record; the block replaces
+  any block stored earlier for realization @iens.
+*/
+
+void enkf_fs_fwrite_vector_block( enkf_fs_type * fs , vector_block_type * block , int iens ) {
+  if (fs->read_only)
+    util_abort("%s: attempt to write to read_only filesystem mounted at:%s - aborting. \n",__func__ , fs->mount_point);
+
+  pthread_rwlock_wrlock( &fs->vector_block_lock );
+  pthread_mutex_lock( &fs->vector_block_mutex );
+  enkf_fs_fwrite_vector_block__( fs , block , iens );
+  pthread_mutex_unlock( &fs->vector_block_mutex );
+  pthread_rwlock_unlock( &fs->vector_block_lock );
+
+  misfit_ensemble_invalidate( fs->misfit_ensemble );
+}
+
+
+/*
+  Will load the vector @node_key of realization @iens from the vector
+  block into @buffer, either from the replaced vectors which are not
+  yet written or from the stored block; returns false if the vector is
+  not in the block. The vector_block_lock is held across the range
+  lookup and the read, so the block can not be rewritten in between.
+*/
+
+static bool enkf_fs_fread_vector_block_vector( enkf_fs_type * fs , buffer_type * buffer , const char * node_key , enkf_var_type var_type , int iens) {
+  bool found = false;
+  if (var_type != DYNAMIC_RESULT)
+    return false;
+
+  pthread_rwlock_rdlock( &fs->vector_block_lock );
+  {
+    buffer_type * edit = enkf_fs_alloc_vector_block_edit( fs , node_key , var_type , iens );
+    if (edit != NULL) {
+      buffer_clear( buffer );
+      buffer_fwrite( buffer , buffer_get_data( edit ) , 1 , buffer_get_size( edit ));
+      buffer_rewind( buffer );
+      buffer_free( edit );
+      found = true;
+    } else {
+      int offset, size;
+      if (enkf_fs_get_vector_block_range( fs , node_key , var_type , iens , &offset , &size )) {
+        enkf_fs_fread_vector_block_range( fs , iens , offset , size , buffer );
+        found = true;
+      }
+    }
+  }
+  pthread_rwlock_unlock( &fs->vector_block_lock );
+  return found;
+}
+
+
 void enkf_fs_fread_vector(enkf_fs_type * enkf_fs , buffer_type * buffer ,
                           const char * node_key ,
                           enkf_var_type var_type ,
                           int iens) {
 
+  if (enkf_fs_fread_vector_block_vector( enkf_fs , buffer , node_key , var_type , iens ))
+    return;
+
   fs_driver_type * driver = (fs_driver_type * ) enkf_fs_select_driver(enkf_fs , var_type , node_key );
 
   buffer_rewind( buffer );
@@ -836,13 +1452,122 @@ void enkf_fs_fread_vector(enkf_fs_type * enkf_fs , buffer_type * buffer ,
 
 
 
+/*
+  The view functions return a read-only buffer with the stored
+  content. When the driver supports it, and mmap reading has been
+  enabled with enkf_fs_set_mmap(), the buffer will refer directly to
+  the memory mapped storage without any intermediate copy. The buffer
+  must be released with enkf_fs_free_view() as soon as the content
+  has been deserialized, and no writes to the same filesystem should
+  be issued while it is held.
+*/
+
+buffer_type * enkf_fs_alloc_node_view(enkf_fs_type * enkf_fs ,
+                                      const char * node_key ,
+                                      enkf_var_type var_type ,
+                                      int report_step,
+                                      int iens) {
+
+  /*
+    A node shared from the parameter source is returned as a plain
+    copy; a view into the source storage could not be released
+    through this filesystem.
+  */
+  if (enkf_fs_get_parameter_source( enkf_fs , node_key , var_type , iens ) != NULL) {
+    buffer_type * buffer = buffer_alloc( 100 );
+    enkf_fs_fread_node( enkf_fs , buffer , node_key , var_type , report_step , iens );
+    return buffer;
+  }
+
+  fs_driver_type * driver = (fs_driver_type * ) enkf_fs_select_driver(enkf_fs , var_type , node_key );
+  if (var_type == PARAMETER)
+    /* Parameters are *ONLY* stored at report_step == 0 */
+    report_step = 0;
+
+  if (driver->alloc_node_view != NULL)
+    return driver->alloc_node_view(driver , node_key , report_step , iens);
+  else {
+    buffer_type * buffer = buffer_alloc( 100 );
+    driver->load_node(driver , node_key ,  report_step , iens , buffer);
+    return buffer;
+  }
+}
+
+
+buffer_type * enkf_fs_alloc_vector_view(enkf_fs_type * enkf_fs ,
+                                        const char * node_key ,
+                                        enkf_var_type var_type ,
+                                        int iens) {
+
+  {
+    buffer_type * buffer = buffer_alloc( 100 );
+    if (enkf_fs_fread_vector_block_vector( enkf_fs , buffer , node_key , var_type , iens ))
+      return buffer;
+    buffer_free( buffer );
+  }
+
+  fs_driver_type * driver = (fs_driver_type * ) enkf_fs_select_driver(enkf_fs , var_type , node_key );
+
+  if (driver->alloc_vector_view != NULL)
+    return driver->alloc_vector_view(driver , node_key , iens);
+  else {
+    buffer_type * buffer = buffer_alloc( 100 );
+    driver->load_vector(driver , node_key ,  iens , buffer);
+    return buffer;
+  }
+}
+
+
+void enkf_fs_free_view(enkf_fs_type * enkf_fs ,
+                       buffer_type * view ,
+                       const char * node_key ,
+                       enkf_var_type var_type ,
+                       int iens) {
+
+  fs_driver_type * driver = (fs_driver_type * ) enkf_fs_select_driver(enkf_fs , var_type , node_key );
+
+  if (driver->free_view != NULL)
+    driver->free_view(driver , iens , view);
+  else
+    buffer_free( view );
+}
+
+
+static void enkf_fs_set_mmap_driver( fs_driver_type * driver , bool use_mmap ) {
+  if (driver->set_mmap != NULL)
+    driver->set_mmap( driver , use_mmap );
+}
+
+
+void enkf_fs_set_mmap( enkf_fs_type * fs , bool use_mmap ) {
+  enkf_fs_set_mmap_driver( fs->parameter , use_mmap );
+  enkf_fs_set_mmap_driver( fs->dynamic_forecast , use_mmap );
+  enkf_fs_set_mmap_driver( fs->index , use_mmap );
+  fs->use_mmap = use_mmap;
+}
+
+
+bool enkf_fs_get_mmap( const enkf_fs_type * fs ) {
+  return fs->use_mmap;
+}
+
+
+
 bool enkf_fs_has_node(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type , int report_step , int iens) {
+  enkf_fs_type * source_fs = enkf_fs_get_parameter_source( enkf_fs , node_key , var_type , iens );
+  if (source_fs != NULL)
+    return enkf_fs_has_node( source_fs , node_key , var_type , report_step , iens );
+
   fs_driver_type * driver = fs_driver_safe_cast(enkf_fs_select_driver(enkf_fs , var_type , node_key));
   return driver->has_node(driver , node_key , report_step , iens );
 }
 
 
 bool enkf_fs_has_vector(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type , int iens ) {
+  int offset, size;
+  if (enkf_fs_get_vector_block_range( enkf_fs , node_key , var_type , iens , &offset , &size ))
+    return true;
+
   fs_driver_type * driver = fs_driver_safe_cast(enkf_fs_select_driver(enkf_fs , var_type ,  node_key));
   return driver->has_vector(driver , node_key , iens );
 }
@@ -862,6 +1587,10 @@ void enkf_fs_fwrite_node(enkf_fs_type * enkf_fs , buffer_type * buffer , const c
       driver->save_node(driver , node_key , report_step , iens , buffer);
     }
   }
+  misfit_ensemble_invalidate( enkf_fs->misfit_ensemble );
+
+  if ((var_type == PARAMETER) && (enkf_fs->parameter_source != NULL))
+    enkf_fs_unshare_node( enkf_fs , node_key , iens );
 }
 
 
@@ -869,6 +1598,13 @@ void enkf_fs_fwrite_vector(enkf_fs_type * enkf_fs , buffer_type * buffer , const
                            int iens ) {
   if (enkf_fs->read_only)
     util_abort("%s: attempt to write to read_only filesystem mounted at:%s - aborting. \n",__func__ , enkf_fs->mount_point);
+
+  int offset, size;
+  if (enkf_fs_get_vector_block_range( enkf_fs , node_key , var_type , iens , &offset , &size )) {
+    enkf_fs_add_vector_block_edit( enkf_fs , buffer , node_key , iens );
+    misfit_ensemble_invalidate( enkf_fs->misfit_ensemble );
+    return;
+  }
   {
     void * _driver = enkf_fs_select_driver(enkf_fs , var_type , node_key);
     {
@@ -876,6 +1612,7 @@ void enkf_fs_fwrite_vector(enkf_fs_type * enkf_fs , buffer_type * buffer , const
       driver->save_vector(driver , node_key  , iens , buffer);
     }
   }
+  misfit_ensemble_invalidate( enkf_fs->misfit_ensemble );
 }
 
 
@@ -19,6 +19,7 @@
 
 #include <errno.h>
 #include <string.h>
+#include <limits.h>
 #include <stdlib.h>
 #include <stdio.h>
 #include <signal.h>
@@ -28,6 +29,7 @@
 #include <pwd.h>
 #include <unistd.h>
 #include <sys/types.h>
+#include <time.h>
 #include <thread>
 
 #define HAVE_THREAD_POOL 1
@@ -110,6 +112,7 @@
 #include <ert/enkf/ert_run_context.hpp>
 #include <ert/enkf/run_arg.hpp>
 #include <ert/enkf/callback_arg.hpp>
+#include <ert/enkf/summary_load_cache.hpp>
 
 
 /**/
@@ -173,6 +176,25 @@ static void enkf_main_close_fs( enkf_main_type * enkf_main );
 static void enkf_main_init_fs( enkf_main_type * enkf_main );
 static void enkf_main_user_select_initial_fs(enkf_main_type * enkf_main );
 static void enkf_main_free_ensemble( enkf_main_type * enkf_main );
+static int  enkf_main_load_from_run_context__( enkf_main_type * enkf_main ,
+                                               ert_run_context_type * run_context ,
+                                               stringlist_type ** realizations_msg_list ,
+                                               enkf_fs_type * fs ,
+                                               load_scheduler_type * scheduler);
+
+/*
+  Wall clock time (in seconds) spent in the different phases of one
+  update; logged when the update is complete.
+*/
+typedef struct {
+  double load;
+  double serialize;
+  double initX;
+  double matmul;
+  double deserialize;
+  double store;
+} update_timing_type;
+
 static void enkf_main_analysis_update( enkf_main_type * enkf_main ,
                                        enkf_fs_type * target_fs ,
                                        const bool_vector_type * ens_mask ,
@@ -183,7 +205,8 @@ static void enkf_main_analysis_update( enkf_main_type * enkf_main ,
                                        int step2 ,
                                        const local_ministep_type * ministep ,
                                        const meas_data_type * forecast ,
-                                       obs_data_type * obs_data);
+                                       obs_data_type * obs_data ,
+                                       update_timing_type * timing);
 /*****************************************************************/
 
 UTIL_SAFE_CAST_FUNCTION(enkf_main , ENKF_MAIN_ID)
@@ -564,6 +587,13 @@ typedef struct {
 } serialize_info_type;
 
 
+static double enkf_main_elapsed_time( const struct timespec * start_time ) {
+  struct timespec end_time;
+  clock_gettime( CLOCK_MONOTONIC , &end_time );
+  return (end_time.tv_sec - start_time->tv_sec) + 1e-9 * (end_time.tv_nsec - start_time->tv_nsec);
+}
+
+
 static void serialize_node( enkf_fs_type * fs ,
                             const ensemble_config_type * ensemble_config,
                             const char * key ,
@@ -716,6 +746,28 @@ static void * deserialize_nodes_mt( void * arg ) {
 }
 
 
+static void enkf_main_deserialize_node( const char * node_key ,
+                                        const active_list_type * active_list ,
+                                        int row_offset ,
+                                        thread_pool_type * work_pool ,
+                                        serialize_info_type * serialize_info) {
+
+  /* Multithreaded deserializing*/
+  const int num_cpu_threads = thread_pool_get_max_running( work_pool );
+  int icpu;
+
+  thread_pool_restart( work_pool );
+  for (icpu = 0; icpu < num_cpu_threads; icpu++) {
+    serialize_info[icpu].key         = node_key;
+    serialize_info[icpu].active_list = active_list;
+    serialize_info[icpu].row_offset  = row_offset;
+
+    thread_pool_add_job( work_pool , deserialize_nodes_mt , &serialize_info[icpu]);
+  }
+  thread_pool_join( work_pool );
+}
+
+
 static void enkf_main_deserialize_dataset( ensemble_config_type * ensemble_config ,
                                            const local_dataset_type * dataset ,
                                            const int * active_size ,
@@ -723,7 +775,6 @@ static void enkf_main_deserialize_dataset( ensemble_config_type * ensemble_confi
                                            serialize_info_type * serialize_info ,
                                            thread_pool_type * work_pool ) {
 
-  int num_cpu_threads = thread_pool_get_max_running( work_pool );
   stringlist_type * update_keys = local_dataset_alloc_keys( dataset );
   for (int i = 0; i < stringlist_get_size( update_keys ); i++) {
     const char             * key         = stringlist_iget(update_keys , i);
@@ -738,20 +789,84 @@ static void enkf_main_deserialize_dataset( ensemble_config_type * ensemble_confi
     else {
       if (active_size[i] > 0) {
         const active_list_type * active_list      = local_dataset_get_node_active_list( dataset , key );
+        enkf_main_deserialize_node( key , active_list , row_offset[i] , work_pool , serialize_info );
+      }
+    }
+  }
+  stringlist_free( update_keys );
+}
 
-        {
-          /* Multithreaded */
-          int icpu;
-          thread_pool_restart( work_pool );
-          for (icpu = 0; icpu < num_cpu_threads; icpu++) {
-            serialize_info[icpu].key         = key;
-            serialize_info[icpu].active_list = active_list;
-            serialize_info[icpu].row_offset  = row_offset[i];
 
-            thread_pool_add_job( work_pool , deserialize_nodes_mt , &serialize_info[icpu]);
-          }
-          thread_pool_join( work_pool );
-        }
+/**
+   Memory bounded alternative to serialize -> A*X -> deserialize of
+   the full dataset, for modules which only need the X matrix. The
+   nodes are updated one at a time, and the parameter nodes are split
+   in blocks of at most @block_rows rows; every block is serialized
+   into the A matrix of serialize_info, multiplied with X and
+   deserialized before the next block is loaded.
+
+   Since every row of A*X only depends on the same row of A the result
+   is identical to the full update, but the A matrix never holds more
+   than @block_rows rows - except for dynamic nodes, which are not split
+   because a partly active deserialize must be able to load the node
+   at the target step.
+
+   The price is that a node which is split in n blocks is loaded n
+   times from the source, and n - 1 times from the target file system.
+*/
+
+static void enkf_main_update_dataset_blocked( const ensemble_config_type * ens_config ,
+                                              const local_dataset_type * dataset ,
+                                              int report_step ,
+                                              const matrix_type * X ,
+                                              int block_rows ,
+                                              thread_pool_type * work_pool ,
+                                              serialize_info_type * serialize_info ,
+                                              update_timing_type * timing) {
+
+  matrix_type * A = serialize_info->A;
+  stringlist_type * update_keys = local_dataset_alloc_keys( dataset );
+  const int num_kw = stringlist_get_size( update_keys );
+
+  for (int ikw=0; ikw < num_kw; ikw++) {
+    const char             * key         = stringlist_iget(update_keys , ikw);
+    enkf_config_node_type * config_node  = ensemble_config_get_node( ens_config , key );
+    bool parameter = (enkf_config_node_get_var_type( config_node ) == PARAMETER);
+
+    if ((serialize_info[0].run_mode == SMOOTHER_RUN) && !parameter)
+      continue;
+
+    {
+      const active_list_type * active_list = local_dataset_get_node_active_list( dataset , key );
+      int active_size = __get_active_size( ens_config , serialize_info->src_fs , key , report_step , active_list );
+      int node_block_rows = parameter ? block_rows : active_size;
+
+      for (int row1 = 0; row1 < active_size; row1 += node_block_rows) {
+        int rows = util_int_min( node_block_rows , active_size - row1 );
+        active_list_type * block_list = NULL;
+
+        matrix_full_size( A );
+        matrix_ensure_rows( A , rows , false );
+        matrix_shrink_header( A , rows , matrix_get_columns( A ));
+
+        if (rows < active_size)
+          block_list = active_list_alloc_block( active_list , row1 , rows );
+
+        struct timespec start_time;
+        clock_gettime( CLOCK_MONOTONIC , &start_time );
+        enkf_main_serialize_node( key , block_list ? block_list : active_list , 0 , work_pool , serialize_info );
+        timing->serialize += enkf_main_elapsed_time( &start_time );
+
+        clock_gettime( CLOCK_MONOTONIC , &start_time );
+        matrix_inplace_matmul_mt2( A , X , work_pool );
+        timing->matmul += enkf_main_elapsed_time( &start_time );
+
+        clock_gettime( CLOCK_MONOTONIC , &start_time );
+        enkf_main_deserialize_node( key , block_list ? block_list : active_list , 0 , work_pool , serialize_info );
+        timing->deserialize += enkf_main_elapsed_time( &start_time );
+
+        if (block_list)
+          active_list_free( block_list );
       }
     }
   }
@@ -915,6 +1030,21 @@ static FILE * enkf_main_log_step_list(enkf_main_type * enkf_main, const int_vect
 }
 
 
+/**
+   The number of threads used for the serializing, the matrix product
+   and the parameter copying in the update; UPDATE_THREADS in the
+   config, by default one thread per available core.
+*/
+
+static int enkf_main_get_update_threads( const enkf_main_type * enkf_main ) {
+  int update_threads = analysis_config_get_update_threads( enkf_main_get_analysis_config( enkf_main ));
+  if (update_threads <= 0)
+    update_threads = std::thread::hardware_concurrency();
+
+  return util_int_max( 1 , update_threads );
+}
+
+
 /**
  * This is THE ENKF update function.  It should only be called from enkf_main_UPDATE.
  */
@@ -944,29 +1074,18 @@ static void enkf_main_update__(enkf_main_type * enkf_main, const int_vector_type
     int_vector_type * ens_active_list = bool_vector_alloc_active_list(ens_mask);
 
     /*
-      Copy all the parameter nodes from source case to target case;
-      nodes which are updated will be fetched from the new target
-      case, and nodes which are not updated will be manually copied
-      over there.
+      The parameter nodes of the source case are shared copy-on-write
+      with the target case; nodes which are updated will be written to
+      the new target case, and only the nodes which are not updated
+      will be copied over there when the sharing ends below.
     */
+    update_timing_type timing = {0};
+    struct timespec start_time;
+
     if (target_fs != source_fs) {
-      const ensemble_config_type * ensemble_config = enkf_main_get_ensemble_config(enkf_main);
-      stringlist_type * param_keys = ensemble_config_alloc_keylist_from_var_type(ensemble_config, PARAMETER);
-      for (int i = 0; i < stringlist_get_size(param_keys); i++) {
-        const char * key = stringlist_iget(param_keys, i);
-        enkf_config_node_type * config_node = ensemble_config_get_node(ensemble_config, key);
-        enkf_node_type * data_node = enkf_node_alloc(config_node);
-        for (int j = 0; j < int_vector_size(ens_active_list); j++) {
-          node_id_type node_id;
-          node_id.iens = int_vector_iget(ens_active_list, j);
-          node_id.report_step = 0;
-
-          enkf_node_load(data_node, source_fs, node_id);
-          enkf_node_store(data_node, target_fs, false, node_id);
-        }
-        enkf_node_free(data_node);
-      }
-      stringlist_free(param_keys);
+      stringlist_type * param_keys = ensemble_config_alloc_keylist_from_var_type(enkf_main_get_ensemble_config(enkf_main), PARAMETER);
+      enkf_fs_share_parameters( target_fs , source_fs , param_keys , ens_mask );
+      stringlist_free( param_keys );
     }
 
     {
@@ -999,8 +1118,10 @@ static void enkf_main_update__(enkf_main_type * enkf_main, const int_vector_type
           res_log_finfo("Scaling standard deviation in obdsata set:%s with %g",
                         local_obsdata_get_name(obsdata), scale_factor);
         }
+        clock_gettime( CLOCK_MONOTONIC , &start_time );
         enkf_obs_get_obs_and_measure_data(enkf_main->obs, source_fs, obsdata,
                                           ens_active_list, meas_data, obs_data);
+        timing.load += enkf_main_elapsed_time( &start_time );
 
         enkf_analysis_deactivate_outliers(obs_data, meas_data,
                                           std_cutoff, alpha, enkf_main->verbose);
@@ -1020,7 +1141,8 @@ static void enkf_main_update__(enkf_main_type * enkf_main, const int_vector_type
                                       current_step,
                                       ministep,
                                       meas_data,
-                                      obs_data);
+                                      obs_data,
+                                      &timing);
         else if (target_fs != source_fs)
           res_log_ferror("No active observations/parameters for MINISTEP: %s.",
                          local_ministep_get_name(ministep));
@@ -1034,13 +1156,24 @@ static void enkf_main_update__(enkf_main_type * enkf_main, const int_vector_type
     {
       state_map_type * target_state_map = enkf_fs_get_state_map(target_fs);
 
+      clock_gettime( CLOCK_MONOTONIC , &start_time );
+      if (target_fs != source_fs) {
+        int copy_count = enkf_fs_unshare_parameters( target_fs );
+        res_log_finfo("Copied %d parameter nodes which were not updated to the target case", copy_count);
+      }
+
       if (target_state_map != source_state_map) {
         state_map_set_from_inverted_mask(target_state_map, ens_mask, STATE_PARENT_FAILURE);
         state_map_set_from_mask(target_state_map, ens_mask, STATE_INITIALIZED);
         enkf_fs_fsync(target_fs);
       }
+      timing.store += enkf_main_elapsed_time( &start_time );
     }
 
+    res_log_finfo("Update timing with %d threads - load:%.3fs serialize:%.3fs initX:%.3fs matmul:%.3fs deserialize:%.3fs store:%.3fs",
+                  enkf_main_get_update_threads( enkf_main ),
+                  timing.load, timing.serialize, timing.initX, timing.matmul, timing.deserialize, timing.store);
+
     int_vector_free(ens_active_list);
     obs_data_free(obs_data);
     meas_data_free(meas_data);
@@ -1060,18 +1193,20 @@ static void enkf_main_analysis_update( enkf_main_type * enkf_main ,
                                        int step2 ,
                                        const local_ministep_type * ministep ,
                                        const meas_data_type * forecast ,
-                                       obs_data_type * obs_data) {
+                                       obs_data_type * obs_data ,
+                                       update_timing_type * timing) {
 
-  const int cpu_threads       = 4;
+  const int cpu_threads       = enkf_main_get_update_threads( enkf_main );
   const int matrix_start_size = 250000;
   thread_pool_type * tp       = thread_pool_alloc( cpu_threads , false );
+  struct timespec start_time;
   int active_ens_size   = meas_data_get_active_ens_size( forecast );
   int active_size       = obs_data_get_active_size( obs_data );
   matrix_type * X       = matrix_alloc( active_ens_size , active_ens_size );
   matrix_type * S       = meas_data_allocS( forecast );
-  matrix_type * R       = obs_data_allocR( obs_data );
+  matrix_type * R       = NULL;
   matrix_type * dObs    = obs_data_allocdObs( obs_data );
-  matrix_type * A       = matrix_alloc( matrix_start_size , active_ens_size );
+  matrix_type * A       = NULL;
   matrix_type * E       = NULL;
   matrix_type * D       = NULL;
   matrix_type * localA  = NULL;
@@ -1083,9 +1218,42 @@ static void enkf_main_analysis_update( enkf_main_type * enkf_main ,
   if ( local_ministep_has_analysis_module (ministep))
     module = local_ministep_get_analysis_module (ministep);
 
+  /*
+    With MAX_UPDATE_MEMORY set, modules which only need X are updated
+    in row blocks sized to keep A below the limit; the modules which
+    use or update A must see the full dataset.
+  */
+  int block_rows = 0;
+  {
+    int max_update_memory = analysis_config_get_max_update_memory( analysis_config );
+    if ((max_update_memory > 0) &&
+        !analysis_module_check_option( module , ANALYSIS_USE_A) &&
+        !analysis_module_check_option( module , ANALYSIS_UPDATE_A)) {
+      size_t row_bytes = util_size_t_max( 1 , active_ens_size ) * sizeof(double);
+      size_t max_rows  = (size_t) max_update_memory * 1024 * 1024 / row_bytes;
+      block_rows = (int) util_size_t_min( util_size_t_max( 1 , max_rows ) , INT_MAX );
+    }
+  }
+
+  if (block_rows > 0)
+    A = matrix_alloc( util_int_min( block_rows , matrix_start_size ) , active_ens_size );
+  else
+    A = matrix_alloc( matrix_start_size , active_ens_size );
+
   assert_matrix_size(X , "X" , active_ens_size , active_ens_size);
   assert_matrix_size(S , "S" , active_size , active_ens_size);
-  assert_matrix_size(R , "R" , active_size , active_size);
+  /*
+    With uncorrelated observation errors the modules which can handle
+    it get only the diagonal of R, so the memory does not grow with the
+    square of the number of observations.
+  */
+  if (analysis_module_check_option( module , ANALYSIS_DIAGONAL_R) && obs_data_has_diagonal_R( obs_data )) {
+    R = obs_data_alloc_diagR( obs_data );
+    assert_matrix_size(R , "R" , active_size , 1);
+  } else {
+    R = obs_data_allocR( obs_data );
+    assert_matrix_size(R , "R" , active_size , active_size);
+  }
   assert_size_equal( enkf_main_get_ensemble_size( enkf_main ) , ens_mask );
 
   if (analysis_module_check_option( module , ANALYSIS_NEED_ED)) {
@@ -1144,14 +1312,19 @@ static void enkf_main_analysis_update( enkf_main_type * enkf_main ,
       double_vector_free( singular_values );
     }
 
-    if (localA == NULL)
+    if (localA == NULL) {
+      clock_gettime( CLOCK_MONOTONIC , &start_time );
       analysis_module_initX( module , X , NULL , S , R , dObs , E , D, enkf_main->shared_rng);
+      timing->initX += enkf_main_elapsed_time( &start_time );
+    }
 
 
     while (!hash_iter_is_complete( dataset_iter )) {
       const char * dataset_name = hash_iter_get_next_key( dataset_iter );
       const local_dataset_type * dataset = local_ministep_get_dataset( ministep , dataset_name );
-      if (local_dataset_get_size( dataset )) {
+      if (local_dataset_get_size( dataset ) && (block_rows > 0))
+        enkf_main_update_dataset_blocked( enkf_main_get_ensemble_config(enkf_main) , dataset , step2 , X , block_rows , tp , serialize_info , timing );
+      else if (local_dataset_get_size( dataset )) {
         int * active_size = (int *)util_calloc( local_dataset_get_size( dataset ) , sizeof * active_size );
         int * row_offset = (int *)util_calloc( local_dataset_get_size( dataset ) , sizeof * row_offset  );
         local_obsdata_type   * local_obsdata = local_ministep_get_obsdata( ministep );
@@ -1159,28 +1332,38 @@ static void enkf_main_analysis_update( enkf_main_type * enkf_main ,
         // The enkf_main_serialize_dataset() function will query the storage
         // layer and fetch data which is serialized into the A matrix which is
         // buried deep into the serialize_info structure.
+        clock_gettime( CLOCK_MONOTONIC , &start_time );
         enkf_main_serialize_dataset(enkf_main_get_ensemble_config(enkf_main), dataset , step2 ,  use_count , active_size , row_offset , tp , serialize_info);
+        timing->serialize += enkf_main_elapsed_time( &start_time );
         module_info_type * module_info = enkf_main_module_info_alloc(ministep, obs_data, dataset, local_obsdata, active_size , row_offset);
 
         if (analysis_module_check_option( module , ANALYSIS_UPDATE_A)){
+          clock_gettime( CLOCK_MONOTONIC , &start_time );
           if (analysis_module_check_option( module , ANALYSIS_ITERABLE)){
             analysis_module_updateA( module , localA , S , R , dObs , E , D , module_info, enkf_main->shared_rng);
           }
           else
             analysis_module_updateA( module , localA , S , R , dObs , E , D , module_info, enkf_main->shared_rng);
+          timing->matmul += enkf_main_elapsed_time( &start_time );
         }
         else {
           if (analysis_module_check_option( module , ANALYSIS_USE_A)){
+            clock_gettime( CLOCK_MONOTONIC , &start_time );
             analysis_module_initX( module , X , localA , S , R , dObs , E , D, enkf_main->shared_rng);
+            timing->initX += enkf_main_elapsed_time( &start_time );
           }
 
+          clock_gettime( CLOCK_MONOTONIC , &start_time );
           matrix_inplace_matmul_mt2( A , X , tp );
+          timing->matmul += enkf_main_elapsed_time( &start_time );
         }
 
         // The enkf_main_deserialize_dataset() function will dismantle the A
         // matrix from the serialize_info structure and distribute that content
         // over to enkf_node instances and eventually the storage layer.
+        clock_gettime( CLOCK_MONOTONIC , &start_time );
         enkf_main_deserialize_dataset( enkf_main_get_ensemble_config( enkf_main ) , dataset , active_size , row_offset , serialize_info , tp);
+        timing->deserialize += enkf_main_elapsed_time( &start_time );
 
         free( active_size );
         free( row_offset );
@@ -1203,6 +1386,7 @@ static void enkf_main_analysis_update( enkf_main_type * enkf_main ,
   matrix_free( dObs );
   matrix_free( X );
   matrix_free( A );
+  thread_pool_free( tp );
 }
 
 
@@ -1353,7 +1537,7 @@ void enkf_main_isubmit_job( enkf_main_type * enkf_main , run_arg_type * run_arg
 
 }
 
-void * enkf_main_icreate_run_path( enkf_main_type * enkf_main, run_arg_type * run_arg, init_mode_type init_mode) {
+static void enkf_main_icreate_run_path__( enkf_main_type * enkf_main, run_arg_type * run_arg, init_mode_type init_mode, bool write_parameters) {
   {
     runpath_list_type * runpath_list = enkf_main_get_runpath_list(enkf_main);
     runpath_list_add( runpath_list ,
@@ -1373,8 +1557,14 @@ void * enkf_main_icreate_run_path( enkf_main_type * enkf_main, run_arg_type * ru
     stringlist_free( param_list );
   }
 
-  enkf_state_init_eclipse( enkf_main->res_config,
-                           run_arg );
+  enkf_state_init_eclipse__( enkf_main->res_config,
+                             run_arg,
+                             write_parameters );
+}
+
+
+void * enkf_main_icreate_run_path( enkf_main_type * enkf_main, run_arg_type * run_arg, init_mode_type init_mode) {
+  enkf_main_icreate_run_path__( enkf_main , run_arg , init_mode , true );
 
   runpath_list_type * runpath_list = enkf_main_get_runpath_list(enkf_main);
   runpath_list_fprintf( runpath_list );
@@ -1382,16 +1572,36 @@ void * enkf_main_icreate_run_path( enkf_main_type * enkf_main, run_arg_type * ru
 }
 
 
+/*
+  The parameter files of all the realizations are written in one go
+  after the rest of the runpath content; with the GEN_KW templates
+  parsed once and the realizations written in parallel, see
+  enkf_state_ecl_write_ensemble(). The runpath list file is also only
+  written once.
+*/
+
 static void * enkf_main_create_run_path__( enkf_main_type * enkf_main,
                                            const ert_run_context_type * run_context) {
 
+  int num_active = 0;
   int iens;
   for (iens = 0; iens < ert_run_context_get_size( run_context ); iens++) {
     if (ert_run_context_iactive( run_context , iens)) {
       run_arg_type * run_arg = ert_run_context_iget_arg( run_context , iens);
-      enkf_main_icreate_run_path(enkf_main, run_arg, INIT_NONE);
+      enkf_main_icreate_run_path__(enkf_main, run_arg, INIT_NONE, false);
+      num_active++;
     }
   }
+
+  if (num_active > 0) {
+    enkf_state_ecl_write_ensemble( enkf_main_get_ensemble_config( enkf_main ),
+                                   enkf_main_get_model_config( enkf_main ),
+                                   run_context,
+                                   enkf_main_get_cpu_threads( enkf_main ));
+
+    runpath_list_type * runpath_list = enkf_main_get_runpath_list(enkf_main);
+    runpath_list_fprintf( runpath_list );
+  }
   return NULL;
 }
 
@@ -2293,12 +2503,24 @@ int enkf_main_load_from_forward_model_with_fs(enkf_main_type * enkf_main, int it
 
 
 int enkf_main_load_from_run_context_from_gui(enkf_main_type* enkf_main, ert_run_context_type* run_context, enkf_fs_type* fs) {
+   return enkf_main_load_from_run_context_with_scheduler(enkf_main, run_context, fs, NULL);
+}
+
+
+/*
+  As enkf_main_load_from_run_context_from_gui(), but the loading is
+  scheduled by @scheduler - which can be queried from another thread
+  for progress and timings while loading. If @scheduler is NULL one is
+  allocated from the LOAD_IO_THREADS and LOAD_CPU_THREADS settings.
+*/
+
+int enkf_main_load_from_run_context_with_scheduler(enkf_main_type* enkf_main, ert_run_context_type* run_context, enkf_fs_type* fs, load_scheduler_type * scheduler) {
    auto const ens_size = enkf_main_get_ensemble_size(enkf_main);
    stringlist_type ** realizations_msg_list = (stringlist_type **) util_calloc(ens_size, sizeof *realizations_msg_list); // CXX_CAST_ERROR
    for(int iens = 0; iens < ens_size; ++iens)
       realizations_msg_list[iens] = stringlist_alloc_new();
 
-   int loaded = enkf_main_load_from_run_context(enkf_main, run_context, realizations_msg_list, fs);
+   int loaded = enkf_main_load_from_run_context__(enkf_main, run_context, realizations_msg_list, fs, scheduler);
 
    for(int iens = 0; iens < ens_size; ++iens)
       stringlist_free(realizations_msg_list[iens]);
@@ -2306,17 +2528,73 @@ int enkf_main_load_from_run_context_from_gui(enkf_main_type* enkf_main, ert_run_
    return loaded;
 }
 
+
+/*
+  The number of threads used for CPU bound work over the whole
+  ensemble, e.g. internalizing results, evaluating the misfit or
+  writing the parameter files to the runpaths; LOAD_CPU_THREADS in the
+  config, by default one per available core.
+*/
+
+int enkf_main_get_cpu_threads( const enkf_main_type * enkf_main ) {
+  int cpu_threads = model_config_get_load_cpu_threads( enkf_main_get_model_config( enkf_main ));
+  if (cpu_threads <= 0)
+    cpu_threads = std::thread::hardware_concurrency();
+
+  return util_int_max( 1 , cpu_threads );
+}
+
+
+/*
+  The number of realizations reading results, and internalizing them,
+  at the same time; LOAD_IO_THREADS and LOAD_CPU_THREADS in the config,
+  by default one per available core.
+*/
+
+load_scheduler_type * enkf_main_alloc_load_scheduler( const enkf_main_type * enkf_main ) {
+  const model_config_type * model_config = enkf_main_get_model_config( enkf_main );
+  int io_threads  = model_config_get_load_io_threads( model_config );
+
+  if (io_threads <= 0)
+    io_threads = std::thread::hardware_concurrency();
+
+  return load_scheduler_alloc( enkf_main_get_ensemble_size( enkf_main ) ,
+                               util_int_max( 1 , io_threads ) ,
+                               enkf_main_get_cpu_threads( enkf_main ));
+}
+
+
 int enkf_main_load_from_run_context(
       enkf_main_type * enkf_main,
       ert_run_context_type * run_context,
       stringlist_type ** realizations_msg_list,
       enkf_fs_type * fs) {
+   return enkf_main_load_from_run_context__( enkf_main , run_context , realizations_msg_list , fs , NULL );
+}
+
+
+static int enkf_main_load_from_run_context__(
+      enkf_main_type * enkf_main,
+      ert_run_context_type * run_context,
+      stringlist_type ** realizations_msg_list,
+      enkf_fs_type * fs,
+      load_scheduler_type * scheduler) {
    auto const ens_size = enkf_main_get_ensemble_size( enkf_main );
    auto const * iactive = ert_run_context_get_iactive(run_context);
+   load_scheduler_type * own_scheduler = NULL;
+
+   if (scheduler == NULL) {
+     own_scheduler = enkf_main_alloc_load_scheduler( enkf_main );
+     scheduler = own_scheduler;
+   } else
+     load_scheduler_reset( scheduler );
 
    int result[ens_size];
    arg_pack_type ** arg_list = (arg_pack_type **) util_calloc( ens_size , sizeof * arg_list ); // CXX_CAST_ERROR
-   thread_pool_type * tp     = thread_pool_alloc( std::thread::hardware_concurrency() , true );
+   thread_pool_type * tp     = thread_pool_alloc( load_scheduler_get_num_threads( scheduler ) , true );
+   summary_load_cache_type * cache = summary_load_cache_alloc( );
+   struct timespec start_time;
+   clock_gettime( CLOCK_MONOTONIC , &start_time );
 
    for (int iens = 0; iens < ens_size; ++iens) {
      result[iens] = 0;
@@ -2330,6 +2608,9 @@ int enkf_main_load_from_run_context(
        arg_pack_append_ptr(arg_pack, realizations_msg_list[iens]);                          /* 2: List of interactive mode messages. */
        arg_pack_append_bool( arg_pack, true );                                              /* 3: Manual load */
        arg_pack_append_ptr(arg_pack, &result[iens]);                                        /* 4: Result */
+       arg_pack_append_ptr(arg_pack, scheduler);                                            /* 5: load_scheduler */
+       arg_pack_append_ptr(arg_pack, cache);                                                /* 6: summary_load_cache */
+       load_scheduler_add_job( scheduler , iens );
        thread_pool_add_job( tp , enkf_state_load_from_forward_model_mt , arg_pack);
      }
    }
@@ -2346,10 +2627,29 @@ int enkf_main_load_from_run_context(
          fprintf(stderr, "** Warning: Function %s: Realization %d report step incompatible\n", __func__, iens);
        else
          loaded++;
+
+       res_log_fdebug("[%03d] Load time: %.3f s reading results, %.3f s internalizing.",
+                      iens,
+                      load_scheduler_iget_io_time( scheduler , iens ),
+                      load_scheduler_iget_cpu_time( scheduler , iens ));
      }
      arg_pack_free(arg_list[iens]);
    }
+   res_log_finfo("Loaded %d of %d realizations in %.3f s with %d io and %d cpu threads.",
+                 loaded,
+                 load_scheduler_get_num_jobs( scheduler ),
+                 enkf_main_elapsed_time( &start_time ),
+                 load_scheduler_get_io_threads( scheduler ),
+                 load_scheduler_get_cpu_threads( scheduler ));
+
+   res_log_fdebug("Summary load cache: %d layouts and %d time indices.",
+                  summary_load_cache_get_num_layouts( cache ),
+                  summary_load_cache_get_num_time_indices( cache ));
+
    free( arg_list );
+   summary_load_cache_free( cache );
+   if (own_scheduler != NULL)
+     load_scheduler_free( own_scheduler );
    return loaded;
 }
 
@@ -2446,7 +2746,8 @@ void enkf_main_rank_on_observations(enkf_main_type * enkf_main,
   const int ens_size                           = enkf_main_get_ensemble_size( enkf_main );
 
   misfit_ensemble_type * misfit_ensemble = enkf_fs_get_misfit_ensemble( fs );
-  misfit_ensemble_initialize( misfit_ensemble , ensemble_config , enkf_obs , fs , ens_size , history_length, false);
+  misfit_ensemble_initialize( misfit_ensemble , ensemble_config , enkf_obs , fs , ens_size , history_length, false,
+                              enkf_main_get_cpu_threads( enkf_main ));
 
   ranking_table_type * ranking_table = enkf_main_get_ranking_table( enkf_main );
 
@@ -403,7 +403,8 @@ void * enkf_main_init_misfit_table_JOB(void * self, const stringlist_type * args
 
 
   misfit_ensemble_type * misfit_ensemble = enkf_fs_get_misfit_ensemble( fs );
-  misfit_ensemble_initialize( misfit_ensemble , ensemble_config , enkf_obs , fs , ens_size , history_length, force_update);
+  misfit_ensemble_initialize( misfit_ensemble , ensemble_config , enkf_obs , fs , ens_size , history_length, force_update,
+                              enkf_main_get_cpu_threads( enkf_main ));
 
   return NULL;
 }
@@ -236,17 +236,25 @@ void enkf_main_init_case_from_existing(const enkf_main_type * enkf_main,
                                        enkf_fs_type * target_case_fs ) {
 
   stringlist_type * param_list = ensemble_config_alloc_keylist_from_var_type( enkf_main_get_ensemble_config(enkf_main) , PARAMETER ); /* Select only paramters - will fail for GEN_DATA of type DYNAMIC_STATE. */
-  int target_report_step  = 0;
-  bool_vector_type * iactive = bool_vector_alloc( 0 , true );
+  const int ens_size = enkf_main_get_ensemble_size( enkf_main );
+  bool_vector_type * iactive = bool_vector_alloc( ens_size , true );
 
-  enkf_main_copy_ensemble(enkf_main,
-                          source_case_fs,
-                          source_report_step,
-                          target_case_fs,
-                          target_report_step,
-                          iactive,
-                          NULL,
-                          param_list);
+  /*
+    Parameters are only stored at report step 0, and the realizations
+    are not permuted; the nodes can then be copied as raw buffers
+    through the copy-on-write sharing in enkf_fs, without loading and
+    storing every node.
+  */
+  if (source_case_fs != target_case_fs) {
+    enkf_fs_share_parameters( target_case_fs , source_case_fs , param_list , iactive );
+    enkf_fs_unshare_parameters( target_case_fs );
+
+    if (stringlist_get_size( param_list ) > 0) {
+      state_map_type * target_state_map = enkf_fs_get_state_map( target_case_fs );
+      for (int iens = 0; iens < ens_size; iens++)
+        state_map_iset( target_state_map , iens , STATE_INITIALIZED );
+    }
+  }
 
 
   enkf_fs_fsync(target_case_fs);
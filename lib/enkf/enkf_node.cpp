@@ -245,6 +245,18 @@ bool enkf_node_vector_storage( const enkf_node_type * node ) {
 }
 
 
+/*
+  For a node with vector storage which has already been loaded with
+  enkf_node_try_load_vector(): checks whether the vector has data for
+  @report_step, without going to storage again.
+*/
+
+bool enkf_node_vector_has_step( const enkf_node_type * node , int report_step ) {
+  FUNC_ASSERT(node->has_data);
+  return node->has_data( node->data , report_step );
+}
+
+
 /*****************************************************************/
 
 /*
@@ -473,6 +485,19 @@ bool enkf_node_store_vector(enkf_node_type *enkf_node , enkf_fs_type * fs , int
 }
 
 
+/*
+  Serializes a node with vector storage to @buffer in the format used
+  by enkf_node_store_vector(), without writing it to storage; this is
+  used to collect many vectors in one vector_block.
+*/
+
+bool enkf_node_fwrite_vector_buffer(enkf_node_type *enkf_node , buffer_type * buffer ) {
+  FUNC_ASSERT(enkf_node->write_to_buffer);
+  buffer_fwrite_time_t( buffer , time(NULL));
+  return enkf_node->write_to_buffer(enkf_node->data , buffer , -1 );
+}
+
+
 
 bool enkf_node_store(enkf_node_type * enkf_node , enkf_fs_type * fs , bool force_vectors , node_id_type node_id) {
   if (enkf_node->vector_storage) {
@@ -515,20 +540,20 @@ bool enkf_node_try_load(enkf_node_type *enkf_node , enkf_fs_type * fs , node_id_
 static void enkf_node_buffer_load( enkf_node_type * enkf_node , enkf_fs_type * fs , int report_step , int iens) {
   FUNC_ASSERT(enkf_node->read_from_buffer);
   {
-    buffer_type * buffer                      = buffer_alloc( 100 );
     const enkf_config_node_type * config_node = enkf_node_get_config( enkf_node );
     const char * node_key                     = enkf_config_node_get_key( config_node );
     enkf_var_type var_type                    = enkf_config_node_get_var_type( config_node );
+    buffer_type * buffer;
 
     if (enkf_node->vector_storage)
-      enkf_fs_fread_vector( fs , buffer , node_key , var_type , iens );
+      buffer = enkf_fs_alloc_vector_view( fs , node_key , var_type , iens );
     else
-      enkf_fs_fread_node( fs , buffer , node_key , var_type , report_step , iens );
+      buffer = enkf_fs_alloc_node_view( fs , node_key , var_type , report_step , iens );
 
     buffer_fskip_time_t( buffer );
 
     enkf_node->read_from_buffer(enkf_node->data , buffer , fs , report_step );
-    buffer_free( buffer );
+    enkf_fs_free_view( fs , buffer , node_key , var_type , iens );
   }
 }
 
@@ -540,6 +565,13 @@ void enkf_node_load_vector( enkf_node_type * enkf_node , enkf_fs_type * fs , int
 }
 
 
+void enkf_node_fread_vector_buffer( enkf_node_type * enkf_node , enkf_fs_type * fs , buffer_type * buffer ) {
+  FUNC_ASSERT(enkf_node->read_from_buffer);
+  buffer_fskip_time_t( buffer );
+  enkf_node->read_from_buffer(enkf_node->data , buffer , fs , -1 );
+}
+
+
 
 static void enkf_node_load_container( enkf_node_type * enkf_node , enkf_fs_type * fs , node_id_type node_id ) {
   for (int inode=0; inode < vector_get_size( enkf_node->container_nodes ); inode++) {
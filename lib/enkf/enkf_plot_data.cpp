@@ -17,14 +17,18 @@
 */
 #include <time.h>
 #include <stdbool.h>
+#include <cmath>
 
 #include <ert/util/double_vector.h>
+#include <ert/util/int_vector.h>
 #include <ert/util/vector.h>
 #include <ert/util/type_macros.h>
 
 #include <ert/res_util/thread_pool.hpp>
 
 #include <ert/enkf/enkf_fs.hpp>
+#include <ert/enkf/enkf_node.hpp>
+#include <ert/enkf/summary.hpp>
 #include <ert/enkf/enkf_plot_tvector.hpp>
 #include <ert/enkf/enkf_plot_data.hpp>
 #include <ert/enkf/state_map.hpp>
@@ -150,3 +154,46 @@ void enkf_plot_data_load( enkf_plot_data_type * plot_data ,
 }
 
 
+/*
+  Bulk loader for summary data which bypasses the per-value access of
+  the enkf_plot_tvector instances. The data for realization
+  int_vector_iget(realizations, i) is written to the row
+
+     data[i * num_steps : (i + 1) * num_steps]
+
+  of the caller supplied buffer, i.e. the buffers should be laid out
+  as a row major [num_realizations x num_steps] array. The active
+  buffer is filled with the corresponding mask; realizations without
+  stored data are completely inactive, and all inactive elements in
+  the data buffer are set to NAN.
+*/
+
+void enkf_plot_data_load_summary_buffer( const enkf_config_node_type * config_node ,
+                                         enkf_fs_type * fs ,
+                                         const int_vector_type * realizations ,
+                                         int step1 ,
+                                         int num_steps ,
+                                         double * data ,
+                                         bool * active) {
+  if (enkf_config_node_get_impl_type( config_node ) != SUMMARY)
+    util_abort("%s: internal error - function can only be used for SUMMARY nodes.\n",__func__);
+
+  {
+    enkf_node_type * work_node = enkf_node_alloc( config_node );
+    for (int index = 0; index < int_vector_size( realizations ); index++) {
+      int iens = int_vector_iget( realizations , index );
+      double * row_data = &data[ index * num_steps ];
+      bool * row_active = &active[ index * num_steps ];
+
+      if (enkf_node_try_load_vector( work_node , fs , iens ))
+        summary_export_values( (const summary_type *) enkf_node_value_ptr( work_node ) , step1 , num_steps , row_data , row_active );
+      else {
+        for (int step = 0; step < num_steps; step++) {
+          row_data[step] = NAN;
+          row_active[step] = false;
+        }
+      }
+    }
+    enkf_node_free( work_node );
+  }
+}
@@ -29,10 +29,12 @@
 #include <ert/util/hash.h>
 #include <ert/util/util.h>
 #include <ert/res_util/arg_pack.hpp>
+#include <ert/res_util/thread_pool.hpp>
 #include <ert/util/stringlist.h>
 #include <ert/util/node_ctype.h>
 #include <ert/util/timer.h>
 #include <ert/util/time_t_vector.h>
+#include <ert/util/vector.h>
 #include <ert/util/rng.h>
 #include <ert/res_util/subst_list.hpp>
 
@@ -59,6 +61,9 @@
 #include <ert/enkf/field_config.hpp>
 #include <ert/enkf/gen_kw.hpp>
 #include <ert/enkf/summary.hpp>
+#include <ert/enkf/vector_block.hpp>
+#include <ert/enkf/load_scheduler.hpp>
+#include <ert/enkf/summary_load_cache.hpp>
 #include <ert/enkf/gen_data.hpp>
 #include <ert/enkf/enkf_fs.hpp>
 #include <ert/enkf/ensemble_config.hpp>
@@ -70,6 +75,7 @@
 #include <ert/enkf/state_map.hpp>
 #include <ert/res_util/res_log.hpp>
 #include <ert/enkf/run_arg.hpp>
+#include <ert/enkf/ert_run_context.hpp>
 #include <ert/enkf/summary_key_matcher.hpp>
 #include <ert/enkf/forward_load_context.hpp>
 #include <ert/enkf/enkf_config_node.hpp>
@@ -368,9 +374,16 @@ static void enkf_state_check_for_missing_eclipse_summary_data(const ensemble_con
   stringlist_free(keys);
 }
 
+/*
+  The @cache is optional; when it is given the matching of the summary
+  keys and the time index are shared with the other realizations
+  loaded with the same cache.
+*/
+
 static bool enkf_state_internalize_dynamic_eclipse_results(ensemble_config_type * ens_config,
                                                            forward_load_context_type * load_context ,
-                                                           const model_config_type * model_config) {
+                                                           const model_config_type * model_config,
+                                                           summary_load_cache_type * cache) {
 
   bool load_summary = ensemble_config_has_impl_type(ens_config, SUMMARY);
   const run_arg_type * run_arg = forward_load_context_get_run_arg( load_context );
@@ -389,7 +402,11 @@ static bool enkf_state_internalize_dynamic_eclipse_results(ensemble_config_type
       enkf_fs_type * sim_fs = run_arg_get_sim_fs( run_arg );
       /** OK - now we have actually loaded the ecl_sum instance, or ecl_sum == NULL. */
       if (summary) {
-        int_vector_type * time_index = __enkf_state_get_time_index(sim_fs, summary);
+        int_vector_type * time_index;
+        if (cache)
+          time_index = summary_load_cache_alloc_time_index( cache , enkf_fs_get_time_map( sim_fs ) , summary );
+        else
+          time_index = __enkf_state_get_time_index(sim_fs, summary);
 
         /*
           Now there are two related / conflicting(?) systems for
@@ -412,25 +429,66 @@ static bool enkf_state_internalize_dynamic_eclipse_results(ensemble_config_type
 
         const ecl_smspec_type * smspec = ecl_sum_get_smspec(summary);
 
-        for(int i = 0; i < ecl_smspec_num_nodes(smspec); i++) {
-          const ecl::smspec_node& smspec_node = ecl_smspec_iget_node_w_node_index(smspec, i);
+        /*
+          All the summary vectors of the realization are collected in
+          one vector_block, which is read and written as one record.
+        */
+        vector_block_type * stored_block = enkf_fs_alloc_vector_block( sim_fs , iens );
+        vector_block_type * block = vector_block_alloc( );
+        buffer_type * buffer = buffer_alloc( 1024 );
+        const int_vector_type * matched_nodes = NULL;
+        int num_nodes = ecl_smspec_num_nodes(smspec);
+
+        if (cache) {
+          matched_nodes = summary_load_cache_get_matched_nodes( cache , smspec , matcher );
+          num_nodes = int_vector_size( matched_nodes );
+        }
+
+        for(int i = 0; i < num_nodes; i++) {
+          int node_index = matched_nodes ? int_vector_iget( matched_nodes , i ) : i;
+          const ecl::smspec_node& smspec_node = ecl_smspec_iget_node_w_node_index(smspec, node_index);
           const char * key = smspec_node.get_gen_key1();
 
-          if(summary_key_matcher_match_summary_key(matcher, key)) {
+          if((matched_nodes || summary_key_matcher_match_summary_key(matcher, key)) && !vector_block_has_key(block, key)) {
             summary_key_set_type * key_set = enkf_fs_get_summary_key_set(sim_fs);
             summary_key_set_add_summary_key(key_set, key);
 
             enkf_config_node_type * config_node = ensemble_config_get_or_create_summary_node(ens_config, key);
             enkf_node_type * node = enkf_node_alloc( config_node );
 
-            enkf_node_try_load_vector( node , sim_fs , iens );  // Ensure that what is currently on file is loaded before we update.
+            // Ensure that what is currently on file is loaded before we update.
+            if (stored_block != NULL && vector_block_has_key( stored_block , key )) {
+              vector_block_copy_buffer( stored_block , key , buffer );
+              enkf_node_fread_vector_buffer( node , sim_fs , buffer );
+            } else
+              enkf_node_try_load_vector( node , sim_fs , iens );
 
             enkf_node_forward_load_vector( node , load_context , time_index);
-            enkf_node_store_vector( node , sim_fs , iens );
+
+            buffer_clear( buffer );
+            if (enkf_node_fwrite_vector_buffer( node , buffer ))
+              vector_block_add( block , key , buffer );
             enkf_node_free( node );
           }
         }
 
+        /* Vectors stored earlier which are not in this summary are kept. */
+        if (stored_block != NULL) {
+          for (int i = 0; i < vector_block_get_size( stored_block ); i++) {
+            const char * key = vector_block_iget_key( stored_block , i );
+            if (!vector_block_has_key( block , key )) {
+              vector_block_copy_buffer( stored_block , key , buffer );
+              vector_block_add( block , key , buffer );
+            }
+          }
+          vector_block_free( stored_block );
+        }
+
+        if (vector_block_get_size( block ) > 0)
+          enkf_fs_fwrite_vector_block( sim_fs , block , iens );
+
+        buffer_free( buffer );
+        vector_block_free( block );
         int_vector_free( time_index );
 
         /*
@@ -624,11 +682,10 @@ static forward_load_context_type * enkf_state_alloc_load_context(const ensemble_
 */
 static int enkf_state_internalize_results(ensemble_config_type * ens_config,
                                           model_config_type * model_config,
-                                          const ecl_config_type * ecl_config,
-                                          const run_arg_type * run_arg,
-                                          stringlist_type * msg_list) {
+                                          forward_load_context_type * load_context,
+                                          summary_load_cache_type * cache) {
 
-  forward_load_context_type * load_context = enkf_state_alloc_load_context( ens_config, ecl_config, run_arg, msg_list);
+  const run_arg_type * run_arg = forward_load_context_get_run_arg( load_context );
   /*
     The timing information - i.e. mainly what is the last report step
     in these results are inferred from the loading of summary results,
@@ -637,7 +694,8 @@ static int enkf_state_internalize_results(ensemble_config_type * ens_config,
 
   enkf_state_internalize_dynamic_eclipse_results(ens_config,
                                                  load_context ,
-                                                 model_config);
+                                                 model_config,
+                                                 cache);
 
   enkf_fs_type * sim_fs = run_arg_get_sim_fs( run_arg );
   int last_report = time_map_get_last_step( enkf_fs_get_time_map( sim_fs ));
@@ -651,29 +709,48 @@ static int enkf_state_internalize_results(ensemble_config_type * ens_config,
   enkf_state_internalize_GEN_DATA(ens_config , load_context , model_config , last_report);
   enkf_state_internalize_custom_kw(ens_config, load_context , model_config);
 
-  int result = forward_load_context_get_result(load_context);
-  forward_load_context_free( load_context );
-  return result;
+  return forward_load_context_get_result(load_context);
 }
 
 
 
 
 
+/*
+  The loading is split in two phases, reading the results from the
+  runpath and internalizing them in the storage; the @scheduler, which
+  can be NULL, limits how many realizations are in each phase at the
+  same time. The @cache, which can also be NULL, is shared by all the
+  realizations loaded together.
+*/
+
 static int enkf_state_load_from_forward_model__(ensemble_config_type * ens_config,
                                                 model_config_type * model_config,
                                                 const ecl_config_type * ecl_config,
                                                 const run_arg_type * run_arg ,
-                                                stringlist_type * msg_list) {
+                                                stringlist_type * msg_list,
+                                                load_scheduler_type * scheduler,
+                                                summary_load_cache_type * cache) {
 
   int result = 0;
+  int iens = run_arg_get_iens( run_arg );
+  forward_load_context_type * load_context;
 
-  if (ensemble_config_have_forward_init( ens_config ))
-    result |= ensemble_config_forward_init( ens_config , run_arg );
+  load_scheduler_begin_io( scheduler , iens );
+  {
+    if (ensemble_config_have_forward_init( ens_config ))
+      result |= ensemble_config_forward_init( ens_config , run_arg );
+
+    load_context = enkf_state_alloc_load_context( ens_config, ecl_config, run_arg, msg_list);
+  }
+  load_scheduler_end_io( scheduler , iens );
+
+  load_scheduler_begin_cpu( scheduler , iens );
+  result |= enkf_state_internalize_results( ens_config, model_config, load_context, cache );
+  load_scheduler_end_cpu( scheduler , iens );
+  forward_load_context_free( load_context );
 
-  result |= enkf_state_internalize_results( ens_config, model_config, ecl_config, run_arg , msg_list );
   state_map_type * state_map = enkf_fs_get_state_map( run_arg_get_sim_fs( run_arg ) );
-  int iens = run_arg_get_iens( run_arg );
   if (result & LOAD_FAILURE)
     state_map_iset( state_map , iens , STATE_LOAD_FAILURE);
   else
@@ -690,7 +767,7 @@ int enkf_state_load_from_forward_model(enkf_state_type * enkf_state ,
   model_config_type * model_config = enkf_state->shared_info->model_config;
   const ecl_config_type * ecl_config = enkf_state->shared_info->ecl_config;
 
-  return enkf_state_load_from_forward_model__( ens_config, model_config, ecl_config, run_arg, msg_list);
+  return enkf_state_load_from_forward_model__( ens_config, model_config, ecl_config, run_arg, msg_list, NULL, NULL);
 }
 
 
@@ -707,16 +784,31 @@ void * enkf_state_load_from_forward_model_mt( void * arg ) {
   bool manual_load             = arg_pack_iget_bool( arg_pack , 3 );
   int * result                 = (int * ) arg_pack_iget_ptr( arg_pack  , 4 );
   int iens                     = run_arg_get_iens( run_arg );
+  load_scheduler_type * scheduler = NULL;                       /* Optional */
+  summary_load_cache_type * cache = NULL;                       /* Optional */
+
+  if (arg_pack_size( arg_pack ) > 5)
+    scheduler = (load_scheduler_type * ) arg_pack_iget_ptr( arg_pack , 5 );
+
+  if (arg_pack_size( arg_pack ) > 6)
+    cache = (summary_load_cache_type * ) arg_pack_iget_ptr( arg_pack , 6 );
 
   if (manual_load)
     state_map_update_undefined(enkf_fs_get_state_map( run_arg_get_sim_fs(run_arg) ) , iens , STATE_INITIALIZED);
 
-  *result = enkf_state_load_from_forward_model( enkf_state , run_arg , msg_list );
+  *result = enkf_state_load_from_forward_model__( enkf_state->ensemble_config ,
+                                                  enkf_state->shared_info->model_config ,
+                                                  enkf_state->shared_info->ecl_config ,
+                                                  run_arg ,
+                                                  msg_list ,
+                                                  scheduler ,
+                                                  cache );
   if (*result & REPORT_STEP_INCOMPATIBLE) {
     // If refcase has been used for observations: crash and burn.
     fprintf(stderr,"** Warning the timesteps in refcase and current simulation are not in accordance - something wrong with schedule file?\n");
     *result -= REPORT_STEP_INCOMPATIBLE;
   }
+  load_scheduler_complete_job( scheduler , iens );
 
   return NULL;
 }
@@ -750,8 +842,9 @@ void enkf_state_free(enkf_state_type *enkf_state) {
    will become completely inconsistent. We just don't allow that!
 */
 
-void enkf_state_init_eclipse(const res_config_type * res_config,
-                             const run_arg_type * run_arg ) {
+void enkf_state_init_eclipse__(const res_config_type * res_config,
+                               const run_arg_type * run_arg,
+                               bool write_parameters) {
 
   ensemble_config_type * ens_config = res_config_get_ensemble_config(res_config);
   const ecl_config_type * ecl_config = res_config_get_ecl_config(res_config);
@@ -776,10 +869,11 @@ void enkf_state_init_eclipse(const res_config_type * res_config,
                             run_arg_get_runpath(run_arg),
                             run_arg_get_subst_list(run_arg));
 
-  enkf_state_ecl_write(ens_config,
-                       model_config,
-                       run_arg,
-                       run_arg_get_sim_fs(run_arg));
+  if (write_parameters)
+    enkf_state_ecl_write(ens_config,
+                         model_config,
+                         run_arg,
+                         run_arg_get_sim_fs(run_arg));
 
   /* Writing the ECLIPSE data file. */
   if (ecl_config_have_eclbase(ecl_config) && ecl_config_get_data_file(ecl_config)) {
@@ -811,6 +905,12 @@ void enkf_state_init_eclipse(const res_config_type * res_config,
 }
 
 
+void enkf_state_init_eclipse(const res_config_type * res_config,
+                             const run_arg_type * run_arg ) {
+  enkf_state_init_eclipse__(res_config, run_arg, true);
+}
+
+
 
 /**
     Observe that if run_arg == false, this routine will return with
@@ -843,6 +943,7 @@ static bool enkf_state_complete_forward_modelOK(const res_config_type * res_conf
                                                  model_config,
                                                  ecl_config,
                                                  run_arg,
+                                                 NULL,
                                                  NULL);
 
   if (result & REPORT_STEP_INCOMPATIBLE) {
@@ -975,16 +1076,14 @@ const ensemble_config_type * enkf_state_get_ensemble_config( const enkf_state_ty
 }
 
 
-/**
-  This function writes out all the files needed by an ECLIPSE simulation, this
-  includes the restart file, and the various INCLUDE files corresponding to
-  parameters estimated by EnKF.
-
-  The writing of restart file is delegated to enkf_state_write_restart_file().
+/*
+  If @templates is not NULL it should contain the gen_kw templates,
+  parsed with gen_kw_config_alloc_template(), of the GEN_KW nodes which
+  have one; these nodes are then written with the shared template
+  instead of reading the template file again.
 */
 
-// TODO: enkf_fs_type could be fetched from run_arg
-void enkf_state_ecl_write(const ensemble_config_type * ens_config, const model_config_type * model_config, const run_arg_type * run_arg , enkf_fs_type * fs) {
+static void enkf_state_ecl_write__(const ensemble_config_type * ens_config, const model_config_type * model_config, const run_arg_type * run_arg , enkf_fs_type * fs , const hash_type * templates) {
   /**
      This iteration manipulates the hash (thorugh the enkf_state_del_node() call)
 
@@ -998,7 +1097,8 @@ void enkf_state_ecl_write(const ensemble_config_type * ens_config, const model_c
 
   stringlist_type * key_list = ensemble_config_alloc_keylist_from_var_type( ens_config , PARAMETER + EXT_PARAMETER);
   for (int ikey = 0; ikey < stringlist_get_size( key_list ); ikey++) {
-    enkf_config_node_type * config_node = ensemble_config_get_node( ens_config, stringlist_iget( key_list , ikey));
+    const char * key = stringlist_iget( key_list , ikey );
+    enkf_config_node_type * config_node = ensemble_config_get_node( ens_config, key );
     enkf_node_type * enkf_node = enkf_node_alloc( config_node );
     bool forward_init = enkf_node_use_forward_init( enkf_node );
     node_id_type node_id = {.report_step = run_arg_get_step1(run_arg),
@@ -1008,12 +1108,25 @@ void enkf_state_ecl_write(const ensemble_config_type * ens_config, const model_c
 
       if (enkf_node_has_data( enkf_node , fs , node_id))
         enkf_node_load(enkf_node, fs, node_id);
-      else
+      else {
+        enkf_node_free(enkf_node);
         continue;
+      }
     } else
       enkf_node_load(enkf_node, fs, node_id);
 
-    enkf_node_ecl_write(enkf_node , run_arg_get_runpath( run_arg ) , export_value , run_arg_get_step1(run_arg));
+    if (templates && hash_has_key( templates , key )) {
+      const gen_kw_template_type * template_ = (const gen_kw_template_type *)hash_get( templates , key );
+      char * node_eclfile = enkf_config_node_alloc_outfile( config_node , run_arg_get_step1(run_arg));
+
+      gen_kw_ecl_write_with_template( (const gen_kw_type *)enkf_node_value_ptr( enkf_node ),
+                                      template_ ,
+                                      run_arg_get_runpath( run_arg ),
+                                      node_eclfile ,
+                                      export_value );
+      free( node_eclfile );
+    } else
+      enkf_node_ecl_write(enkf_node , run_arg_get_runpath( run_arg ) , export_value , run_arg_get_step1(run_arg));
     enkf_node_free(enkf_node);
   }
   value_export( export_value );
@@ -1023,4 +1136,93 @@ void enkf_state_ecl_write(const ensemble_config_type * ens_config, const model_c
 }
 
 
+/**
+  This function writes out all the files needed by an ECLIPSE simulation, this
+  includes the restart file, and the various INCLUDE files corresponding to
+  parameters estimated by EnKF.
+
+  The writing of restart file is delegated to enkf_state_write_restart_file().
+*/
+
+// TODO: enkf_fs_type could be fetched from run_arg
+void enkf_state_ecl_write(const ensemble_config_type * ens_config, const model_config_type * model_config, const run_arg_type * run_arg , enkf_fs_type * fs) {
+  enkf_state_ecl_write__(ens_config, model_config, run_arg, fs, NULL);
+}
+
+
+static void * enkf_state_ecl_write_mt( void * arg ) {
+  arg_pack_type * arg_pack = arg_pack_safe_cast( arg );
+  const ensemble_config_type * ens_config = (const ensemble_config_type *)arg_pack_iget_const_ptr( arg_pack , 0 );
+  const model_config_type * model_config  = (const model_config_type *)arg_pack_iget_const_ptr( arg_pack , 1 );
+  const run_arg_type * run_arg            = (const run_arg_type *)arg_pack_iget_const_ptr( arg_pack , 2 );
+  const hash_type * templates             = (const hash_type *)arg_pack_iget_const_ptr( arg_pack , 3 );
+
+  enkf_state_ecl_write__( ens_config , model_config , run_arg , run_arg_get_sim_fs( run_arg ) , templates );
+  return NULL;
+}
+
+
+/**
+  Writes the parameter files, i.e. what enkf_state_ecl_write() writes,
+  for all the active realizations in @run_context. The templates of the
+  GEN_KW nodes are parsed once for the whole ensemble, and the
+  realizations are written in parallel by @num_threads threads.
+
+  The runpath directories are created before the threads are started.
+*/
+
+void enkf_state_ecl_write_ensemble(const ensemble_config_type * ens_config,
+                                   const model_config_type * model_config,
+                                   const ert_run_context_type * run_context,
+                                   int num_threads) {
+  hash_type * templates = hash_alloc();
+  {
+    stringlist_type * key_list = ensemble_config_alloc_keylist_from_impl_type( ens_config , GEN_KW );
+    for (int ikey = 0; ikey < stringlist_get_size( key_list ); ikey++) {
+      const char * key = stringlist_iget( key_list , ikey );
+      const enkf_config_node_type * config_node = ensemble_config_get_node( ens_config , key );
+      const gen_kw_config_type * gen_kw_config = (const gen_kw_config_type *)enkf_config_node_get_ref( config_node );
+      gen_kw_template_type * template_ = gen_kw_config_alloc_template( gen_kw_config );
+
+      if (template_)
+        hash_insert_ref( templates , key , template_ );
+    }
+    stringlist_free( key_list );
+  }
+
+  {
+    thread_pool_type * tp = thread_pool_alloc( num_threads , true );
+    vector_type * arg_list = vector_alloc_new();
+
+    for (int iens = 0; iens < ert_run_context_get_size( run_context ); iens++) {
+      if (ert_run_context_iactive( run_context , iens )) {
+        run_arg_type * run_arg = ert_run_context_iget_arg( run_context , iens );
+        arg_pack_type * arg_pack = arg_pack_alloc();
+
+        util_make_path( run_arg_get_runpath( run_arg ));
+        arg_pack_append_const_ptr( arg_pack , ens_config );
+        arg_pack_append_const_ptr( arg_pack , model_config );
+        arg_pack_append_const_ptr( arg_pack , run_arg );
+        arg_pack_append_const_ptr( arg_pack , templates );
+        vector_append_owned_ref( arg_list , arg_pack , arg_pack_free__ );
+
+        thread_pool_add_job( tp , enkf_state_ecl_write_mt , arg_pack );
+      }
+    }
+
+    thread_pool_join( tp );
+    thread_pool_free( tp );
+    vector_free( arg_list );
+  }
+
+  {
+    hash_iter_type * iter = hash_iter_alloc( templates );
+    while (!hash_iter_is_complete( iter ))
+      gen_kw_template_free( (gen_kw_template_type *)hash_iter_get_next_value( iter ));
+    hash_iter_free( iter );
+  }
+  hash_free( templates );
+}
+
+
 #include "enkf_state_nodes.cpp"
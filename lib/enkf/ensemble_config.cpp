@@ -113,6 +113,8 @@ struct ensemble_config_struct {
   field_trans_table_type                       * field_trans_table;      /* a table of the transformations which are available to apply on fields. */
   bool                                           have_forward_init;
   summary_key_matcher_type                     * summary_key_matcher;
+  storage_codec_enum                             storage_codec;          /* The default codec for storing FIELD and GEN_DATA nodes. */
+  int                                            storage_level;
 };
 
 
@@ -169,6 +171,60 @@ const char * ensemble_config_get_gen_kw_format( const ensemble_config_type * ens
 }
 
 
+static void ensemble_config_update_storage_codec( enkf_config_node_type * config_node , storage_codec_enum codec , int level) {
+  ert_impl_type impl_type = enkf_config_node_get_impl_type( config_node );
+
+  if (impl_type == FIELD)
+    field_config_set_storage_codec( (field_config_type *) enkf_config_node_get_ref( config_node ) , codec , level );
+  else if (impl_type == GEN_DATA)
+    gen_data_config_set_storage_codec( (gen_data_config_type *) enkf_config_node_get_ref( config_node ) , codec , level );
+}
+
+
+/*
+  Sets the codec used when the FIELD and GEN_DATA nodes are stored;
+  nodes which are configured with a COMPRESSION option of their own
+  are also updated.
+*/
+
+void ensemble_config_set_storage_codec( ensemble_config_type * ensemble_config , storage_codec_enum codec , int level) {
+  ensemble_config->storage_codec = codec;
+  ensemble_config->storage_level = level;
+  for (auto& config_pair : ensemble_config->config_nodes)
+    ensemble_config_update_storage_codec( config_pair.second , codec , level );
+}
+
+
+storage_codec_enum ensemble_config_get_storage_codec( const ensemble_config_type * ensemble_config ) {
+  return ensemble_config->storage_codec;
+}
+
+
+int ensemble_config_get_storage_level( const ensemble_config_type * ensemble_config ) {
+  return ensemble_config->storage_level;
+}
+
+
+/*
+  Applies the COMPRESSION:<codec> option given for one FIELD, GEN_DATA
+  or GEN_PARAM node.
+*/
+
+static void ensemble_config_set_node_storage_codec( enkf_config_node_type * config_node , const char * codec_string) {
+  storage_codec_enum codec;
+  int level;
+
+  if (codec_string == NULL)
+    return;
+
+  if (storage_codec_parse( codec_string , &codec , &level ))
+    ensemble_config_update_storage_codec( config_node , codec , level );
+  else
+    fprintf(stderr,"** Warning: invalid %s:%s for %s - using the default codec \n",
+            COMPRESSION_KEY , codec_string , enkf_config_node_get_key( config_node ));
+}
+
+
 static ensemble_config_type * ensemble_config_alloc_empty(void) {
   ensemble_config_type * ensemble_config = new ensemble_config_type();
 
@@ -177,6 +233,7 @@ static ensemble_config_type * ensemble_config_alloc_empty(void) {
   ensemble_config->gen_kw_format_string  = util_alloc_string_copy( DEFAULT_GEN_KW_TAG_FORMAT );
   ensemble_config->have_forward_init     = false;
   ensemble_config->summary_key_matcher   = summary_key_matcher_alloc();
+  storage_codec_parse( DEFAULT_STORAGE_COMPRESSION , &ensemble_config->storage_codec , &ensemble_config->storage_level );
   pthread_mutex_init( &ensemble_config->mutex , NULL);
 
   return ensemble_config;
@@ -307,6 +364,7 @@ void ensemble_config_add_node( ensemble_config_type * ensemble_config , enkf_con
 
     ensemble_config->config_nodes[key] = node;
     ensemble_config->have_forward_init |= enkf_config_node_use_forward_init( node );
+    ensemble_config_update_storage_codec( node , ensemble_config->storage_codec , ensemble_config->storage_level );
   } else
     util_abort("%s: internal error - tried to add NULL node to ensemble configuration \n",__func__);
 }
@@ -361,6 +419,7 @@ void ensemble_config_add_config_items(config_parser_type * config) {
 
 
   item = config_add_key_value( config , GEN_KW_TAG_FORMAT_KEY , false , CONFIG_STRING);
+  item = config_add_key_value( config , STORAGE_COMPRESSION_KEY , false , CONFIG_STRING);
   item = config_add_schema_item(config , SCHEDULE_PREDICTION_FILE_KEY , false  );
   /* scedhule_prediction_file   filename  <parameters:> <init_files:> */
   config_schema_item_set_argc_minmax(item , 1 , 3 );
@@ -422,8 +481,11 @@ void ensemble_config_init_GEN_DATA( ensemble_config_type * ensemble_config , con
     for (i=0; i < config_content_item_get_size(item); i++) {
       const config_content_node_type * node = config_content_item_iget_node( item , i );
       enkf_config_node_type * config_node = enkf_config_node_alloc_GEN_DATA_from_config( node );
-      if (config_node)
+      if (config_node) {
+        auto opt_map = create_opt_map(node, 1);
         ensemble_config_add_node( ensemble_config , config_node );
+        ensemble_config_set_node_storage_codec( config_node , get_string( opt_map , COMPRESSION_KEY ));
+      }
 
     }
   }
@@ -437,8 +499,11 @@ void ensemble_config_init_GEN_PARAM( ensemble_config_type * ensemble_config , co
     for (int i=0; i < config_content_item_get_size(item); i++) {
       const config_content_node_type * node = config_content_item_iget_node( item , i );
       enkf_config_node_type * config_node = enkf_config_node_alloc_GEN_PARAM_from_config( node );
-      if (config_node)
+      if (config_node) {
+        auto opt_map = create_opt_map(node, 2);
         ensemble_config_add_node( ensemble_config , config_node );
+        ensemble_config_set_node_storage_codec( config_node , get_string( opt_map , COMPRESSION_KEY ));
+      }
 
     }
   }
@@ -655,6 +720,8 @@ void ensemble_config_init_FIELD( ensemble_config_type * ensemble_config , const
 
         } else
           util_abort("%s: field type: %s is not recognized\n",__func__ , var_type_string);
+
+        ensemble_config_set_node_storage_codec( config_node , get_string( opt_map , COMPRESSION_KEY ));
       }
     }
   }
@@ -707,6 +774,18 @@ void ensemble_config_init(ensemble_config_type * ensemble_config , const config_
     ensemble_config_set_gen_kw_format( ensemble_config , config_content_iget( config , GEN_KW_TAG_FORMAT_KEY , 0 , 0 ));
   }
 
+  if (config_content_has_item( config , STORAGE_COMPRESSION_KEY)) {
+    const char * codec_string = config_content_get_value( config , STORAGE_COMPRESSION_KEY );
+    storage_codec_enum codec;
+    int level;
+
+    if (storage_codec_parse( codec_string , &codec , &level ))
+      ensemble_config_set_storage_codec( ensemble_config , codec , level );
+    else
+      fprintf(stderr,"** Warning: invalid %s:%s - using %s \n",
+              STORAGE_COMPRESSION_KEY , codec_string , DEFAULT_STORAGE_COMPRESSION);
+  }
+
   ensemble_config_init_GEN_PARAM(ensemble_config, config);
   ensemble_config_init_GEN_DATA(ensemble_config, config);
   ensemble_config_init_CUSTOM_KW(ensemble_config, config);
@@ -38,6 +38,7 @@
 
 #include <ert/enkf/field.hpp>
 #include <ert/enkf/field_config.hpp>
+#include <ert/enkf/storage_codec.hpp>
 #include <ert/enkf/enkf_serialize.hpp>
 #include <ert/enkf/enkf_fs.hpp>
 #include <ert/enkf/forward_load_context.hpp>
@@ -391,10 +392,7 @@ void field_copy(const field_type *src , field_type * target ) {
 void field_read_from_buffer(field_type * field , buffer_type * buffer, enkf_fs_type * fs, int report_step) {
   int byte_size = field_config_get_byte_size(field->config);
   enkf_util_assert_buffer_type(buffer, FIELD); // FIXME flaky runpath_list test
-  buffer_fread_compressed(buffer,
-                          buffer_get_remaining_size(buffer),
-                          field->data,
-                          byte_size);
+  storage_codec_fread(buffer, field->data, byte_size);
 }
 
 
@@ -440,8 +438,8 @@ static void * __field_alloc_3D_data(const field_type * field ,
 
    o The native function field_fwrite() will save the field in the
      format most suitable for use with enkf. This function will only
-     save the active cells, and compress the field if the variable
-     write_compressed is true. Most of the configuration information
+     save the active cells, and compress the field with the storage
+     codec of the field_config. Most of the configuration information
      is with the field_config object, and not saved with the field.
 
    o Export as ECLIPSE input. This again has three subdivisions:
@@ -537,7 +535,12 @@ void field_ROFF_export(const field_type * field , const char * export_filename,
 bool field_write_to_buffer(const field_type * field , buffer_type * buffer , int report_step) {
   int byte_size = field_config_get_byte_size( field->config );
   buffer_fwrite_int( buffer , FIELD );
-  buffer_fwrite_compressed( buffer , field->data , byte_size );
+  storage_codec_fwrite( buffer ,
+                        field_config_get_storage_codec( field->config ) ,
+                        field_config_get_storage_level( field->config ) ,
+                        field->data ,
+                        byte_size ,
+                        field_config_get_sizeof_ctype( field->config ));
   return true;
 }
 
@@ -1274,6 +1277,29 @@ void field_get_dims(const field_type * field, int *nx, int *ny , int *nz) {
 }
 
 
+/*
+  The data of the field, field_get_data_size() elements of
+  field_get_sizeof_ctype() bytes, ordered as the global index returned
+  from field_config_alloc_global_index().
+*/
+
+void * field_get_data_ptr(const field_type * field) {
+  return field->data;
+}
+
+int field_get_data_size(const field_type * field) {
+  return field_config_get_data_size( field->config );
+}
+
+int field_get_sizeof_ctype(const field_type * field) {
+  return field_config_get_sizeof_ctype( field->config );
+}
+
+const field_config_type * field_get_config(const field_type * field) {
+  return field->config;
+}
+
+
 
 
 
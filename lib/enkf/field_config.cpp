@@ -142,6 +142,8 @@ struct field_config_struct {
   ecl_data_type           internal_data_type;
   bool                    __enkf_mode;          /* See doc of functions field_config_set_key() / field_config_enkf_OFF() */
   bool                    write_compressed;
+  storage_codec_enum      storage_codec;        /* The codec used when the field is stored in enkf_fs. */
+  int                     storage_level;
 
   field_type_enum           type;
   field_type              * min_std;
@@ -352,6 +354,8 @@ field_config_type * field_config_alloc_empty( const char * ecl_kw_name , ecl_gri
   config->__enkf_mode         = true;
   config->grid                = NULL;
   config->write_compressed    = true;
+  config->storage_codec       = STORAGE_CODEC_ZLIB;
+  config->storage_level       = STORAGE_CODEC_DEFAULT_LEVEL;
   config->type                = UNKNOWN_FIELD_TYPE;
 
   config->output_transform      = NULL;
@@ -576,6 +580,21 @@ void field_config_get_ijk( const field_config_type * config , int active_index ,
 bool field_config_write_compressed(const field_config_type * config) { return config->write_compressed; }
 
 
+void field_config_set_storage_codec( field_config_type * config , storage_codec_enum codec , int level) {
+  config->storage_codec = codec;
+  config->storage_level = level;
+  config->write_compressed = (codec != STORAGE_CODEC_NONE);
+}
+
+storage_codec_enum field_config_get_storage_codec( const field_config_type * config ) {
+  return config->storage_codec;
+}
+
+int field_config_get_storage_level( const field_config_type * config ) {
+  return config->storage_level;
+}
+
+
 
 void field_config_set_truncation(field_config_type * config , int truncation, double min_value, double max_value) {
   config->truncation = truncation;
@@ -834,6 +853,24 @@ int field_config_parse_user_key(const field_config_type * config, const char * i
 ecl_grid_type * field_config_get_grid(const field_config_type * config) { return config->grid; }
 
 
+/*
+  Returns the global index of each element in the data of the field
+  instances; when inactive cells are not kept the data only holds the
+  active cells.
+*/
+
+int_vector_type * field_config_alloc_global_index(const field_config_type * config) {
+  int_vector_type * global_index = int_vector_alloc( config->data_size , 0 );
+  for (int index = 0; index < config->data_size; index++) {
+    if (config->keep_inactive_cells)
+      int_vector_iset( global_index , index , index );
+    else
+      int_vector_iset( global_index , index , ecl_grid_get_global_index1A( config->grid , index ));
+  }
+  return global_index;
+}
+
+
 void field_config_fprintf_config( const field_config_type * config ,
                                   enkf_var_type var_type ,
                                   const char * outfile ,
@@ -47,6 +47,12 @@ void fs_driver_init(fs_driver_type * driver) {
   driver->has_vector    = NULL;
   driver->unlink_vector = NULL;
 
+  driver->alloc_node_view   = NULL;
+  driver->alloc_vector_view = NULL;
+  driver->free_view         = NULL;
+  driver->set_mmap          = NULL;
+  driver->load_vector_range = NULL;
+
   driver->free_driver   = NULL;
   driver->fsync_driver  = NULL;
 }
@@ -18,7 +18,9 @@
 
 #include <stdlib.h>
 #include <stdio.h>
+#include <stdint.h>
 #include <string.h>
+#include <ctype.h>
 
 #include <ert/util/util.h>
 
@@ -34,50 +36,360 @@
 */
 
 
+/*
+  Fast path for parsing a decimal number, which handles the numbers
+  with at most 19 significant digits that typically come out of
+  printf("%g"). When the mantissa and the power of ten are both exactly
+  representable the result of one multiplication or division is
+  correctly rounded, i.e. identical to strtod() / strtof(). Returns
+  false if the number must be parsed by strtod() / strtof() instead.
+*/
+
+static const double gen_common_pow10[] = {1e0 , 1e1 , 1e2 , 1e3 , 1e4 , 1e5 , 1e6 , 1e7 , 1e8 , 1e9 , 1e10 ,
+                                          1e11 , 1e12 , 1e13 , 1e14 , 1e15 , 1e16 , 1e17 , 1e18 , 1e19 , 1e20 ,
+                                          1e21 , 1e22};
+
+static const float gen_common_pow10f[] = {1e0f , 1e1f , 1e2f , 1e3f , 1e4f , 1e5f , 1e6f , 1e7f , 1e8f , 1e9f , 1e10f};
+
+static bool gen_common_parse_fast(const char * start , char ** end , bool single , void * value) {
+  const char * ptr = start;
+  bool negative = false;
+  uint64_t mantissa = 0;
+  bool has_digits = false;
+  int num_digits = 0;
+  int exponent = 0;
+
+  if (*ptr == '-' || *ptr == '+') {
+    negative = (*ptr == '-');
+    ptr++;
+  }
+
+  while (isdigit( (unsigned char) *ptr )) {
+    if (mantissa > 0 || *ptr != '0')
+      num_digits++;
+    mantissa = 10 * mantissa + (*ptr - '0');
+    has_digits = true;
+    ptr++;
+    if (num_digits > 19)
+      return false;
+  }
+
+  if (*ptr == '.') {
+    ptr++;
+    while (isdigit( (unsigned char) *ptr )) {
+      if (mantissa > 0 || *ptr != '0')
+        num_digits++;
+      mantissa = 10 * mantissa + (*ptr - '0');
+      has_digits = true;
+      exponent--;
+      ptr++;
+      if (num_digits > 19)
+        return false;
+    }
+  }
+
+  if (!has_digits)
+    return false;
+
+  if (*ptr == 'e' || *ptr == 'E') {
+    const char * exp_ptr = ptr + 1;
+    bool exp_negative = false;
+    int exp_value = 0;
+
+    if (*exp_ptr == '-' || *exp_ptr == '+') {
+      exp_negative = (*exp_ptr == '-');
+      exp_ptr++;
+    }
+
+    if (isdigit( (unsigned char) *exp_ptr )) {
+      while (isdigit( (unsigned char) *exp_ptr )) {
+        if (exp_value < 10000)
+          exp_value = 10 * exp_value + (*exp_ptr - '0');
+        exp_ptr++;
+      }
+      exponent += exp_negative ? -exp_value : exp_value;
+      ptr = exp_ptr;
+    }
+  }
+
+  /* Something like "1x" or "inf" - leave it to strtod(). */
+  if (isalpha( (unsigned char) *ptr ) || *ptr == '.')
+    return false;
+
+  if (single) {
+    float result;
+    if (mantissa > (1 << 24) || exponent < -10 || exponent > 10)
+      return false;
+
+    result = (float) mantissa;
+    if (exponent >= 0)
+      result *= gen_common_pow10f[exponent];
+    else
+      result /= gen_common_pow10f[-exponent];
+    *((float *) value) = negative ? -result : result;
+  } else {
+    double result;
+    if (mantissa > (UINT64_C(1) << 53) || exponent < -22 || exponent > 22)
+      return false;
+
+    result = (double) mantissa;
+    if (exponent >= 0)
+      result *= gen_common_pow10[exponent];
+    else
+      result /= gen_common_pow10[-exponent];
+    *((double *) value) = negative ? -result : result;
+  }
+
+  *end = (char *) ptr;
+  return true;
+}
+
+
+/*
+  Parses the next number in the text at *@ptr into @value, and moves
+  *@ptr past it. Returns false when the text is exhausted; aborts if
+  the text contains something which is not a number of @data_type,
+  i.e. the same as the loop of fscanf() calls this replaces.
+*/
+
+static bool gen_common_parse_next(const char ** ptr , ecl_data_type data_type , void * value , const char * file) {
+  const char * start = *ptr;
+  char * end;
+
+  while (isspace( (unsigned char) *start ))
+    start++;
+
+  if (*start == '\0') {
+    *ptr = start;
+    return false;
+  }
+
+  if (ecl_type_is_float(data_type)) {
+    if (!gen_common_parse_fast( start , &end , true , value ))
+      *((float *) value) = strtof( start , &end );
+  } else if (ecl_type_is_double(data_type)) {
+    if (!gen_common_parse_fast( start , &end , false , value ))
+      *((double *) value) = strtod( start , &end );
+  }
+  else if (ecl_type_is_int(data_type))
+    *((int *) value) = (int) strtol( start , &end , 10 );
+  else {
+    util_abort("%s: god dammit - internal error \n",__func__);
+    end = NULL;
+  }
+
+  if (end == start)
+    util_abort("%s: scanning of %s terminated before EOF was reached -- fix your file.\n" , __func__ , file);
+
+  *ptr = end;
+  return true;
+}
+
+
+/*
+  Loads a formatted file with numbers separated by whitespace. The
+  whole file is read into memory in one operation and parsed with
+  a fast number parser, which is much faster than one fscanf() call
+  per value for large files.
+*/
+
 void * gen_common_fscanf_alloc(const char * file , ecl_data_type load_data_type , int * size) {
-  FILE * stream           = util_fopen(file , "r");
   int sizeof_ctype        = ecl_type_get_sizeof_ctype(load_data_type);
   int buffer_elements     = *size;
   int current_size        = 0;
-  int fscanf_return       = 1; /* To keep the compiler happy .*/
-  void * buffer;
+  int file_size;
+  char * content          = util_fread_alloc_file_content( file , &file_size );
+  const char * ptr        = content;
+  char * buffer;
 
+  /*
+    A number takes at least two characters including the separator;
+    the estimate avoids most reallocations.
+  */
   if (buffer_elements == 0)
-    buffer_elements = 100;
+    buffer_elements = util_int_max( 100 , file_size / 2 + 1 );
 
-  buffer = util_calloc( buffer_elements , sizeof_ctype ); // CXX_CAST_ERROR
-  {
-    do {
-      if (ecl_type_is_float(load_data_type)) {
-        float  * float_buffer = (float *) buffer;
-        fscanf_return = fscanf(stream , "%g" , &float_buffer[current_size]);
-      } else if (ecl_type_is_double(load_data_type)) {
-        double  * double_buffer = (double *) buffer;
-        fscanf_return = fscanf(stream , "%lg" , &double_buffer[current_size]);
-      } else if (ecl_type_is_int(load_data_type)) {
-        int * int_buffer = (int *) buffer;
-        fscanf_return = fscanf(stream , "%d" , &int_buffer[current_size]);
-      }  else
-        util_abort("%s: god dammit - internal error \n",__func__);
-
-      if (fscanf_return == 1)
-        current_size += 1;
-
-      if (current_size == buffer_elements) {
-        buffer_elements *= 2;
-        buffer = util_realloc( buffer , buffer_elements * sizeof_ctype );
-      }
-    } while (fscanf_return == 1);
+  buffer = (char *) util_calloc( buffer_elements , sizeof_ctype );
+  while (gen_common_parse_next( &ptr , load_data_type , &buffer[ current_size * sizeof_ctype ] , file )) {
+    current_size += 1;
+
+    if (current_size == buffer_elements) {
+      buffer_elements *= 2;
+      buffer = (char *) util_realloc( buffer , buffer_elements * sizeof_ctype );
+    }
   }
-  if (fscanf_return != EOF)
-    util_abort("%s: scanning of %s terminated before EOF was reached -- fix your file.\n" , __func__ , file);
 
-  fclose(stream);
+  free( content );
   *size = current_size;
   return buffer;
 }
 
 
+/*
+  Parses the first @size integers of @file into @data. Returns the
+  number of integers found, which is less than @size if the file is
+  too short.
+*/
+
+int gen_common_fscanf_int(const char * file , int * data , int size) {
+  char * content   = util_fread_alloc_file_content( file , NULL );
+  const char * ptr = content;
+  int index        = 0;
+
+  while (index < size && gen_common_parse_next( &ptr , ECL_INT , &data[index] , file ))
+    index++;
+
+  free( content );
+  return index;
+}
+
+
+
+/*
+  The binary GEN_DATA format is a self describing format which a
+  forward model can write directly, and which is loaded without any
+  parsing. All the fields are in native byte order, i.e. little endian
+  on all supported platforms:
+
+     offset  size  content
+     ------  ----  ---------------------------------------------------
+       0       8   Magic bytes: 0x89 'G' 'E' 'N' 'D' 'A' 'T' 'A'
+       8       4   int32 version, currently 1.
+      12       4   int32 data type: 1 = float32, 2 = float64.
+      16       4   int32 number of elements, N.
+      20       4   int32 flags: bit 0 set if an active mask follows.
+      24     N*s   The N data elements, s = 4 or 8 bytes.
+      ...      N   Optional active mask: one byte per element, 0 or 1.
+
+  A file in this format is recognized by the magic bytes independent
+  of the INPUT_FORMAT setting; the leading 0x89 byte can not appear in
+  an ASCII file.
+*/
+
+#define GEN_DATA_BINARY_VERSION   1
+#define GEN_DATA_BINARY_FLOAT     1
+#define GEN_DATA_BINARY_DOUBLE    2
+#define GEN_DATA_BINARY_ACTIVE    1
+#define GEN_DATA_BINARY_HEADER_SIZE 24
+
+static const unsigned char GEN_DATA_BINARY_MAGIC[8] = {0x89 , 'G' , 'E' , 'N' , 'D' , 'A' , 'T' , 'A'};
+
+
+bool gen_common_is_binary_file(const char * file) {
+  bool is_binary = false;
+  FILE * stream = fopen( file , "rb" );
+  if (stream) {
+    unsigned char magic[sizeof GEN_DATA_BINARY_MAGIC];
+    if (fread( magic , 1 , sizeof magic , stream ) == sizeof magic)
+      is_binary = (memcmp( magic , GEN_DATA_BINARY_MAGIC , sizeof magic ) == 0);
+    fclose( stream );
+  }
+  return is_binary;
+}
+
+
+/*
+  Loads a file in the binary GEN_DATA format. If the file has an active
+  mask, and @active_mask is not NULL, the mask is loaded into
+  @active_mask and *@has_active is set to true.
+*/
+
+void * gen_common_fload_binary_alloc(const char * file ,
+                                     ecl_type_enum * load_data_type ,
+                                     int * size ,
+                                     bool_vector_type * active_mask ,
+                                     bool * has_active) {
+  FILE * stream = util_fopen( file , "rb" );
+  unsigned char magic[sizeof GEN_DATA_BINARY_MAGIC];
+  int32_t header[4];
+  int sizeof_ctype;
+  char * buffer;
+
+  if ((fread( magic , 1 , sizeof magic , stream ) != sizeof magic) || (memcmp( magic , GEN_DATA_BINARY_MAGIC , sizeof magic ) != 0))
+    util_abort("%s: %s is not a binary GEN_DATA file \n",__func__ , file);
+
+  if (fread( header , sizeof header[0] , 4 , stream ) != 4)
+    util_abort("%s: %s: file is truncated \n",__func__ , file);
+
+  if (header[0] != GEN_DATA_BINARY_VERSION)
+    util_abort("%s: %s: unsupported binary GEN_DATA version:%d \n",__func__ , file , header[0]);
+
+  if (header[1] == GEN_DATA_BINARY_FLOAT)
+    *load_data_type = ECL_FLOAT_TYPE;
+  else if (header[1] == GEN_DATA_BINARY_DOUBLE)
+    *load_data_type = ECL_DOUBLE_TYPE;
+  else
+    util_abort("%s: %s: invalid data type:%d \n",__func__ , file , header[1]);
+
+  if (header[2] < 0)
+    util_abort("%s: %s: invalid size:%d \n",__func__ , file , header[2]);
+
+  *size = header[2];
+  sizeof_ctype = (*load_data_type == ECL_FLOAT_TYPE) ? sizeof(float) : sizeof(double);
+  buffer = (char *) util_calloc( util_int_max( *size , 1 ) , sizeof_ctype );
+  if (fread( buffer , sizeof_ctype , *size , stream ) != (size_t) *size)
+    util_abort("%s: %s: file is truncated \n",__func__ , file);
+
+  if (has_active)
+    *has_active = false;
+
+  if ((header[3] & GEN_DATA_BINARY_ACTIVE) && (active_mask != NULL)) {
+    unsigned char * mask = (unsigned char *) util_calloc( util_int_max( *size , 1 ) , sizeof * mask );
+    if (fread( mask , 1 , *size , stream ) != (size_t) *size)
+      util_abort("%s: %s: file is truncated \n",__func__ , file);
+
+    bool_vector_reset( active_mask );
+    for (int index = 0; index < *size; index++) {
+      if (mask[index] > 1)
+        util_abort("%s: error when loading active mask from:%s only 0 and 1 allowed \n",__func__ , file);
+      bool_vector_iset( active_mask , index , mask[index] == 1 );
+    }
+    free( mask );
+
+    if (has_active)
+      *has_active = true;
+  }
+
+  fclose( stream );
+  return buffer;
+}
+
+
+/*
+  Writes @size elements of @data_type from @data to @file in the binary
+  GEN_DATA format; @active_mask is optional.
+*/
+
+void gen_common_fwrite_binary(const char * file , ecl_data_type data_type , const void * data , int size , const bool_vector_type * active_mask) {
+  FILE * stream = util_mkdir_fopen( file , "wb" );
+  int32_t header[4];
+  int sizeof_ctype = ecl_type_get_sizeof_ctype( data_type );
+
+  header[0] = GEN_DATA_BINARY_VERSION;
+  if (ecl_type_is_float( data_type ))
+    header[1] = GEN_DATA_BINARY_FLOAT;
+  else if (ecl_type_is_double( data_type ))
+    header[1] = GEN_DATA_BINARY_DOUBLE;
+  else
+    util_abort("%s: only float and double data can be written \n",__func__);
+  header[2] = size;
+  header[3] = active_mask ? GEN_DATA_BINARY_ACTIVE : 0;
+
+  util_fwrite( GEN_DATA_BINARY_MAGIC , 1 , sizeof GEN_DATA_BINARY_MAGIC , stream , __func__ );
+  util_fwrite( header , sizeof header[0] , 4 , stream , __func__ );
+  if (size > 0)
+    util_fwrite( data , sizeof_ctype , size , stream , __func__ );
+
+  if (active_mask) {
+    for (int index = 0; index < size; index++) {
+      unsigned char active = bool_vector_safe_iget( active_mask , index ) ? 1 : 0;
+      util_fwrite( &active , 1 , 1 , stream , __func__ );
+    }
+  }
+  fclose( stream );
+}
+
+
 
 void * gen_common_fread_alloc(const char * file , ecl_data_type load_data_type , int * size) {
   const int max_read_size = 100000;
@@ -128,7 +440,9 @@ void * gen_common_fload_alloc(const char * file,
                               int * size) {
   void * buffer = NULL;
 
-  if (load_format == ASCII) {
+  if (gen_common_is_binary_file(file))
+    buffer = gen_common_fload_binary_alloc(file , load_data_type , size , NULL , NULL);
+  else if (load_format == ASCII) {
     *load_data_type = ecl_type_get_type(ASCII_data_type);
     buffer =  gen_common_fscanf_alloc(file , ASCII_data_type , size);
   } else if (load_format == BINARY_FLOAT) {
@@ -39,6 +39,7 @@
 #include <ert/enkf/enkf_macros.hpp>
 #include <ert/enkf/enkf_util.hpp>
 #include <ert/enkf/gen_data_config.hpp>
+#include <ert/enkf/storage_codec.hpp>
 #include <ert/enkf/gen_data.hpp>
 #include <ert/enkf/gen_data_common.hpp>
 #include <ert/enkf/gen_common.hpp>
@@ -82,6 +83,19 @@ int gen_data_get_size( const gen_data_type * gen_data ) {
   return gen_data_config_get_data_size( gen_data->config , gen_data->current_report_step );
 }
 
+/*
+  The data of the gen_data instance, gen_data_get_size() elements of
+  gen_data_get_sizeof_ctype() bytes; the storage is reallocated when
+  new data is loaded.
+*/
+void * gen_data_get_data_ptr( const gen_data_type * gen_data ) {
+  return gen_data->data;
+}
+
+int gen_data_get_sizeof_ctype( const gen_data_type * gen_data ) {
+  return ecl_type_get_sizeof_ctype( gen_data_config_get_internal_data_type( gen_data->config ));
+}
+
 /**
    It is a bug to call this before some function has set the size.
 */
@@ -153,7 +167,12 @@ bool gen_data_write_to_buffer(const gen_data_type * gen_data , buffer_type * buf
       buffer_fwrite_int( buffer , size );
       buffer_fwrite_int( buffer , report_step);   /* Why the heck do I need to store this ????  It was a mistake ...*/
 
-      buffer_fwrite_compressed( buffer , gen_data->data , byte_size);
+      storage_codec_fwrite( buffer ,
+                            gen_data_config_get_storage_codec( gen_data->config ) ,
+                            gen_data_config_get_storage_level( gen_data->config ) ,
+                            gen_data->data ,
+                            byte_size ,
+                            ecl_type_get_sizeof_ctype( gen_data_config_get_internal_data_type( gen_data->config )));
       return true;
     } else
       return false;   /* When false is returned - the (empty) file will be removed */
@@ -169,9 +188,8 @@ void gen_data_read_from_buffer(gen_data_type * gen_data , buffer_type * buffer ,
   buffer_fskip_int( buffer );  /* Skipping report_step from the buffer - was a mistake to store it - I think ... */
   {
     size_t byte_size       = size * ecl_type_get_sizeof_ctype( gen_data_config_get_internal_data_type ( gen_data->config ));
-    size_t compressed_size = buffer_get_remaining_size( buffer );
     gen_data->data         = (char *) util_realloc( gen_data->data , byte_size );
-    buffer_fread_compressed( buffer , compressed_size , gen_data->data , byte_size );
+    storage_codec_fread( buffer , gen_data->data , byte_size );
   }
   gen_data_assert_size( gen_data , size , report_step );
 
@@ -258,21 +276,20 @@ static bool gen_data_fload_active__(gen_data_type * gen_data, const char * filen
     {
       char * active_file = util_alloc_sprintf("%s_active" , filename );
       if (util_file_exists( active_file )) {
+        int * active_int = (int *) util_calloc( size , sizeof * active_int );
         file_exists = true;
-        FILE * stream = util_fopen( active_file , "r");
-        int active_int;
+        if (gen_common_fscanf_int( active_file , active_int , size ) < size)
+          util_abort("%s: error when loading active mask from:%s - file not long enough.\n",__func__ , active_file );
+
         for (int index=0; index < size; index++) {
-          if (fscanf( stream ,  "%d" , &active_int) == 1) {
-            if (active_int == 1)
-              bool_vector_iset( gen_data->active_mask , index , true);
-            else if (active_int == 0)
-              bool_vector_iset( gen_data->active_mask , index , false);
-            else
-              util_abort("%s: error when loading active mask from:%s only 0 and 1 allowed \n",__func__ , active_file);
-          } else
-            util_abort("%s: error when loading active mask from:%s - file not long enough.\n",__func__ , active_file );
+          if (active_int[index] == 1)
+            bool_vector_iset( gen_data->active_mask , index , true);
+          else if (active_int[index] == 0)
+            bool_vector_iset( gen_data->active_mask , index , false);
+          else
+            util_abort("%s: error when loading active mask from:%s only 0 and 1 allowed \n",__func__ , active_file);
         }
-        fclose( stream );
+        free( active_int );
         res_log_finfo("GEN_DATA(%s): active information loaded from:%s.",
                       gen_data_get_key(gen_data), active_file);
       } else
@@ -291,7 +308,9 @@ static bool gen_data_fload_active__(gen_data_type * gen_data, const char * filen
    how much can be successfully loaded.
 
    The file is loaded with the gen_common_fload_alloc() function, and
-   can be in formatted ASCII or binary_float / binary_double.
+   can be in formatted ASCII or binary_float / binary_double. A file in
+   the self describing binary GEN_DATA format, see gen_common.cpp, is
+   loaded directly and can hold the active mask as well.
 
    When the read is complete it is checked/verified with the config
    object that this file was as long as the others we have loaded for
@@ -310,11 +329,18 @@ bool gen_data_fload_with_report_step( gen_data_type * gen_data , const char * fi
     ecl_data_type internal_type            = gen_data_config_get_internal_data_type(gen_data->config);
     gen_data_file_format_type input_format = gen_data_config_get_input_format( gen_data->config );
     int    size     = 0;
-    buffer = gen_common_fload_alloc( filename , input_format , internal_type , &load_type , &size);
+    bool   has_active = false;
+
+    if (gen_common_is_binary_file( filename )) {
+      bool_vector_type * active_mask = gen_data_config_is_dynamic( gen_data->config ) ? gen_data->active_mask : NULL;
+      buffer = gen_common_fload_binary_alloc( filename , &load_type , &size , active_mask , &has_active );
+    } else
+      buffer = gen_common_fload_alloc( filename , input_format , internal_type , &load_type , &size);
     res_log_finfo("GEN_DATA(%s): loading from: %s   size:%d",
                   gen_data_get_key(gen_data), filename, size);
     if (size > 0) {
-      gen_data_fload_active__(gen_data, filename, size);
+      if (!has_active)
+        gen_data_fload_active__(gen_data, filename, size);
     } else {
       bool_vector_reset( gen_data->active_mask );
     }
@@ -70,6 +70,8 @@ struct gen_data_config_struct {
   int_vector_type              * data_size_vector;      /* Data size, i.e. number of elements , indexed with report_step */
   int_vector_type              * active_report_steps;   /* The report steps where we expect to load data for this instance. */
   pthread_mutex_t                update_lock;
+  storage_codec_enum             storage_codec;         /* The codec used when the gen_data instances are stored in enkf_fs. */
+  int                            storage_level;
   /*****************************************************************/
   /* All the fields below this line are related to the capability of
      the forward model to deactivate elements in a gen_data
@@ -173,6 +175,8 @@ static gen_data_config_type * gen_data_config_alloc( const char * key , bool dyn
   config->ens_size           = -1;
   config->last_read_fs       = NULL;
   config->dynamic            = dynamic;
+  config->storage_codec      = STORAGE_CODEC_ZLIB;
+  config->storage_level      = STORAGE_CODEC_DEFAULT_LEVEL;
   pthread_mutex_init( &config->update_lock , NULL );
 
 
@@ -291,6 +295,20 @@ const char * gen_data_config_get_template_key( const gen_data_config_type * conf
 }
 
 
+void gen_data_config_set_storage_codec( gen_data_config_type * config , storage_codec_enum codec , int level) {
+  config->storage_codec = codec;
+  config->storage_level = level;
+}
+
+storage_codec_enum gen_data_config_get_storage_codec( const gen_data_config_type * config ) {
+  return config->storage_codec;
+}
+
+int gen_data_config_get_storage_level( const gen_data_config_type * config ) {
+  return config->storage_level;
+}
+
+
 
 
 
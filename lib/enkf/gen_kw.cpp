@@ -91,6 +91,11 @@ int gen_kw_data_size( const gen_kw_type * gen_kw ) {
 }
 
 
+const double * gen_kw_get_data_ref( const gen_kw_type * gen_kw ) {
+  return gen_kw->data;
+}
+
+
 
 double gen_kw_data_iget( const gen_kw_type * gen_kw, int index , bool do_transform )
 {
@@ -250,6 +255,31 @@ void gen_kw_filter_file(const gen_kw_type * gen_kw , const char * target_file) {
     util_abort("%s: internal error - tried to filter gen_kw instance without template file.\n",__func__);
 }
 
+/**
+   Writes the same file as gen_kw_filter_file(), but with the template
+   @template_ which has been parsed with gen_kw_config_alloc_template()
+   beforehand; the template can be shared between gen_kw instances, and
+   threads.
+*/
+
+void gen_kw_filter_file_template(const gen_kw_type * gen_kw , const gen_kw_template_type * template_ , const char * target_file) {
+  const int size = gen_kw_config_get_data_size(gen_kw->config );
+  double * values = (double *)util_calloc( size , sizeof * values );
+
+  for (int ikw = 0; ikw < size; ikw++)
+    values[ikw] = gen_kw_config_transform( gen_kw->config , ikw , gen_kw->data[ikw] );
+
+  if (util_is_link( target_file ))
+    remove( target_file );
+
+  {
+    FILE * stream = util_mkdir_fopen( target_file , "w" );
+    gen_kw_template_fprintf( template_ , values , stream );
+    fclose( stream );
+  }
+  free( values );
+}
+
 void gen_kw_export_values(const gen_kw_type * gen_kw, value_export_type * export_value) {
   const int size = gen_kw_config_get_data_size(gen_kw->config );
 
@@ -283,14 +313,17 @@ void gen_kw_ecl_write_template(const gen_kw_type * gen_kw , const char * file_na
 }
 
 
-void gen_kw_ecl_write(const gen_kw_type * gen_kw , const char * run_path , const char * base_file , value_export_type * export_value) {
+static void gen_kw_ecl_write__(const gen_kw_type * gen_kw , const gen_kw_template_type * template_ , const char * run_path , const char * base_file , value_export_type * export_value) {
   char * target_file;
   if (run_path)
     target_file = util_alloc_filename( run_path , base_file  , NULL);
   else
     target_file = util_alloc_string_copy( base_file );
 
-  gen_kw_filter_file(gen_kw , target_file);
+  if (template_)
+    gen_kw_filter_file_template(gen_kw , template_ , target_file);
+  else
+    gen_kw_filter_file(gen_kw , target_file);
   free( target_file );
 
   if (export_value)
@@ -298,6 +331,16 @@ void gen_kw_ecl_write(const gen_kw_type * gen_kw , const char * run_path , const
 }
 
 
+void gen_kw_ecl_write(const gen_kw_type * gen_kw , const char * run_path , const char * base_file , value_export_type * export_value) {
+  gen_kw_ecl_write__(gen_kw , NULL , run_path , base_file , export_value);
+}
+
+
+void gen_kw_ecl_write_with_template(const gen_kw_type * gen_kw , const gen_kw_template_type * template_ , const char * run_path , const char * base_file , value_export_type * export_value) {
+  gen_kw_ecl_write__(gen_kw , template_ , run_path , base_file , export_value);
+}
+
+
 
 const char * gen_kw_get_name(const gen_kw_type * gen_kw, int kw_nr) {
   return  gen_kw_config_iget_name(gen_kw->config , kw_nr);
@@ -22,6 +22,9 @@
 #include <ert/util/util.h>
 #include <ert/util/hash.h>
 #include <ert/util/vector.h>
+#include <ert/util/int_vector.h>
+
+#include <ert/res_util/subst_list.hpp>
 
 #include <ert/config/config_parser.hpp>
 #include <ert/config/config_content.hpp>
@@ -36,6 +39,7 @@
 
 #define GEN_KW_CONFIG_TYPE_ID     550761
 #define GEN_KW_PARAMETER_TYPE_ID  886201
+#define GEN_KW_TEMPLATE_TYPE_ID   661309
 
 
 typedef struct {
@@ -47,6 +51,23 @@ typedef struct {
 
 
 
+/*
+  A gen_kw_template is the template file of a gen_kw_config parsed
+  once; the content is loaded and the tokens which should be replaced
+  are located and mapped to a parameter index, so the template can be
+  written for all the realizations without reading and searching the
+  file again. See gen_kw_config_alloc_template().
+*/
+
+struct gen_kw_template_struct {
+  UTIL_TYPE_ID_DECLARATION;
+  char             * buffer;
+  int                size;
+  int_vector_type  * token_offsets;    /* Pairs of (start, end) offsets of the tokens in the buffer. */
+  int_vector_type  * token_index;      /* The parameter index of each token. */
+};
+
+
 struct gen_kw_config_struct {
   UTIL_TYPE_ID_DECLARATION;
   char                 * key;
@@ -332,6 +353,99 @@ void gen_kw_config_fprintf_config( const gen_kw_config_type * config , const cha
 }
 
 
+/*****************************************************************/
+
+static bool gen_kw_config_is_token( const char * tagged_name ) {
+  const char * token_end;
+  const char * token_start = subst_list_next_token( tagged_name , &token_end );
+
+  return ((token_start == tagged_name) && (token_end[0] == '\0'));
+}
+
+
+/**
+   Will parse the template file of @config and return a template which
+   can be used with gen_kw_filter_file_template(). Writing the template
+   this way gives exactly the same result as gen_kw_filter_file(),
+   which does a single pass substitution when all the tagged names are
+   <...> tokens. If the config does not have a template file, or the
+   tag format gives tagged names which are not tokens, the function
+   returns NULL and gen_kw_filter_file() must be used.
+*/
+
+gen_kw_template_type * gen_kw_config_alloc_template( const gen_kw_config_type * config ) {
+  if (config->template_file == NULL)
+    return NULL;
+
+  hash_type * index_map = hash_alloc();
+  for (int i = 0; i < vector_get_size( config->parameters ); i++) {
+    const gen_kw_parameter_type * parameter = (const gen_kw_parameter_type *)vector_iget_const( config->parameters , i );
+    if ((parameter->tagged_name == NULL) || !gen_kw_config_is_token( parameter->tagged_name )) {
+      hash_free( index_map );
+      return NULL;
+    }
+
+    /* As with the subst_list; the last parameter with a given name wins. */
+    hash_insert_int( index_map , parameter->tagged_name , i );
+  }
+
+  gen_kw_template_type * template_ = (gen_kw_template_type *)util_malloc( sizeof * template_ );
+  UTIL_TYPE_ID_INIT( template_ , GEN_KW_TEMPLATE_TYPE_ID );
+  template_->buffer        = util_fread_alloc_file_content( config->template_file , &template_->size );
+  template_->token_offsets = int_vector_alloc( 0 , 0 );
+  template_->token_index   = int_vector_alloc( 0 , 0 );
+  {
+    const char * pos = template_->buffer;
+    const char * token_start;
+    const char * token_end;
+
+    while ((token_start = subst_list_next_token( pos , &token_end )) != NULL) {
+      char * key = util_alloc_substring_copy( token_start , 0 , token_end - token_start );
+      if (hash_has_key( index_map , key )) {
+        int_vector_append( template_->token_offsets , token_start - template_->buffer );
+        int_vector_append( template_->token_offsets , token_end - template_->buffer );
+        int_vector_append( template_->token_index , hash_get_int( index_map , key ));
+      }
+      free( key );
+      pos = token_end;
+    }
+  }
+  hash_free( index_map );
+  return template_;
+}
+
+
+void gen_kw_template_free( gen_kw_template_type * template_ ) {
+  free( template_->buffer );
+  int_vector_free( template_->token_offsets );
+  int_vector_free( template_->token_index );
+  free( template_ );
+}
+
+
+/**
+   Writes the template to @stream, with the tokens replaced by the
+   values in @values formatted with "%g". The @values vector should
+   contain the transformed values of all the parameters.
+*/
+
+void gen_kw_template_fprintf( const gen_kw_template_type * template_ , const double * values , FILE * stream ) {
+  int pos = 0;
+
+  for (int i = 0; i < int_vector_size( template_->token_index ); i++) {
+    int token_start = int_vector_iget( template_->token_offsets , 2*i );
+    int token_end   = int_vector_iget( template_->token_offsets , 2*i + 1 );
+
+    fwrite( &template_->buffer[pos] , 1 , token_start - pos , stream );
+    fprintf( stream , "%g" , values[ int_vector_iget( template_->token_index , i ) ] );
+    pos = token_end;
+  }
+  fwrite( &template_->buffer[pos] , 1 , template_->size - pos , stream );
+}
+
+
+UTIL_IS_INSTANCE_FUNCTION( gen_kw_template , GEN_KW_TEMPLATE_TYPE_ID )
+
 /*****************************************************************/
 
 VOID_FREE(gen_kw_config)
@@ -0,0 +1,304 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'load_scheduler.cpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+
+#include <stdlib.h>
+#include <pthread.h>
+#include <time.h>
+
+#include <ert/util/util.h>
+#include <ert/util/type_macros.h>
+
+#include <ert/enkf/load_scheduler.hpp>
+
+/*
+  The load_scheduler limits how many realizations are concurrently in
+  the two phases of loading results from the forward model:
+
+    io:  Reading the ECLIPSE summary results from the runpath; this is
+         typically limited by the shared filesystem.
+
+    cpu: Internalizing the results into the storage of the case.
+
+  A loading thread calls begin/end around each phase, and will block in
+  begin until a slot in that phase is available. The thread pool which
+  runs the loads should have load_scheduler_get_num_threads() threads,
+  so that both phases can be saturated at the same time.
+
+  The scheduler also records the time spent in each phase, and which
+  realizations have been loaded; the progress can be queried from
+  another thread while loading. All the functions accept a NULL
+  scheduler, which means no limits and no bookkeeping.
+*/
+
+
+#define LOAD_SCHEDULER_TYPE_ID 761943527
+
+typedef struct {
+  bool            complete;
+  struct timespec phase_start;
+  double          io_time;
+  double          cpu_time;
+} load_job_type;
+
+
+struct load_scheduler_struct {
+  UTIL_TYPE_ID_DECLARATION;
+  int               ens_size;
+  int               io_threads;
+  int               cpu_threads;
+  int               io_running;
+  int               cpu_running;
+  int               num_jobs;
+  int               num_complete;
+  load_job_type   * jobs;
+  pthread_mutex_t   mutex;
+  pthread_cond_t    io_cond;
+  pthread_cond_t    cpu_cond;
+};
+
+
+UTIL_IS_INSTANCE_FUNCTION( load_scheduler , LOAD_SCHEDULER_TYPE_ID )
+
+
+load_scheduler_type * load_scheduler_alloc( int ens_size , int io_threads , int cpu_threads ) {
+  if ((io_threads <= 0) || (cpu_threads <= 0))
+    util_abort("%s: invalid number of threads io:%d cpu:%d \n",__func__ , io_threads , cpu_threads);
+
+  load_scheduler_type * scheduler = (load_scheduler_type *) util_malloc( sizeof * scheduler );
+  UTIL_TYPE_ID_INIT( scheduler , LOAD_SCHEDULER_TYPE_ID );
+  scheduler->ens_size = ens_size;
+  scheduler->io_threads = io_threads;
+  scheduler->cpu_threads = cpu_threads;
+  scheduler->io_running = 0;
+  scheduler->cpu_running = 0;
+  scheduler->num_jobs = 0;
+  scheduler->num_complete = 0;
+  scheduler->jobs = (load_job_type *) util_calloc( ens_size , sizeof * scheduler->jobs );
+  for (int iens = 0; iens < ens_size; iens++) {
+    scheduler->jobs[iens].complete = false;
+    scheduler->jobs[iens].io_time = 0;
+    scheduler->jobs[iens].cpu_time = 0;
+  }
+  pthread_mutex_init( &scheduler->mutex , NULL );
+  pthread_cond_init( &scheduler->io_cond , NULL );
+  pthread_cond_init( &scheduler->cpu_cond , NULL );
+  return scheduler;
+}
+
+
+void load_scheduler_free( load_scheduler_type * scheduler ) {
+  pthread_cond_destroy( &scheduler->cpu_cond );
+  pthread_cond_destroy( &scheduler->io_cond );
+  pthread_mutex_destroy( &scheduler->mutex );
+  free( scheduler->jobs );
+  free( scheduler );
+}
+
+
+int load_scheduler_get_ens_size( const load_scheduler_type * scheduler ) {
+  return scheduler->ens_size;
+}
+
+
+int load_scheduler_get_io_threads( const load_scheduler_type * scheduler ) {
+  return scheduler->io_threads;
+}
+
+
+int load_scheduler_get_cpu_threads( const load_scheduler_type * scheduler ) {
+  return scheduler->cpu_threads;
+}
+
+
+int load_scheduler_get_num_threads( const load_scheduler_type * scheduler ) {
+  return scheduler->io_threads + scheduler->cpu_threads;
+}
+
+
+static load_job_type * load_scheduler_get_job( load_scheduler_type * scheduler , int iens ) {
+  if ((iens < 0) || (iens >= scheduler->ens_size))
+    util_abort("%s: invalid realization:%d - ensemble size:%d \n",__func__ , iens , scheduler->ens_size);
+
+  return &scheduler->jobs[iens];
+}
+
+
+static double load_scheduler_elapsed_time( const struct timespec * start_time ) {
+  struct timespec end_time;
+  clock_gettime( CLOCK_MONOTONIC , &end_time );
+  return (end_time.tv_sec - start_time->tv_sec) + 1e-9 * (end_time.tv_nsec - start_time->tv_nsec);
+}
+
+
+/*
+  Clears the jobs and the progress counters, so that the scheduler can
+  be reused for another load; must not be called while loading.
+*/
+
+void load_scheduler_reset( load_scheduler_type * scheduler ) {
+  if (scheduler == NULL)
+    return;
+
+  pthread_mutex_lock( &scheduler->mutex );
+  {
+    for (int iens = 0; iens < scheduler->ens_size; iens++) {
+      scheduler->jobs[iens].complete = false;
+      scheduler->jobs[iens].io_time = 0;
+      scheduler->jobs[iens].cpu_time = 0;
+    }
+    scheduler->num_jobs = 0;
+    scheduler->num_complete = 0;
+  }
+  pthread_mutex_unlock( &scheduler->mutex );
+}
+
+
+void load_scheduler_add_job( load_scheduler_type * scheduler , int iens ) {
+  if (scheduler == NULL)
+    return;
+
+  pthread_mutex_lock( &scheduler->mutex );
+  {
+    load_job_type * job = load_scheduler_get_job( scheduler , iens );
+    job->complete = false;
+    job->io_time = 0;
+    job->cpu_time = 0;
+    scheduler->num_jobs++;
+  }
+  pthread_mutex_unlock( &scheduler->mutex );
+}
+
+
+void load_scheduler_begin_io( load_scheduler_type * scheduler , int iens ) {
+  if (scheduler == NULL)
+    return;
+
+  pthread_mutex_lock( &scheduler->mutex );
+  while (scheduler->io_running >= scheduler->io_threads)
+    pthread_cond_wait( &scheduler->io_cond , &scheduler->mutex );
+
+  scheduler->io_running++;
+  clock_gettime( CLOCK_MONOTONIC , &load_scheduler_get_job( scheduler , iens )->phase_start );
+  pthread_mutex_unlock( &scheduler->mutex );
+}
+
+
+void load_scheduler_end_io( load_scheduler_type * scheduler , int iens ) {
+  if (scheduler == NULL)
+    return;
+
+  pthread_mutex_lock( &scheduler->mutex );
+  {
+    load_job_type * job = load_scheduler_get_job( scheduler , iens );
+    job->io_time += load_scheduler_elapsed_time( &job->phase_start );
+  }
+  scheduler->io_running--;
+  pthread_cond_signal( &scheduler->io_cond );
+  pthread_mutex_unlock( &scheduler->mutex );
+}
+
+
+void load_scheduler_begin_cpu( load_scheduler_type * scheduler , int iens ) {
+  if (scheduler == NULL)
+    return;
+
+  pthread_mutex_lock( &scheduler->mutex );
+  while (scheduler->cpu_running >= scheduler->cpu_threads)
+    pthread_cond_wait( &scheduler->cpu_cond , &scheduler->mutex );
+
+  scheduler->cpu_running++;
+  clock_gettime( CLOCK_MONOTONIC , &load_scheduler_get_job( scheduler , iens )->phase_start );
+  pthread_mutex_unlock( &scheduler->mutex );
+}
+
+
+void load_scheduler_end_cpu( load_scheduler_type * scheduler , int iens ) {
+  if (scheduler == NULL)
+    return;
+
+  pthread_mutex_lock( &scheduler->mutex );
+  {
+    load_job_type * job = load_scheduler_get_job( scheduler , iens );
+    job->cpu_time += load_scheduler_elapsed_time( &job->phase_start );
+  }
+  scheduler->cpu_running--;
+  pthread_cond_signal( &scheduler->cpu_cond );
+  pthread_mutex_unlock( &scheduler->mutex );
+}
+
+
+void load_scheduler_complete_job( load_scheduler_type * scheduler , int iens ) {
+  if (scheduler == NULL)
+    return;
+
+  pthread_mutex_lock( &scheduler->mutex );
+  load_scheduler_get_job( scheduler , iens )->complete = true;
+  scheduler->num_complete++;
+  pthread_mutex_unlock( &scheduler->mutex );
+}
+
+
+int load_scheduler_get_num_jobs( load_scheduler_type * scheduler ) {
+  int num_jobs;
+  pthread_mutex_lock( &scheduler->mutex );
+  num_jobs = scheduler->num_jobs;
+  pthread_mutex_unlock( &scheduler->mutex );
+  return num_jobs;
+}
+
+
+int load_scheduler_get_num_complete( load_scheduler_type * scheduler ) {
+  int num_complete;
+  pthread_mutex_lock( &scheduler->mutex );
+  num_complete = scheduler->num_complete;
+  pthread_mutex_unlock( &scheduler->mutex );
+  return num_complete;
+}
+
+
+bool load_scheduler_iget_complete( load_scheduler_type * scheduler , int iens ) {
+  bool complete;
+  pthread_mutex_lock( &scheduler->mutex );
+  complete = load_scheduler_get_job( scheduler , iens )->complete;
+  pthread_mutex_unlock( &scheduler->mutex );
+  return complete;
+}
+
+
+/*
+  The time (in seconds) realization @iens has spent reading results,
+  and internalizing them. The values are only final when the
+  realization is complete.
+*/
+
+double load_scheduler_iget_io_time( load_scheduler_type * scheduler , int iens ) {
+  double io_time;
+  pthread_mutex_lock( &scheduler->mutex );
+  io_time = load_scheduler_get_job( scheduler , iens )->io_time;
+  pthread_mutex_unlock( &scheduler->mutex );
+  return io_time;
+}
+
+
+double load_scheduler_iget_cpu_time( load_scheduler_type * scheduler , int iens ) {
+  double cpu_time;
+  pthread_mutex_lock( &scheduler->mutex );
+  cpu_time = load_scheduler_get_job( scheduler , iens )->cpu_time;
+  pthread_mutex_unlock( &scheduler->mutex );
+  return cpu_time;
+}
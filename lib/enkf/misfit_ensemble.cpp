@@ -21,13 +21,25 @@
 #include <cmath>
 #include <stdbool.h>
 
+#include <string.h>
+
+#include <algorithm>
+#include <string>
+#include <vector>
+#include <unordered_map>
+
 #include <ert/util/util.h>
 #include <ert/util/hash.h>
 #include <ert/util/vector.h>
 #include <ert/util/double_vector.h>
 #include <ert/util/buffer.h>
+#include <ert/res_util/thread_pool.hpp>
+#include <ert/res_util/arg_pack.hpp>
 
 #include <ert/enkf/enkf_obs.hpp>
+#include <ert/enkf/enkf_node.hpp>
+#include <ert/enkf/enkf_config_node.hpp>
+#include <ert/enkf/obs_vector.hpp>
 #include <ert/enkf/enkf_fs.hpp>
 #include <ert/enkf/enkf_util.hpp>
 #include <ert/enkf/misfit_ensemble.hpp>
@@ -51,28 +63,187 @@
 
 
 #define MISFIT_ENSEMBLE_TYPE_ID   441066
+#define MISFIT_ENSEMBLE_FILE_TAG  -441066     /* Leading the files which carry an observation signature. */
 
 struct misfit_ensemble_struct {
   UTIL_TYPE_ID_DECLARATION;
   bool                  initialized;
   int                   history_length;
+  char                * obs_signature;      /* The observation set the table was calculated from - see misfit_ensemble_alloc_obs_signature(). */
   vector_type         * ensemble;           /* Vector of misfit_member_type instances - one for each ensemble member. */
 };
 
 
 /*****************************************************************/
 
-static double ** __2d_malloc(int rows , int columns) {
-  double ** d = (double **) util_calloc( rows , sizeof * d );
-  for (int i =0; i < rows; i++)
-    d[i] = (double *) util_calloc( columns , sizeof * d[i]);
-  return d;
+/*
+  The observations are grouped by the config node they observe, and
+  the chi2 is evaluated with one job per realization on a thread
+  pool. Each job loads the node of a group once per report step - or
+  once in total for nodes with vector storage, e.g. summary - and
+  evaluates all the observations of the group on it.
+
+  The result is stored in the case when the filesystem is unmounted,
+  and reused by later rankings as long as the observation set, the
+  history length and the ensemble size are unchanged; the
+  misfit_ensemble is invalidated by enkf_fs when new data is written
+  to the case.
+*/
+
+typedef struct {
+  const enkf_config_node_type            * config_node;
+  std::vector<const char *>                obs_keys;
+  std::vector<const obs_vector_type *>     obs_vectors;
+} misfit_group_type;
+
+
+/*
+  The signature is the number of observations and the sorted list of
+  observation keys, each with the number of active report steps.
+*/
+
+static char * misfit_ensemble_alloc_obs_signature( const enkf_obs_type * enkf_obs ) {
+  std::vector<std::string> obs_keys;
+  hash_iter_type * obs_iter = enkf_obs_alloc_iter( enkf_obs );
+  const char * obs_key      = hash_iter_get_next_key( obs_iter );
+
+  while (obs_key != NULL) {
+    const obs_vector_type * obs_vector = enkf_obs_get_vector( enkf_obs , obs_key );
+    obs_keys.push_back( std::string( obs_key ) + ":" + std::to_string( obs_vector_get_num_active( obs_vector )));
+    obs_key = hash_iter_get_next_key( obs_iter );
+  }
+  hash_iter_free( obs_iter );
+
+  std::sort( obs_keys.begin() , obs_keys.end() );
+  std::string signature = std::to_string( obs_keys.size() );
+  for (const auto& key : obs_keys)
+    signature += " " + key;
+
+  return util_alloc_string_copy( signature.c_str() );
+}
+
+
+static std::vector<misfit_group_type> misfit_ensemble_alloc_groups( const enkf_obs_type * enkf_obs ) {
+  std::vector<misfit_group_type> groups;
+  std::unordered_map<std::string, size_t> group_index;
+  hash_iter_type * obs_iter = enkf_obs_alloc_iter( enkf_obs );
+  const char * obs_key      = hash_iter_get_next_key( obs_iter );
+
+  while (obs_key != NULL) {
+    const obs_vector_type * obs_vector = enkf_obs_get_vector( enkf_obs , obs_key );
+    const enkf_config_node_type * config_node = obs_vector_get_config_node( obs_vector );
+    std::string node_key = enkf_config_node_get_key( config_node );
+
+    auto iter = group_index.find( node_key );
+    if (iter == group_index.end()) {
+      misfit_group_type group;
+      group.config_node = config_node;
+      iter = group_index.insert( std::make_pair( node_key , groups.size() )).first;
+      groups.push_back( group );
+    }
+    groups[iter->second].obs_keys.push_back( obs_key );
+    groups[iter->second].obs_vectors.push_back( obs_vector );
+
+    obs_key = hash_iter_get_next_key( obs_iter );
+  }
+  hash_iter_free( obs_iter );
+  return groups;
+}
+
+
+/*
+  Evaluates the chi2 of all the observations in @group for one
+  realization. An observation is only installed in the misfit_member
+  if the data could be loaded for all its active report steps.
+*/
+
+static void misfit_ensemble_update_group( misfit_member_type * member ,
+                                          const misfit_group_type& group ,
+                                          enkf_fs_type * fs ,
+                                          int iens ,
+                                          int history_length ) {
+  size_t num_obs = group.obs_vectors.size();
+  std::vector<double> chi2( (history_length + 1) * num_obs , 0 );
+  std::vector<bool> valid( num_obs , true );
+  enkf_node_type * enkf_node = enkf_node_alloc( group.config_node );
+  bool vector_storage = enkf_node_vector_storage( enkf_node );
+  bool vector_loaded = false;
+  node_id_type node_id = {.report_step = 0, .iens = iens };
+
+  if (vector_storage)
+    vector_loaded = enkf_node_try_load_vector( enkf_node , fs , iens );
+
+  for (int step = 0; step <= history_length; step++) {
+    bool load_attempted = false;
+    bool loaded = false;
+    node_id.report_step = step;
+
+    for (size_t iobs = 0; iobs < num_obs; iobs++) {
+      const obs_vector_type * obs_vector = group.obs_vectors[iobs];
+      if (!obs_vector_iget_active( obs_vector , step ))
+        continue;
+
+      if (!load_attempted) {
+        if (vector_storage)
+          loaded = vector_loaded && enkf_node_vector_has_step( enkf_node , step );
+        else
+          loaded = enkf_node_try_load( enkf_node , fs , node_id );
+        load_attempted = true;
+      }
+
+      if (loaded)
+        chi2[iobs * (history_length + 1) + step] = obs_vector_node_chi2( obs_vector , enkf_node , node_id );
+      else
+        // Missing data - this member will be marked as invalid in the misfit calculations.
+        valid[iobs] = false;
+    }
+  }
+
+  for (size_t iobs = 0; iobs < num_obs; iobs++) {
+    if (valid[iobs])
+      misfit_member_set_chi2( member , group.obs_keys[iobs] , history_length , &chi2[iobs * (history_length + 1)] );
+  }
+
+  enkf_node_free( enkf_node );
 }
 
-static void  __2d_free(double ** d , int rows) {
-  for (int i =0; i < rows; i++)
-    free(d[i]);
-  free(d);
+
+static void * misfit_ensemble_update_member__( void * arg ) {
+  arg_pack_type * arg_pack = arg_pack_safe_cast( arg );
+  misfit_member_type * member                   = (misfit_member_type *) arg_pack_iget_ptr( arg_pack , 0 );
+  const std::vector<misfit_group_type> * groups = (const std::vector<misfit_group_type> *) arg_pack_iget_const_ptr( arg_pack , 1 );
+  enkf_fs_type * fs                             = (enkf_fs_type *) arg_pack_iget_ptr( arg_pack , 2 );
+  int iens                                      = arg_pack_iget_int( arg_pack , 3 );
+  int history_length                            = arg_pack_iget_int( arg_pack , 4 );
+
+  for (const auto& group : *groups)
+    misfit_ensemble_update_group( member , group , fs , iens , history_length );
+
+  return NULL;
+}
+
+
+/*
+  The misfit ensemble is valid if it has been initialized, or read
+  from the case, and it was calculated from the same observation set,
+  ensemble size and history length as given here.
+*/
+
+bool misfit_ensemble_is_valid( const misfit_ensemble_type * misfit_ensemble ,
+                               const enkf_obs_type * enkf_obs ,
+                               int ens_size ,
+                               int history_length ) {
+  bool valid = misfit_ensemble->initialized &&
+               (misfit_ensemble->history_length == history_length) &&
+               (misfit_ensemble_get_ens_size( misfit_ensemble ) == ens_size) &&
+               (misfit_ensemble->obs_signature != NULL);
+
+  if (valid) {
+    char * obs_signature = misfit_ensemble_alloc_obs_signature( enkf_obs );
+    valid = (strcmp( misfit_ensemble->obs_signature , obs_signature ) == 0);
+    free( obs_signature );
+  }
+  return valid;
 }
 
 
@@ -82,56 +253,46 @@ void misfit_ensemble_initialize( misfit_ensemble_type * misfit_ensemble ,
                                  enkf_fs_type * fs ,
                                  int ens_size ,
                                  int history_length,
-                                 bool force_init) {
-
-  if (force_init || !misfit_ensemble->initialized) {
-    misfit_ensemble_clear( misfit_ensemble );
+                                 bool force_init,
+                                 int num_threads) {
 
-    double ** chi2_work            = __2d_malloc( history_length + 1 , ens_size );
-    bool_vector_type * iens_valid  = bool_vector_alloc( ens_size , true );
-
-    hash_iter_type * obs_iter = enkf_obs_alloc_iter( enkf_obs );
-    const char * obs_key      = hash_iter_get_next_key( obs_iter );
+  if (force_init || !misfit_ensemble_is_valid( misfit_ensemble , enkf_obs , ens_size , history_length )) {
+    char * obs_signature = misfit_ensemble_alloc_obs_signature( enkf_obs );
+    std::vector<misfit_group_type> groups = misfit_ensemble_alloc_groups( enkf_obs );
+    thread_pool_type * tp = thread_pool_alloc( util_int_max( 1 , num_threads ) , true );
+    vector_type * arg_list = vector_alloc_new();
 
+    misfit_ensemble_clear( misfit_ensemble );
     misfit_ensemble->history_length = history_length;
+    misfit_ensemble->obs_signature = util_realloc_string_copy( misfit_ensemble->obs_signature , obs_signature );
     misfit_ensemble_set_ens_size( misfit_ensemble , ens_size );
 
-    while (obs_key != NULL) {
-      obs_vector_type * obs_vector = enkf_obs_get_vector( enkf_obs , obs_key );
-
-      bool_vector_reset( iens_valid );
-      bool_vector_iset( iens_valid , ens_size - 1 , true );
-      obs_vector_ensemble_chi2( obs_vector ,
-                                fs ,
-                                iens_valid ,
-                                0 ,
-                                misfit_ensemble->history_length,
-                                0 ,
-                                ens_size ,
-                                chi2_work);
-
-      /**
-          Internalizing the results from the chi2_work table into the misfit structure.
-      */
-      for (int iens = 0; iens < ens_size; iens++) {
-        misfit_member_type * node = misfit_ensemble_iget_member( misfit_ensemble , iens );
-        if (bool_vector_iget( iens_valid , iens))
-          misfit_member_update( node , obs_key , misfit_ensemble->history_length , iens , (const double **) chi2_work);
-      }
-      obs_key = hash_iter_get_next_key( obs_iter );
-    }
+    for (int iens = 0; iens < ens_size; iens++) {
+      arg_pack_type * arg_pack = arg_pack_alloc( );
 
-    bool_vector_free( iens_valid );
-    hash_iter_free( obs_iter );
+      arg_pack_append_ptr( arg_pack , misfit_ensemble_iget_member( misfit_ensemble , iens ));
+      arg_pack_append_const_ptr( arg_pack , &groups );
+      arg_pack_append_ptr( arg_pack , fs );
+      arg_pack_append_int( arg_pack , iens );
+      arg_pack_append_int( arg_pack , history_length );
+
+      vector_append_owned_ref( arg_list , arg_pack , arg_pack_free__ );
+      thread_pool_add_job( tp , misfit_ensemble_update_member__ , arg_pack );
+    }
+    thread_pool_join( tp );
+    thread_pool_free( tp );
+    vector_free( arg_list );
 
-    __2d_free( chi2_work , misfit_ensemble->history_length + 1);
     misfit_ensemble->initialized = true;
+    free( obs_signature );
   }
 }
 
 
 void misfit_ensemble_fwrite( const misfit_ensemble_type * misfit_ensemble , FILE * stream ) {
   int ens_size = vector_get_size( misfit_ensemble->ensemble);
+  util_fwrite_int( MISFIT_ENSEMBLE_FILE_TAG , stream );
+  util_fwrite_string( misfit_ensemble->obs_signature , stream );
   util_fwrite_int( misfit_ensemble->history_length , stream );
   util_fwrite_int( vector_get_size( misfit_ensemble->ensemble ) , stream);
 
@@ -156,6 +317,7 @@ static misfit_ensemble_type * misfit_ensemble_alloc_empty() {
   misfit_ensemble_type * table = (misfit_ensemble_type *)util_malloc( sizeof * table );
 
   table->initialized     = false;
+  table->obs_signature   = NULL;
   table->ensemble        = vector_alloc_new();
 
   return table;
@@ -185,8 +347,20 @@ void misfit_ensemble_set_ens_size( misfit_ensemble_type * misfit_ensemble , int
 }
 
 
+/*
+  A table read from file is only considered initialized if it carries
+  an observation signature, misfit_ensemble_initialize() will then
+  compare it with the current observation set before reusing the
+  table. Files written without the signature are ignored.
+*/
+
 void misfit_ensemble_fread( misfit_ensemble_type * misfit_ensemble , FILE * stream ) {
   misfit_ensemble_clear( misfit_ensemble );
+  if (util_fread_int( stream ) != MISFIT_ENSEMBLE_FILE_TAG)
+    return;
+
+  free( misfit_ensemble->obs_signature );
+  misfit_ensemble->obs_signature = util_fread_alloc_string( stream );
   {
     int ens_size;
 
@@ -201,6 +375,7 @@ void misfit_ensemble_fread( misfit_ensemble_type * misfit_ensemble , FILE * stre
     }
 
   }
+  misfit_ensemble->initialized = (misfit_ensemble->obs_signature != NULL);
 }
 
 
@@ -227,6 +402,7 @@ void misfit_ensemble_clear( misfit_ensemble_type * table) {
 
 void misfit_ensemble_free(misfit_ensemble_type * table ) {
   vector_free( table->ensemble );
+  free( table->obs_signature );
   free( table );
 }
 
@@ -236,6 +412,31 @@ bool misfit_ensemble_initialized( const misfit_ensemble_type * misfit_ensemble )
 }
 
 
+/*
+  Marks the misfit ensemble as out of date, the next call to
+  misfit_ensemble_initialize() will recalculate it.
+*/
+
+void misfit_ensemble_invalidate( misfit_ensemble_type * misfit_ensemble ) {
+  misfit_ensemble->initialized = false;
+}
+
+
+/*
+  The chi2 of observation @obs_key for realization @iens, summed over
+  all the report steps. Returns NAN if the data of the realization
+  could not be loaded for all the active steps of the observation.
+*/
+
+double misfit_ensemble_get_total_chi2( const misfit_ensemble_type * misfit_ensemble , const char * obs_key , int iens ) {
+  const misfit_member_type * member = misfit_ensemble_iget_member( misfit_ensemble , iens );
+  if (misfit_member_has_ts( member , obs_key ))
+    return misfit_ts_eval_total( misfit_member_get_ts( member , obs_key ));
+  else
+    return NAN;
+}
+
+
 /*****************************************************************/
 
 
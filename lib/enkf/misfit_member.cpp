@@ -88,6 +88,18 @@ void misfit_member_update( misfit_member_type * node , const char * obs_key , in
 }
 
 
+/*
+  Sets the misfit time series for @obs_key from @chi2, which holds
+  history_length + 1 elements.
+*/
+
+void misfit_member_set_chi2( misfit_member_type * node , const char * obs_key , int history_length , const double * chi2) {
+  misfit_ts_type * vector = misfit_member_safe_get_vector( node , obs_key , history_length );
+  for (int step = 0; step <= history_length; step++)
+    misfit_ts_iset( vector , step , chi2[step]);
+}
+
+
 void misfit_member_fwrite( const misfit_member_type * node , FILE * stream) {
   util_fwrite_int( node->my_iens , stream);
   util_fwrite_int( hash_get_size( node->obs ) , stream);
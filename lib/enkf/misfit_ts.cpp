@@ -99,3 +99,18 @@ double misfit_ts_eval( const misfit_ts_type * vector , const int_vector_type * s
   return misfit_sum;
 }
 
+
+/*
+  The sum over all the steps; equal to obs_vector_total_chi2() since
+  the steps where the observation is not active hold zero.
+*/
+
+double misfit_ts_eval_total( const misfit_ts_type * vector ) {
+  double misfit_sum = 0;
+
+  for (int step = 0; step < double_vector_size( vector->data ); ++step)
+    misfit_sum += double_vector_iget( vector->data , step );
+
+  return misfit_sum;
+}
+
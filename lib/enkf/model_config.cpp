@@ -99,6 +99,8 @@ struct model_config_struct {
   fs_driver_impl         dbase_type;
   bool                   has_prediction;
   int                    max_internal_submit;        /* How many times to retry if the load fails. */
+  int                    load_io_threads;            /* Number of realizations reading forward model results concurrently; 0: one per core. */
+  int                    load_cpu_threads;           /* Number of realizations internalizing results concurrently; 0: one per core. */
   const ecl_sum_type   * refcase;                    /* A pointer to the refcase - can be NULL. Observe that this ONLY a pointer
                                                         to the ecl_sum instance owned and held by the ecl_config object. */
   char                 * gen_kw_export_name;
@@ -272,6 +274,22 @@ void model_config_set_max_internal_submit( model_config_type * model_config , in
   model_config->max_internal_submit = max_resample;
 }
 
+int model_config_get_load_io_threads( const model_config_type * config ) {
+  return config->load_io_threads;
+}
+
+void model_config_set_load_io_threads( model_config_type * model_config , int load_io_threads ) {
+  model_config->load_io_threads = load_io_threads;
+}
+
+int model_config_get_load_cpu_threads( const model_config_type * config ) {
+  return config->load_cpu_threads;
+}
+
+void model_config_set_load_cpu_threads( model_config_type * model_config , int load_cpu_threads ) {
+  model_config->load_cpu_threads = load_cpu_threads;
+}
+
 
 UTIL_IS_INSTANCE_FUNCTION( model_config , MODEL_CONFIG_TYPE_ID)
 
@@ -309,6 +327,8 @@ model_config_type * model_config_alloc_empty() {
   model_config_set_rftpath( model_config        , DEFAULT_RFTPATH );
   model_config_set_dbase_type( model_config     , DEFAULT_DBASE_TYPE );
   model_config_set_max_internal_submit( model_config   , DEFAULT_MAX_INTERNAL_SUBMIT);
+  model_config_set_load_io_threads( model_config       , DEFAULT_LOAD_IO_THREADS );
+  model_config_set_load_cpu_threads( model_config      , DEFAULT_LOAD_CPU_THREADS );
   model_config_add_runpath( model_config , DEFAULT_RUNPATH_KEY , DEFAULT_RUNPATH);
   model_config_select_runpath( model_config , DEFAULT_RUNPATH_KEY );
   model_config_set_gen_kw_export_name(model_config, DEFAULT_GEN_KW_EXPORT_NAME);
@@ -548,6 +568,12 @@ void model_config_init(model_config_type * model_config ,
   if (config_content_has_item( config , MAX_RESAMPLE_KEY))
     model_config_set_max_internal_submit( model_config , config_content_get_value_as_int( config , MAX_RESAMPLE_KEY ));
 
+  if (config_content_has_item( config , LOAD_IO_THREADS_KEY))
+    model_config_set_load_io_threads( model_config , config_content_get_value_as_int( config , LOAD_IO_THREADS_KEY ));
+
+  if (config_content_has_item( config , LOAD_CPU_THREADS_KEY))
+    model_config_set_load_cpu_threads( model_config , config_content_get_value_as_int( config , LOAD_CPU_THREADS_KEY ));
+
 
   {
     if (config_content_has_item( config , GEN_KW_EXPORT_NAME_KEY)) {
@@ -784,6 +810,8 @@ static void model_config_init_user_config(config_parser_type * config ) {
   config_add_key_value(config, LOG_FILE_KEY, false, CONFIG_PATH);
 
   config_add_key_value(config, MAX_RESAMPLE_KEY, false, CONFIG_INT);
+  config_add_key_value(config, LOAD_IO_THREADS_KEY, false, CONFIG_INT);
+  config_add_key_value(config, LOAD_CPU_THREADS_KEY, false, CONFIG_INT);
 
 
   item = config_add_schema_item(config, NUM_REALIZATIONS_KEY, true);
@@ -285,6 +285,20 @@ static void obs_block_initR( const obs_block_type * obs_block , matrix_type * R,
 }
 
 
+static void obs_block_init_diagR( const obs_block_type * obs_block , matrix_type * R, int * __obs_offset) {
+  int obs_offset = *__obs_offset;
+  int iactive = 0;
+  for (int iobs =0; iobs < obs_block->size; iobs++) {
+    if (obs_block->active_mode[iobs] == ACTIVE) {
+      double var = obs_block_iget_std(obs_block, iobs) * obs_block_iget_std(obs_block, iobs);
+      matrix_iset_safe(R , obs_offset + iactive, 0, var);
+      iactive++;
+    }
+  }
+  *__obs_offset = obs_offset + obs_block->active_size;
+}
+
+
 
 static void obs_block_initE( const obs_block_type * obs_block , matrix_type * E, const double * pert_var , int * __obs_offset) {
   int ens_size   = matrix_get_columns( E );
@@ -542,6 +556,43 @@ matrix_type * obs_data_allocR(const obs_data_type * obs_data) {
   return R;
 }
 
+/*
+  When none of the observation blocks has an error covariance matrix R
+  is diagonal; obs_data_alloc_diagR() will then return the diagonal of
+  R as an active_size x 1 matrix, instead of the full active_size x
+  active_size matrix from obs_data_allocR(). The analysis modules which
+  set the ANALYSIS_DIAGONAL_R option accept R in this compact form.
+*/
+
+bool obs_data_has_diagonal_R(const obs_data_type * obs_data) {
+  for (int block_nr = 0; block_nr < vector_get_size( obs_data->data ); block_nr++) {
+    const obs_block_type * obs_block = (const obs_block_type *)vector_iget_const( obs_data->data , block_nr);
+    if (obs_block->error_covar != NULL)
+      return false;
+  }
+  return true;
+}
+
+
+matrix_type * obs_data_alloc_diagR(const obs_data_type * obs_data) {
+  if (!obs_data_has_diagonal_R( obs_data ))
+    util_abort("%s: the observation errors are correlated - must use the full R matrix\n",__func__);
+
+  {
+    int active_size = obs_data_get_active_size( obs_data );
+    matrix_type * R = matrix_alloc( active_size , 1 );
+    int obs_offset = 0;
+    for (int block_nr = 0; block_nr < vector_get_size( obs_data->data ); block_nr++) {
+      const obs_block_type * obs_block = (const obs_block_type *)vector_iget_const( obs_data->data , block_nr);
+      obs_block_init_diagR( obs_block , R , &obs_offset);
+    }
+
+    matrix_set_name( R , "R");
+    matrix_assert_finite( R );
+    return R;
+  }
+}
+
 /*
 matrix_type * obs_data_alloc_innov(const obs_data_type * obs_data , const meas_data_type * meas_data , int active_size) {
   matrix_type * innov = matrix_alloc( active_size , 1 );
@@ -589,9 +640,15 @@ static void obs_data_scale_Rmatrix__( matrix_type * R , const double * scale_fac
   int nrobs_active = matrix_get_rows( R );
 
   /* Scale the error covariance matrix*/
-  for (int i=0; i < nrobs_active; i++)
+  if (matrix_get_columns( R ) == 1) {
+    /* Only the diagonal - see obs_data_alloc_diagR(). */
+    for (int i=0; i < nrobs_active; i++)
+      matrix_imul(R , i , 0 , scale_factor[i] * scale_factor[i]);
+  } else {
+    for (int i=0; i < nrobs_active; i++)
       for (int j=0; j < nrobs_active; j++)
         matrix_imul(R , i , j , scale_factor[i] * scale_factor[j]);
+  }
 }
 
 
@@ -964,6 +964,16 @@ static double obs_vector_chi2__(const obs_vector_type * obs_vector , int report_
 
 
 
+/*
+  The chi2 for @node_id.report_step of a node which has already been
+  loaded; the node must have the config node of the obs_vector.
+*/
+
+double obs_vector_node_chi2(const obs_vector_type * obs_vector , const enkf_node_type * node , node_id_type node_id) {
+  return obs_vector_chi2__(obs_vector , node_id.report_step , node , node_id);
+}
+
+
 double obs_vector_chi2(const obs_vector_type * obs_vector , enkf_fs_type * fs , node_id_type node_id) {
   enkf_node_type * enkf_node = enkf_node_alloc( obs_vector->config_node );
   double chi2 = 0;
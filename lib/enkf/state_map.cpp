@@ -17,8 +17,12 @@
 
 
 #include <stdlib.h>
+#include <stdio.h>
 #include <pthread.h>
 #include <stdbool.h>
+#include <string.h>
+#include <errno.h>
+#include <unistd.h>
 
 #include <ert/util/util.h>
 #include <ert/util/int_vector.h>
@@ -35,6 +39,7 @@ struct state_map_struct {
   UTIL_TYPE_ID_DECLARATION;
   int_vector_type  * state;
   pthread_rwlock_t mutable rw_lock;
+  bool             mutable modified;    /* The state has changed since the map was read or written. */
   bool               read_only;
 };
 
@@ -47,6 +52,7 @@ state_map_type * state_map_alloc( ) {
   UTIL_TYPE_ID_INIT( map , STATE_MAP_TYPE_ID );
   map->state = int_vector_alloc( 0 , STATE_UNDEFINED );
   pthread_rwlock_init( &map->rw_lock , NULL);
+  map->modified = false;
   map->read_only = false;
   return map;
 }
@@ -76,6 +82,15 @@ state_map_type * state_map_alloc_copy(const state_map_type * map) {
     int_vector_memcpy( copy->state , map->state );
   }
   pthread_rwlock_unlock( &map->rw_lock );
+  copy->modified = true;
+  return copy;
+}
+
+
+state_map_type * state_map_alloc_readonly_copy(const state_map_type * map) {
+  state_map_type * copy = state_map_alloc_copy( map );
+  copy->modified = false;
+  copy->read_only = true;
   return copy;
 }
 
@@ -152,9 +167,11 @@ static void state_map_assert_writable( const state_map_type * map) {
 static void state_map_iset__( state_map_type * map , int index , realisation_state_enum new_state) {
   realisation_state_enum current_state = (realisation_state_enum ) int_vector_safe_iget( map->state , index );
 
-  if (state_map_legal_transition( current_state , new_state ))
+  if (state_map_legal_transition( current_state , new_state )) {
+    if ((current_state != new_state) || (index >= int_vector_size( map->state )))
+      map->modified = true;
     int_vector_iset( map->state , index , new_state);
-  else
+  } else
     util_abort("%s: illegal state transition for realisation:%d %d -> %d \n" , __func__ , index , current_state , new_state );
 }
 
@@ -182,15 +199,33 @@ void state_map_update_undefined( state_map_type * map , int index , realisation_
 
 
 
+/**
+   The map is only written if it has been modified since it was read or
+   written, or if the file does not exist. The content is written to a
+   temporary file which is renamed to @filename; i.e. a reader will see
+   either the old or the new map - never a partially written file. The
+   temporary file is synced to disk before it is renamed, and the map
+   is only marked as unmodified when the write has succeeded.
+*/
+
 void state_map_fwrite(const state_map_type * map, const char * filename) {
   pthread_rwlock_rdlock( &map->rw_lock );
   {
-    FILE * stream = util_mkdir_fopen( filename , "w");
-    if (stream) {
-      int_vector_fwrite( map->state , stream );
-      fclose( stream );
-    } else
-      util_abort("%s: failed to open:%s for writing \n",__func__ , filename );
+    if (map->modified || !util_file_exists( filename )) {
+      char * tmp_file = util_alloc_sprintf("%s.tmp" , filename );
+      FILE * stream = util_mkdir_fopen( tmp_file , "w");
+      if (stream) {
+        int_vector_fwrite( map->state , stream );
+        fflush( stream );
+        fsync( fileno( stream ));
+        fclose( stream );
+        if (rename( tmp_file , filename ) != 0)
+          util_abort("%s: failed to rename:%s -> %s: %s \n",__func__ , tmp_file , filename , strerror( errno ));
+      } else
+        util_abort("%s: failed to open:%s for writing \n",__func__ , tmp_file );
+      free( tmp_file );
+      map->modified = false;
+    }
   }
   pthread_rwlock_unlock( &map->rw_lock );
 }
@@ -211,6 +246,7 @@ bool state_map_fread( state_map_type * map , const char * filename) {
       file_exists = true;
     } else
       int_vector_reset( map->state );
+    map->modified = false;
   }
   pthread_rwlock_unlock( &map->rw_lock );
   return file_exists;
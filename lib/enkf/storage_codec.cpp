@@ -0,0 +1,226 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'storage_codec.cpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+
+#include <stdlib.h>
+#include <string.h>
+
+#include <zlib.h>
+
+#include <ert/util/util.h>
+
+#include <ert/enkf/storage_codec.hpp>
+
+/*
+  The storage codecs are used to store the data of FIELD and GEN_DATA
+  nodes. The stored record is:
+
+    STORAGE_CODEC_ID | codec | elem_size | byte_size | stored_size | stored data
+
+  Records written before the codecs were introduced contain only the
+  zlib compressed data. A zlib stream written with compress() starts
+  with the byte 0x78, whereas the first byte of STORAGE_CODEC_ID is
+  not 0x78 on any platform; hence the old records are recognized and
+  still read.
+
+  The FAST codec shuffles the bytes of the elements, i.e. all the
+  first bytes of the elements are stored, then all the second bytes
+  and so on, before it is compressed with the fastest zlib
+  level. Neighbouring floating point values typically share the
+  exponent bytes, and the shuffled data compresses much better.
+*/
+
+#define STORAGE_CODEC_ID 0x43534501
+
+
+static const char * storage_codec_names[] = {"NONE" , "FAST" , "ZLIB"};
+
+
+const char * storage_codec_get_name( storage_codec_enum codec ) {
+  return storage_codec_names[ codec ];
+}
+
+
+/*
+  Parses strings like "NONE", "FAST", "ZLIB" and "ZLIB:9". The level
+  is only used by the ZLIB codec, and must be in the range [1,9].
+*/
+
+bool storage_codec_parse( const char * codec_string , storage_codec_enum * codec , int * level ) {
+  bool valid = false;
+  char * name = NULL;
+  char * level_string = NULL;
+  int codec_level = STORAGE_CODEC_DEFAULT_LEVEL;
+
+  if (codec_string == NULL)
+    return false;
+
+  util_binary_split_string( codec_string , ":" , true , &name , &level_string );
+  if (name != NULL) {
+    for (int i = STORAGE_CODEC_NONE; i <= STORAGE_CODEC_ZLIB; i++) {
+      if (strcasecmp( name , storage_codec_names[i] ) == 0) {
+        *codec = (storage_codec_enum) i;
+        valid = true;
+      }
+    }
+  }
+
+  if (valid && level_string) {
+    if (*codec != STORAGE_CODEC_ZLIB)
+      valid = false;
+    else if (!util_sscanf_int( level_string , &codec_level ) || codec_level < 1 || codec_level > 9)
+      valid = false;
+  }
+
+  if (valid)
+    *level = codec_level;
+
+  free( name );
+  free( level_string );
+  return valid;
+}
+
+
+static void storage_codec_shuffle( const char * src , char * target , int byte_size , int elem_size ) {
+  int num_elem = byte_size / elem_size;
+  int tail = byte_size - num_elem * elem_size;
+
+  for (int b = 0; b < elem_size; b++)
+    for (int i = 0; i < num_elem; i++)
+      target[b * num_elem + i] = src[i * elem_size + b];
+
+  memcpy( &target[ num_elem * elem_size ] , &src[ num_elem * elem_size ] , tail );
+}
+
+
+static void storage_codec_unshuffle( const char * src , char * target , int byte_size , int elem_size ) {
+  int num_elem = byte_size / elem_size;
+  int tail = byte_size - num_elem * elem_size;
+
+  for (int b = 0; b < elem_size; b++)
+    for (int i = 0; i < num_elem; i++)
+      target[i * elem_size + b] = src[b * num_elem + i];
+
+  memcpy( &target[ num_elem * elem_size ] , &src[ num_elem * elem_size ] , tail );
+}
+
+
+static uLongf storage_codec_compress( const void * data , int byte_size , int level , buffer_type * buffer ) {
+  uLongf stored_size = compressBound( byte_size );
+  char * stored = (char *) util_malloc( stored_size );
+  int status = compress2( (Bytef *) stored , &stored_size , (const Bytef *) data , byte_size , level );
+  if (status != Z_OK)
+    util_abort("%s: compression failed - zlib status:%d \n",__func__ , status);
+
+  buffer_fwrite_int( buffer , stored_size );
+  buffer_fwrite( buffer , stored , 1 , stored_size );
+  free( stored );
+  return stored_size;
+}
+
+
+void storage_codec_fwrite( buffer_type * buffer , storage_codec_enum codec , int level ,
+                           const void * data , int byte_size , int elem_size ) {
+  buffer_fwrite_int( buffer , STORAGE_CODEC_ID );
+  buffer_fwrite_int( buffer , codec );
+  buffer_fwrite_int( buffer , elem_size );
+  buffer_fwrite_int( buffer , byte_size );
+
+  if (byte_size == 0) {
+    buffer_fwrite_int( buffer , 0 );
+    return;
+  }
+
+  switch (codec) {
+  case STORAGE_CODEC_NONE:
+    buffer_fwrite_int( buffer , byte_size );
+    buffer_fwrite( buffer , data , 1 , byte_size );
+    break;
+  case STORAGE_CODEC_FAST:
+    {
+      char * shuffled = (char *) util_malloc( byte_size );
+      storage_codec_shuffle( (const char *) data , shuffled , byte_size , elem_size );
+      storage_codec_compress( shuffled , byte_size , Z_BEST_SPEED , buffer );
+      free( shuffled );
+    }
+    break;
+  case STORAGE_CODEC_ZLIB:
+    storage_codec_compress( data , byte_size , level , buffer );
+    break;
+  default:
+    util_abort("%s: invalid codec:%d \n",__func__ , codec);
+  }
+}
+
+
+static void storage_codec_uncompress( const void * stored , int stored_size , void * data , int byte_size ) {
+  uLongf data_size = byte_size;
+  int status = uncompress( (Bytef *) data , &data_size , (const Bytef *) stored , stored_size );
+  if (status != Z_OK || data_size != (uLongf) byte_size)
+    util_abort("%s: uncompress failed - zlib status:%d \n",__func__ , status);
+}
+
+
+/*
+  Reads a record written with storage_codec_fwrite(), or with
+  buffer_fwrite_compressed(), into @data. The record must extend to the
+  end of the buffer in the latter case.
+*/
+
+void storage_codec_fread( buffer_type * buffer , void * data , int byte_size ) {
+  size_t offset = buffer_get_offset( buffer );
+
+  if (buffer_get_remaining_size( buffer ) < 5 * sizeof(int) || buffer_fread_int( buffer ) != STORAGE_CODEC_ID) {
+    buffer_fseek( buffer , offset , SEEK_SET );
+    buffer_fread_compressed( buffer , buffer_get_remaining_size( buffer ) , data , byte_size );
+    return;
+  }
+
+  {
+    storage_codec_enum codec = (storage_codec_enum) buffer_fread_int( buffer );
+    int elem_size            = buffer_fread_int( buffer );
+    int stored_byte_size     = buffer_fread_int( buffer );
+    int stored_size          = buffer_fread_int( buffer );
+    const void * stored      = buffer_iget_data( buffer , buffer_get_offset( buffer ));
+
+    if (stored_byte_size != byte_size)
+      util_abort("%s: size mismatch - expected:%d bytes  stored:%d bytes \n",__func__ , byte_size , stored_byte_size);
+
+    if (byte_size == 0)
+      return;
+
+    switch (codec) {
+    case STORAGE_CODEC_NONE:
+      memcpy( data , stored , byte_size );
+      break;
+    case STORAGE_CODEC_FAST:
+      {
+        char * shuffled = (char *) util_malloc( byte_size );
+        storage_codec_uncompress( stored , stored_size , shuffled , byte_size );
+        storage_codec_unshuffle( shuffled , (char *) data , byte_size , elem_size );
+        free( shuffled );
+      }
+      break;
+    case STORAGE_CODEC_ZLIB:
+      storage_codec_uncompress( stored , stored_size , data , byte_size );
+      break;
+    default:
+      util_abort("%s: invalid codec:%d in stored record \n",__func__ , codec);
+    }
+    buffer_fskip( buffer , stored_size );
+  }
+}
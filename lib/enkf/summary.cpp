@@ -175,6 +175,14 @@ int summary_length(const summary_type * summary) {
   return double_vector_size(summary->data_vector);
 }
 
+/*
+  The values of all the report steps, summary_length() elements; the
+  storage is reallocated when the summary grows.
+*/
+double * summary_get_data_ptr(const summary_type * summary) {
+  return double_vector_get_ptr(summary->data_vector);
+}
+
 double summary_get(const summary_type * summary, int report_step) {
   return SUMMARY_GET_VALUE( summary, report_step );
 }
@@ -203,6 +211,35 @@ void summary_user_get_vector(const summary_type * summary,
 
 
 
+/**
+   Will copy the values for the report steps [step1, step1 + num_steps)
+   into the caller supplied buffers data and active, which must both
+   have room for num_steps elements. Steps which have not been stored,
+   or which hold the undefined value, are marked as inactive and the
+   corresponding data element is set to NAN.
+*/
+
+void summary_export_values(const summary_type * summary,
+                           int step1,
+                           int num_steps,
+                           double * data,
+                           bool * active) {
+  int size = double_vector_size( summary->data_vector );
+  const double * values = double_vector_get_const_ptr( summary->data_vector );
+
+  for (int index = 0; index < num_steps; index++) {
+    int step = step1 + index;
+    if (step < size && summary_active_value( values[step] )) {
+      data[index] = values[step];
+      active[index] = true;
+    } else {
+      data[index] = NAN;
+      active[index] = false;
+    }
+  }
+}
+
+
 /**
    There are three typical reasons why the node data can not be loaded:
 
@@ -2,6 +2,12 @@
 
 #include <stdlib.h>
 #include <stdbool.h>
+#include <string.h>
+
+#include <string>
+#include <vector>
+#include <unordered_map>
+#include <unordered_set>
 
 #include <ert/util/util.h>
 #include <ert/util/hash.h>
@@ -11,12 +17,39 @@
 #include <ert/enkf/enkf_types.hpp>
 
 
+/*
+  The summary keys are compiled when they are added, so that matching
+  a key does not have to test it against all the patterns:
+
+  1. Keys without any fnmatch special characters are stored in a hash
+     set, and matched with one lookup.
+
+  2. The other patterns are bucketed by their literal prefix, i.e. the
+     characters in front of the first special character. A key is only
+     tested against the patterns in the buckets of its own prefixes;
+     since there are typically only a few distinct prefix lengths this
+     is a few hash lookups. Patterns of the form "PREFIX*" match all
+     keys in their bucket without calling util_fnmatch().
+
+  The key_set hash is the authoritative list of keys, and holds
+  whether a key is required.
+*/
 
 #define SUMMARY_KEY_MATCHER_TYPE_ID 700672137
+#define SUMMARY_KEY_MATCHER_SPECIAL "*?[\\"
+
+typedef struct {
+  bool                       match_all;
+  std::vector<std::string>   patterns;
+} pattern_bucket_type;
+
 
 struct summary_key_matcher_struct {
   UTIL_TYPE_ID_DECLARATION;
   hash_type        * key_set;
+  std::unordered_set<std::string>                      exact_keys;
+  std::unordered_map<std::string, pattern_bucket_type> buckets;
+  std::vector<size_t>                                  prefix_lengths;
 };
 
 
@@ -24,7 +57,7 @@ UTIL_IS_INSTANCE_FUNCTION( summary_key_matcher , SUMMARY_KEY_MATCHER_TYPE_ID )
 
 
 summary_key_matcher_type * summary_key_matcher_alloc() {
-  summary_key_matcher_type * matcher = (summary_key_matcher_type *)util_malloc(sizeof * matcher);
+  summary_key_matcher_type * matcher = new summary_key_matcher_type();
   UTIL_TYPE_ID_INIT( matcher , SUMMARY_KEY_MATCHER_TYPE_ID);
   matcher->key_set = hash_alloc();
   return matcher;
@@ -32,35 +65,72 @@ summary_key_matcher_type * summary_key_matcher_alloc() {
 
 void summary_key_matcher_free(summary_key_matcher_type * matcher) {
     hash_free(matcher->key_set);
-    free(matcher);
+    delete matcher;
 }
 
 int summary_key_matcher_get_size(const summary_key_matcher_type * matcher) {
   return hash_get_size( matcher->key_set );
 }
 
+static void summary_key_matcher_compile_key(summary_key_matcher_type * matcher, const char * summary_key) {
+    size_t prefix_length = strcspn(summary_key, SUMMARY_KEY_MATCHER_SPECIAL);
+
+    if (summary_key[prefix_length] == '\0')
+        matcher->exact_keys.insert(summary_key);
+    else {
+        std::string prefix(summary_key, prefix_length);
+        pattern_bucket_type& bucket = matcher->buckets[prefix];
+
+        if (strcmp(&summary_key[prefix_length], "*") == 0)
+            bucket.match_all = true;
+        else
+            bucket.patterns.push_back(summary_key);
+
+        bool new_length = true;
+        for (size_t length : matcher->prefix_lengths)
+            if (length == prefix_length)
+                new_length = false;
+
+        if (new_length)
+            matcher->prefix_lengths.push_back(prefix_length);
+    }
+}
+
 void summary_key_matcher_add_summary_key(summary_key_matcher_type * matcher, const char * summary_key) {
     if(!hash_has_key(matcher->key_set, summary_key)) {
         hash_insert_int(matcher->key_set, summary_key, !util_string_has_wildcard(summary_key));
+        summary_key_matcher_compile_key(matcher, summary_key);
     }
 }
 
 bool summary_key_matcher_match_summary_key(const summary_key_matcher_type * matcher, const char * summary_key) {
-    stringlist_type * keys = hash_alloc_stringlist(matcher->key_set);
-    bool has_key = false;
-
-    for (int i = 0; i < stringlist_get_size(keys); i++) {
-        const char * pattern = stringlist_iget(keys, i);
-        if (summary_key)
-            if(util_fnmatch(pattern, summary_key) == 0) {
-               has_key = true;
-               break;
+    if (!summary_key)
+        return false;
+
+    if (matcher->exact_keys.count(summary_key) > 0)
+        return true;
+
+    {
+        size_t key_length = strlen(summary_key);
+        for (size_t prefix_length : matcher->prefix_lengths) {
+            if (prefix_length > key_length)
+                continue;
+
+            auto iter = matcher->buckets.find(std::string(summary_key, prefix_length));
+            if (iter == matcher->buckets.end())
+                continue;
+
+            const pattern_bucket_type& bucket = iter->second;
+            if (bucket.match_all)
+                return true;
+
+            for (const std::string& pattern : bucket.patterns)
+                if (util_fnmatch(pattern.c_str(), summary_key) == 0)
+                    return true;
         }
     }
 
-    stringlist_free(keys);
-
-    return has_key;
+    return false;
 }
 
 stringlist_type * summary_key_matcher_get_keys(const summary_key_matcher_type * matcher) {
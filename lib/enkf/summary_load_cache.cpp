@@ -0,0 +1,243 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'summary_load_cache.cpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+
+#include <stdint.h>
+#include <string.h>
+#include <pthread.h>
+
+#include <unordered_map>
+
+#include <ert/util/util.h>
+#include <ert/util/type_macros.h>
+
+#include <ert/enkf/summary_load_cache.hpp>
+
+/*
+  The summary_load_cache holds information derived from the ECLIPSE
+  summary of one realization which can be reused for the other
+  realizations loaded in the same session; it is typically allocated
+  for one call to enkf_main_load_from_run_context(), and shared by all
+  the loading threads.
+
+  Layouts: The smspec nodes which are matched by the summary key
+  matcher. The layout is identified by a hash of all the keys in the
+  smspec; realizations run with the same model get the same hash, and
+  the matching of every key against all the patterns in the matcher is
+  only done once.
+
+  Time indices: The map from time_map index to summary report step
+  made by time_map_alloc_index_map(). It is identified by the time_map,
+  the current size of the time_map and a hash of the report dates of
+  the summary; when it is found, the time_map has already been updated
+  with the same dates and time_map_summary_update() is skipped.
+
+  The cache keeps the entries until it is freed, so the pointers
+  returned from summary_load_cache_get_matched_nodes() stay valid.
+*/
+
+#define SUMMARY_LOAD_CACHE_TYPE_ID 712906423
+
+#define FNV_OFFSET 14695981039346656037ULL
+#define FNV_PRIME  1099511628211ULL
+
+
+struct summary_load_cache_struct {
+  UTIL_TYPE_ID_DECLARATION;
+  std::unordered_map<uint64_t, int_vector_type *> layouts;
+  std::unordered_map<uint64_t, int_vector_type *> time_indices;
+  pthread_mutex_t mutex;
+};
+
+
+UTIL_IS_INSTANCE_FUNCTION( summary_load_cache , SUMMARY_LOAD_CACHE_TYPE_ID )
+
+
+summary_load_cache_type * summary_load_cache_alloc( ) {
+  summary_load_cache_type * cache = new summary_load_cache_type();
+  UTIL_TYPE_ID_INIT( cache , SUMMARY_LOAD_CACHE_TYPE_ID );
+  pthread_mutex_init( &cache->mutex , NULL );
+  return cache;
+}
+
+
+void summary_load_cache_free( summary_load_cache_type * cache ) {
+  for (auto& entry : cache->layouts)
+    int_vector_free( entry.second );
+
+  for (auto& entry : cache->time_indices)
+    int_vector_free( entry.second );
+
+  pthread_mutex_destroy( &cache->mutex );
+  delete cache;
+}
+
+
+static uint64_t summary_load_cache_hash( uint64_t hash , const void * data , size_t size ) {
+  const unsigned char * bytes = (const unsigned char *) data;
+  for (size_t i = 0; i < size; i++) {
+    hash ^= bytes[i];
+    hash *= FNV_PRIME;
+  }
+  return hash;
+}
+
+
+static uint64_t summary_load_cache_hash_int( uint64_t hash , int64_t value ) {
+  return summary_load_cache_hash( hash , &value , sizeof value );
+}
+
+
+static uint64_t summary_load_cache_hash_layout( const ecl_smspec_type * smspec , const summary_key_matcher_type * matcher ) {
+  uint64_t hash = FNV_OFFSET;
+  int num_nodes = ecl_smspec_num_nodes( smspec );
+
+  hash = summary_load_cache_hash( hash , &matcher , sizeof matcher );
+  hash = summary_load_cache_hash_int( hash , summary_key_matcher_get_size( matcher ));
+  hash = summary_load_cache_hash_int( hash , num_nodes );
+  for (int i = 0; i < num_nodes; i++) {
+    const ecl::smspec_node& smspec_node = ecl_smspec_iget_node_w_node_index( smspec , i );
+    const char * key = smspec_node.get_gen_key1();
+
+    /* The terminating '\0' is included to separate the keys. */
+    if (key)
+      hash = summary_load_cache_hash( hash , key , strlen( key ) + 1 );
+    else
+      hash = summary_load_cache_hash( hash , "" , 1 );
+  }
+  return hash;
+}
+
+
+/*
+  Returns the smspec node indices, in increasing order, of the nodes
+  whose key is matched by @matcher.
+*/
+
+const int_vector_type * summary_load_cache_get_matched_nodes( summary_load_cache_type * cache ,
+                                                              const ecl_smspec_type * smspec ,
+                                                              const summary_key_matcher_type * matcher ) {
+  uint64_t hash = summary_load_cache_hash_layout( smspec , matcher );
+  int_vector_type * matched_nodes = NULL;
+
+  pthread_mutex_lock( &cache->mutex );
+  {
+    auto iter = cache->layouts.find( hash );
+    if (iter != cache->layouts.end())
+      matched_nodes = iter->second;
+  }
+  pthread_mutex_unlock( &cache->mutex );
+
+  if (matched_nodes == NULL) {
+    int_vector_type * new_nodes = int_vector_alloc( 0 , 0 );
+    for (int i = 0; i < ecl_smspec_num_nodes( smspec ); i++) {
+      const ecl::smspec_node& smspec_node = ecl_smspec_iget_node_w_node_index( smspec , i );
+      if (summary_key_matcher_match_summary_key( matcher , smspec_node.get_gen_key1() ))
+        int_vector_append( new_nodes , i );
+    }
+
+    /* Another thread can have added the same layout in the meantime. */
+    pthread_mutex_lock( &cache->mutex );
+    {
+      auto result = cache->layouts.insert( std::make_pair( hash , new_nodes ));
+      if (!result.second)
+        int_vector_free( new_nodes );
+      matched_nodes = result.first->second;
+    }
+    pthread_mutex_unlock( &cache->mutex );
+  }
+
+  return matched_nodes;
+}
+
+
+static uint64_t summary_load_cache_hash_time_index( time_map_type * time_map , const ecl_sum_type * summary ) {
+  uint64_t hash = FNV_OFFSET;
+  int first_step = ecl_sum_get_first_report_step( summary );
+  int last_step = ecl_sum_get_last_report_step( summary );
+
+  hash = summary_load_cache_hash( hash , &time_map , sizeof time_map );
+  hash = summary_load_cache_hash_int( hash , time_map_get_size( time_map ));
+  hash = summary_load_cache_hash_int( hash , first_step );
+  hash = summary_load_cache_hash_int( hash , last_step );
+  hash = summary_load_cache_hash_int( hash , ecl_sum_get_start_time( summary ));
+  for (int step = first_step; step <= last_step; step++) {
+    if (ecl_sum_has_report_step( summary , step ))
+      hash = summary_load_cache_hash_int( hash , ecl_sum_get_report_time( summary , step ));
+    else
+      hash = summary_load_cache_hash_int( hash , -1 );
+  }
+  return hash;
+}
+
+
+/*
+  Returns a newly allocated copy of the index map of @summary; see
+  time_map_alloc_index_map(). The first time a set of report dates is
+  seen the time_map is updated with time_map_summary_update().
+*/
+
+int_vector_type * summary_load_cache_alloc_time_index( summary_load_cache_type * cache ,
+                                                       time_map_type * time_map ,
+                                                       const ecl_sum_type * summary ) {
+  uint64_t hash = summary_load_cache_hash_time_index( time_map , summary );
+
+  pthread_mutex_lock( &cache->mutex );
+  {
+    auto iter = cache->time_indices.find( hash );
+    if (iter != cache->time_indices.end()) {
+      int_vector_type * time_index = int_vector_alloc_copy( iter->second );
+      pthread_mutex_unlock( &cache->mutex );
+      return time_index;
+    }
+  }
+  pthread_mutex_unlock( &cache->mutex );
+
+  time_map_summary_update( time_map , summary );
+  {
+    int_vector_type * time_index = time_map_alloc_index_map( time_map , summary );
+
+    /* The size of the time_map after the update is part of the key. */
+    hash = summary_load_cache_hash_time_index( time_map , summary );
+    pthread_mutex_lock( &cache->mutex );
+    {
+      auto result = cache->time_indices.insert( std::make_pair( hash , (int_vector_type *) NULL ));
+      if (result.second)
+        result.first->second = int_vector_alloc_copy( time_index );
+    }
+    pthread_mutex_unlock( &cache->mutex );
+    return time_index;
+  }
+}
+
+
+int summary_load_cache_get_num_layouts( summary_load_cache_type * cache ) {
+  int num_layouts;
+  pthread_mutex_lock( &cache->mutex );
+  num_layouts = cache->layouts.size();
+  pthread_mutex_unlock( &cache->mutex );
+  return num_layouts;
+}
+
+
+int summary_load_cache_get_num_time_indices( summary_load_cache_type * cache ) {
+  int num_time_indices;
+  pthread_mutex_lock( &cache->mutex );
+  num_time_indices = cache->time_indices.size();
+  pthread_mutex_unlock( &cache->mutex );
+  return num_time_indices;
+}
@@ -58,6 +58,28 @@ int main(int argc , char ** argv) {
   active_list_copy( active_list1 , active_list2 );
   test_assert_true(active_list_equal( active_list1 , active_list2 ));
 
+  {
+    active_list_type * all_active = active_list_alloc( );
+    active_list_type * block = active_list_alloc_block( all_active , 5 , 3 );
+    const int * index = active_list_get_active( block );
+
+    test_assert_int_equal( active_list_get_mode( block ) , PARTLY_ACTIVE );
+    test_assert_int_equal( active_list_get_active_size( block , -1 ) , 3 );
+    test_assert_int_equal( index[0] , 5 );
+    test_assert_int_equal( index[2] , 7 );
+    active_list_free( block );
+
+    /* active_list2: 11, 12, 13, 27 */
+    block = active_list_alloc_block( active_list2 , 1 , 3 );
+    index = active_list_get_active( block );
+    test_assert_int_equal( active_list_get_active_size( block , -1 ) , 3 );
+    test_assert_int_equal( index[0] , 12 );
+    test_assert_int_equal( index[1] , 13 );
+    test_assert_int_equal( index[2] , 27 );
+    active_list_free( block );
+    active_list_free( all_active );
+  }
+
   active_list_free( active_list1 );
   active_list_free( active_list2 );
   exit(0);
@@ -70,6 +70,133 @@ void test_refcount() {
   }
 }
 
+void test_share_parameters() {
+  ecl::util::TestArea ta("share");
+  enkf_fs_type * source_fs = enkf_fs_create_fs( "source" , BLOCK_FS_DRIVER_ID , NULL , true);
+  enkf_fs_type * target_fs = enkf_fs_create_fs( "target" , BLOCK_FS_DRIVER_ID , NULL , true);
+  buffer_type * buffer = buffer_alloc( 100 );
+  stringlist_type * keys = stringlist_alloc_new();
+  bool_vector_type * iens_mask = bool_vector_alloc( 3 , true );
+
+  stringlist_append_copy( keys , "PARAM" );
+  for (int iens = 0; iens < 3; iens++) {
+    buffer_clear( buffer );
+    buffer_fwrite_int( buffer , iens );
+    enkf_fs_fwrite_node( source_fs , buffer , "PARAM" , PARAMETER , 0 , iens );
+  }
+
+  enkf_fs_share_parameters( target_fs , source_fs , keys , iens_mask );
+  test_assert_true( enkf_fs_has_shared_parameters( target_fs ));
+  test_assert_int_equal( 2 , enkf_fs_get_refcount( source_fs ));
+  test_assert_true( enkf_fs_has_node( target_fs , "PARAM" , PARAMETER , 0 , 1 ));
+  test_assert_false( enkf_fs_has_node( target_fs , "OTHER" , PARAMETER , 0 , 1 ));
+
+  enkf_fs_fread_node( target_fs , buffer , "PARAM" , PARAMETER , 0 , 2 );
+  test_assert_int_equal( 2 , buffer_fread_int( buffer ));
+
+  buffer_clear( buffer );
+  buffer_fwrite_int( buffer , 100 );
+  enkf_fs_fwrite_node( target_fs , buffer , "PARAM" , PARAMETER , 0 , 1 );
+  enkf_fs_fread_node( target_fs , buffer , "PARAM" , PARAMETER , 0 , 1 );
+  test_assert_int_equal( 100 , buffer_fread_int( buffer ));
+  enkf_fs_fread_node( source_fs , buffer , "PARAM" , PARAMETER , 0 , 1 );
+  test_assert_int_equal( 1 , buffer_fread_int( buffer ));
+
+  test_assert_int_equal( 2 , enkf_fs_unshare_parameters( target_fs ));
+  test_assert_false( enkf_fs_has_shared_parameters( target_fs ));
+  test_assert_int_equal( 1 , enkf_fs_get_refcount( source_fs ));
+  enkf_fs_decref( source_fs );
+
+  for (int iens = 0; iens < 3; iens++) {
+    buffer_type * view = enkf_fs_alloc_node_view( target_fs , "PARAM" , PARAMETER , 0 , iens );
+    test_assert_int_equal( (iens == 1) ? 100 : iens , buffer_fread_int( view ));
+    enkf_fs_free_view( target_fs , view , "PARAM" , PARAMETER , iens );
+  }
+
+  enkf_fs_decref( target_fs );
+  bool_vector_free( iens_mask );
+  stringlist_free( keys );
+  buffer_free( buffer );
+}
+
+void test_vector_block() {
+  ecl::util::TestArea ta("vector_block");
+  enkf_fs_type * fs = enkf_fs_create_fs( "mnt" , BLOCK_FS_DRIVER_ID , NULL , true);
+  buffer_type * buffer = buffer_alloc( 100 );
+
+  buffer_fwrite_int( buffer , 77 );
+  enkf_fs_fwrite_vector( fs , buffer , "OLD" , DYNAMIC_RESULT , 0 );
+  test_assert_NULL( enkf_fs_alloc_vector_block( fs , 0 ));
+  {
+    vector_block_type * block = vector_block_alloc( );
+    for (int i = 0; i < 3; i++) {
+      char * key = util_alloc_sprintf( "KEY%d" , i );
+      buffer_clear( buffer );
+      buffer_fwrite_int( buffer , i );
+      vector_block_add( block , key , buffer );
+      free( key );
+    }
+    enkf_fs_fwrite_vector_block( fs , block , 0 );
+    vector_block_free( block );
+  }
+
+  test_assert_true( enkf_fs_has_vector( fs , "KEY1" , DYNAMIC_RESULT , 0 ));
+  test_assert_true( enkf_fs_has_vector( fs , "OLD" , DYNAMIC_RESULT , 0 ));
+  test_assert_false( enkf_fs_has_vector( fs , "KEY1" , DYNAMIC_RESULT , 1 ));
+  test_assert_false( enkf_fs_has_vector( fs , "KEY1" , PARAMETER , 0 ));
+
+  enkf_fs_fread_vector( fs , buffer , "KEY2" , DYNAMIC_RESULT , 0 );
+  test_assert_int_equal( 2 , buffer_fread_int( buffer ));
+  enkf_fs_fread_vector( fs , buffer , "OLD" , DYNAMIC_RESULT , 0 );
+  test_assert_int_equal( 77 , buffer_fread_int( buffer ));
+
+  buffer_clear( buffer );
+  buffer_fwrite_int( buffer , 100 );
+  enkf_fs_fwrite_vector( fs , buffer , "KEY1" , DYNAMIC_RESULT , 0 );
+  {
+    buffer_type * view = enkf_fs_alloc_vector_view( fs , "KEY1" , DYNAMIC_RESULT , 0 );
+    test_assert_int_equal( 100 , buffer_fread_int( view ));
+    enkf_fs_free_view( fs , view , "KEY1" , DYNAMIC_RESULT , 0 );
+  }
+  buffer_clear( buffer );
+  buffer_fwrite_int( buffer , 200 );
+  enkf_fs_fwrite_vector( fs , buffer , "KEY2" , DYNAMIC_RESULT , 0 );
+  buffer_clear( buffer );
+  buffer_fwrite_int( buffer , 201 );
+  enkf_fs_fwrite_vector( fs , buffer , "KEY2" , DYNAMIC_RESULT , 0 );
+  enkf_fs_fread_vector( fs , buffer , "KEY2" , DYNAMIC_RESULT , 0 );
+  test_assert_int_equal( 201 , buffer_fread_int( buffer ));
+  {
+    vector_block_type * block = enkf_fs_alloc_vector_block( fs , 0 );
+    test_assert_int_equal( 3 , vector_block_get_size( block ));
+    vector_block_copy_buffer( block , "KEY1" , buffer );
+    test_assert_int_equal( 100 , buffer_fread_int( buffer ));
+    vector_block_copy_buffer( block , "KEY2" , buffer );
+    test_assert_int_equal( 201 , buffer_fread_int( buffer ));
+    vector_block_free( block );
+  }
+  buffer_clear( buffer );
+  buffer_fwrite_int( buffer , 300 );
+  enkf_fs_fwrite_vector( fs , buffer , "KEY0" , DYNAMIC_RESULT , 0 );
+  enkf_fs_decref( fs );
+
+  fs = enkf_fs_mount( "mnt" );
+  {
+    vector_block_type * block = enkf_fs_alloc_vector_block( fs , 0 );
+    test_assert_int_equal( 3 , vector_block_get_size( block ));
+    vector_block_copy_buffer( block , "KEY0" , buffer );
+    test_assert_int_equal( 300 , buffer_fread_int( buffer ));
+    vector_block_free( block );
+  }
+  enkf_fs_fread_vector( fs , buffer , "KEY1" , DYNAMIC_RESULT , 0 );
+  test_assert_int_equal( 100 , buffer_fread_int( buffer ));
+  enkf_fs_fread_vector( fs , buffer , "KEY2" , DYNAMIC_RESULT , 0 );
+  test_assert_int_equal( 201 , buffer_fread_int( buffer ));
+
+  enkf_fs_decref( fs );
+  buffer_free( buffer );
+}
+
 void createFS() {
 
  pthread_mutex_lock(&data->mutex1);
@@ -147,6 +274,8 @@ void test_read_only2() {
 int main(int argc, char ** argv) {
   test_mount();
   test_refcount();
+  test_share_parameters();
+  test_vector_block();
   test_read_only2();
   exit(0);
 }
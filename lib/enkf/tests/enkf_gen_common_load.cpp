@@ -0,0 +1,216 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'enkf_gen_common_load.cpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <time.h>
+
+#include <ert/util/test_util.h>
+#include <ert/util/test_work_area.hpp>
+#include <ert/util/util.h>
+#include <ert/util/bool_vector.h>
+
+#include <ert/enkf/gen_data_config.hpp>
+#include <ert/enkf/gen_common.hpp>
+
+
+/*
+  The fscanf() loop which was used by gen_common_fscanf_alloc()
+  before; used as reference in the benchmark.
+*/
+
+static double * fscanf_alloc_double( const char * file , int * size ) {
+  FILE * stream = util_fopen( file , "r" );
+  int buffer_elements = 100;
+  int current_size = 0;
+  double * buffer = (double *) util_calloc( buffer_elements , sizeof * buffer );
+
+  while (fscanf( stream , "%lg" , &buffer[current_size] ) == 1) {
+    current_size++;
+    if (current_size == buffer_elements) {
+      buffer_elements *= 2;
+      buffer = (double *) util_realloc( buffer , buffer_elements * sizeof * buffer );
+    }
+  }
+  fclose( stream );
+  *size = current_size;
+  return buffer;
+}
+
+
+static double elapsed( const struct timespec * t0 , const struct timespec * t1 ) {
+  return (t1->tv_sec - t0->tv_sec) + 1e-9 * (t1->tv_nsec - t0->tv_nsec);
+}
+
+
+void test_ascii() {
+  ecl::util::TestArea ta("gen_common_ascii");
+  {
+    FILE * stream = util_fopen( "data.txt" , "w" );
+    fprintf( stream , "1.5 -2\n  3e2\n\n4.25E-1\t7 " );
+    fclose( stream );
+  }
+  {
+    int size = 0;
+    double * data = (double *) gen_common_fscanf_alloc( "data.txt" , ECL_DOUBLE , &size );
+    test_assert_int_equal( 5 , size );
+    test_assert_double_equal( 1.5 , data[0] );
+    test_assert_double_equal( -2 , data[1] );
+    test_assert_double_equal( 300 , data[2] );
+    test_assert_double_equal( 0.425 , data[3] );
+    test_assert_double_equal( 7 , data[4] );
+    free( data );
+  }
+  {
+    int size = 0;
+    float * data = (float *) gen_common_fscanf_alloc( "data.txt" , ECL_FLOAT , &size );
+    test_assert_int_equal( 5 , size );
+    test_assert_float_equal( 0.425 , data[3] );
+    free( data );
+  }
+  {
+    FILE * stream = util_fopen( "empty.txt" , "w" );
+    fclose( stream );
+
+    int size = 0;
+    void * data = gen_common_fscanf_alloc( "empty.txt" , ECL_DOUBLE , &size );
+    test_assert_int_equal( 0 , size );
+    free( data );
+  }
+  {
+    FILE * stream = util_fopen( "active.txt" , "w" );
+    fprintf( stream , "1 0 1\n1\n" );
+    fclose( stream );
+
+    int active[4];
+    test_assert_int_equal( 3 , gen_common_fscanf_int( "active.txt" , active , 3 ));
+    test_assert_int_equal( 0 , active[1] );
+    test_assert_int_equal( 4 , gen_common_fscanf_int( "active.txt" , active , 4 ));
+  }
+}
+
+
+void test_binary() {
+  ecl::util::TestArea ta("gen_common_binary");
+  const int size = 100;
+  double data[size];
+  bool_vector_type * active = bool_vector_alloc( size , true );
+
+  for (int i = 0; i < size; i++)
+    data[i] = i * 0.5;
+  bool_vector_iset( active , 10 , false );
+
+  gen_common_fwrite_binary( "data.bin" , ECL_DOUBLE , data , size , active );
+  test_assert_true( gen_common_is_binary_file( "data.bin" ));
+  {
+    ecl_type_enum load_type;
+    int load_size;
+    bool has_active;
+    bool_vector_type * load_active = bool_vector_alloc( 0 , true );
+    double * load_data = (double *) gen_common_fload_binary_alloc( "data.bin" , &load_type , &load_size , load_active , &has_active );
+
+    test_assert_int_equal( ECL_DOUBLE_TYPE , load_type );
+    test_assert_int_equal( size , load_size );
+    test_assert_true( has_active );
+    test_assert_int_equal( 0 , memcmp( data , load_data , sizeof data ));
+    test_assert_false( bool_vector_iget( load_active , 10 ));
+    test_assert_true( bool_vector_iget( load_active , 11 ));
+
+    free( load_data );
+    bool_vector_free( load_active );
+  }
+
+  /* The format is recognized independent of the configured format. */
+  {
+    ecl_type_enum load_type;
+    int load_size = 0;
+    double * load_data = (double *) gen_common_fload_alloc( "data.bin" , ASCII , ECL_FLOAT , &load_type , &load_size );
+    test_assert_int_equal( ECL_DOUBLE_TYPE , load_type );
+    test_assert_int_equal( size , load_size );
+    test_assert_double_equal( data[size - 1] , load_data[size - 1] );
+    free( load_data );
+  }
+
+  {
+    FILE * stream = util_fopen( "data.txt" , "w" );
+    fprintf( stream , "1 2 3\n" );
+    fclose( stream );
+    test_assert_false( gen_common_is_binary_file( "data.txt" ));
+    test_assert_false( gen_common_is_binary_file( "does/not/exist" ));
+  }
+  bool_vector_free( active );
+}
+
+
+/*
+  Compares the load time of a synthetic file of @size values with the
+  old fscanf() loop, the new text parser and the binary format.
+*/
+
+void test_benchmark( int size ) {
+  ecl::util::TestArea ta("gen_common_benchmark");
+  double * data = (double *) util_calloc( size , sizeof * data );
+  struct timespec t0, t1, t2, t3;
+
+  for (int i = 0; i < size; i++)
+    data[i] = 1000.0 * ((double) rand() / RAND_MAX) - 500;
+
+  {
+    FILE * stream = util_fopen( "data.txt" , "w" );
+    for (int i = 0; i < size; i++)
+      fprintf( stream , "%g\n" , data[i] );
+    fclose( stream );
+  }
+  gen_common_fwrite_binary( "data.bin" , ECL_DOUBLE , data , size , NULL );
+
+  {
+    int fscanf_size, parse_size = 0, binary_size;
+    ecl_type_enum load_type;
+    double * fscanf_data, * parse_data, * binary_data;
+
+    clock_gettime( CLOCK_MONOTONIC , &t0 );
+    fscanf_data = fscanf_alloc_double( "data.txt" , &fscanf_size );
+    clock_gettime( CLOCK_MONOTONIC , &t1 );
+    parse_data = (double *) gen_common_fscanf_alloc( "data.txt" , ECL_DOUBLE , &parse_size );
+    clock_gettime( CLOCK_MONOTONIC , &t2 );
+    binary_data = (double *) gen_common_fload_binary_alloc( "data.bin" , &load_type , &binary_size , NULL , NULL );
+    clock_gettime( CLOCK_MONOTONIC , &t3 );
+
+    test_assert_int_equal( size , fscanf_size );
+    test_assert_int_equal( size , parse_size );
+    test_assert_int_equal( size , binary_size );
+    test_assert_int_equal( 0 , memcmp( fscanf_data , parse_data , size * sizeof * data ));
+    test_assert_int_equal( 0 , memcmp( data , binary_data , size * sizeof * data ));
+
+    printf("%d values  fscanf: %.3f s  parser: %.3f s  binary: %.3f s\n",
+           size , elapsed( &t0 , &t1 ) , elapsed( &t1 , &t2 ) , elapsed( &t2 , &t3 ));
+
+    free( fscanf_data );
+    free( parse_data );
+    free( binary_data );
+  }
+  free( data );
+}
+
+
+int main(int argc , char ** argv) {
+  test_ascii();
+  test_binary();
+  test_benchmark( 1000000 );
+  exit(0);
+}
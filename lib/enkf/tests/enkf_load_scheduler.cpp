@@ -0,0 +1,137 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'enkf_load_scheduler.cpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+#include <stdlib.h>
+#include <stdbool.h>
+#include <unistd.h>
+#include <pthread.h>
+
+#include <ert/util/test_util.h>
+#include <ert/util/util.h>
+
+#include <ert/enkf/load_scheduler.hpp>
+
+#define ENS_SIZE 16
+
+typedef struct {
+  load_scheduler_type * scheduler;
+  pthread_mutex_t       mutex;
+  int                   io_running;
+  int                   max_io_running;
+  int                   next_iens;
+} load_test_type;
+
+
+static void * load_job( void * arg ) {
+  load_test_type * test = (load_test_type *) arg;
+  int iens;
+
+  pthread_mutex_lock( &test->mutex );
+  iens = test->next_iens++;
+  pthread_mutex_unlock( &test->mutex );
+
+  load_scheduler_begin_io( test->scheduler , iens );
+  pthread_mutex_lock( &test->mutex );
+  test->io_running++;
+  test->max_io_running = util_int_max( test->max_io_running , test->io_running );
+  pthread_mutex_unlock( &test->mutex );
+
+  usleep( 10000 );
+
+  pthread_mutex_lock( &test->mutex );
+  test->io_running--;
+  pthread_mutex_unlock( &test->mutex );
+  load_scheduler_end_io( test->scheduler , iens );
+
+  load_scheduler_begin_cpu( test->scheduler , iens );
+  load_scheduler_end_cpu( test->scheduler , iens );
+  load_scheduler_complete_job( test->scheduler , iens );
+  return NULL;
+}
+
+
+void test_io_limit() {
+  load_test_type test;
+  pthread_t threads[ENS_SIZE];
+
+  test.scheduler = load_scheduler_alloc( ENS_SIZE , 2 , 4 );
+  test.io_running = 0;
+  test.max_io_running = 0;
+  test.next_iens = 0;
+  pthread_mutex_init( &test.mutex , NULL );
+  test_assert_int_equal( 6 , load_scheduler_get_num_threads( test.scheduler ));
+
+  for (int iens = 0; iens < ENS_SIZE; iens++)
+    load_scheduler_add_job( test.scheduler , iens );
+
+  for (int i = 0; i < ENS_SIZE; i++)
+    pthread_create( &threads[i] , NULL , load_job , &test );
+
+  for (int i = 0; i < ENS_SIZE; i++)
+    pthread_join( threads[i] , NULL );
+
+  test_assert_true( test.max_io_running <= 2 );
+  test_assert_int_equal( ENS_SIZE , load_scheduler_get_num_jobs( test.scheduler ));
+  test_assert_int_equal( ENS_SIZE , load_scheduler_get_num_complete( test.scheduler ));
+  for (int iens = 0; iens < ENS_SIZE; iens++) {
+    test_assert_true( load_scheduler_iget_complete( test.scheduler , iens ));
+    test_assert_true( load_scheduler_iget_io_time( test.scheduler , iens ) > 0 );
+  }
+
+  pthread_mutex_destroy( &test.mutex );
+  load_scheduler_free( test.scheduler );
+}
+
+
+void test_reset() {
+  load_scheduler_type * scheduler = load_scheduler_alloc( ENS_SIZE , 1 , 1 );
+  test_assert_int_equal( ENS_SIZE , load_scheduler_get_ens_size( scheduler ));
+
+  for (int load = 0; load < 2; load++) {
+    load_scheduler_reset( scheduler );
+    test_assert_int_equal( 0 , load_scheduler_get_num_jobs( scheduler ));
+    test_assert_int_equal( 0 , load_scheduler_get_num_complete( scheduler ));
+
+    for (int iens = 0; iens < ENS_SIZE; iens++) {
+      test_assert_false( load_scheduler_iget_complete( scheduler , iens ));
+      load_scheduler_add_job( scheduler , iens );
+      load_scheduler_complete_job( scheduler , iens );
+    }
+    test_assert_int_equal( ENS_SIZE , load_scheduler_get_num_jobs( scheduler ));
+    test_assert_int_equal( ENS_SIZE , load_scheduler_get_num_complete( scheduler ));
+  }
+
+  load_scheduler_free( scheduler );
+}
+
+
+void test_null_scheduler() {
+  load_scheduler_reset( NULL );
+  load_scheduler_begin_io( NULL , 0 );
+  load_scheduler_end_io( NULL , 0 );
+  load_scheduler_begin_cpu( NULL , 0 );
+  load_scheduler_end_cpu( NULL , 0 );
+  load_scheduler_complete_job( NULL , 0 );
+}
+
+
+int main(int argc , char ** argv) {
+  test_io_limit();
+  test_reset();
+  test_null_scheduler();
+  exit(0);
+}
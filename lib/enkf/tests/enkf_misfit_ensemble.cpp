@@ -0,0 +1,114 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'enkf_misfit_ensemble.cpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+#include <stdlib.h>
+#include <stdio.h>
+
+#include <ert/util/test_util.h>
+#include <ert/util/test_work_area.hpp>
+#include <ert/util/int_vector.h>
+
+#include <ert/enkf/misfit_ensemble.hpp>
+#include <ert/enkf/misfit_member.hpp>
+#include <ert/enkf/misfit_ts.hpp>
+
+#define ENS_SIZE       5
+#define HISTORY_LENGTH 3
+
+
+void test_member_chi2() {
+  misfit_member_type * member = misfit_member_alloc( 0 );
+  double chi2[HISTORY_LENGTH + 1] = {0 , 1 , 2 , 4};
+  int_vector_type * steps = int_vector_alloc( 0 , 0 );
+
+  test_assert_false( misfit_member_has_ts( member , "WOPR:OP_1" ));
+  misfit_member_set_chi2( member , "WOPR:OP_1" , HISTORY_LENGTH , chi2 );
+  test_assert_true( misfit_member_has_ts( member , "WOPR:OP_1" ));
+
+  for (int step = 0; step <= HISTORY_LENGTH; step++)
+    int_vector_append( steps , step );
+  test_assert_double_equal( 7 , misfit_ts_eval( misfit_member_get_ts( member , "WOPR:OP_1" ) , steps ));
+
+  int_vector_free( steps );
+  misfit_member_free__( member );
+}
+
+
+void test_fread_initialized() {
+  ecl::util::TestArea ta("misfit_ensemble");
+  misfit_ensemble_type * misfit_ensemble = misfit_ensemble_alloc( );
+  double chi2[HISTORY_LENGTH + 1] = {0 , 1 , 1 , 1};
+
+  misfit_ensemble_set_ens_size( misfit_ensemble , ENS_SIZE );
+  for (int iens = 0; iens < ENS_SIZE; iens++)
+    misfit_member_set_chi2( misfit_ensemble_iget_member( misfit_ensemble , iens ) , "FOPR" , HISTORY_LENGTH , chi2 );
+  test_assert_false( misfit_ensemble_initialized( misfit_ensemble ));
+
+  {
+    FILE * stream = util_fopen( "misfit-ensemble" , "w" );
+    misfit_ensemble_fwrite( misfit_ensemble , stream );
+    fclose( stream );
+  }
+
+  /*
+    The table was never calculated from an observation set, so it has
+    no signature and is not trusted when read back.
+  */
+  {
+    misfit_ensemble_type * copy = misfit_ensemble_alloc( );
+    FILE * stream = util_fopen( "misfit-ensemble" , "r" );
+    misfit_ensemble_fread( copy , stream );
+    fclose( stream );
+
+    test_assert_false( misfit_ensemble_initialized( copy ));
+    test_assert_int_equal( ENS_SIZE , misfit_ensemble_get_ens_size( copy ));
+    test_assert_true( misfit_member_has_ts( misfit_ensemble_iget_member( copy , ENS_SIZE - 1) , "FOPR" ));
+    misfit_ensemble_free( copy );
+  }
+
+  misfit_ensemble_free( misfit_ensemble );
+}
+
+
+void test_fread_old_format() {
+  ecl::util::TestArea ta("misfit_ensemble");
+  {
+    FILE * stream = util_fopen( "misfit-ensemble" , "w" );
+    util_fwrite_int( HISTORY_LENGTH , stream );
+    util_fwrite_int( 0 , stream );
+    fclose( stream );
+  }
+
+  {
+    misfit_ensemble_type * misfit_ensemble = misfit_ensemble_alloc( );
+    FILE * stream = util_fopen( "misfit-ensemble" , "r" );
+    misfit_ensemble_fread( misfit_ensemble , stream );
+    fclose( stream );
+
+    test_assert_false( misfit_ensemble_initialized( misfit_ensemble ));
+    test_assert_int_equal( 0 , misfit_ensemble_get_ens_size( misfit_ensemble ));
+    misfit_ensemble_free( misfit_ensemble );
+  }
+}
+
+
+int main(int argc , char ** argv) {
+  test_member_chi2();
+  test_fread_initialized();
+  test_fread_old_format();
+  exit(0);
+}
@@ -347,6 +347,46 @@ void test_readonly() {
 }
 
 
+void test_fwrite_modified() {
+  ecl::util::TestArea ta("state_map_modified");
+  state_map_type * state_map = state_map_alloc();
+
+  state_map_iset( state_map , 0 , STATE_INITIALIZED );
+  state_map_fwrite( state_map , "map" );
+  test_assert_false( util_file_exists( "map.tmp" ));
+  {
+    time_t mtime1 = util_file_mtime( "map" );
+    sleep(2);
+    state_map_fwrite( state_map , "map" );
+    test_assert_time_t_equal( mtime1 , util_file_mtime( "map" ));
+
+    state_map_iset( state_map , 0 , STATE_INITIALIZED );
+    state_map_fwrite( state_map , "map" );
+    test_assert_time_t_equal( mtime1 , util_file_mtime( "map" ));
+
+    state_map_iset( state_map , 0 , STATE_HAS_DATA );
+    state_map_fwrite( state_map , "map" );
+    test_assert_time_t_not_equal( mtime1 , util_file_mtime( "map" ));
+  }
+
+  /* A map which has not been modified is still written if the file is missing. */
+  unlink( "map" );
+  state_map_fwrite( state_map , "map" );
+  {
+    state_map_type * copy = state_map_fread_alloc( "map" );
+    test_assert_true( state_map_equal( state_map , copy ));
+    state_map_free( copy );
+  }
+  {
+    state_map_type * copy = state_map_alloc_readonly_copy( state_map );
+    test_assert_true( state_map_is_readonly( copy ));
+    test_assert_true( state_map_equal( state_map , copy ));
+    state_map_free( copy );
+  }
+  state_map_free( state_map );
+}
+
+
 int main(int argc , char ** argv) {
   create_test();
   get_test();
@@ -360,6 +400,7 @@ int main(int argc , char ** argv) {
   test_count_matching();
   test_transitions();
   test_readonly();
+  test_fwrite_modified();
   exit(0);
 }
 
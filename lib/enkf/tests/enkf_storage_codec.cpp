@@ -0,0 +1,154 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'enkf_storage_codec.cpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <math.h>
+#include <time.h>
+
+#include <ert/util/test_util.h>
+#include <ert/util/util.h>
+#include <ert/util/buffer.h>
+
+#include <ert/ecl/ecl_file.h>
+#include <ert/ecl/ecl_kw.h>
+
+#include <ert/enkf/storage_codec.hpp>
+
+
+void test_parse() {
+  storage_codec_enum codec;
+  int level;
+
+  test_assert_true( storage_codec_parse( "NONE" , &codec , &level ));
+  test_assert_int_equal( STORAGE_CODEC_NONE , codec );
+
+  test_assert_true( storage_codec_parse( "fast" , &codec , &level ));
+  test_assert_int_equal( STORAGE_CODEC_FAST , codec );
+
+  test_assert_true( storage_codec_parse( "ZLIB" , &codec , &level ));
+  test_assert_int_equal( STORAGE_CODEC_ZLIB , codec );
+  test_assert_int_equal( STORAGE_CODEC_DEFAULT_LEVEL , level );
+
+  test_assert_true( storage_codec_parse( "ZLIB:9" , &codec , &level ));
+  test_assert_int_equal( STORAGE_CODEC_ZLIB , codec );
+  test_assert_int_equal( 9 , level );
+
+  test_assert_false( storage_codec_parse( "ZLIB:10" , &codec , &level ));
+  test_assert_false( storage_codec_parse( "FAST:1" , &codec , &level ));
+  test_assert_false( storage_codec_parse( "LZ4" , &codec , &level ));
+  test_assert_false( storage_codec_parse( NULL , &codec , &level ));
+}
+
+
+/*
+  Writes and reads back @data with all the codecs, and prints the
+  throughput and the size ratio of each of them.
+*/
+
+void test_codecs( const char * name , const void * data , int byte_size , int elem_size ) {
+  const storage_codec_enum codecs[] = {STORAGE_CODEC_NONE , STORAGE_CODEC_FAST , STORAGE_CODEC_ZLIB , STORAGE_CODEC_ZLIB , STORAGE_CODEC_ZLIB};
+  const int levels[]                = {STORAGE_CODEC_DEFAULT_LEVEL , STORAGE_CODEC_DEFAULT_LEVEL , 1 , STORAGE_CODEC_DEFAULT_LEVEL , 9};
+  void * copy = util_malloc( byte_size );
+
+  printf("%s: %d bytes\n", name , byte_size);
+  for (int i = 0; i < 5; i++) {
+    buffer_type * buffer = buffer_alloc( 1024 );
+    struct timespec t0, t1, t2;
+
+    clock_gettime( CLOCK_MONOTONIC , &t0 );
+    storage_codec_fwrite( buffer , codecs[i] , levels[i] , data , byte_size , elem_size );
+    clock_gettime( CLOCK_MONOTONIC , &t1 );
+
+    buffer_rewind( buffer );
+    memset( copy , 0 , byte_size );
+    storage_codec_fread( buffer , copy , byte_size );
+    clock_gettime( CLOCK_MONOTONIC , &t2 );
+
+    test_assert_int_equal( 0 , memcmp( data , copy , byte_size ));
+    test_assert_int_equal( 0 , buffer_get_remaining_size( buffer ));
+    {
+      double write_time = (t1.tv_sec - t0.tv_sec) + 1e-9 * (t1.tv_nsec - t0.tv_nsec);
+      double read_time  = (t2.tv_sec - t1.tv_sec) + 1e-9 * (t2.tv_nsec - t1.tv_nsec);
+      double mb         = byte_size / (1024.0 * 1024.0);
+
+      printf("  %-4s level:%2d  size ratio:%6.3f  write:%9.1f MB/s  read:%9.1f MB/s\n",
+             storage_codec_get_name( codecs[i] ) ,
+             levels[i] ,
+             1.0 * buffer_get_size( buffer ) / util_int_max( byte_size , 1 ),
+             mb / util_double_max( write_time , 1e-9 ),
+             mb / util_double_max( read_time , 1e-9 ));
+    }
+    buffer_free( buffer );
+  }
+  free( copy );
+}
+
+
+/*
+  Records written with buffer_fwrite_compressed() before the codecs
+  were introduced must still be readable.
+*/
+
+void test_read_old_record( const float * data , int byte_size ) {
+  buffer_type * buffer = buffer_alloc( 1024 );
+  float * copy = (float *) util_malloc( byte_size );
+
+  buffer_fwrite_compressed( buffer , data , byte_size );
+  buffer_rewind( buffer );
+  storage_codec_fread( buffer , copy , byte_size );
+  test_assert_int_equal( 0 , memcmp( data , copy , byte_size ));
+
+  free( copy );
+  buffer_free( buffer );
+}
+
+
+void test_empty() {
+  buffer_type * buffer = buffer_alloc( 1024 );
+  storage_codec_fwrite( buffer , STORAGE_CODEC_FAST , STORAGE_CODEC_DEFAULT_LEVEL , NULL , 0 , sizeof(float) );
+  buffer_rewind( buffer );
+  storage_codec_fread( buffer , NULL , 0 );
+  test_assert_int_equal( 0 , buffer_get_remaining_size( buffer ));
+  buffer_free( buffer );
+}
+
+
+int main(int argc , char ** argv) {
+  const int size = 100003;   /* Not a multiple of the element size in bytes. */
+  float * data = (float *) util_malloc( size * sizeof * data );
+  for (int i = 0; i < size; i++)
+    data[i] = 0.25 + 0.05 * sin( i * 0.001 ) + 0.001 * (i % 7);
+
+  test_parse();
+  test_empty();
+  test_read_old_record( data , size * sizeof * data );
+  test_codecs( "Synthetic field" , data , size * sizeof * data , sizeof * data );
+  test_codecs( "Synthetic field - odd byte size" , data , size * sizeof * data - 1 , sizeof * data );
+  free( data );
+
+  /* Optional: an INIT file with a PORO keyword to test real field data. */
+  if (argc > 1) {
+    ecl_file_type * init_file = ecl_file_open( argv[1] , 0 );
+    ecl_kw_type * poro = ecl_file_iget_named_kw( init_file , "PORO" , 0 );
+    test_codecs( argv[1] , ecl_kw_get_ptr( poro ) , ecl_kw_get_size( poro ) * ecl_kw_get_sizeof_ctype( poro ) , ecl_kw_get_sizeof_ctype( poro ));
+    ecl_file_close( init_file );
+  }
+
+  exit(0);
+}
@@ -0,0 +1,90 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'enkf_summary_load_cache.cpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+#include <stdlib.h>
+#include <stdbool.h>
+
+#include <ert/util/test_util.h>
+#include <ert/util/util.h>
+#include <ert/util/int_vector.h>
+
+#include <ert/ecl/ecl_sum.h>
+
+#include <ert/enkf/summary_load_cache.hpp>
+
+
+void test_matched_nodes( const ecl_sum_type * ecl_sum ) {
+  const ecl_smspec_type * smspec = ecl_sum_get_smspec( ecl_sum );
+  summary_load_cache_type * cache = summary_load_cache_alloc( );
+  summary_key_matcher_type * matcher = summary_key_matcher_alloc( );
+  summary_key_matcher_add_summary_key( matcher , "F*" );
+  summary_key_matcher_add_summary_key( matcher , "WOPR:*" );
+
+  test_assert_true( summary_load_cache_is_instance( cache ));
+  {
+    const int_vector_type * matched_nodes = summary_load_cache_get_matched_nodes( cache , smspec , matcher );
+    int num_matched = 0;
+
+    for (int i = 0; i < ecl_smspec_num_nodes( smspec ); i++) {
+      const ecl::smspec_node& smspec_node = ecl_smspec_iget_node_w_node_index( smspec , i );
+      if (summary_key_matcher_match_summary_key( matcher , smspec_node.get_gen_key1() )) {
+        test_assert_int_equal( i , int_vector_iget( matched_nodes , num_matched ));
+        num_matched++;
+      }
+    }
+    test_assert_int_equal( num_matched , int_vector_size( matched_nodes ));
+    test_assert_true( num_matched > 0 );
+
+    test_assert_ptr_equal( matched_nodes , summary_load_cache_get_matched_nodes( cache , smspec , matcher ));
+    test_assert_int_equal( 1 , summary_load_cache_get_num_layouts( cache ));
+  }
+
+  summary_key_matcher_free( matcher );
+  summary_load_cache_free( cache );
+}
+
+
+void test_time_index( const ecl_sum_type * ecl_sum ) {
+  summary_load_cache_type * cache = summary_load_cache_alloc( );
+  time_map_type * time_map = time_map_alloc( );
+  int_vector_type * index1 = summary_load_cache_alloc_time_index( cache , time_map , ecl_sum );
+  int_vector_type * index2 = summary_load_cache_alloc_time_index( cache , time_map , ecl_sum );
+  int_vector_type * expected = time_map_alloc_index_map( time_map , ecl_sum );
+
+  test_assert_int_equal( ecl_sum_get_last_report_step( ecl_sum ) , time_map_get_last_step( time_map ));
+  test_assert_true( int_vector_equal( expected , index1 ));
+  test_assert_true( int_vector_equal( expected , index2 ));
+  test_assert_ptr_not_equal( index1 , index2 );
+  test_assert_int_equal( 1 , summary_load_cache_get_num_time_indices( cache ));
+
+  int_vector_free( expected );
+  int_vector_free( index2 );
+  int_vector_free( index1 );
+  time_map_free( time_map );
+  summary_load_cache_free( cache );
+}
+
+
+int main(int argc , char ** argv) {
+  ecl_sum_type * ecl_sum = ecl_sum_fread_alloc_case( argv[1] , ":" );
+
+  test_matched_nodes( ecl_sum );
+  test_time_index( ecl_sum );
+
+  ecl_sum_free( ecl_sum );
+  exit(0);
+}
@@ -369,6 +369,38 @@ void test_read_only() {
 }
 
 
+void test_readonly_cache() {
+  ecl::util::TestArea ta("readonly_cache");
+  time_map_type * tm = time_map_alloc(  );
+
+  time_map_update( tm , 0 , 0 );
+  time_map_update( tm , 1 , 10 );
+  time_map_fwrite( tm , "case/files/time-map" );
+  test_assert_false( util_file_exists( "case/files/time-map.tmp" ));
+  {
+    time_map_type * tm1 = enkf_fs_alloc_readonly_time_map( "case" );
+    time_map_type * tm2 = enkf_fs_alloc_readonly_time_map( "case" );
+
+    test_assert_true( tm1 != tm2 );
+    test_assert_true( time_map_is_readonly( tm2 ));
+    test_assert_true( time_map_equal( tm , tm1 ));
+    test_assert_true( time_map_equal( tm , tm2 ));
+    time_map_free( tm1 );
+    time_map_free( tm2 );
+  }
+
+  time_map_update( tm , 2 , 20 );
+  time_map_fwrite( tm , "case/files/time-map" );
+  {
+    time_map_type * tm1 = enkf_fs_alloc_readonly_time_map( "case" );
+    test_assert_int_equal( 3 , time_map_get_size( tm1 ));
+    test_assert_true( time_map_equal( tm , tm1 ));
+    time_map_free( tm1 );
+  }
+  time_map_free( tm );
+}
+
+
 int main(int argc , char ** argv) {
 
   enkf_main_install_SIGNALS();
@@ -386,6 +418,7 @@ int main(int argc , char ** argv) {
   }
 
   test_read_only();
+  test_readonly_cache();
 
   exit(0);
 }
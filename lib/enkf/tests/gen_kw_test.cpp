@@ -34,6 +34,7 @@
 #include <ert/enkf/enkf_state.hpp>
 #include <ert/enkf/run_arg.hpp>
 #include <ert/enkf/gen_kw_config.hpp>
+#include <ert/enkf/gen_kw.hpp>
 
 
 
@@ -99,6 +100,64 @@ void test_read_erroneous_gen_kw_file() {
 }
 
 
+static void assert_same_content(const char * file1 , const char * file2) {
+  int size1 , size2;
+  char * content1 = util_fread_alloc_file_content( file1 , &size1 );
+  char * content2 = util_fread_alloc_file_content( file2 , &size2 );
+
+  test_assert_int_equal( size1 , size2 );
+  test_assert_string_equal( content1 , content2 );
+  free( content1 );
+  free( content2 );
+}
+
+
+void test_filter_file_template() {
+  const char * parameter_filename = "TEMPLATE_PARAMETERS.txt";
+  const char * tmpl_filename = "TEMPLATE.tmpl";
+
+  {
+    FILE * stream = util_fopen(parameter_filename, "w");
+    fprintf(stream, "A CONST 1.5\nB NORMAL 0 1\nC UNIFORM 0 1\nA CONST 2.5\n");
+    fclose(stream);
+
+    stream = util_fopen(tmpl_filename, "w");
+    fprintf(stream, "<A> <B>\n<<C>> <D> <B<C>> <>\n<B>");
+    fclose(stream);
+  }
+
+  {
+    gen_kw_config_type * gen_kw_config = gen_kw_config_alloc_empty("TEMPLATE", "<%s>");
+    gen_kw_config_set_template_file(gen_kw_config, tmpl_filename);
+    gen_kw_config_set_parameter_file(gen_kw_config, parameter_filename);
+    {
+      gen_kw_template_type * template_ = gen_kw_config_alloc_template( gen_kw_config );
+      gen_kw_type * gen_kw = gen_kw_alloc( gen_kw_config );
+
+      test_assert_true( gen_kw_template_is_instance( template_ ));
+      for (int i = 0; i < gen_kw_data_size( gen_kw ); i++)
+        gen_kw_data_iset( gen_kw , i , 0.25 * (i + 1));
+
+      gen_kw_filter_file( gen_kw , "template/filter.txt" );
+      gen_kw_filter_file_template( gen_kw , template_ , "template/compiled.txt" );
+      assert_same_content( "template/filter.txt" , "template/compiled.txt" );
+
+      gen_kw_free( gen_kw );
+      gen_kw_template_free( template_ );
+    }
+    gen_kw_config_free(gen_kw_config);
+  }
+
+  {
+    gen_kw_config_type * gen_kw_config = gen_kw_config_alloc_empty("TEMPLATE", "%s");
+    gen_kw_config_set_template_file(gen_kw_config, tmpl_filename);
+    gen_kw_config_set_parameter_file(gen_kw_config, parameter_filename);
+    test_assert_NULL( gen_kw_config_alloc_template( gen_kw_config ));
+    gen_kw_config_free(gen_kw_config);
+  }
+}
+
+
 int main(int argc , char ** argv) {
   const char * config_file             =  argv[1];
   ert_test_context_type * test_context = ert_test_context_alloc("gen_kw_test" , config_file );
@@ -107,6 +166,7 @@ int main(int argc , char ** argv) {
 
   test_write_gen_kw_export_file(enkf_main);
   test_read_erroneous_gen_kw_file();
+  test_filter_file_template();
 
   ert_test_context_free( test_context );
   exit(0);
@@ -17,9 +17,13 @@
 
 
 #include <stdlib.h>
+#include <stdio.h>
 #include <cmath>
 #include <pthread.h>
 #include <stdbool.h>
+#include <string.h>
+#include <errno.h>
+#include <unistd.h>
 
 #include <ert/util/util.h>
 #include <ert/util/time_t_vector.h>
@@ -40,7 +44,7 @@ static void time_map_summary_update_abort( time_map_type * map , const ecl_sum_t
 struct time_map_struct {
   UTIL_TYPE_ID_DECLARATION;
   time_t_vector_type * map;
-  pthread_rwlock_t     rw_lock;
+  mutable pthread_rwlock_t rw_lock;
   bool                 modified;
   bool                 read_only;
   bool                 strict;
@@ -129,6 +133,20 @@ void time_map_set_strict( time_map_type * time_map , bool strict) {
 }
 
 
+time_map_type * time_map_alloc_readonly_copy( const time_map_type * map ) {
+  time_map_type * copy = time_map_alloc();
+
+  pthread_rwlock_rdlock( &map->rw_lock );
+  {
+    time_t_vector_memcpy( copy->map , map->map );
+  }
+  pthread_rwlock_unlock( &map->rw_lock );
+  copy->strict = map->strict;
+  copy->read_only = true;
+  return copy;
+}
+
+
 time_map_type * time_map_fread_alloc_readonly( const char * filename) {
   time_map_type * tm = time_map_alloc();
 
@@ -231,7 +249,8 @@ static bool time_map_update__( time_map_type * map , int step , time_t update_ti
 
 
   if (updateOK) {
-    map->modified = true;
+    if ((current_time != update_time) || (step >= time_t_vector_size( map->map )))
+      map->modified = true;
     time_t_vector_iset( map->map , step , update_time );
   }
 
@@ -305,17 +324,31 @@ static void time_map_assert_writable( const time_map_type * map) {
    the time_map_fwrite() function reads the time_map and takes the
    read lock, whereas the time_map_fread() function takes the write
    lock.
+
+   The map is only written if it has been modified, and it is written
+   to a temporary file which is synced to disk and then renamed to
+   @filename; so the file is never seen partially written. The map is
+   only marked as unmodified when the write has succeeded.
 */
 
 void time_map_fwrite( time_map_type * map , const char * filename ) {
   pthread_rwlock_rdlock( &map->rw_lock );
   {
     if (map->modified) {
-      FILE * stream = util_mkdir_fopen(filename , "w");
-      time_t_vector_fwrite( map->map , stream );
-      fclose( stream );
+      char * tmp_file = util_alloc_sprintf("%s.tmp" , filename );
+      FILE * stream = util_mkdir_fopen(tmp_file , "w");
+      if (stream) {
+        time_t_vector_fwrite( map->map , stream );
+        fflush( stream );
+        fsync( fileno( stream ));
+        fclose( stream );
+        if (rename( tmp_file , filename ) != 0)
+          util_abort("%s: failed to rename:%s -> %s: %s \n",__func__ , tmp_file , filename , strerror( errno ));
+      } else
+        util_abort("%s: failed to open:%s for writing \n",__func__ , tmp_file );
+      free( tmp_file );
+      map->modified = false;
     }
-    map->modified = false;
   }
   pthread_rwlock_unlock( &map->rw_lock );
 }
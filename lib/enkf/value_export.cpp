@@ -97,7 +97,7 @@ static void generate_hirarchical_keys(const value_export_type * value, FILE * st
 {
     for (auto iterMaps = value->values.begin(); iterMaps!= value->values.end(); ++iterMaps   ) {
         std::string key = (*iterMaps).first;
-        std::map<std::string,double> subMap = (*iterMaps).second;
+        const std::map<std::string,double>& subMap = (*iterMaps).second;
         fprintf(stream, "\"%s\" : {\n", key.c_str());
 
         for (auto iterValues = subMap.begin(); iterValues != subMap.end(); ++iterValues) {
@@ -126,7 +126,7 @@ static void generate_comosite_keys(const value_export_type * value, FILE * strea
 {
     for (auto iterMaps = value->values.begin(); iterMaps!= value->values.end(); ++iterMaps   ) {
         std::string key = (*iterMaps).first;
-        std::map<std::string,double> subMap = (*iterMaps).second;
+        const std::map<std::string,double>& subMap = (*iterMaps).second;
 
         for (auto iterValues = subMap.begin(); iterValues != subMap.end(); ++iterValues) {
 
@@ -0,0 +1,247 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'vector_block.cpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+
+#include <stdlib.h>
+
+#include <ert/util/util.h>
+#include <ert/util/hash.h>
+#include <ert/util/stringlist.h>
+#include <ert/util/type_macros.h>
+
+#include <ert/enkf/vector_block.hpp>
+
+/*
+  The vector_block collects the serialized vectors of many keys, for one
+  realization, so they can be stored as one record instead of one
+  record per key. The stored record has the layout:
+
+     int     VECTOR_BLOCK_ID
+     int     index_size           - the size in bytes of the index below
+     int     num_keys             \
+     string  key                   | index
+     int     size                  |
+     ....                         /
+     data                         - the vectors in the same order as the index
+
+  The index is at the start of the record, so a single vector can be
+  located by reading only the index, and then read with a range read of
+  the record; see enkf_fs_alloc_vector_view().
+*/
+
+
+#define VECTOR_BLOCK_TYPE_ID 661093245
+#define VECTOR_BLOCK_ID      117031
+
+typedef struct {
+  int offset;      /* Offset of the vector relative to the start of the data section. */
+  int size;
+} vector_block_entry_type;
+
+
+struct vector_block_struct {
+  UTIL_TYPE_ID_DECLARATION;
+  stringlist_type * keys;
+  hash_type       * index;         /* key -> vector_block_entry_type */
+  buffer_type     * data;          /* NULL if only the index has been loaded. */
+  int               data_offset;   /* Offset of the data section in the stored record; -1 if it has not been stored. */
+};
+
+
+UTIL_IS_INSTANCE_FUNCTION( vector_block , VECTOR_BLOCK_TYPE_ID )
+
+
+static vector_block_type * vector_block_alloc__( bool with_data ) {
+  vector_block_type * block = (vector_block_type *) util_malloc( sizeof * block );
+  UTIL_TYPE_ID_INIT( block , VECTOR_BLOCK_TYPE_ID );
+  block->keys = stringlist_alloc_new( );
+  block->index = hash_alloc( );
+  block->data = with_data ? buffer_alloc( 1024 ) : NULL;
+  block->data_offset = -1;
+  return block;
+}
+
+
+vector_block_type * vector_block_alloc( ) {
+  return vector_block_alloc__( true );
+}
+
+
+void vector_block_free( vector_block_type * block ) {
+  stringlist_free( block->keys );
+  hash_free( block->index );
+  if (block->data != NULL)
+    buffer_free( block->data );
+  free( block );
+}
+
+
+void vector_block_free__( void * arg ) {
+  vector_block_free( (vector_block_type *) arg );
+}
+
+
+static void vector_block_add_entry( vector_block_type * block , const char * key , int offset , int size ) {
+  vector_block_entry_type * entry = (vector_block_entry_type *) util_malloc( sizeof * entry );
+  entry->offset = offset;
+  entry->size = size;
+  hash_insert_hash_owned_ref( block->index , key , entry , free );
+  stringlist_append_copy( block->keys , key );
+}
+
+
+/*
+  Adds the complete content of @buffer as the vector for @key.
+*/
+
+void vector_block_add( vector_block_type * block , const char * key , const buffer_type * buffer ) {
+  if (block->data == NULL)
+    util_abort("%s: can not add vectors to a vector_block which has only loaded the index \n",__func__);
+
+  if (hash_has_key( block->index , key ))
+    util_abort("%s: the key:%s has already been added \n",__func__ , key);
+
+  {
+    int size = buffer_get_size( buffer );
+    vector_block_add_entry( block , key , buffer_get_size( block->data ) , size );
+    buffer_fwrite( block->data , buffer_get_data( buffer ) , 1 , size );
+  }
+}
+
+
+int vector_block_get_size( const vector_block_type * block ) {
+  return stringlist_get_size( block->keys );
+}
+
+
+const char * vector_block_iget_key( const vector_block_type * block , int index ) {
+  return stringlist_iget( block->keys , index );
+}
+
+
+bool vector_block_has_key( const vector_block_type * block , const char * key ) {
+  return hash_has_key( block->index , key );
+}
+
+
+/*
+  Copies the stored vector of @key into @buffer, and rewinds it; the
+  data must have been loaded, i.e. this can not be used on an instance
+  from vector_block_fread_alloc_index().
+*/
+
+void vector_block_copy_buffer( const vector_block_type * block , const char * key , buffer_type * buffer ) {
+  const vector_block_entry_type * entry = (const vector_block_entry_type *) hash_get( block->index , key );
+
+  if (block->data == NULL)
+    util_abort("%s: the vector data has not been loaded \n",__func__);
+
+  buffer_clear( buffer );
+  buffer_fwrite( buffer , buffer_iget_data( block->data , entry->offset ) , 1 , entry->size );
+  buffer_rewind( buffer );
+}
+
+
+/*
+  Returns the position of the vector of @key in the stored record, i.e.
+  in a record written with vector_block_fwrite() or loaded with one of
+  the fread functions.
+*/
+
+void vector_block_get_range( const vector_block_type * block , const char * key , int * offset , int * size ) {
+  const vector_block_entry_type * entry = (const vector_block_entry_type *) hash_get( block->index , key );
+
+  if (block->data_offset < 0)
+    util_abort("%s: the vector_block has not been stored \n",__func__);
+
+  *offset = block->data_offset + entry->offset;
+  *size = entry->size;
+}
+
+
+void vector_block_fwrite( vector_block_type * block , buffer_type * buffer ) {
+  buffer_type * index = buffer_alloc( 1024 );
+
+  buffer_fwrite_int( index , stringlist_get_size( block->keys ));
+  for (int i = 0; i < stringlist_get_size( block->keys ); i++) {
+    const char * key = stringlist_iget( block->keys , i );
+    const vector_block_entry_type * entry = (const vector_block_entry_type *) hash_get( block->index , key );
+
+    buffer_fwrite_string( index , key );
+    buffer_fwrite_int( index , entry->size );
+  }
+
+  buffer_fwrite_int( buffer , VECTOR_BLOCK_ID );
+  buffer_fwrite_int( buffer , buffer_get_size( index ));
+  buffer_fwrite( buffer , buffer_get_data( index ) , 1 , buffer_get_size( index ));
+  block->data_offset = 2 * sizeof(int) + buffer_get_size( index );
+  buffer_fwrite( buffer , buffer_get_data( block->data ) , 1 , buffer_get_size( block->data ));
+
+  buffer_free( index );
+}
+
+
+/*
+  The first VECTOR_BLOCK_HEADER_SIZE bytes of a stored record give the
+  number of bytes which must be read from the start of the record to
+  get the complete index.
+*/
+
+int vector_block_fread_index_size( buffer_type * buffer ) {
+  int id = buffer_fread_int( buffer );
+  if (id != VECTOR_BLOCK_ID)
+    util_abort("%s: the record is not a vector block \n",__func__);
+
+  return VECTOR_BLOCK_HEADER_SIZE + buffer_fread_int( buffer );
+}
+
+
+static vector_block_type * vector_block_fread_alloc__( buffer_type * buffer , bool with_data ) {
+  vector_block_type * block = vector_block_alloc__( with_data );
+  int index_size = vector_block_fread_index_size( buffer );
+  int num_keys = buffer_fread_int( buffer );
+  int offset = 0;
+
+  for (int i = 0; i < num_keys; i++) {
+    const char * key = buffer_fread_string( buffer );
+    int size = buffer_fread_int( buffer );
+
+    vector_block_add_entry( block , key , offset , size );
+    offset += size;
+  }
+  block->data_offset = index_size;
+
+  if (with_data)
+    buffer_fwrite( block->data , buffer_iget_data( buffer , index_size ) , 1 , offset );
+
+  return block;
+}
+
+
+vector_block_type * vector_block_fread_alloc( buffer_type * buffer ) {
+  return vector_block_fread_alloc__( buffer , true );
+}
+
+
+/*
+  Will only load the index; @buffer must contain at least the number of
+  bytes given by vector_block_fread_index_size().
+*/
+
+vector_block_type * vector_block_fread_alloc_index( buffer_type * buffer ) {
+  return vector_block_fread_alloc__( buffer , false );
+}
@@ -46,16 +46,18 @@ typedef enum {
     ANALYSIS_USE_A      = 4,       // The module will read the content of A - but not modify it.
     ANALYSIS_UPDATE_A   = 8,       // The update will be based on modifying A directly, and not on an X matrix.
     ANALYSIS_SCALE_DATA = 16,
-    ANALYSIS_ITERABLE   = 32       // The module can bu used as an iterative smoother.
+    ANALYSIS_ITERABLE   = 32,      // The module can bu used as an iterative smoother.
+    ANALYSIS_DIAGONAL_R = 64       // The module accepts R as an nrobs x 1 matrix with only the diagonal.
 } analysis_module_flag_enum;
 
 
-#define ANALYSIS_MODULE_FLAG_ENUM_SIZE 5
+#define ANALYSIS_MODULE_FLAG_ENUM_SIZE 6
 #define ANALYSIS_MODULE_FLAG_ENUM_DEFS {.value = ANALYSIS_NEED_ED     , .name = "ANALYSIS_NEED_ED"},\
                                        {.value = ANALYSIS_USE_A       , .name = "ANALYSIS_USE_A"},\
                                        {.value = ANALYSIS_UPDATE_A    , .name = "ANALYSIS_UPDATE_A"},\
                                        {.value = ANALYSIS_SCALE_DATA  , .name = "ANALYSIS_SCALE_DATA"},\
-                                       {.value = ANALYSIS_ITERABLE    , .name = "ANALYSIS_ITERABLE"}
+                                       {.value = ANALYSIS_ITERABLE    , .name = "ANALYSIS_ITERABLE"},\
+                                       {.value = ANALYSIS_DIAGONAL_R  , .name = "ANALYSIS_DIAGONAL_R"}
 
 
 #define EXTERNAL_MODULE_NAME "analysis_table"
@@ -45,6 +45,7 @@ typedef struct active_list_struct active_list_type;
   bool               active_list_iget( const active_list_type * active_list , int index );
   bool               active_list_equal( const active_list_type * active_list1 , const active_list_type * active_list2);
   void               active_list_copy( active_list_type * target , const active_list_type * src);
+  active_list_type * active_list_alloc_block( const active_list_type * src , int offset , int size);
 
 UTIL_IS_INSTANCE_HEADER( active_list );
 
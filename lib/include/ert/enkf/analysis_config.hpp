@@ -106,6 +106,10 @@ void                   analysis_config_set_stop_long_running( analysis_config_ty
 bool                   analysis_config_get_stop_long_running( const analysis_config_type * config);
 void                   analysis_config_set_max_runtime( analysis_config_type * config, int max_runtime  );
 int                    analysis_config_get_max_runtime( const analysis_config_type * config );
+void                   analysis_config_set_max_update_memory( analysis_config_type * config , int max_update_memory );
+int                    analysis_config_get_max_update_memory( const analysis_config_type * config );
+void                   analysis_config_set_update_threads( analysis_config_type * config , int update_threads );
+int                    analysis_config_get_update_threads( const analysis_config_type * config );
 int                    analysis_config_get_min_realisations( const analysis_config_type * config );
 const char           * analysis_config_get_active_module_name( const analysis_config_type * config );
 bool                   analysis_config_get_std_scale_correlated_obs( const analysis_config_type * config);
@@ -25,6 +25,7 @@ extern "C" {
 
 /* These keys are used as options in KEY:VALUE statements */
 #define  BASE_SURFACE_KEY                  "BASE_SURFACE"
+#define  COMPRESSION_KEY                   "COMPRESSION"
 #define  DEFINE_KEY                        "DEFINE"
 #define  DYNAMIC_KEY                       "DYNAMIC"
 #define  ECL_FILE_KEY                      "ECL_FILE"
@@ -98,6 +99,8 @@ extern "C" {
 #define  JOB_SCRIPT_KEY                    "JOB_SCRIPT"
 #define  JOBNAME_KEY                       "JOBNAME"
 #define  LICENSE_PATH_KEY                  "LICENSE_PATH"
+#define  LOAD_CPU_THREADS_KEY              "LOAD_CPU_THREADS"
+#define  LOAD_IO_THREADS_KEY               "LOAD_IO_THREADS"
 #define  LOAD_SEED_KEY                     "LOAD_SEED"
 #define  LOCAL_CONFIG_KEY                  "LOCAL_CONFIG"
 #define  LOG_FILE_KEY                      "LOG_FILE"
@@ -137,6 +140,7 @@ extern "C" {
 #define  SIMULATION_JOB_KEY                "SIMULATION_JOB"
 #define  STATIC_KW_KEY                     "ADD_STATIC_KW"
 #define  STD_CUTOFF_KEY                    "STD_CUTOFF"
+#define  STORAGE_COMPRESSION_KEY           "STORAGE_COMPRESSION"
 #define  SUMMARY_KEY                       "SUMMARY"
 #define  SURFACE_KEY                       "SURFACE"
 #define  UPDATE_LOG_PATH_KEY               "UPDATE_LOG_PATH"
@@ -150,6 +154,8 @@ extern "C" {
 #define  LOAD_WORKFLOW_JOB_KEY             "LOAD_WORKFLOW_JOB"
 #define  STOP_LONG_RUNNING_KEY             "STOP_LONG_RUNNING"
 #define  MAX_RUNTIME_KEY                   "MAX_RUNTIME"
+#define  MAX_UPDATE_MEMORY_KEY             "MAX_UPDATE_MEMORY"
+#define  UPDATE_THREADS_KEY                "UPDATE_THREADS"
 #define  TIME_MAP_KEY                      "TIME_MAP"
 #define  EXT_JOB_SEARCH_PATH_KEY           "EXT_JOB_SEARCH_PATH"
 #define  STD_SCALE_CORRELATED_OBS_KEY      "STD_SCALE_CORRELATED_OBS"
@@ -26,6 +26,13 @@
 #define DEFAULT_GEN_KW_TAG_FORMAT    "<%s>"
 
 
+/**
+   The codec used when FIELD and GEN_DATA instances are stored; see
+   storage_codec.cpp. Attached to keyword : STORAGE_COMPRESSION.
+*/
+#define DEFAULT_STORAGE_COMPRESSION  "ZLIB"
+
+
 /**
   Default file name for export file for GEN_KW parameters
 */
@@ -100,6 +107,8 @@ const char * enkf_defaults_get_default_gen_kw_export_name();
 
 #define DEFAULT_MAX_SUBMIT           2        /* The number of times to resubmit - default value for config item: MAX_SUBMIT */
 #define DEFAULT_MAX_INTERNAL_SUBMIT  1        /** Attached to keyword : MAX_RETRY */
+#define DEFAULT_LOAD_IO_THREADS      0        /* Attached to keyword : LOAD_IO_THREADS; 0: One thread per available core */
+#define DEFAULT_LOAD_CPU_THREADS     0        /* Attached to keyword : LOAD_CPU_THREADS; 0: One thread per available core */
 
 
 
@@ -135,6 +144,8 @@ const char * enkf_defaults_get_default_gen_kw_export_name();
 #define DEFAULT_ANALYSIS_MIN_REALISATIONS  0   // 0: No lower limit
 #define DEFAULT_ANALYSIS_STOP_LONG_RUNNING false
 #define DEFAULT_MAX_RUNTIME                0
+#define DEFAULT_MAX_UPDATE_MEMORY          0   // Megabytes; 0: Serialize the full dataset in one go
+#define DEFAULT_UPDATE_THREADS             0   // 0: One thread per available core
 #define DEFAULT_ITER_RETRY_COUNT           4
 
 
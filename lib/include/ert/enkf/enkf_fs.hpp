@@ -24,6 +24,7 @@
 #include <ert/util/type_macros.h>
 #include <ert/util/buffer.h>
 #include <ert/util/stringlist.h>
+#include <ert/util/bool_vector.h>
 
 #include <ert/enkf/fs_driver.hpp>
 #include <ert/enkf/enkf_types.hpp>
@@ -35,6 +36,7 @@
 #include <ert/enkf/misfit_ensemble_typedef.hpp>
 #include <ert/enkf/summary_key_set.hpp>
 #include <ert/enkf/custom_kw_config_set.hpp>
+#include <ert/enkf/vector_block.hpp>
 
 #ifdef __cplusplus
 extern "C" {
@@ -44,6 +46,7 @@ extern "C" {
   const      char * enkf_fs_get_root_path( const enkf_fs_type * fs );
   const      char * enkf_fs_get_case_name( const enkf_fs_type * fs );
   bool              enkf_fs_is_read_only(const enkf_fs_type * fs);
+  double            enkf_fs_get_mount_time( const enkf_fs_type * fs );
   void              enkf_fs_fsync( enkf_fs_type * fs );
   void              enkf_fs_add_index_node(enkf_fs_type *  , int , int , const char * , enkf_var_type, ert_impl_type);
 
@@ -75,10 +78,23 @@ extern "C" {
                                          enkf_var_type var_type ,
                                          int iens);
 
+  buffer_type     * enkf_fs_alloc_node_view(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type ,
+                                            int report_step , int iens);
+  buffer_type     * enkf_fs_alloc_vector_view(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type , int iens);
+  void              enkf_fs_free_view(enkf_fs_type * enkf_fs , buffer_type * view , const char * node_key ,
+                                      enkf_var_type var_type , int iens);
+  void              enkf_fs_set_mmap( enkf_fs_type * fs , bool use_mmap );
+  bool              enkf_fs_get_mmap( const enkf_fs_type * fs );
 
   bool              enkf_fs_has_vector(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type , int iens);
+  vector_block_type * enkf_fs_alloc_vector_block( enkf_fs_type * fs , int iens );
+  void              enkf_fs_fwrite_vector_block( enkf_fs_type * fs , vector_block_type * block , int iens );
   bool              enkf_fs_has_node(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type , int report_step , int iens);
 
+  void              enkf_fs_share_parameters( enkf_fs_type * fs , enkf_fs_type * source_fs , const stringlist_type * keys , const bool_vector_type * iens_mask);
+  int               enkf_fs_unshare_parameters( enkf_fs_type * fs );
+  bool              enkf_fs_has_shared_parameters( const enkf_fs_type * fs );
+
   void              enkf_fs_debug_fprintf( const enkf_fs_type * fs);
 
   enkf_fs_type *    enkf_fs_create_fs( const char * mount_point , fs_driver_impl driver_id , void * arg, bool mount);
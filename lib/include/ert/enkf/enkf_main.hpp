@@ -58,6 +58,7 @@
 #include <ert/enkf/pca_plot_data.hpp>
 #include <ert/enkf/field_config.hpp>
 #include <ert/enkf/ert_run_context.hpp>
+#include <ert/enkf/load_scheduler.hpp>
 
 #ifdef __cplusplus
 extern "C" {
@@ -129,6 +130,7 @@ extern "C" {
   ensemble_config_type        * enkf_main_get_ensemble_config(const enkf_main_type * enkf_main);
   int                           enkf_main_get_ensemble_size( const enkf_main_type * enkf_main );
   int                           enkf_main_get_history_length( const enkf_main_type * );
+  int                           enkf_main_get_cpu_threads( const enkf_main_type * enkf_main );
   bool                          enkf_main_has_prediction( const enkf_main_type *  );
   //const enkf_sched_type       * enkf_main_get_enkf_sched(const enkf_main_type *);
   model_config_type           * enkf_main_get_model_config( const enkf_main_type * );
@@ -209,6 +211,8 @@ extern "C" {
   int enkf_main_load_from_forward_model_from_gui(enkf_main_type * enkf_main, int iter , bool_vector_type * iactive, enkf_fs_type * fs);
   int enkf_main_load_from_run_context(enkf_main_type* enkf_main, ert_run_context_type* run_context, stringlist_type** realizations_msg_list, enkf_fs_type* fs);
   int enkf_main_load_from_run_context_from_gui(enkf_main_type* enkf_main, ert_run_context_type* run_context, enkf_fs_type* fs);
+  int enkf_main_load_from_run_context_with_scheduler(enkf_main_type* enkf_main, ert_run_context_type* run_context, enkf_fs_type* fs, load_scheduler_type * scheduler);
+  load_scheduler_type * enkf_main_alloc_load_scheduler( const enkf_main_type * enkf_main );
 
   void enkf_main_rank_on_observations(enkf_main_type * enkf_main,
                                       const char * ranking_key,
@@ -168,10 +168,13 @@ extern "C" {
   void              enkf_node_load_vector( enkf_node_type * enkf_node , enkf_fs_type * fs , int iens);
   bool              enkf_node_store(enkf_node_type * enkf_node , enkf_fs_type * fs , bool force_vectors , node_id_type node_id);
   bool              enkf_node_store_vector(enkf_node_type *enkf_node , enkf_fs_type * fs , int iens );
+  bool              enkf_node_fwrite_vector_buffer(enkf_node_type *enkf_node , buffer_type * buffer );
+  void              enkf_node_fread_vector_buffer( enkf_node_type * enkf_node , enkf_fs_type * fs , buffer_type * buffer );
   bool              enkf_node_try_load(enkf_node_type *enkf_node , enkf_fs_type * fs , node_id_type node_id);
   bool              enkf_node_try_load_vector(enkf_node_type *enkf_node , enkf_fs_type * fs , int iens );
   bool              enkf_node_exists( enkf_node_type *enkf_node , enkf_fs_type * fs , int report_step , int iens);
   bool              enkf_node_vector_storage( const enkf_node_type * node );
+  bool              enkf_node_vector_has_step( const enkf_node_type * node , int report_step );
   enkf_node_type  * enkf_node_alloc_shared_container(const enkf_config_node_type * config, hash_type * node_hash);
   enkf_node_type * enkf_node_alloc_private_container(const enkf_config_node_type * config);
 /*****************************************************************/
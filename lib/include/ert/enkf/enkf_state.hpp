@@ -49,6 +49,7 @@
 #include <ert/enkf/enkf_util.hpp>
 #include <ert/enkf/enkf_serialize.hpp>
 #include <ert/enkf/run_arg.hpp>
+#include <ert/enkf/ert_run_context.hpp>
 
 #ifdef __cplusplus
 extern "C" {
@@ -77,6 +78,10 @@ typedef struct enkf_state_struct    enkf_state_type;
   void enkf_state_init_eclipse(const res_config_type * res_config,
                                const run_arg_type * run_arg );
 
+  void enkf_state_init_eclipse__(const res_config_type * res_config,
+                                 const run_arg_type * run_arg,
+                                 bool write_parameters);
+
   enkf_state_type  * enkf_state_alloc(int ,
                                       rng_type        * main_rng ,
                                       model_config_type * ,
@@ -90,6 +95,7 @@ typedef struct enkf_state_struct    enkf_state_type;
   void               enkf_state_sample(enkf_state_type * , int);
   void               enkf_state_ens_read(       enkf_state_type * , const char * , int);
   void               enkf_state_ecl_write(const ensemble_config_type * ens_config, const model_config_type * model_config, const run_arg_type * run_arg , enkf_fs_type * fs);
+  void               enkf_state_ecl_write_ensemble(const ensemble_config_type * ens_config, const model_config_type * model_config, const ert_run_context_type * run_context , int num_threads);
   void               enkf_state_free(enkf_state_type * );
   void               enkf_state_apply(enkf_state_type * , enkf_node_ftype1 * , int );
   void               enkf_state_serialize(enkf_state_type * , size_t);
@@ -34,6 +34,7 @@
 #include <ert/enkf/enkf_types.hpp>
 #include <ert/enkf/summary_key_matcher.hpp>
 #include <ert/enkf/custom_kw_config_set.hpp>
+#include <ert/enkf/storage_codec.hpp>
 
 #ifdef __cplusplus
 extern "C" {
@@ -45,6 +46,9 @@ typedef struct ensemble_config_struct ensemble_config_type;
   void                     ensemble_config_set_refcase( ensemble_config_type * ensemble_config , const ecl_sum_type * refcase);
   void                     ensemble_config_set_gen_kw_format( ensemble_config_type * ensemble_config , const char * gen_kw_format_string);
   const char             * ensemble_config_get_gen_kw_format( const ensemble_config_type * ensemble_config );
+  void                     ensemble_config_set_storage_codec( ensemble_config_type * ensemble_config , storage_codec_enum codec , int level);
+  storage_codec_enum       ensemble_config_get_storage_codec( const ensemble_config_type * ensemble_config );
+  int                      ensemble_config_get_storage_level( const ensemble_config_type * ensemble_config );
   enkf_config_node_type  * ensemble_config_add_container( ensemble_config_type * ensemble_config , const char * key);
   enkf_config_node_type  * ensemble_config_add_surface( ensemble_config_type * ensemble_config , const char * key , bool forward_init);
 
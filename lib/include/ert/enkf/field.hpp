@@ -55,6 +55,10 @@ extern "C" {
   field_type * field_alloc_shared(const field_config_type * , void * , int );
   void         field_free(field_type *);
   void         field_get_dims(const field_type *, int *, int *, int *);
+  void       * field_get_data_ptr(const field_type * field);
+  int          field_get_data_size(const field_type * field);
+  int          field_get_sizeof_ctype(const field_type * field);
+  const field_config_type * field_get_config(const field_type * field);
   bool         field_fload_keep_inactive(field_type * field , const char * filename);
   bool         field_fload_auto(field_type * , const char * , bool);
   bool         field_fload_rms(field_type * field , const char * filename, bool keep_inactive);
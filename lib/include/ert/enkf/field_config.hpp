@@ -24,6 +24,7 @@
 #include <stdbool.h>
 
 #include <ert/util/stringlist.h>
+#include <ert/util/int_vector.h>
 #include <ert/util/type_macros.h>
 
 #include <ert/ecl/ecl_kw.h>
@@ -38,6 +39,7 @@
 #include <ert/enkf/active_list.hpp>
 #include <ert/enkf/field_trans.hpp>
 #include <ert/enkf/field_common.hpp>
+#include <ert/enkf/storage_codec.hpp>
 
 #ifdef __cplusplus
 extern "C" {
@@ -126,6 +128,9 @@ void                    field_config_get_ijk( const field_config_type * config ,
 field_type            * field_config_get_min_std( const field_config_type * field_config );
 const char            * field_config_default_extension(field_file_format_type , bool );
 bool                    field_config_write_compressed(const field_config_type * );
+void                    field_config_set_storage_codec( field_config_type * config , storage_codec_enum codec , int level);
+storage_codec_enum      field_config_get_storage_codec( const field_config_type * config );
+int                     field_config_get_storage_level( const field_config_type * config );
 field_file_format_type  field_config_guess_file_type(const char * );
 ecl_data_type           field_config_get_ecl_data_type(const field_config_type *);
 rms_type_enum           field_config_get_rms_type(const field_config_type * );
@@ -176,6 +181,7 @@ int                     field_config_get_truncation_mode(const field_config_type
 double                  field_config_get_truncation_min( const field_config_type * config );
 double                  field_config_get_truncation_max( const field_config_type * config );
 ecl_grid_type         * field_config_get_grid(const field_config_type * );
+int_vector_type       * field_config_alloc_global_index(const field_config_type * config);
 const char            * field_config_get_grid_name( const field_config_type * );
 
   int                     field_config_parse_user_key(const field_config_type * config, const char * index_key , int *i , int *j , int *k);
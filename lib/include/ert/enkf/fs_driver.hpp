@@ -174,6 +174,12 @@ extern "C" {
   typedef void (unlink_vector_ftype)  (void * driver, const char * , int );
   typedef bool (has_vector_ftype)     (void * driver, const char * , int );
 
+  typedef buffer_type * (alloc_node_view_ftype)   (void * driver, const char * , int , int );
+  typedef buffer_type * (alloc_vector_view_ftype) (void * driver, const char * , int );
+  typedef void          (free_view_ftype)         (void * driver, int , buffer_type * );
+  typedef void          (set_mmap_ftype)          (void * driver, bool );
+  typedef void          (load_vector_range_ftype) (void * driver, const char * , int , int , int , buffer_type * );
+
   typedef void (fsync_driver_ftype) (void * driver);
   typedef void (free_driver_ftype)  (void * driver);
 
@@ -208,6 +214,11 @@ load_vector_ftype         * load_vector;   \
 save_vector_ftype         * save_vector;   \
 has_vector_ftype          * has_vector;    \
 unlink_vector_ftype       * unlink_vector; \
+alloc_node_view_ftype     * alloc_node_view;   \
+alloc_vector_view_ftype   * alloc_vector_view; \
+free_view_ftype           * free_view;     \
+set_mmap_ftype            * set_mmap;      \
+load_vector_range_ftype   * load_vector_range; \
 free_driver_ftype         * free_driver;   \
 fsync_driver_ftype        * fsync_driver;  \
 int                         type_id
@@ -26,11 +26,17 @@ extern "C" {
 #include <stdlib.h>
 #include <stdio.h>
 
+#include <ert/util/bool_vector.h>
+
 #include <ert/ecl/ecl_type.h>
 
 void    * gen_common_fscanf_alloc(const char * , ecl_data_type , int * );
+int       gen_common_fscanf_int(const char * file , int * data , int size);
 void    * gen_common_fread_alloc(const char *  , ecl_data_type , int * );
 void    * gen_common_fload_alloc(const char *  , gen_data_file_format_type , ecl_data_type , ecl_type_enum * , int * );
+bool      gen_common_is_binary_file(const char * file);
+void    * gen_common_fload_binary_alloc(const char * file , ecl_type_enum * load_data_type , int * size , bool_vector_type * active_mask , bool * has_active);
+void      gen_common_fwrite_binary(const char * file , ecl_data_type data_type , const void * data , int size , const bool_vector_type * active_mask);
 
 #ifdef __cplusplus
 }
@@ -53,6 +53,8 @@ const char  *             gen_data_get_key( const gen_data_type * gen_data);
 void                      gen_data_upgrade_103(const char * filename);
 int                       gen_data_get_size( const gen_data_type * gen_data );
 void                      gen_data_copy_to_double_vector(const gen_data_type * gen_data , double_vector_type * vector);
+void                    * gen_data_get_data_ptr( const gen_data_type * gen_data );
+int                       gen_data_get_sizeof_ctype( const gen_data_type * gen_data );
 bool                      gen_data_fload_with_report_step( gen_data_type * gen_data , const char * filename , const forward_load_context_type * load_context);
 
 UTIL_SAFE_CAST_HEADER(gen_data);
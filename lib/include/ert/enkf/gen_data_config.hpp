@@ -29,6 +29,7 @@
 #include <ert/enkf/enkf_types.hpp>
 #include <ert/enkf/enkf_macros.hpp>
 #include <ert/enkf/gen_data_common.hpp>
+#include <ert/enkf/storage_codec.hpp>
 
 #ifdef __cplusplus
 extern "C" {
@@ -85,6 +86,9 @@ typedef enum { GEN_DATA_UNDEFINED = 0,
   void gen_data_config_fprintf_config( const gen_data_config_type * config , enkf_var_type var_type , const char * outfile , const char * infile ,
                                        const char * min_std_file , FILE * stream);
   int gen_data_config_get_data_size__( const gen_data_config_type * config , int report_step);
+  void                        gen_data_config_set_storage_codec( gen_data_config_type * config , storage_codec_enum codec , int level);
+  storage_codec_enum          gen_data_config_get_storage_codec( const gen_data_config_type * config );
+  int                         gen_data_config_get_storage_level( const gen_data_config_type * config );
 
   UTIL_IS_INSTANCE_HEADER(gen_data_config);
   UTIL_SAFE_CAST_HEADER(gen_data_config);
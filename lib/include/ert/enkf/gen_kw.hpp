@@ -32,6 +32,7 @@ extern "C" {
 #include <ert/enkf/gen_kw_common.hpp>
 
 void             gen_kw_ecl_write(const gen_kw_type * gen_kw , const char * run_path , const char * base_file , value_export_type * export_value);
+void             gen_kw_ecl_write_with_template(const gen_kw_type * gen_kw , const gen_kw_template_type * template_ , const char * run_path , const char * base_file , value_export_type * export_value);
 void             gen_kw_write_export_file(const gen_kw_type * gen_kw , const char * filename);
 void             gen_kw_output_transform(gen_kw_type * );
 void             gen_kw_get_output_data(const gen_kw_type * , double * );
@@ -54,6 +55,7 @@ void             gen_kw_truncate(gen_kw_type * );
 gen_kw_type   *  gen_kw_alloc_mean(int , const gen_kw_type **);
 const char     * gen_kw_get_name(const gen_kw_type * , int );
 void             gen_kw_filter_file(const gen_kw_type * , const char * );
+void             gen_kw_filter_file_template(const gen_kw_type * gen_kw , const gen_kw_template_type * template_ , const char * target_file);
 void             gen_kw_export(const gen_kw_type * , int * , char ***, double **);
 void             gen_kw_upgrade_103( const char * filename );
 char           * gen_kw_alloc_user_key(const gen_kw_config_type *  , const char * , int );
@@ -28,8 +28,9 @@ extern "C" {
 #endif
 
 
-typedef struct gen_kw_config_struct gen_kw_config_type;
-typedef struct gen_kw_struct        gen_kw_type;
+typedef struct gen_kw_config_struct   gen_kw_config_type;
+typedef struct gen_kw_struct          gen_kw_type;
+typedef struct gen_kw_template_struct gen_kw_template_type;
 
 gen_kw_type * gen_kw_alloc(const gen_kw_config_type * );
 bool          gen_kw_fload(gen_kw_type * , const char *);
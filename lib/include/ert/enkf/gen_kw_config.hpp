@@ -56,6 +56,11 @@ gen_kw_config_type        * gen_kw_config_alloc_empty( const char * key , const
 void                        gen_kw_config_update( gen_kw_config_type * config , const char * template_file , const char * parameter_file);
 void                        gen_kw_config_update_tag_format(gen_kw_config_type * config , const char * tag_format);
 
+gen_kw_template_type      * gen_kw_config_alloc_template( const gen_kw_config_type * config );
+void                        gen_kw_template_free( gen_kw_template_type * template_ );
+void                        gen_kw_template_fprintf( const gen_kw_template_type * template_ , const double * values , FILE * stream );
+UTIL_IS_INSTANCE_HEADER( gen_kw_template );
+
 UTIL_SAFE_CAST_HEADER_CONST( gen_kw_config );
 UTIL_SAFE_CAST_HEADER(gen_kw_config);
 VOID_FREE_HEADER(gen_kw_config);
@@ -0,0 +1,58 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'load_scheduler.hpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+
+#ifndef ERT_LOAD_SCHEDULER_H
+#define ERT_LOAD_SCHEDULER_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <stdbool.h>
+
+#include <ert/util/type_macros.h>
+
+  typedef struct load_scheduler_struct load_scheduler_type;
+
+  load_scheduler_type * load_scheduler_alloc( int ens_size , int io_threads , int cpu_threads );
+  void                  load_scheduler_free( load_scheduler_type * scheduler );
+  int                   load_scheduler_get_ens_size( const load_scheduler_type * scheduler );
+  int                   load_scheduler_get_io_threads( const load_scheduler_type * scheduler );
+  int                   load_scheduler_get_cpu_threads( const load_scheduler_type * scheduler );
+  int                   load_scheduler_get_num_threads( const load_scheduler_type * scheduler );
+
+  void                  load_scheduler_reset( load_scheduler_type * scheduler );
+  void                  load_scheduler_add_job( load_scheduler_type * scheduler , int iens );
+  void                  load_scheduler_begin_io( load_scheduler_type * scheduler , int iens );
+  void                  load_scheduler_end_io( load_scheduler_type * scheduler , int iens );
+  void                  load_scheduler_begin_cpu( load_scheduler_type * scheduler , int iens );
+  void                  load_scheduler_end_cpu( load_scheduler_type * scheduler , int iens );
+  void                  load_scheduler_complete_job( load_scheduler_type * scheduler , int iens );
+
+  int                   load_scheduler_get_num_jobs( load_scheduler_type * scheduler );
+  int                   load_scheduler_get_num_complete( load_scheduler_type * scheduler );
+  bool                  load_scheduler_iget_complete( load_scheduler_type * scheduler , int iens );
+  double                load_scheduler_iget_io_time( load_scheduler_type * scheduler , int iens );
+  double                load_scheduler_iget_cpu_time( load_scheduler_type * scheduler , int iens );
+
+  UTIL_IS_INSTANCE_HEADER( load_scheduler );
+
+#ifdef __cplusplus
+}
+#endif
+#endif
@@ -42,6 +42,12 @@ extern "C" {
   void                misfit_ensemble_free( misfit_ensemble_type * table );
   void                misfit_ensemble_fwrite( const misfit_ensemble_type * misfit_ensemble , FILE * stream);
   bool                misfit_ensemble_initialized( const misfit_ensemble_type * misfit_ensemble );
+  void                misfit_ensemble_invalidate( misfit_ensemble_type * misfit_ensemble );
+  bool                misfit_ensemble_is_valid( const misfit_ensemble_type * misfit_ensemble ,
+                                                const enkf_obs_type * enkf_obs ,
+                                                int ens_size ,
+                                                int history_length );
+  double              misfit_ensemble_get_total_chi2( const misfit_ensemble_type * misfit_ensemble , const char * obs_key , int iens );
 
   void                misfit_ensemble_initialize( misfit_ensemble_type * misfit_ensemble ,
                                                   const ensemble_config_type * ensemble_config ,
@@ -49,7 +55,8 @@ extern "C" {
                                                   enkf_fs_type * fs ,
                                                   int ens_size ,
                                                   int history_length,
-                                                  bool force_init);
+                                                  bool force_init,
+                                                  int num_threads);
 
   void                misfit_ensemble_set_ens_size( misfit_ensemble_type * misfit_ensemble , int ens_size);
   int                 misfit_ensemble_get_ens_size( const misfit_ensemble_type * misfit_ensemble );
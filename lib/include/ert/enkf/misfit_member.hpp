@@ -33,6 +33,7 @@ extern "C" {
   misfit_member_type * misfit_member_fread_alloc( FILE * stream );
   void                 misfit_member_fwrite( const misfit_member_type * node , FILE * stream );
   void                 misfit_member_update( misfit_member_type * node , const char * obs_key , int history_length , int iens , const double ** work_chi2);
+  void                 misfit_member_set_chi2( misfit_member_type * node , const char * obs_key , int history_length , const double * chi2);
   void                 misfit_member_free__( void * node );
   misfit_member_type * misfit_member_alloc(int iens);
 
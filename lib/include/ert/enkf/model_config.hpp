@@ -86,6 +86,10 @@ extern "C" {
   //int                    model_config_get_max_resample(const model_config_type * model_config );
   void                   model_config_set_max_internal_submit(model_config_type * config, int max_resample);
   int                    model_config_get_max_internal_submit( const model_config_type * config );
+  void                   model_config_set_load_io_threads( model_config_type * model_config , int load_io_threads );
+  int                    model_config_get_load_io_threads( const model_config_type * config );
+  void                   model_config_set_load_cpu_threads( model_config_type * model_config , int load_cpu_threads );
+  int                    model_config_get_load_cpu_threads( const model_config_type * config );
   bool                   model_config_select_runpath( model_config_type * model_config , const char * path_key);
   void                   model_config_add_runpath( model_config_type * model_config , const char * path_key , const char * fmt );
   const char           * model_config_get_runpath_as_char( const model_config_type * model_config );
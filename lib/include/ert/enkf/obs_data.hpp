@@ -63,6 +63,8 @@ void                 obs_data_free(obs_data_type *);
 void                 obs_data_reset(obs_data_type * obs_data);
 matrix_type        * obs_data_allocD(const obs_data_type * obs_data , const matrix_type * E  , const matrix_type * S);
 matrix_type        * obs_data_allocR(const obs_data_type * obs_data );
+matrix_type        * obs_data_alloc_diagR(const obs_data_type * obs_data );
+bool                 obs_data_has_diagonal_R(const obs_data_type * obs_data );
 matrix_type        * obs_data_allocdObs(const obs_data_type * obs_data );
 //matrix_type        * obs_data_alloc_innov(const obs_data_type * obs_data , const meas_data_type * meas_data , int active_size);
 matrix_type        * obs_data_allocE(const obs_data_type * obs_data , rng_type * rng , int active_ens_size);
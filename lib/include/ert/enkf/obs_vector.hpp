@@ -86,6 +86,7 @@ extern "C" {
   void                 obs_vector_install_node(obs_vector_type * obs_vector , int obs_index , void * node );
 
   double                  obs_vector_chi2(const obs_vector_type *  , enkf_fs_type *  , node_id_type node_id);
+  double                  obs_vector_node_chi2(const obs_vector_type * obs_vector , const enkf_node_type * node , node_id_type node_id);
 
   void                    obs_vector_ensemble_chi2(const obs_vector_type * obs_vector ,
                                                    enkf_fs_type * fs,
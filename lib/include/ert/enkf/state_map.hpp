@@ -34,6 +34,7 @@ extern "C" {
   state_map_type         * state_map_fread_alloc( const char * filename );
   state_map_type         * state_map_fread_alloc_readonly( const char * filename );
   state_map_type         * state_map_alloc_copy(const state_map_type * map );
+  state_map_type         * state_map_alloc_readonly_copy(const state_map_type * map );
   bool                     state_map_is_readonly(const state_map_type * state_map);
   void                     state_map_free( state_map_type * map );
   int                      state_map_get_size(const state_map_type * map);
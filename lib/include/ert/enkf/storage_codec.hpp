@@ -0,0 +1,47 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'storage_codec.hpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+
+#ifndef ERT_STORAGE_CODEC_H
+#define ERT_STORAGE_CODEC_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <stdbool.h>
+
+#include <ert/util/buffer.h>
+
+typedef enum {
+  STORAGE_CODEC_NONE = 0,   /* The data is stored as is. */
+  STORAGE_CODEC_FAST = 1,   /* Byte shuffle followed by the fastest zlib level. */
+  STORAGE_CODEC_ZLIB = 2    /* zlib with a selectable level. */
+} storage_codec_enum;
+
+#define STORAGE_CODEC_DEFAULT_LEVEL -1   /* The zlib default level. */
+
+  bool          storage_codec_parse( const char * codec_string , storage_codec_enum * codec , int * level );
+  const char  * storage_codec_get_name( storage_codec_enum codec );
+  void          storage_codec_fwrite( buffer_type * buffer , storage_codec_enum codec , int level ,
+                                      const void * data , int byte_size , int elem_size );
+  void          storage_codec_fread( buffer_type * buffer , void * data , int byte_size );
+
+#ifdef __cplusplus
+}
+#endif
+#endif
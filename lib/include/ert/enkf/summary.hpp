@@ -38,6 +38,8 @@ void           summary_free(summary_type *summary);
 double         summary_get(const summary_type * summary, int report_step );
 bool           summary_active_value( double value );
 int            summary_length(const summary_type * summary);
+double       * summary_get_data_ptr(const summary_type * summary);
+void           summary_export_values(const summary_type * summary, int step1, int num_steps, double * data, bool * active);
 
 VOID_HAS_DATA_HEADER(summary);
 UTIL_SAFE_CAST_HEADER(summary);
@@ -0,0 +1,53 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'summary_load_cache.hpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+
+#ifndef ERT_SUMMARY_LOAD_CACHE_H
+#define ERT_SUMMARY_LOAD_CACHE_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <ert/util/type_macros.h>
+#include <ert/util/int_vector.h>
+
+#include <ert/ecl/ecl_sum.h>
+#include <ert/ecl/ecl_smspec.h>
+
+#include <ert/enkf/summary_key_matcher.hpp>
+#include <ert/enkf/time_map.hpp>
+
+  typedef struct summary_load_cache_struct summary_load_cache_type;
+
+  summary_load_cache_type * summary_load_cache_alloc( );
+  void                      summary_load_cache_free( summary_load_cache_type * cache );
+  const int_vector_type   * summary_load_cache_get_matched_nodes( summary_load_cache_type * cache ,
+                                                                  const ecl_smspec_type * smspec ,
+                                                                  const summary_key_matcher_type * matcher );
+  int_vector_type         * summary_load_cache_alloc_time_index( summary_load_cache_type * cache ,
+                                                                 time_map_type * time_map ,
+                                                                 const ecl_sum_type * summary );
+  int                       summary_load_cache_get_num_layouts( summary_load_cache_type * cache );
+  int                       summary_load_cache_get_num_time_indices( summary_load_cache_type * cache );
+
+  UTIL_IS_INSTANCE_HEADER( summary_load_cache );
+
+#ifdef __cplusplus
+}
+#endif
+#endif
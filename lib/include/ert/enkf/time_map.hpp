@@ -57,6 +57,7 @@ typedef struct time_map_struct time_map_type;
   double           time_map_get_end_days( time_map_type * map);
   bool             time_map_is_readonly( const time_map_type * tm);
   time_map_type  * time_map_fread_alloc_readonly( const char * filename);
+  time_map_type  * time_map_alloc_readonly_copy( const time_map_type * map );
   int_vector_type * time_map_alloc_index_map( time_map_type * map , const ecl_sum_type * ecl_sum );
   int              time_map_lookup_time( time_map_type * map , time_t time);
   int              time_map_lookup_days( time_map_type * map , double sim_days);
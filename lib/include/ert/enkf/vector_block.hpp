@@ -0,0 +1,56 @@
+/*
+   Copyright (C) 2019  Equinor ASA, Norway.
+
+   The file 'vector_block.hpp' is part of ERT - Ensemble based Reservoir Tool.
+
+   ERT is free software: you can redistribute it and/or modify
+   it under the terms of the GNU General Public License as published by
+   the Free Software Foundation, either version 3 of the License, or
+   (at your option) any later version.
+
+   ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+   WARRANTY; without even the implied warranty of MERCHANTABILITY or
+   FITNESS FOR A PARTICULAR PURPOSE.
+
+   See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+   for more details.
+*/
+
+#ifndef ERT_VECTOR_BLOCK_H
+#define ERT_VECTOR_BLOCK_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <stdbool.h>
+
+#include <ert/util/buffer.hpp>
+#include <ert/util/type_macros.h>
+
+/* The number of bytes needed by vector_block_fread_index_size(). */
+#define VECTOR_BLOCK_HEADER_SIZE (2 * sizeof(int))
+
+  typedef struct vector_block_struct vector_block_type;
+
+  vector_block_type * vector_block_alloc( );
+  void                vector_block_free( vector_block_type * block );
+  void                vector_block_free__( void * arg );
+  void                vector_block_add( vector_block_type * block , const char * key , const buffer_type * buffer );
+  int                 vector_block_get_size( const vector_block_type * block );
+  const char        * vector_block_iget_key( const vector_block_type * block , int index );
+  bool                vector_block_has_key( const vector_block_type * block , const char * key );
+  void                vector_block_copy_buffer( const vector_block_type * block , const char * key , buffer_type * buffer );
+  void                vector_block_get_range( const vector_block_type * block , const char * key , int * offset , int * size );
+
+  void                vector_block_fwrite( vector_block_type * block , buffer_type * buffer );
+  int                 vector_block_fread_index_size( buffer_type * buffer );
+  vector_block_type * vector_block_fread_alloc( buffer_type * buffer );
+  vector_block_type * vector_block_fread_alloc_index( buffer_type * buffer );
+
+  UTIL_IS_INSTANCE_HEADER( vector_block );
+
+#ifdef __cplusplus
+}
+#endif
+#endif
@@ -41,6 +41,7 @@ extern "C" {
   job_status_type local_driver_get_job_status(void * __driver , void * __job);
   void            local_driver_free_job(void * __job);
   void            local_driver_init_option_list(stringlist_type * option_list);
+  void            local_driver_add_status_notify( void * __driver , status_notify_ftype * status_notify , void * arg);
 
 
 
@@ -53,6 +53,11 @@ extern "C" {
   typedef const void * (get_option_ftype) (const void *, const char *);
   typedef bool (has_option_ftype) (const void *, const char *);
   typedef void (init_option_list_ftype) (stringlist_type *);
+  typedef void (status_notify_ftype) (void *, void *);
+  typedef bool (update_status_ftype) (void *, status_notify_ftype *, void *);
+  typedef void (add_status_notify_ftype) (void *, status_notify_ftype *, void *);
+
+  typedef struct queue_status_listener_struct queue_status_listener_type;
 
 
   queue_driver_type * queue_driver_alloc_RSH(const char * rsh_cmd, const hash_type * rsh_hostlist);
@@ -66,6 +71,9 @@ extern "C" {
   void queue_driver_blacklist_node(queue_driver_type * driver, void * job_data);
   void queue_driver_kill_job(queue_driver_type * driver, void * job_data);
   job_status_type queue_driver_get_status(queue_driver_type * driver, void * job_data);
+  bool queue_driver_update_status(queue_driver_type * driver, status_notify_ftype * status_changed, void * arg);
+  queue_status_listener_type * queue_driver_alloc_status_listener(queue_driver_type * driver, status_notify_ftype * status_notify, void * arg);
+  void queue_status_listener_free(queue_status_listener_type * listener);
 
   const char * queue_driver_get_name(const queue_driver_type * driver);
 
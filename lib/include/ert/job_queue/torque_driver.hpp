@@ -40,11 +40,13 @@ extern "C" {
 #define TORQUE_JOB_PREFIX_KEY    "JOB_PREFIX"
 #define TORQUE_SUBMIT_SLEEP      "SUBMIT_SLEEP"
 #define TORQUE_DEBUG_OUTPUT      "DEBUG_OUTPUT"
+#define TORQUE_QSTAT_REFRESH_INTERVAL "QSTAT_REFRESH_INTERVAL"
 
 #define TORQUE_DEFAULT_QSUB_CMD      "qsub"
 #define TORQUE_DEFAULT_QSTAT_CMD     "qstat"
 #define TORQUE_DEFAULT_QDEL_CMD      "qdel"
 #define TORQUE_DEFAULT_SUBMIT_SLEEP  "0"
+#define TORQUE_DEFAULT_QSTAT_REFRESH_INTERVAL "10"
 
 
   typedef struct torque_driver_struct torque_driver_type;
@@ -66,6 +68,7 @@ extern "C" {
   void torque_driver_free__(void * __driver);
   void torque_driver_free(torque_driver_type * driver);
   job_status_type torque_driver_get_job_status(void * __driver, void * __job);
+  bool torque_driver_update_status(void * __driver, status_notify_ftype * status_changed, void * arg);
   void torque_driver_free_job(void * __job);
   void torque_driver_set_qstat_refresh_interval(torque_driver_type * driver, int refresh_interval);
 
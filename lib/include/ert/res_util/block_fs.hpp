@@ -36,6 +36,7 @@ extern "C" {
   } block_fs_sort_type;
 
   size_t          block_fs_get_cache_usage( const block_fs_type * block_fs );
+  double          block_fs_get_index_load_time( const block_fs_type * block_fs );
   double          block_fs_get_fragmentation( const block_fs_type * block_fs );
   bool            block_fs_rotate( block_fs_type * block_fs , double fragmentation_limit);
   void            block_fs_fsync( block_fs_type * block_fs );
@@ -55,6 +56,11 @@ extern "C" {
   void            block_fs_fread_file( block_fs_type * block_fs , const char * filename , void * ptr);
   int             block_fs_get_filesize( block_fs_type * block_fs , const char * filename);
   void            block_fs_fread_realloc_buffer( block_fs_type * block_fs , const char * filename , buffer_type * buffer);
+  void            block_fs_fread_range( block_fs_type * block_fs , const char * filename , int offset , int size , buffer_type * buffer);
+  buffer_type   * block_fs_alloc_buffer_view( block_fs_type * block_fs , const char * filename );
+  void            block_fs_free_buffer_view( block_fs_type * block_fs , buffer_type * buffer );
+  void            block_fs_set_mmap( block_fs_type * block_fs , bool use_mmap );
+  bool            block_fs_get_mmap( const block_fs_type * block_fs );
   void            block_fs_sync( block_fs_type * block_fs );
   void            block_fs_unlink_file( block_fs_type * block_fs , const char * filename);
   bool            block_fs_has_file( block_fs_type * block_fs , const char * filename);
@@ -61,6 +61,10 @@ extern "C" {
   bool                    subst_list_has_key( const subst_list_type * subst_list , const char * key);
   char                  * subst_list_alloc_string_representation( const subst_list_type * subst_list );
   int                     subst_list_add_from_string( subst_list_type * subst_list , const char * arg_string, bool append);
+  const char            * subst_list_next_token( const char * string , const char ** token_end );
+  bool                    subst_list_has_nested_tokens( const char * string );
+  bool                    subst_list_is_single_pass( const subst_list_type * subst_list );
+  const char            * subst_list_get_single_pass_value( const subst_list_type * subst_list , const char * key );
 
   UTIL_IS_INSTANCE_HEADER( subst_list );
 #ifdef __cplusplus
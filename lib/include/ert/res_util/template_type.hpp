@@ -3,6 +3,8 @@
 
 #include <ert/util/ert_api_config.hpp>
 
+#include <ert/util/int_vector.hpp>
+
 #include <ert/res_util/subst_list.hpp>
 
 #ifdef ERT_HAVE_REGEXP
@@ -22,6 +24,9 @@ struct template_struct {
   bool              internalize_template;    /* Should the template be loadad and internalized at template_alloc(). */
   subst_list_type * arg_list;                /* Key-value mapping established at alloc time. */
   char            * arg_string;              /* A string representation of the arguments - ONLY used for a _get_ function. */
+  int_vector_type * token_offsets;           /* Start and end offset of every <...> token in template_buffer; pairwise. */
+  int               max_token_length;
+  bool              nested_tokens;             /* The template_buffer has nested tokens, and can not be rendered in a single pass. */
   #ifdef ERT_HAVE_REGEXP
   regex_t start_regexp;
   regex_t end_regexp;
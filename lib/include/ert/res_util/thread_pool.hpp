@@ -34,6 +34,9 @@ extern "C" {
   void             * thread_pool_iget_return_value( const thread_pool_type * pool , int queue_index );
   int                thread_pool_get_max_running( const thread_pool_type * pool );
   bool               thread_pool_try_join(thread_pool_type * pool, int timeout_seconds);
+  int                thread_pool_get_task_count( const thread_pool_type * pool );
+  double             thread_pool_get_queue_wait_time( const thread_pool_type * pool );
+  double             thread_pool_get_busy_time( const thread_pool_type * pool );
 
 #ifdef __cplusplus
 }
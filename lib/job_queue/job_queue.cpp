@@ -25,6 +25,11 @@
 #include <stdio.h>
 #include <pthread.h>
 #include <unistd.h>
+#include <time.h>
+
+#include <algorithm>
+#include <unordered_map>
+#include <vector>
 
 #include <ert/util/util.hpp>
 #include <ert/res_util/arg_pack.hpp>
@@ -235,6 +240,24 @@ struct job_queue_struct {
   unsigned long              usleep_time;                       /* The sleep time before checking for updates. */
   pthread_mutex_t            run_mutex;                         /* This mutex is used to ensure that ONLY one thread is executing the job_queue_run_jobs(). */
   thread_pool_type         * work_pool;
+
+  queue_status_listener_type * status_listener;                 /* Non NULL when the driver pushes status changes, the queue waits for notifications instead of sleeping. */
+  bool                       status_notified;                   /* A notification has arrived since the last status sweep. */
+  bool                       full_sweep;                        /* The driver has reported a change without telling which job has changed. */
+  std::vector<void *>      * changed_jobs;                      /* Driver data of the jobs reported as changed since the last status sweep. */
+  pthread_mutex_t            notify_mutex;                      /* Protects the notification fields above. */
+  pthread_cond_t             notify_cond;
+  struct timespec            notify_time;                       /* Time of the first notification since the last status sweep. */
+  struct timespec            last_sweep;                        /* Start time of the previous status sweep. */
+  struct timespec            last_full_sweep;                   /* Start time of the previous sweep over all the jobs. */
+  std::unordered_map<void *, job_queue_node_type *> * driver_nodes;   /* Driver data -> node, for all the jobs submitted from this queue. */
+
+  int                        sweep_count;                       /* Statistics for the status sweeps and the status transitions they find. */
+  double                     sweep_time;
+  double                     max_sweep_time;
+  int                        transition_count;
+  double                     transition_latency;
+  double                     max_transition_latency;
 };
 
 
@@ -279,18 +302,194 @@ static bool job_queue_change_node_status(job_queue_type * queue , job_queue_node
   on to joblist readlock
 */
 
+/*
+  When the driver reports which jobs have changed status, either by
+  pushing notifications or from its batched status query, a status
+  sweep will only update the nodes of those jobs. All the nodes are
+  updated when the driver can not report the changed jobs, when it has
+  reported a change without telling which job, and periodically as a
+  fallback for the changes which are not reported, e.g. jobs which
+  have run for too long.
+
+  The duration and the number of status transitions of every sweep
+  is recorded. The latency of a transition is measured from the
+  notification from the driver, when the driver pushes status changes,
+  and otherwise from the start of the previous sweep, i.e. for polled
+  drivers the latency is an upper bound.
+*/
+
+#define JOB_QUEUE_FULL_SWEEP_FACTOR 8    /* All the nodes are updated at least every JOB_QUEUE_FULL_SWEEP_FACTOR * usleep_time. */
+
+static double job_queue_elapsed_time( const struct timespec * start_time , const struct timespec * end_time ) {
+  return (end_time->tv_sec - start_time->tv_sec) + 1e-9 * (end_time->tv_nsec - start_time->tv_nsec);
+}
+
+
+static void job_queue_status_notify__( void * arg , void * job_data );
+
+
+static bool job_queue_update_node_status( job_queue_type * queue , job_queue_node_type * node ) {
+  bool status_change = job_queue_node_update_status( node , queue->status , queue->driver );
+  queue->progress_timestamp = util_time_t_max(queue->progress_timestamp, job_queue_node_get_timestamp(node));
+  return status_change;
+}
+
+
 static bool job_queue_update_status(job_queue_type * queue ) {
   bool update = false;
-  int ijob;
+  bool full_sweep;
+  int num_transitions = 0;
+  std::vector<void *> changed_jobs;
+  struct timespec start_time , end_time , event_time;
+
+  clock_gettime( CLOCK_MONOTONIC , &start_time );
+  bool report_changes = queue_driver_update_status( queue->driver , job_queue_status_notify__ , queue ) ||
+                        (queue->status_listener != NULL);
+
+  pthread_mutex_lock( &queue->notify_mutex );
+  {
+    if (queue->status_notified)
+      event_time = queue->notify_time;
+    else
+      event_time = queue->last_sweep;
+
+    full_sweep = !report_changes || queue->full_sweep ||
+                 (job_queue_elapsed_time( &queue->last_full_sweep , &start_time ) * 1e6 >= JOB_QUEUE_FULL_SWEEP_FACTOR * queue->usleep_time);
+    changed_jobs.swap( *queue->changed_jobs );
+
+    queue->status_notified = false;
+    queue->full_sweep = false;
+    queue->last_sweep = start_time;
+    if (full_sweep)
+      queue->last_full_sweep = start_time;
+  }
+  pthread_mutex_unlock( &queue->notify_mutex );
+
+  if (!full_sweep && changed_jobs.empty())
+    return false;
+
+  if (full_sweep) {
+    for (int ijob = 0; ijob < job_list_get_size( queue->job_list ); ijob++) {
+      job_queue_node_type * node = job_list_iget_job( queue->job_list , ijob );
+      if (job_queue_update_node_status( queue , node )) {
+        update = true;
+        num_transitions++;
+      }
+    }
+  } else {
+    /*
+      Jobs which are not found have been submitted from another queue
+      sharing the driver.
+    */
+    std::sort( changed_jobs.begin() , changed_jobs.end() );
+    changed_jobs.erase( std::unique( changed_jobs.begin() , changed_jobs.end() ) , changed_jobs.end() );
+    for (void * job_data : changed_jobs) {
+      auto iter = queue->driver_nodes->find( job_data );
+      if (iter != queue->driver_nodes->end()) {
+        if (job_queue_update_node_status( queue , iter->second )) {
+          update = true;
+          num_transitions++;
+        }
+      }
+    }
+  }
+  clock_gettime( CLOCK_MONOTONIC , &end_time );
 
-  for (ijob = 0; ijob < job_list_get_size( queue->job_list ); ijob++) {
-    job_queue_node_type * node = job_list_iget_job( queue->job_list , ijob );
-    update |= job_queue_node_update_status( node , queue->status , queue->driver );
-    queue->progress_timestamp = util_time_t_max(queue->progress_timestamp, job_queue_node_get_timestamp(node));
+  {
+    double sweep_time = job_queue_elapsed_time( &start_time , &end_time );
+    queue->sweep_count++;
+    queue->sweep_time += sweep_time;
+    queue->max_sweep_time = util_double_max( queue->max_sweep_time , sweep_time );
+
+    if (num_transitions > 0) {
+      double latency = job_queue_elapsed_time( &event_time , &end_time );
+      queue->transition_count += num_transitions;
+      queue->transition_latency += num_transitions * latency;
+      queue->max_transition_latency = util_double_max( queue->max_transition_latency , latency );
+    }
   }
   return update;
 }
 
+
+/*
+  Wakes up the queue loop; called by drivers which push status
+  changes, and internally when the queue state has changed.
+*/
+
+static void job_queue_notify( job_queue_type * queue ) {
+  pthread_mutex_lock( &queue->notify_mutex );
+  if (!queue->status_notified) {
+    queue->status_notified = true;
+    clock_gettime( CLOCK_MONOTONIC , &queue->notify_time );
+  }
+  pthread_cond_signal( &queue->notify_cond );
+  pthread_mutex_unlock( &queue->notify_mutex );
+}
+
+
+/*
+  Called by the driver with the driver data of a job which has changed
+  status, or with NULL when the driver does not know which job has
+  changed.
+*/
+
+static void job_queue_status_notify__( void * arg , void * job_data ) {
+  job_queue_type * queue = job_queue_safe_cast( arg );
+  pthread_mutex_lock( &queue->notify_mutex );
+  if (job_data != NULL)
+    queue->changed_jobs->push_back( job_data );
+  else
+    queue->full_sweep = true;
+  pthread_mutex_unlock( &queue->notify_mutex );
+  job_queue_notify( queue );
+}
+
+
+static void job_queue_wait_notify( job_queue_type * queue , unsigned long usleep_time ) {
+  pthread_mutex_lock( &queue->notify_mutex );
+  if (!queue->status_notified) {
+    struct timespec wakeup_time;
+    clock_gettime( CLOCK_REALTIME , &wakeup_time );
+    wakeup_time.tv_sec  += usleep_time / 1000000;
+    wakeup_time.tv_nsec += (usleep_time % 1000000) * 1000;
+    if (wakeup_time.tv_nsec >= 1000000000) {
+      wakeup_time.tv_sec  += 1;
+      wakeup_time.tv_nsec -= 1000000000;
+    }
+    pthread_cond_timedwait( &queue->notify_cond , &queue->notify_mutex , &wakeup_time );
+  }
+  pthread_mutex_unlock( &queue->notify_mutex );
+}
+
+
+int job_queue_get_sweep_count( const job_queue_type * queue ) {
+  return queue->sweep_count;
+}
+
+double job_queue_get_sweep_time( const job_queue_type * queue ) {
+  return queue->sweep_time;
+}
+
+double job_queue_get_max_sweep_time( const job_queue_type * queue ) {
+  return queue->max_sweep_time;
+}
+
+int job_queue_get_transition_count( const job_queue_type * queue ) {
+  return queue->transition_count;
+}
+
+double job_queue_get_transition_latency( const job_queue_type * queue ) {
+  if (queue->transition_count > 0)
+    return queue->transition_latency / queue->transition_count;
+  else
+    return 0;
+}
+
+double job_queue_get_max_transition_latency( const job_queue_type * queue ) {
+  return queue->max_transition_latency;
+}
+
 /*
   Must hold on to joblist readlock
 */
@@ -303,6 +502,8 @@ static submit_status_type job_queue_submit_job(job_queue_type * queue , int queu
     {
       job_queue_node_type * node = job_list_iget_job( queue->job_list , queue_index );
       submit_status = job_queue_node_submit( node , queue->status , queue->driver );
+      if (submit_status == SUBMIT_OK)
+        (*queue->driver_nodes)[ job_queue_node_get_driver_data( node ) ] = node;
     }
   }
   return submit_status;
@@ -442,6 +643,7 @@ job_list_unlock( queue->job_list );
 bool job_queue_kill_job( job_queue_type * queue , int job_index) {
   bool result;
   ASSIGN_LOCKED_ATTRIBUTE( result , job_queue_kill_job_node , queue , node);
+  job_queue_notify( queue );
   return result;
 }
 
@@ -541,6 +743,7 @@ void job_queue_iset_external_restart(job_queue_type * queue , int job_index) {
     job_queue_node_restart(node,queue->status);
   }
   job_list_unlock( queue->job_list );
+  job_queue_notify( queue );
 }
 
 
@@ -566,6 +769,7 @@ void job_queue_iset_external_fail(job_queue_type * queue , int job_index) {
     job_queue_node_status_transition(node,queue->status,JOB_QUEUE_EXIT);
   }
   job_list_unlock( queue->job_list );
+  job_queue_notify( queue );
 }
 
 
@@ -688,6 +892,7 @@ static void * job_queue_run_DONE_callback( void * arg ) {
   }
   job_list_unlock(job_queue->job_list );
   arg_pack_free( arg_pack );
+  job_queue_notify( job_queue );
   return NULL;
 }
 
@@ -732,6 +937,7 @@ static void * job_queue_run_EXIT_callback( void * arg ) {
   }
   job_list_unlock(job_queue->job_list );
   arg_pack_free( arg_pack );
+  job_queue_notify( job_queue );
 
   return NULL;
 }
@@ -978,7 +1184,15 @@ static void job_queue_loop(job_queue_type * queue, int num_total_run, bool verbo
 
     if (!exit) {
       res_yield();
-      job_list_reader_wait(queue->job_list, queue->usleep_time, 8 * queue->usleep_time);
+      if (queue->status_listener != NULL)
+        /*
+          The driver will notify about status changes; the timeout
+          is only a fallback for the changes which are not notified,
+          e.g. jobs which have run for too long.
+        */
+        job_queue_wait_notify(queue, 4 * queue->usleep_time);
+      else
+        job_list_reader_wait(queue->job_list, queue->usleep_time, 8 * queue->usleep_time);
     }
 
   } while (!complete && !exit);
@@ -1169,6 +1383,7 @@ int job_queue_add_job(job_queue_type * queue ,
         job_queue_change_node_status(queue , node , JOB_QUEUE_WAITING);
       }
       job_list_unlock( queue->job_list );
+      job_queue_notify( queue );
       return queue_index;   /* Handle used by the calling scope. */
     } else {
       char * cwd = (char*)util_alloc_cwd();
@@ -1218,6 +1433,22 @@ job_queue_type * job_queue_alloc(int  max_submit               ,
   queue->progress_timestamp = time(NULL);
 
   pthread_mutex_init( &queue->run_mutex    , NULL );
+  pthread_mutex_init( &queue->notify_mutex , NULL );
+  pthread_cond_init( &queue->notify_cond   , NULL );
+  queue->status_listener        = NULL;
+  queue->status_notified        = false;
+  queue->full_sweep             = false;
+  queue->changed_jobs           = new std::vector<void *>();
+  queue->driver_nodes           = new std::unordered_map<void *, job_queue_node_type *>();
+  clock_gettime( CLOCK_MONOTONIC , &queue->last_sweep );
+  queue->notify_time            = queue->last_sweep;
+  queue->last_full_sweep        = queue->last_sweep;
+  queue->sweep_count            = 0;
+  queue->sweep_time             = 0;
+  queue->max_sweep_time         = 0;
+  queue->transition_count       = 0;
+  queue->transition_latency     = 0;
+  queue->max_transition_latency = 0;
 
 
 
@@ -1242,13 +1473,18 @@ void job_queue_submit_complete( job_queue_type * queue ){
 
 /**
    The calling scope must retain a handle to the current driver and
-   free it.  Should (in principle) be possible to change driver on a
-   running system whoaaa. Will read and update the max_running value
-   from the driver.
+   free it; the driver and the queue can be freed in any order.
+   Should (in principle) be possible to change driver on a running
+   system whoaaa. Will read and update the max_running value from the
+   driver.
 */
 
 void job_queue_set_driver(job_queue_type * queue , queue_driver_type * driver) {
+  if (queue->status_listener != NULL)
+    queue_status_listener_free( queue->status_listener );
+
   queue->driver = driver;
+  queue->status_listener = queue_driver_alloc_status_listener( driver , job_queue_status_notify__ , queue );
 }
 
 
@@ -1287,6 +1523,7 @@ void job_queue_set_pause_on( job_queue_type * job_queue) {
 
 void job_queue_set_pause_off( job_queue_type * job_queue) {
   job_queue->pause_on = false;
+  job_queue_notify( job_queue );
 }
 
 /*
@@ -1307,6 +1544,7 @@ bool job_queue_start_user_exit( job_queue_type * queue) {
     while (true) {
       if (queue->running) {
         queue->user_exit = true;
+        job_queue_notify( queue );
         break;
     }
       usleep( usleep_time );
@@ -1324,6 +1562,13 @@ bool job_queue_get_user_exit( const job_queue_type * queue) {
 }
 
 void job_queue_free(job_queue_type * queue) {
+  if (queue->status_listener != NULL)
+    queue_status_listener_free( queue->status_listener );
+
+  pthread_cond_destroy( &queue->notify_cond );
+  pthread_mutex_destroy( &queue->notify_mutex );
+  delete queue->changed_jobs;
+  delete queue->driver_nodes;
   free( queue->ok_file );
   free( queue->exit_file );
   free( queue->status_file );
@@ -24,6 +24,9 @@
 #include <pthread.h>
 #include <errno.h>
 
+#include <utility>
+#include <vector>
+
 #include <ert/util/util.hpp>
 #include <ert/res_util/arg_pack.hpp>
 
@@ -45,10 +48,29 @@ struct local_job_struct {
 #define LOCAL_DRIVER_TYPE_ID 66196305
 #define LOCAL_JOB_TYPE_ID    63056619
 
+/*
+  The listeners which are called when the status of a job has changed.
+  The job threads are detached and can outlive the driver, so the
+  notifier is reference counted: the driver holds one reference and
+  every running job thread holds one, and the last one to let go
+  frees it. The listeners are called with the mutex held, so when the
+  driver has been freed they will not be called again.
+*/
+
+typedef std::pair<status_notify_ftype *, void *> local_listener_type;
+
+typedef struct {
+  pthread_mutex_t                   mutex;
+  int                               ref_count;
+  std::vector<local_listener_type>  listeners;
+} local_notifier_type;
+
+
 struct local_driver_struct {
   UTIL_TYPE_ID_DECLARATION;
-  pthread_attr_t     thread_attr;
-  pthread_mutex_t    submit_lock;
+  pthread_attr_t        thread_attr;
+  pthread_mutex_t       submit_lock;
+  local_notifier_type * notifier;
 };
 
 /*****************************************************************/
@@ -100,12 +122,51 @@ void local_driver_kill_job( void * __driver , void * __job) {
 
 
 
+static local_notifier_type * local_notifier_alloc() {
+  local_notifier_type * notifier = new local_notifier_type();
+  pthread_mutex_init( &notifier->mutex , NULL );
+  notifier->ref_count = 1;
+  return notifier;
+}
+
+
+static void local_notifier_retain( local_notifier_type * notifier ) {
+  pthread_mutex_lock( &notifier->mutex );
+  notifier->ref_count++;
+  pthread_mutex_unlock( &notifier->mutex );
+}
+
+
+static void local_notifier_release( local_notifier_type * notifier ) {
+  bool last;
+  pthread_mutex_lock( &notifier->mutex );
+  notifier->ref_count--;
+  last = (notifier->ref_count == 0);
+  pthread_mutex_unlock( &notifier->mutex );
+
+  if (last) {
+    pthread_mutex_destroy( &notifier->mutex );
+    delete notifier;
+  }
+}
+
+
+static void local_notifier_notify( local_notifier_type * notifier , local_job_type * job ) {
+  pthread_mutex_lock( &notifier->mutex );
+  for (const auto& listener : notifier->listeners)
+    listener.first( listener.second , job );
+  pthread_mutex_unlock( &notifier->mutex );
+}
+
+
 /*
   This function needs to dereference the job pointer after the waitpid() call is
   complete, it is therefor essential that no other threads have called free(job)
-  while the external process is running.
+  while the external process is running. The driver is not dereferenced after
+  the job has been started, only the notifier the thread holds a reference to.
 */
 
+
 void * submit_job_thread__(void * __arg) {
   arg_pack_type *arg_pack = arg_pack_safe_cast(__arg);
   const char *executable = (const char*)arg_pack_iget_const_ptr(arg_pack, 0);
@@ -118,6 +179,7 @@ void * submit_job_thread__(void * __arg) {
   int argc = arg_pack_iget_int(arg_pack, 2);
   char **argv = (char**)arg_pack_iget_ptr(arg_pack, 3);
   local_job_type *job = (local_job_type*)arg_pack_iget_ptr(arg_pack, 4);
+  local_notifier_type * notifier = (local_notifier_type *) arg_pack_iget_ptr(arg_pack, 5);
   {
     int wait_status;
     job->child_process = util_spawn(executable, argc, (const char**) argv, NULL, NULL);
@@ -131,6 +193,8 @@ void * submit_job_thread__(void * __arg) {
       if (WEXITSTATUS(wait_status) == 0)
         job->status = JOB_QUEUE_DONE;
 
+    local_notifier_notify( notifier , job );
+    local_notifier_release( notifier );
   }
   return NULL;
 }
@@ -153,15 +217,18 @@ void * local_driver_submit_job(void * __driver           ,
     arg_pack_append_int( arg_pack , argc );
     arg_pack_append_ptr( arg_pack , util_alloc_stringlist_copy( argv , argc ));   /* Due to conflict with threads and python GC we take a local copy. */
     arg_pack_append_ptr( arg_pack , job );
+    arg_pack_append_ptr( arg_pack , driver->notifier );
 
     pthread_mutex_lock( &driver->submit_lock );
     job->active = true;
     job->status = JOB_QUEUE_RUNNING;
 
+    local_notifier_retain( driver->notifier );
     if (pthread_create( &job->run_thread , &driver->thread_attr , submit_job_thread__ , arg_pack) != 0)
       util_abort("%s: failed to create run thread - aborting \n",__func__);
 
     pthread_mutex_unlock( &driver->submit_lock );
+    local_notifier_notify( driver->notifier , job );
     return job;
   }
 }
@@ -169,7 +236,13 @@ void * local_driver_submit_job(void * __driver           ,
 
 
 void local_driver_free(local_driver_type * driver) {
+  pthread_mutex_lock( &driver->notifier->mutex );
+  driver->notifier->listeners.clear();
+  pthread_mutex_unlock( &driver->notifier->mutex );
+  local_notifier_release( driver->notifier );
+
   pthread_attr_destroy ( &driver->thread_attr );
+  pthread_mutex_destroy( &driver->submit_lock );
   free(driver);
   driver = NULL;
 }
@@ -187,11 +260,26 @@ void * local_driver_alloc() {
   pthread_mutex_init( &local_driver->submit_lock , NULL );
   pthread_attr_init( &local_driver->thread_attr );
   pthread_attr_setdetachstate( &local_driver->thread_attr , PTHREAD_CREATE_DETACHED );
+  local_driver->notifier = local_notifier_alloc();
 
   return local_driver;
 }
 
 
+/*
+  The local driver knows immediately when a job changes status, and
+  will push a notification with the job to the listeners - typically the job_queues
+  using the driver - instead of waiting to be polled.
+*/
+
+void local_driver_add_status_notify( void * __driver , status_notify_ftype * status_notify , void * arg) {
+  local_driver_type * driver = local_driver_safe_cast( __driver );
+  pthread_mutex_lock( &driver->notifier->mutex );
+  driver->notifier->listeners.push_back( local_listener_type( status_notify , arg ));
+  pthread_mutex_unlock( &driver->notifier->mutex );
+}
+
+
 bool local_driver_set_option( void * __driver , const char * option_key , const void * value){
   return false;
 }
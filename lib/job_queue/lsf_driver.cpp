@@ -128,6 +128,7 @@ struct lsf_job_struct {
   char      **exec_host;
   char       * lsf_jobnr_char;  /* Used to look up the job status in the bjobs_cache hash table */
   char       * job_name;
+  time_t       submit_time;
 };
 
 
@@ -162,9 +163,11 @@ struct lsf_driver_struct {
   int                 bjobs_refresh_interval;
   time_t              last_bjobs_update;
   hash_type         * my_jobs;            /* A hash table of all jobs submitted by this ERT instance -
-                                             to ensure that we do not check status of old jobs in e.g. ZOMBIE status. */
+                                             to ensure that we do not check status of old jobs in e.g. ZOMBIE status.
+                                             The values are the lsf_job instances, used only to report status changes. */
   hash_type         * status_map;
   hash_type         * bjobs_cache;        /* The output of calling bjobs is cached in this table. */
+  std::vector<void *> changed_jobs;       /* The jobs whose status has changed in the bjobs table since the last lsf_driver_update_status(). */
   pthread_mutex_t     bjobs_mutex;        /* Only one thread should update the bjobs_chache table. */
   char              * remote_lsf_server;
   char              * rsh_cmd;
@@ -192,6 +195,7 @@ static lsf_job_type * lsf_job_alloc( const char * job_name ) {
   job->lsf_jobnr      = 0;
   job->lsf_jobnr_char = NULL;
   job->job_name = util_alloc_string_copy( job_name );
+  job->submit_time    = 0;
   UTIL_TYPE_ID_INIT( job , LSF_JOB_TYPE_ID);
   return job;
 }
@@ -614,8 +618,30 @@ static int lsf_driver_get_status__(lsf_driver_type * driver , const char * statu
 
 
 
+/*
+  Records the submitted jobs whose status differs between the previous
+  and the new bjobs table.
+*/
+
+static void lsf_driver_record_changed_jobs(lsf_driver_type * driver, const hash_type * old_cache) {
+  stringlist_type * job_id_list = hash_alloc_stringlist( driver->my_jobs );
+
+  for (int i = 0; i < stringlist_get_size( job_id_list ); i++) {
+    const char * job_id = stringlist_iget( job_id_list , i );
+    bool old_listed = hash_has_key( old_cache , job_id );
+    bool new_listed = hash_has_key( driver->bjobs_cache , job_id );
+
+    if ((old_listed != new_listed) ||
+        (new_listed && (hash_get_int( old_cache , job_id ) != hash_get_int( driver->bjobs_cache , job_id ))))
+      driver->changed_jobs.push_back( hash_get( driver->my_jobs , job_id ));
+  }
+  stringlist_free( job_id_list );
+}
+
+
 static void lsf_driver_update_bjobs_table(lsf_driver_type * driver) {
   char * tmp_file   = (char*)util_alloc_tmp_file("/tmp" , "enkf-bjobs" , true);
+  hash_type * old_cache = driver->bjobs_cache;
 
   if (driver->submit_method == LSF_SUBMIT_REMOTE_SHELL) {
     char ** argv = (char**)util_calloc( 2 , sizeof * argv);
@@ -636,7 +662,7 @@ static void lsf_driver_update_bjobs_table(lsf_driver_type * driver) {
     char status[16];
     FILE *stream = util_fopen(tmp_file , "r");;
     bool at_eof = false;
-    hash_clear(driver->bjobs_cache);
+    driver->bjobs_cache = hash_alloc();
     util_fskip_lines(stream , 1);
     while (!at_eof) {
       char * line = util_fscanf_alloc_line(stream , &at_eof);
@@ -658,6 +684,44 @@ static void lsf_driver_update_bjobs_table(lsf_driver_type * driver) {
   }
   util_unlink_existing(tmp_file);
   free(tmp_file);
+
+  lsf_driver_record_changed_jobs( driver , old_cache );
+  hash_free( old_cache );
+}
+
+
+
+static bool lsf_driver_bjobs_table_expired(const lsf_driver_type * driver) {
+  return (difftime(time(NULL) , driver->last_bjobs_update) > driver->bjobs_refresh_interval);
+}
+
+
+/*
+  Called by the job queue once before the status of the individual
+  jobs is checked; for the shell based submit methods the bjobs table
+  is refreshed here if it has expired, so that all the jobs in one
+  status sweep are served from the same bjobs call, and the jobs whose
+  status has changed since the previous call are reported through
+  @status_changed. The library based submit method can not report the
+  changed jobs, and false is returned.
+*/
+
+bool lsf_driver_update_status(void * __driver, status_notify_ftype * status_changed, void * arg) {
+  lsf_driver_type * driver = lsf_driver_safe_cast( __driver );
+  if (driver->submit_method == LSF_SUBMIT_INTERNAL)
+    return false;
+
+  pthread_mutex_lock( &driver->bjobs_mutex );
+  if (lsf_driver_bjobs_table_expired( driver )) {
+    lsf_driver_update_bjobs_table(driver);
+    driver->last_bjobs_update = time( NULL );
+  }
+
+  for (void * job : driver->changed_jobs)
+    status_changed( arg , job );
+  driver->changed_jobs.clear();
+  pthread_mutex_unlock( &driver->bjobs_mutex );
+  return true;
 }
 
 
@@ -813,20 +877,30 @@ static int lsf_driver_get_job_status_shell(void * __driver , void * __job) {
          unfortunate because this is clearly a get() function; to protect
          against concurrent updates of this table we use a mutex.
       */
+      bool cached;
       pthread_mutex_lock( &driver->bjobs_mutex );
       {
-        bool update_cache = ((difftime(time(NULL) , driver->last_bjobs_update) > driver->bjobs_refresh_interval) ||
-                             (!hash_has_key( driver->bjobs_cache , job->lsf_jobnr_char) ));
+        /*
+          A job missing from the table only forces a new bjobs call if
+          it has been submitted after the last update, otherwise every
+          job which has fallen out of the bjobs table would trigger a
+          full update.
+        */
+        bool update_cache = (lsf_driver_bjobs_table_expired( driver ) ||
+                             (!hash_has_key( driver->bjobs_cache , job->lsf_jobnr_char) &&
+                              (difftime(job->submit_time , driver->last_bjobs_update) >= 0)));
         if (update_cache) {
           lsf_driver_update_bjobs_table(driver);
           driver->last_bjobs_update = time( NULL );
         }
+
+        cached = hash_has_key( driver->bjobs_cache , job->lsf_jobnr_char);
+        if (cached)
+          status = hash_get_int(driver->bjobs_cache , job->lsf_jobnr_char);
       }
       pthread_mutex_unlock( &driver->bjobs_mutex );
 
-      if (hash_has_key( driver->bjobs_cache , job->lsf_jobnr_char) )
-        status = hash_get_int(driver->bjobs_cache , job->lsf_jobnr_char);
-      else {
+      if (!cached) {
         /*
            The job was not in the status cache, this *might* mean that
            it has completed/exited and fallen out of the bjobs status
@@ -841,8 +915,11 @@ static int lsf_driver_get_job_status_shell(void * __driver , void * __job) {
           res_log_info("Have turned lsf debug info ON.");
         }
         status = lsf_driver_get_bhist_status_shell( driver , job );
-        if (status != JOB_STAT_UNKWN)
+        if (status != JOB_STAT_UNKWN) {
+          pthread_mutex_lock( &driver->bjobs_mutex );
           hash_insert_int( driver->bjobs_cache , job->lsf_jobnr_char , status );
+          pthread_mutex_unlock( &driver->bjobs_mutex );
+        }
       }
     }
   }
@@ -1009,7 +1086,8 @@ void * lsf_driver_submit_job(void * __driver ,
       } else {
         job->lsf_jobnr      = lsf_driver_submit_shell_job( driver , lsf_stdout , job_name , submit_cmd , num_cpu , argc, argv);
         job->lsf_jobnr_char = util_alloc_sprintf("%ld" , job->lsf_jobnr);
-        hash_insert_ref( driver->my_jobs , job->lsf_jobnr_char , NULL );
+        job->submit_time    = time( NULL );
+        hash_insert_ref( driver->my_jobs , job->lsf_jobnr_char , job );
       }
 
       pthread_mutex_unlock( &driver->submit_lock );
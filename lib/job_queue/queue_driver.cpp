@@ -20,6 +20,9 @@
 #include <string.h>
 #include <stdbool.h>
 #include <string.h>
+#include <pthread.h>
+
+#include <vector>
 
 #include <ert/util/util.hpp>
 
@@ -68,6 +71,8 @@ struct queue_driver_struct {
   kill_job_ftype * kill_job;
   blacklist_node_ftype * blacklist_node;
   get_status_ftype * get_status;
+  update_status_ftype * update_status;            /* Optional: refresh the status of all jobs with one batched query, and report the changed jobs. */
+  add_status_notify_ftype * add_status_notify;    /* Optional: for drivers which push status changes. */
   free_queue_driver_ftype * free_driver;
   set_option_ftype * set_option;
   get_option_ftype * get_option;
@@ -86,12 +91,101 @@ struct queue_driver_struct {
                                         drivers; the value 0 is interpreted as no limit - i.e. the queue layer
                                         will (try) to send an unlimited number of jobs to the driver. */
 
+  pthread_mutex_t listener_mutex;
+  std::vector<queue_status_listener_type *> * listeners;   /* Notified when a driver which pushes status changes reports a change. */
+};
+
+
+/*
+  A listener is shared between the driver and the scope which added
+  it, typically a job_queue, and is reference counted so that the two
+  can be freed in any order. When the driver is freed the listener is
+  deactivated, and when the owner is done with it the listener is
+  deactivated without touching the driver. The listener function is
+  called with the listener mutex held, so a deactivated listener will
+  not be called again.
+*/
+
+struct queue_status_listener_struct {
+  pthread_mutex_t       mutex;
+  int                   ref_count;
+  bool                  active;
+  status_notify_ftype * status_notify;
+  void                * arg;
 };
 
 UTIL_IS_INSTANCE_FUNCTION( queue_driver, QUEUE_DRIVER_ID )
 
 /*****************************************************************/
 
+static queue_status_listener_type * queue_status_listener_alloc(status_notify_ftype * status_notify, void * arg) {
+  queue_status_listener_type * listener = (queue_status_listener_type*)util_malloc(sizeof * listener);
+  pthread_mutex_init(&listener->mutex, NULL);
+  listener->ref_count = 2;   /* One reference for the driver and one for the caller. */
+  listener->active = true;
+  listener->status_notify = status_notify;
+  listener->arg = arg;
+  return listener;
+}
+
+
+static bool queue_status_listener_is_active(queue_status_listener_type * listener) {
+  bool active;
+  pthread_mutex_lock(&listener->mutex);
+  active = listener->active;
+  pthread_mutex_unlock(&listener->mutex);
+  return active;
+}
+
+
+static void queue_status_listener_release(queue_status_listener_type * listener) {
+  bool last;
+  pthread_mutex_lock(&listener->mutex);
+  listener->active = false;
+  listener->ref_count--;
+  last = (listener->ref_count == 0);
+  pthread_mutex_unlock(&listener->mutex);
+
+  if (last) {
+    pthread_mutex_destroy(&listener->mutex);
+    free(listener);
+  }
+}
+
+
+static void queue_status_listener_notify(queue_status_listener_type * listener, void * job_data) {
+  pthread_mutex_lock(&listener->mutex);
+  if (listener->active)
+    listener->status_notify(listener->arg, job_data);
+  pthread_mutex_unlock(&listener->mutex);
+}
+
+
+/**
+   Deactivates a listener returned from queue_driver_alloc_status_listener();
+   when this returns the listener will not be called again. The driver
+   is not accessed, i.e. this is safe also when the driver has already
+   been freed.
+*/
+
+void queue_status_listener_free(queue_status_listener_type * listener) {
+  queue_status_listener_release(listener);
+}
+
+
+/*
+  Registered with the low level drivers which push status changes;
+  forwards the notification about the job @job_data to all the active
+  listeners.
+*/
+
+static void queue_driver_status_notify__(void * arg, void * job_data) {
+  queue_driver_type * driver = (queue_driver_type *) arg;
+  pthread_mutex_lock(&driver->listener_mutex);
+  for (auto listener : *driver->listeners)
+    queue_status_listener_notify(listener, job_data);
+  pthread_mutex_unlock(&driver->listener_mutex);
+}
 
 /*****************************************************************/
 
@@ -204,6 +298,8 @@ static queue_driver_type * queue_driver_alloc_empty() {
   driver->driver_type = NULL_DRIVER;
   driver->submit = NULL;
   driver->get_status = NULL;
+  driver->update_status = NULL;
+  driver->add_status_notify = NULL;
   driver->kill_job = NULL;
   driver->free_job = NULL;
   driver->free_driver = NULL;
@@ -214,6 +310,8 @@ static queue_driver_type * queue_driver_alloc_empty() {
   driver->data = NULL;
   driver->max_running_string = NULL;
   driver->init_options = NULL;
+  driver->listeners = new std::vector<queue_status_listener_type *>();
+  pthread_mutex_init(&driver->listener_mutex, NULL);
 
   queue_driver_set_generic_option__(driver, MAX_RUNNING, "0");
 
@@ -238,6 +336,7 @@ queue_driver_type * queue_driver_alloc(job_driver_type type) {
     case LSF_DRIVER:
       driver->submit = lsf_driver_submit_job;
       driver->get_status = lsf_driver_get_job_status;
+      driver->update_status = lsf_driver_update_status;
       driver->blacklist_node = lsf_driver_blacklist_node;
       driver->kill_job = lsf_driver_kill_job;
       driver->free_job = lsf_driver_free_job;
@@ -252,6 +351,7 @@ queue_driver_type * queue_driver_alloc(job_driver_type type) {
     case LOCAL_DRIVER:
       driver->submit = local_driver_submit_job;
       driver->get_status = local_driver_get_job_status;
+      driver->add_status_notify = local_driver_add_status_notify;
       driver->blacklist_node = NULL;
       driver->kill_job = local_driver_kill_job;
       driver->free_job = local_driver_free_job;
@@ -276,6 +376,7 @@ queue_driver_type * queue_driver_alloc(job_driver_type type) {
     case TORQUE_DRIVER:
       driver->submit = torque_driver_submit_job;
       driver->get_status = torque_driver_get_job_status;
+      driver->update_status = torque_driver_update_status;
       driver->blacklist_node = NULL;
       driver->kill_job = torque_driver_kill_job;
       driver->free_job = torque_driver_free_job;
@@ -290,6 +391,9 @@ queue_driver_type * queue_driver_alloc(job_driver_type type) {
       util_abort("%s: unrecognized driver type:%d \n", __func__, type);
   }
 
+  if (driver->add_status_notify != NULL)
+    driver->add_status_notify(driver->data, queue_driver_status_notify__, driver);
+
   queue_driver_set_generic_option__(driver, MAX_RUNNING, "0");
   return driver;
 }
@@ -391,6 +495,63 @@ job_status_type queue_driver_get_status(queue_driver_type * driver, void * job_d
   return status;
 }
 
+
+/**
+   Drivers which can query the status of all jobs in one operation
+   implement the update_status function; it is called once before the
+   status of the individual jobs is requested with
+   queue_driver_get_status(), which should then be served from the
+   result of the batched query.
+
+   The driver calls @status_changed with the driver data of every job
+   whose status has changed since the previous call, so that only the
+   status of those jobs needs to be requested. Returns false if the
+   driver can not report the changed jobs, in which case the status of
+   all the jobs must be requested.
+*/
+
+bool queue_driver_update_status(queue_driver_type * driver, status_notify_ftype * status_changed, void * arg) {
+  if (driver->update_status != NULL)
+    return driver->update_status(driver->data, status_changed, arg);
+  else
+    return false;
+}
+
+
+/**
+   Register a function which will be called with the driver data of a
+   job whenever the driver reports that its status has changed, or
+   with NULL if the driver does not know which job has changed; several
+   listeners, e.g. several queues sharing the
+   driver, can be registered. The returned listener must be freed with
+   queue_status_listener_free(), before or after the driver is freed.
+   Returns NULL if the driver does not support pushing status changes,
+   in which case the status must be polled.
+*/
+
+queue_status_listener_type * queue_driver_alloc_status_listener(queue_driver_type * driver, status_notify_ftype * status_notify, void * arg) {
+  if (driver->add_status_notify == NULL)
+    return NULL;
+
+  {
+    queue_status_listener_type * listener = queue_status_listener_alloc(status_notify, arg);
+    std::vector<queue_status_listener_type *> active_listeners;
+
+    pthread_mutex_lock(&driver->listener_mutex);
+    for (auto old_listener : *driver->listeners) {
+      if (queue_status_listener_is_active(old_listener))
+        active_listeners.push_back(old_listener);
+      else
+        queue_status_listener_release(old_listener);
+    }
+    active_listeners.push_back(listener);
+    driver->listeners->swap(active_listeners);
+    pthread_mutex_unlock(&driver->listener_mutex);
+
+    return listener;
+  }
+}
+
 void queue_driver_free_driver(queue_driver_type * driver) {
   driver->free_driver(driver->data);
 }
@@ -399,6 +560,13 @@ void queue_driver_free_driver(queue_driver_type * driver) {
 
 void queue_driver_free(queue_driver_type * driver) {
   queue_driver_free_driver(driver);
+
+  /* The low level driver is gone and will not notify again. */
+  for (auto listener : *driver->listeners)
+    queue_status_listener_release(listener);
+  delete driver->listeners;
+  pthread_mutex_destroy(&driver->listener_mutex);
+
   free(driver->name);
   free(driver->max_running_string);
   free(driver);
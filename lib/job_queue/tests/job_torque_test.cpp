@@ -18,6 +18,11 @@
 #include <stdlib.h>
 #include <stdio.h>
 #include <stdbool.h>
+#include <string.h>
+
+#include <algorithm>
+#include <vector>
+
 
 #include <ert/util/test_work_area.hpp>
 #include <ert/util/test_util.hpp>
@@ -42,6 +47,7 @@ void setoption_setalloptions_optionsset() {
   test_option(driver, TORQUE_KEEP_QSUB_OUTPUT, "0");
   test_option(driver, TORQUE_CLUSTER_LABEL, "thecluster");
   test_option(driver, TORQUE_JOB_PREFIX_KEY, "coolJob");
+  test_option(driver, TORQUE_QSTAT_REFRESH_INTERVAL, "60");
 
   test_assert_int_equal( 0 , torque_driver_get_submit_sleep(driver));
   test_assert_NULL( torque_driver_get_debug_stream(driver) );
@@ -82,6 +88,8 @@ void setoption_set_typed_options_wrong_format_returns_false() {
   test_assert_false(torque_driver_set_option(driver, TORQUE_KEEP_QSUB_OUTPUT, "22"));
   test_assert_false(torque_driver_set_option(driver, TORQUE_KEEP_QSUB_OUTPUT, "1.1"));
   test_assert_false(torque_driver_set_option(driver, TORQUE_SUBMIT_SLEEP, "X45"));
+  test_assert_false(torque_driver_set_option(driver, TORQUE_QSTAT_REFRESH_INTERVAL, "-1"));
+  test_assert_false(torque_driver_set_option(driver, TORQUE_QSTAT_REFRESH_INTERVAL, "often"));
 }
 
 void getoption_nooptionsset_defaultoptionsreturned() {
@@ -94,6 +102,7 @@ void getoption_nooptionsset_defaultoptionsreturned() {
   test_assert_string_equal((const char *) torque_driver_get_option(driver, TORQUE_NUM_NODES), "1");
   test_assert_string_equal((const char *) torque_driver_get_option(driver, TORQUE_CLUSTER_LABEL), NULL );
   test_assert_string_equal((const char *) torque_driver_get_option(driver, TORQUE_JOB_PREFIX_KEY), NULL);
+  test_assert_string_equal((const char *) torque_driver_get_option(driver, TORQUE_QSTAT_REFRESH_INTERVAL), TORQUE_DEFAULT_QSTAT_REFRESH_INTERVAL);
 
   printf("Default options OK\n");
   torque_driver_free(driver);
@@ -146,6 +155,98 @@ void test_parse_invalid( ) {
 }
 
 
+static void write_script(const char * filename, const char * content) {
+  FILE * stream = util_fopen(filename, "w");
+  fprintf(stream, "#!/bin/sh\n%s", content);
+  fclose(stream);
+  util_addmode_if_owner(filename, S_IXUSR);
+}
+
+static int count_lines(const char * filename) {
+  int count = 0;
+  if (util_file_exists(filename)) {
+    FILE * stream = util_fopen(filename, "r");
+    bool at_eof = false;
+    while (!at_eof) {
+      char * line = util_fscanf_alloc_line(stream, &at_eof);
+      if (line) {
+        if (strlen(line) > 0)
+          count++;
+        free(line);
+      }
+    }
+    fclose(stream);
+  }
+  return count;
+}
+
+
+static void record_changed_job(void * arg, void * job_data) {
+  std::vector<void *> * changed_jobs = (std::vector<void *> *) arg;
+  changed_jobs->push_back(job_data);
+}
+
+
+void test_batched_qstat() {
+  ecl::util::TestArea ta("batched_qstat");
+  char * cwd = util_alloc_cwd();
+  char * qsub_cmd = util_alloc_filename(cwd, "qsub", NULL);
+  char * qstat_cmd = util_alloc_filename(cwd, "qstat", NULL);
+  char * calls_file = util_alloc_filename(cwd, "qstat_calls", NULL);
+  char * qstat_content = util_alloc_sprintf("echo call >> %s\n"
+                                            "echo \"Job id    Name   User   Time Use S Queue\"\n"
+                                            "echo \"--------- ------ ------ -------- - -----\"\n"
+                                            "echo \"101.host  job    user   00:00:01 R normal\"\n"
+                                            "echo \"102.host  job    user   00:00:01 Q normal\"\n"
+                                            "echo \"103.host  job    user   00:00:01 C normal\"\n", calls_file);
+  char * qsub_content = util_alloc_sprintf("n=$(cat %s/qsub_count 2>/dev/null || echo 100)\n"
+                                           "n=$((n+1))\n"
+                                           "echo $n > %s/qsub_count\n"
+                                           "echo $n.host\n", cwd, cwd);
+  write_script(qsub_cmd, qsub_content);
+  write_script(qstat_cmd, qstat_content);
+
+  {
+    torque_driver_type * driver = (torque_driver_type *) torque_driver_alloc();
+    torque_job_type * jobs[3];
+    torque_driver_set_option(driver, TORQUE_QSUB_CMD, qsub_cmd);
+    torque_driver_set_option(driver, TORQUE_QSTAT_CMD, qstat_cmd);
+    torque_driver_set_option(driver, TORQUE_QSTAT_REFRESH_INTERVAL, "1000");
+
+    for (int i = 0; i < 3; i++)
+      jobs[i] = (torque_job_type *) torque_driver_submit_job(driver, "/bin/true", 1, cwd, "JOB", 0, NULL);
+
+    {
+      std::vector<void *> changed_jobs;
+      test_assert_true(torque_driver_update_status(driver, record_changed_job, &changed_jobs));
+      test_assert_int_equal(changed_jobs.size(), 3);
+      for (int i = 0; i < 3; i++)
+        test_assert_true(std::find(changed_jobs.begin(), changed_jobs.end(), jobs[i]) != changed_jobs.end());
+    }
+    test_assert_int_equal(torque_driver_get_job_status(driver, jobs[0]), JOB_QUEUE_RUNNING);
+    test_assert_int_equal(torque_driver_get_job_status(driver, jobs[1]), JOB_QUEUE_PENDING);
+    test_assert_int_equal(torque_driver_get_job_status(driver, jobs[2]), JOB_QUEUE_DONE);
+    {
+      std::vector<void *> changed_jobs;
+      test_assert_true(torque_driver_update_status(driver, record_changed_job, &changed_jobs));
+      test_assert_int_equal(changed_jobs.size(), 0);
+    }
+    test_assert_int_equal(count_lines(calls_file), 1);
+
+    for (int i = 0; i < 3; i++)
+      torque_driver_free_job(jobs[i]);
+    torque_driver_free(driver);
+  }
+
+  free(qsub_content);
+  free(qstat_content);
+  free(calls_file);
+  free(qstat_cmd);
+  free(qsub_cmd);
+  free(cwd);
+}
+
+
 int main(int argc, char ** argv) {
   getoption_nooptionsset_defaultoptionsreturned();
   setoption_setalloptions_optionsset();
@@ -153,5 +254,6 @@ int main(int argc, char ** argv) {
   setoption_set_typed_options_wrong_format_returns_false();
   create_submit_script_script_according_to_input();
   test_parse_invalid( );
+  test_batched_qstat( );
   exit(0);
 }
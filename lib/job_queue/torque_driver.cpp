@@ -18,8 +18,12 @@
 #include <stdio.h>
 #include <string.h>
 #include <unistd.h>
+#include <time.h>
+#include <pthread.h>
 
 #include <ert/util/util.hpp>
+#include <ert/util/hash.hpp>
+#include <ert/util/vector.hpp>
 #include <ert/util/type_macros.hpp>
 
 #include <ert/job_queue/torque_driver.hpp>
@@ -44,12 +48,21 @@ struct torque_driver_struct {
   char * cluster_label;
   int    submit_sleep;
   FILE * debug_stream;
+
+  int               qstat_refresh_interval;
+  char            * qstat_refresh_interval_char;
+  time_t            last_qstat_update;
+  hash_type       * qstat_cache;       /* The output of calling qstat for all jobs is cached in this table. */
+  hash_type       * jobs;              /* jobnr -> job for the submitted jobs which have not yet dropped out of the qstat table. */
+  vector_type     * changed_jobs;      /* The jobs whose status has changed in the qstat table since the last torque_driver_update_status(). */
+  pthread_mutex_t   qstat_mutex;       /* Only one thread should update the qstat_cache table. */
 };
 
 struct torque_job_struct {
   UTIL_TYPE_ID_DECLARATION;
   long int torque_jobnr;
   char * torque_jobnr_char;
+  time_t submit_time;
 };
 
 UTIL_SAFE_CAST_FUNCTION(torque_driver, TORQUE_DRIVER_TYPE_ID);
@@ -73,6 +86,12 @@ void * torque_driver_alloc() {
   torque_driver->cluster_label = NULL;
   torque_driver->job_prefix = NULL;
   torque_driver->debug_stream = NULL;
+  torque_driver->qstat_refresh_interval_char = NULL;
+  torque_driver->last_qstat_update = 0;
+  torque_driver->qstat_cache = hash_alloc();
+  torque_driver->jobs = hash_alloc();
+  torque_driver->changed_jobs = vector_alloc_new();
+  pthread_mutex_init( &torque_driver->qstat_mutex , NULL );
 
   torque_driver_set_option(torque_driver, TORQUE_QSUB_CMD, TORQUE_DEFAULT_QSUB_CMD);
   torque_driver_set_option(torque_driver, TORQUE_QSTAT_CMD, TORQUE_DEFAULT_QSTAT_CMD);
@@ -80,6 +99,7 @@ void * torque_driver_alloc() {
   torque_driver_set_option(torque_driver, TORQUE_NUM_CPUS_PER_NODE, "1");
   torque_driver_set_option(torque_driver, TORQUE_NUM_NODES, "1");
   torque_driver_set_option(torque_driver, TORQUE_SUBMIT_SLEEP, TORQUE_DEFAULT_SUBMIT_SLEEP);
+  torque_driver_set_option(torque_driver, TORQUE_QSTAT_REFRESH_INTERVAL, TORQUE_DEFAULT_QSTAT_REFRESH_INTERVAL);
 
   return torque_driver;
 }
@@ -99,8 +119,17 @@ static void torque_driver_set_qsub_cmd(torque_driver_type * driver, const char *
   driver->qsub_cmd = util_realloc_string_copy(driver->qsub_cmd, qsub_cmd);
 }
 
+/*
+  The cached qstat output is invalidated when the qstat command is
+  changed.
+*/
+
 static void torque_driver_set_qstat_cmd(torque_driver_type * driver, const char * qstat_cmd) {
+  pthread_mutex_lock( &driver->qstat_mutex );
   driver->qstat_cmd = util_realloc_string_copy(driver->qstat_cmd, qstat_cmd);
+  hash_clear( driver->qstat_cache );
+  driver->last_qstat_update = 0;
+  pthread_mutex_unlock( &driver->qstat_mutex );
 }
 
 static void torque_driver_set_qdel_cmd(torque_driver_type * driver, const char * qdel_cmd) {
@@ -121,6 +150,21 @@ static bool torque_driver_set_submit_sleep(torque_driver_type * driver, const ch
 }
 
 
+void torque_driver_set_qstat_refresh_interval(torque_driver_type * driver, int refresh_interval) {
+  driver->qstat_refresh_interval = refresh_interval;
+  free( driver->qstat_refresh_interval_char );
+  driver->qstat_refresh_interval_char = util_alloc_sprintf("%d", refresh_interval);
+}
+
+static bool torque_driver_set_qstat_refresh_interval_option(torque_driver_type * driver, const char* refresh_interval_char) {
+  int refresh_interval;
+  if (util_sscanf_int(refresh_interval_char, &refresh_interval) && (refresh_interval >= 0)) {
+    torque_driver_set_qstat_refresh_interval(driver, refresh_interval);
+    return true;
+  } else
+    return false;
+}
+
 static bool torque_driver_set_num_nodes(torque_driver_type * driver, const char* num_nodes_char) {
   int num_nodes = 0;
   if (util_sscanf_int(num_nodes_char, &num_nodes)) {
@@ -189,6 +233,8 @@ bool torque_driver_set_option(void * __driver, const char * option_key, const vo
       torque_driver_set_debug_output(driver, value);
     else if (strcmp(TORQUE_SUBMIT_SLEEP, option_key) == 0)
       option_set = torque_driver_set_submit_sleep(driver, value);
+    else if (strcmp(TORQUE_QSTAT_REFRESH_INTERVAL, option_key) == 0)
+      option_set = torque_driver_set_qstat_refresh_interval_option(driver, value);
     else
       option_set = false;
   }
@@ -216,6 +262,8 @@ const void * torque_driver_get_option(const void * __driver, const char * option
       return driver->cluster_label;
     else if(strcmp(TORQUE_JOB_PREFIX_KEY, option_key) == 0)
       return driver->job_prefix;
+    else if (strcmp(TORQUE_QSTAT_REFRESH_INTERVAL, option_key) == 0)
+      return driver->qstat_refresh_interval_char;
     else {
       util_abort("%s: option_id:%s not recognized for TORQUE driver \n", __func__, option_key);
       return NULL;
@@ -233,6 +281,7 @@ void torque_driver_init_option_list(stringlist_type * option_list) {
   stringlist_append_copy(option_list, TORQUE_KEEP_QSUB_OUTPUT);
   stringlist_append_copy(option_list, TORQUE_CLUSTER_LABEL);
   stringlist_append_copy(option_list, TORQUE_JOB_PREFIX_KEY);
+  stringlist_append_copy(option_list, TORQUE_QSTAT_REFRESH_INTERVAL);
 }
 
 torque_job_type * torque_job_alloc() {
@@ -240,6 +289,7 @@ torque_job_type * torque_job_alloc() {
   job = (torque_job_type*)util_malloc(sizeof * job);
   job->torque_jobnr_char = NULL;
   job->torque_jobnr = 0;
+  job->submit_time = 0;
   UTIL_TYPE_ID_INIT(job, TORQUE_JOB_TYPE_ID);
 
   return job;
@@ -431,6 +481,15 @@ void * torque_driver_submit_job(void * __driver,
 
     job->torque_jobnr = torque_driver_submit_shell_job(driver, run_path, local_job_name, submit_cmd, num_cpu, argc, argv);
     job->torque_jobnr_char = util_alloc_sprintf("%ld", job->torque_jobnr);
+    job->submit_time = time( NULL );
+
+    /* A stale status for a previous job with the same id must not be used. */
+    pthread_mutex_lock( &driver->qstat_mutex );
+    if (hash_has_key( driver->qstat_cache , job->torque_jobnr_char ))
+      hash_del( driver->qstat_cache , job->torque_jobnr_char );
+    if (job->torque_jobnr > 0)
+      hash_insert_ref( driver->jobs , job->torque_jobnr_char , job );
+    pthread_mutex_unlock( &driver->qstat_mutex );
 
     torque_debug( driver , "Job:%s Id:%d" , run_path , job->torque_jobnr);
     free(local_job_name);
@@ -448,10 +507,58 @@ void * torque_driver_submit_job(void * __driver,
   }
 }
 
+/*
+  Parses one job line from the qstat output, i.e. a line like:
+
+     1612427.st-lcmm     ...130getupdates fama     00:00:01 R normal
+
+  The job id is returned without the server suffix, or NULL if the
+  line could not be parsed. Status letters which are not recognized
+  are returned as JOB_QUEUE_STATUS_FAILURE.
+*/
+
+static char * torque_driver_alloc_parse_qstat_line(const char * line, job_status_type * status) {
+  char job_id_full_string[32];
+  char string_status[2];
+
+  *status = JOB_QUEUE_STATUS_FAILURE;
+  if (sscanf(line, "%31s %*s %*s %*s %1s %*s", job_id_full_string, string_status) == 2) {
+    const char * dotPtr = strchr(job_id_full_string, '.');
+    char * job_id;
+
+    if (dotPtr)
+      job_id = util_alloc_substring_copy(job_id_full_string, 0, dotPtr - job_id_full_string);
+    else
+      job_id = util_alloc_string_copy(job_id_full_string);
+
+    switch( string_status[0] ) {
+    case 'R':
+      *status = JOB_QUEUE_RUNNING;
+      break;
+
+    case 'E':
+      *status = JOB_QUEUE_DONE;
+      break;
+
+    case 'C':
+      *status = JOB_QUEUE_DONE;
+      break;
+
+    case 'Q':
+      *status = JOB_QUEUE_PENDING;
+      break;
+    }
+
+    return job_id;
+  } else
+    return NULL;
+}
+
+
 /**
-   Will return NULL if "something" fails; that again will be
-   translated to JOB_QUEUE_STATUS_FAILURE - which the queue layer will
-   just interpret as "No change in status". Possible failures are:
+   Will return JOB_QUEUE_STATUS_FAILURE if "something" fails; the queue
+   layer will just interpret that as "No change in status". Possible
+   failures are:
 
     1. The file capturing stdout is not created.
     2. Can not extract the correct status string from the stdout file.
@@ -481,55 +588,106 @@ static job_status_type torque_driver_get_qstat_status(torque_driver_type * drive
   return status;
 }
 
-job_status_type torque_driver_parse_status(const char * qstat_file, const char * jobnr_char) {
-  job_status_type status = JOB_QUEUE_STATUS_FAILURE;
 
-  if (util_file_exists(qstat_file)) {
-    char * line = NULL;
-    {
-      FILE *stream = util_fopen(qstat_file, "r");
-      bool at_eof = false;
-      util_fskip_lines(stream, 2);
-      line = util_fscanf_alloc_line(stream, &at_eof);
-      fclose(stream);
-    }
+/*
+  Records the submitted jobs whose status differs between the previous
+  and the new qstat table. A job which has dropped out of the table is
+  recorded one last time, and is then forgotten.
+*/
 
-    if (line) {
-      char job_id_full_string[32];
-      char   string_status[2];
+static void torque_driver_record_changed_jobs(torque_driver_type * driver, const hash_type * old_cache) {
+  stringlist_type * jobnr_list = hash_alloc_stringlist( driver->jobs );
 
-      if (sscanf(line, "%s %*s %*s %*s %s %*s", job_id_full_string, string_status) == 2) {
-        const char *dotPtr = strchr(job_id_full_string, '.');
-        int dotPosition = dotPtr - job_id_full_string;
+  for (int i = 0; i < stringlist_get_size( jobnr_list ); i++) {
+    const char * jobnr = stringlist_iget( jobnr_list , i );
+    bool old_listed = hash_has_key( old_cache , jobnr );
+    bool new_listed = hash_has_key( driver->qstat_cache , jobnr );
 
-        {
-          char* job_id_as_char_ptr = util_alloc_substring_copy(job_id_full_string, 0, dotPosition);
-          if (util_string_equal(job_id_as_char_ptr, jobnr_char)) {
+    if ((old_listed != new_listed) ||
+        (new_listed && (hash_get_int( old_cache , jobnr ) != hash_get_int( driver->qstat_cache , jobnr ))))
+      vector_append_ref( driver->changed_jobs , hash_get( driver->jobs , jobnr ));
 
-            switch( string_status[0] ) {
-            case 'R':
-              status = JOB_QUEUE_RUNNING;
-              break;
+    if (old_listed && !new_listed)
+      hash_del( driver->jobs , jobnr );
+  }
+  stringlist_free( jobnr_list );
+}
 
-            case 'E':
-              status = JOB_QUEUE_DONE;
-              break;
 
-            case 'C':
-              status = JOB_QUEUE_DONE;
-              break;
+/*
+  Calls qstat once without job arguments and caches the status of all
+  the listed jobs; must be called with the qstat_mutex held.
+*/
 
-            case 'Q':
-              status = JOB_QUEUE_PENDING;
-              break;
-            }
+static void torque_driver_update_qstat_table(torque_driver_type * driver) {
+  char * tmp_file = (char*)util_alloc_tmp_file("/tmp", "enkf-qstat", true);
+  hash_type * old_cache = driver->qstat_cache;
+
+  util_spawn_blocking(driver->qstat_cmd, 0, NULL, tmp_file, NULL);
+  driver->qstat_cache = hash_alloc();
+  if (util_file_exists( tmp_file )) {
+    FILE * stream = util_fopen(tmp_file, "r");
+    bool at_eof = false;
+
+    util_fskip_lines(stream, 2);
+    while (!at_eof) {
+      char * line = util_fscanf_alloc_line(stream, &at_eof);
+      if (line != NULL) {
+        job_status_type status;
+        char * job_id = torque_driver_alloc_parse_qstat_line(line, &status);
+
+        if (job_id != NULL) {
+          if (status != JOB_QUEUE_STATUS_FAILURE)
+            hash_insert_int( driver->qstat_cache , job_id , status );
+          free(job_id);
+        }
+        free(line);
+      }
+    }
+    fclose(stream);
+    unlink(tmp_file);
+  } else
+    fprintf(stderr, "No such file: %s - reading qstat status failed \n", tmp_file );
+
+  free(tmp_file);
+  driver->last_qstat_update = time( NULL );
+
+  torque_driver_record_changed_jobs( driver , old_cache );
+  hash_free( old_cache );
+}
+
+
+static bool torque_driver_qstat_table_expired(const torque_driver_type * driver) {
+  return (difftime(time(NULL), driver->last_qstat_update) > driver->qstat_refresh_interval);
+}
+
+
+job_status_type torque_driver_parse_status(const char * qstat_file, const char * jobnr_char) {
+  job_status_type status = JOB_QUEUE_STATUS_FAILURE;
 
-            free(job_id_as_char_ptr);
+  if (util_file_exists(qstat_file)) {
+    FILE *stream = util_fopen(qstat_file, "r");
+    bool at_eof = false;
+    bool found = false;
+
+    util_fskip_lines(stream, 2);
+    while (!at_eof && !found) {
+      char * line = util_fscanf_alloc_line(stream, &at_eof);
+      if (line) {
+        job_status_type line_status;
+        char * job_id = torque_driver_alloc_parse_qstat_line(line, &line_status);
+
+        if (job_id) {
+          if (util_string_equal(job_id, jobnr_char)) {
+            status = line_status;
+            found = true;
           }
+          free(job_id);
         }
+        free(line);
       }
-      free(line);
     }
+    fclose(stream);
   }
   if (status == JOB_QUEUE_STATUS_FAILURE)
     fprintf(stderr,"** Warning: failed to get job status for job:%s from file:%s\n",jobnr_char , qstat_file );
@@ -538,11 +696,64 @@ job_status_type torque_driver_parse_status(const char * qstat_file, const char *
 }
 
 
+/*
+  Refreshes the cached qstat table if it is older than the refresh
+  interval; called by the job queue once before the status of the
+  individual jobs is checked. The jobs whose status has changed since
+  the previous call are reported through @status_changed.
+*/
+
+bool torque_driver_update_status(void * __driver, status_notify_ftype * status_changed, void * arg) {
+  torque_driver_type * driver = torque_driver_safe_cast(__driver);
+  pthread_mutex_lock( &driver->qstat_mutex );
+  if (torque_driver_qstat_table_expired(driver))
+    torque_driver_update_qstat_table(driver);
+
+  for (int i = 0; i < vector_get_size( driver->changed_jobs ); i++)
+    status_changed( arg , vector_iget( driver->changed_jobs , i ));
+  vector_clear( driver->changed_jobs );
+  pthread_mutex_unlock( &driver->qstat_mutex );
+  return true;
+}
+
+
+/*
+  The status is served from the cached qstat table. The table is
+  refreshed if it has expired, or if the job has been submitted after
+  the last refresh. Jobs which are not in the table, e.g. completed jobs
+  which are no longer listed, are queried individually.
+*/
 
 job_status_type torque_driver_get_job_status(void * __driver, void * __job) {
   torque_driver_type * driver = torque_driver_safe_cast(__driver);
   torque_job_type * job = torque_job_safe_cast(__job);
-  return torque_driver_get_qstat_status(driver, job->torque_jobnr_char);
+  job_status_type status = JOB_QUEUE_STATUS_FAILURE;
+  bool cached;
+
+  pthread_mutex_lock( &driver->qstat_mutex );
+  {
+    bool update_cache = torque_driver_qstat_table_expired(driver) ||
+                        (!hash_has_key( driver->qstat_cache , job->torque_jobnr_char ) &&
+                         (difftime(job->submit_time , driver->last_qstat_update) > 0));
+    if (update_cache)
+      torque_driver_update_qstat_table(driver);
+
+    cached = hash_has_key( driver->qstat_cache , job->torque_jobnr_char );
+    if (cached)
+      status = (job_status_type) hash_get_int( driver->qstat_cache , job->torque_jobnr_char );
+  }
+  pthread_mutex_unlock( &driver->qstat_mutex );
+
+  if (!cached) {
+    status = torque_driver_get_qstat_status(driver, job->torque_jobnr_char);
+    if (status != JOB_QUEUE_STATUS_FAILURE) {
+      pthread_mutex_lock( &driver->qstat_mutex );
+      hash_insert_int( driver->qstat_cache , job->torque_jobnr_char , status );
+      pthread_mutex_unlock( &driver->qstat_mutex );
+    }
+  }
+
+  return status;
 }
 
 
@@ -551,6 +762,13 @@ void torque_driver_kill_job(void * __driver, void * __job) {
   torque_driver_type * driver = torque_driver_safe_cast(__driver);
   torque_job_type * job = torque_job_safe_cast(__job);
   util_spawn_blocking(driver->qdel_cmd, 1, (const char **) &job->torque_jobnr_char, NULL, NULL);
+
+  pthread_mutex_lock( &driver->qstat_mutex );
+  if (hash_has_key( driver->qstat_cache , job->torque_jobnr_char ))
+    hash_del( driver->qstat_cache , job->torque_jobnr_char );
+  if (hash_has_key( driver->jobs , job->torque_jobnr_char ))
+    hash_del( driver->jobs , job->torque_jobnr_char );
+  pthread_mutex_unlock( &driver->qstat_mutex );
 }
 
 void torque_driver_free(torque_driver_type * driver) {
@@ -561,9 +779,14 @@ void torque_driver_free(torque_driver_type * driver) {
   free(driver->qsub_cmd);
   free(driver->num_cpus_per_node_char);
   free(driver->num_nodes_char);
+  free(driver->qstat_refresh_interval_char);
   if (driver->job_prefix)
     free(driver->job_prefix);
 
+  hash_free(driver->qstat_cache);
+  hash_free(driver->jobs);
+  vector_free(driver->changed_jobs);
+  pthread_mutex_destroy( &driver->qstat_mutex );
   free(driver);
 }
 
@@ -22,15 +22,20 @@
 #include <stdio.h>
 #include <errno.h>
 #include <unistd.h>
+#include <fcntl.h>
+#include <stdint.h>
 #include <pthread.h>
 #include <time.h>
 #include <fnmatch.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
 
 #include <ert/util/hash.hpp>
 #include <ert/util/util.hpp>
 #include <ert/util/vector.hpp>
 #include <ert/util/buffer.hpp>
 #include <ert/util/long_vector.hpp>
+#include <ert/util/stringlist.hpp>
 
 #include <ert/res_util/block_fs.hpp>
 
@@ -38,7 +43,8 @@
 #define MOUNT_MAP_MAGIC_INT  8861290
 #define BLOCK_FS_TYPE_ID     7100652
 #define INDEX_MAGIC_INT      1213775
-#define INDEX_FORMAT_VERSION       1
+#define INDEX_FORMAT_VERSION       2
+#define INDEX_FORMAT_VERSION_HASH  1   /* The old unsorted index format; can still be loaded. */
 
 // #define ENABLE_CACHE
 
@@ -87,6 +93,7 @@ typedef enum {
 */
 typedef struct file_node_struct file_node_type;
 typedef struct free_node_struct free_node_type;
+typedef struct sorted_index_struct sorted_index_type;
 
 struct free_node_struct {
   free_node_type * next;
@@ -164,6 +171,13 @@ struct block_fs_struct {
                                             fragmentation_limit == 0.0 : Rotate when one byte is wasted. */
   bool             data_owner;
   int              fsync_interval;  /* 0: never  n: every nth iteration. */
+
+  sorted_index_type * sorted_index; /* A sorted index loaded from disk which has not yet been installed in the hash table. */
+  double           index_load_time; /* Wall time in seconds spent on loading or building the index when mounting. */
+
+  bool             use_mmap;        /* Serve reads from a read-only memory mapping of the data file. */
+  char           * mmap_data;       /* The current mapping - NULL if the data file has not been mapped (yet). */
+  size_t           mmap_size;
 };
 
 /*****************************************************************/
@@ -454,6 +468,171 @@ static file_node_type * file_node_index_buffer_fread_alloc( buffer_type * buffer
 }
 
 /* file_node functions - end. */
+/*****************************************************************/
+/*
+  The sorted index
+  ----------------
+
+  The index file is written with all the active nodes sorted on
+  filename, as fixed size records, with the filenames stored in a
+  separate string table at the end of the file:
+
+    | header | active records (sorted) | free records | string table |
+
+  When mounting the index file is memory mapped, the free nodes are
+  installed immediately and the data file size is taken from the
+  header. The active nodes are NOT inserted in the index hash table;
+  instead lookups are done with binary search directly in the mapped
+  records. The hash table is built, in one go and with the correct
+  capacity, only when the filesystem is about to be modified, or the
+  full list of nodes is requested, see block_fs_install_sorted_index().
+
+  For read-only mounts of large cases this reduces mounting to a
+  handful of system calls.
+*/
+
+typedef struct {
+  int              magic;
+  int              version;
+  int64_t          data_mtime;
+  int              num_active_nodes;
+  int              num_free_nodes;
+  int64_t          data_file_size;
+  int64_t          string_size;
+} sorted_index_header_type;
+
+
+typedef struct {
+  int64_t          key_offset;      /* Offset of the filename in the string table; -1 for free nodes. */
+  int64_t          node_offset;
+  int              node_size;
+  int              data_offset;
+  int              data_size;
+  int              status;
+} sorted_index_record_type;
+
+
+struct sorted_index_struct {
+  char                           * data;
+  size_t                           size;
+  const sorted_index_header_type * header;
+  const sorted_index_record_type * records;
+  const char                     * strings;
+};
+
+
+static const char * sorted_index_iget_key( const sorted_index_type * sorted_index , int index ) {
+  return &sorted_index->strings[ sorted_index->records[index].key_offset ];
+}
+
+
+static void sorted_index_free( sorted_index_type * sorted_index ) {
+  munmap( sorted_index->data , sorted_index->size );
+  free( sorted_index );
+}
+
+
+/*
+  Will map the index file and verify that it is a sorted index which
+  is consistent with the data file. Returns NULL if the index file can
+  not be used.
+*/
+
+static sorted_index_type * sorted_index_mmap( const char * index_file , time_t data_mtime ) {
+  sorted_index_type * sorted_index = NULL;
+  int fd = open( index_file , O_RDONLY );
+  if (fd == -1)
+    return NULL;
+
+  {
+    stat_type index_stat;
+    if ((fstat( fd , &index_stat ) == 0) && (index_stat.st_size >= (off_t) sizeof(sorted_index_header_type))) {
+      void * data = mmap( NULL , index_stat.st_size , PROT_READ , MAP_SHARED , fd , 0 );
+      if (data != MAP_FAILED) {
+        const sorted_index_header_type * header = (const sorted_index_header_type *) data;
+        size_t num_records = (size_t) header->num_active_nodes + header->num_free_nodes;
+        size_t expected_size = sizeof * header + num_records * sizeof(sorted_index_record_type) + header->string_size;
+
+        if ((header->magic == INDEX_MAGIC_INT) &&
+            (header->version == INDEX_FORMAT_VERSION) &&
+            (header->data_mtime == (int64_t) data_mtime) &&
+            (expected_size == (size_t) index_stat.st_size)) {
+
+          sorted_index = (sorted_index_type *) util_malloc( sizeof * sorted_index );
+          sorted_index->data    = (char *) data;
+          sorted_index->size    = index_stat.st_size;
+          sorted_index->header  = header;
+          sorted_index->records = (const sorted_index_record_type *) &sorted_index->data[ sizeof * header ];
+          sorted_index->strings = (const char *) &sorted_index->records[ num_records ];
+        } else
+          munmap( data , index_stat.st_size );
+      }
+    }
+  }
+  close( fd );
+  return sorted_index;
+}
+
+
+/*
+  Binary search for filename among the active nodes; returns the
+  record index or -1 if the file is not in the index.
+*/
+
+static int sorted_index_lookup( const sorted_index_type * sorted_index , const char * filename ) {
+  int lower = 0;
+  int upper = sorted_index->header->num_active_nodes - 1;
+
+  while (lower <= upper) {
+    int middle = lower + (upper - lower) / 2;
+    int cmp = strcmp( sorted_index_iget_key( sorted_index , middle ) , filename );
+
+    if (cmp == 0)
+      return middle;
+
+    if (cmp < 0)
+      lower = middle + 1;
+    else
+      upper = middle - 1;
+  }
+  return -1;
+}
+
+
+static void sorted_index_record_init_file_node( const sorted_index_record_type * record , file_node_type * file_node ) {
+  file_node->node_offset = record->node_offset;
+  file_node->node_size   = record->node_size;
+  file_node->data_offset = record->data_offset;
+  file_node->data_size   = record->data_size;
+  file_node->status      = (node_status_type) record->status;
+#ifdef ENABLE_CACHE
+  file_node->cache      = NULL;
+  file_node->cache_size = 0;
+#endif
+}
+
+
+static file_node_type * sorted_index_record_alloc_file_node( const sorted_index_record_type * record ) {
+  file_node_type * file_node = file_node_alloc( (node_status_type) record->status , record->node_offset , record->node_size );
+  sorted_index_record_init_file_node( record , file_node );
+  return file_node;
+}
+
+
+static void sorted_index_record_fwrite( const file_node_type * file_node , int64_t key_offset , FILE * stream ) {
+  sorted_index_record_type record;
+
+  memset( &record , 0 , sizeof record );
+  record.key_offset  = key_offset;
+  record.node_offset = file_node->node_offset;
+  record.node_size   = file_node->node_size;
+  record.data_offset = file_node->data_offset;
+  record.data_size   = file_node->data_size;
+  record.status      = file_node->status;
+
+  util_fwrite( &record , sizeof record , 1 , stream , __func__ );
+}
+
 /*****************************************************************/
 
 static free_node_type * free_node_alloc( file_node_type * file_node ) {
@@ -513,6 +692,41 @@ static void block_fs_insert_index_node( block_fs_type * block_fs , const char *
 }
 
 
+/*
+  Will look up the node for filename, either in the hash table or in
+  the sorted index. For nodes found in the sorted index the
+  information is copied into the storage supplied by the calling
+  scope, i.e. the returned pointer should only be used for reading
+  and only while the lock is held. Returns NULL if the file does not
+  exist.
+*/
+
+static file_node_type * block_fs_lookup_node( const block_fs_type * block_fs , const char * filename , file_node_type * node_storage) {
+  if (block_fs->sorted_index != NULL) {
+    int index = sorted_index_lookup( block_fs->sorted_index , filename );
+    if (index < 0)
+      return NULL;
+
+    sorted_index_record_init_file_node( &block_fs->sorted_index->records[index] , node_storage );
+    return node_storage;
+  }
+
+  if (hash_has_key( block_fs->index , filename ))
+    return (file_node_type*)hash_get( block_fs->index , filename );
+  else
+    return NULL;
+}
+
+
+static file_node_type * block_fs_get_node( const block_fs_type * block_fs , const char * filename , file_node_type * node_storage) {
+  file_node_type * node = block_fs_lookup_node( block_fs , filename , node_storage );
+  if (node == NULL)
+    util_abort("%s: file:%s does not exist in filesystem:%s \n",__func__ , filename , block_fs->mount_file );
+
+  return node;
+}
+
+
 /**
    Looks through the list of free nodes - looking for a node with
    offset 'node_offset'. If no such node can be found, NULL will be
@@ -602,6 +816,47 @@ static void block_fs_install_node(block_fs_type * block_fs , file_node_type * no
 }
 
 
+/**
+   Will install the active nodes from a pending sorted index in the
+   hash table and release the sorted index. Must be called with
+   exclusive access to the block_fs instance, before the index is
+   modified or iterated over.
+*/
+
+static void block_fs_install_sorted_index( block_fs_type * block_fs ) {
+  sorted_index_type * sorted_index = block_fs->sorted_index;
+  if (sorted_index == NULL)
+    return;
+
+  {
+    int num_active_nodes = sorted_index->header->num_active_nodes;
+    hash_resize( block_fs->index , num_active_nodes * 2 + 64);
+
+    for (int i=0; i < num_active_nodes; i++) {
+      file_node_type * file_node = sorted_index_record_alloc_file_node( &sorted_index->records[i] );
+      block_fs_install_node( block_fs , file_node );
+      block_fs_insert_index_node( block_fs , sorted_index_iget_key( sorted_index , i ) , file_node );
+    }
+  }
+  sorted_index_free( sorted_index );
+  block_fs->sorted_index = NULL;
+}
+
+
+/*
+  Like block_fs_install_sorted_index(), but for use by functions which
+  only hold the read lock while iterating over the index.
+*/
+
+static void block_fs_ensure_index( block_fs_type * block_fs ) {
+  if (block_fs->sorted_index != NULL) {
+    pthread_rwlock_wrlock( &block_fs->rw_lock );
+    block_fs_install_sorted_index( block_fs );
+    pthread_rwlock_unlock( &block_fs->rw_lock );
+  }
+}
+
+
 static void block_fs_set_filenames( block_fs_type * block_fs ) {
   char * data_ext  = util_alloc_sprintf("data_%d" , block_fs->version );
   char * lock_ext  = util_alloc_sprintf("lock_%d" , block_fs->version );
@@ -660,6 +915,11 @@ static block_fs_type * block_fs_alloc_empty( const char * mount_file ,
   block_fs->max_total_cache_size = 512 * 1024 * 1024;  /* 512 MB */
 
   block_fs->fragmentation_limit = fragmentation_limit;
+  block_fs->sorted_index         = NULL;
+  block_fs->index_load_time      = 0;
+  block_fs->use_mmap             = false;
+  block_fs->mmap_data            = NULL;
+  block_fs->mmap_size            = 0;
   util_alloc_file_components( mount_file , &block_fs->path , &block_fs->base_name, NULL );
   pthread_mutex_init( &block_fs->io_lock  , NULL);
   pthread_rwlock_init( &block_fs->rw_lock , NULL);
@@ -810,6 +1070,97 @@ static void block_fs_open_data( block_fs_type * block_fs , bool read_write) {
     block_fs->data_fd = fileno( block_fs->data_stream );
 }
 
+/*
+  The mmap read mode
+  ------------------
+
+  When use_mmap is set the data file is mapped read-only into memory,
+  and reads are served directly from the mapping instead of going
+  through fseek() + fread() on the shared data stream. The mapping is
+  created lazily by the first reader, and the life cycle is tied to
+  the rw_lock:
+
+    1. The mapping is only created while holding the read lock (and
+       the io_lock to serialize concurrent readers).
+
+    2. The mapping is only removed while holding the write lock,
+       i.e. when there are no readers which can hold a pointer into
+       it. This happens when a write has extended the data file
+       beyond the current mapping, on rotate and on close.
+
+  The writes go through the buffered data stream, so in mmap mode the
+  stream is flushed after all modifications to ensure that the
+  mapping is coherent with the file content.
+*/
+
+static void block_fs_munmap( block_fs_type * block_fs ) {
+  if (block_fs->mmap_data != NULL) {
+    munmap( block_fs->mmap_data , block_fs->mmap_size );
+    block_fs->mmap_data = NULL;
+    block_fs->mmap_size = 0;
+  }
+}
+
+
+static void block_fs_mmap( block_fs_type * block_fs ) {
+  if (block_fs->data_stream == NULL)
+    return;
+
+  {
+    stat_type data_stat;
+    if (fstat( block_fs->data_fd , &data_stat ) == 0 && data_stat.st_size > 0) {
+      void * data = mmap( NULL , data_stat.st_size , PROT_READ , MAP_SHARED , block_fs->data_fd , 0 );
+      if (data != MAP_FAILED) {
+        block_fs->mmap_data = (char *) data;
+        block_fs->mmap_size = data_stat.st_size;
+      } else
+        fprintf(stderr,"** Warning: mmap of %s failed: %s - falling back to normal reads.\n", block_fs->data_file , strerror( errno ));
+    }
+  }
+}
+
+
+/*
+  Should be called with the write lock held, after the data file has
+  been modified.
+*/
+static void block_fs_mmap_sync( block_fs_type * block_fs ) {
+  if (block_fs->use_mmap && (block_fs->data_stream != NULL)) {
+    fflush( block_fs->data_stream );
+    if (block_fs->data_file_size > (long int) block_fs->mmap_size)
+      block_fs_munmap( block_fs );
+  }
+}
+
+
+/*
+  Should be called with the read lock held. Will return a pointer to
+  the data of file_node in the mapping, or NULL if the node can not be
+  served from the mapping. The pointer is valid as long as the read
+  lock is held.
+*/
+static const char * block_fs_mmap_get_data( block_fs_type * block_fs , const file_node_type * file_node ) {
+  if (!block_fs->use_mmap)
+    return NULL;
+
+  if (block_fs->mmap_data == NULL) {
+    pthread_mutex_lock( &block_fs->io_lock );
+    if (block_fs->mmap_data == NULL)
+      block_fs_mmap( block_fs );
+    pthread_mutex_unlock( &block_fs->io_lock );
+  }
+
+  {
+    size_t data_start = file_node->node_offset + file_node->data_offset;
+    if ((block_fs->mmap_data == NULL) || (data_start + file_node->data_size > block_fs->mmap_size))
+      return NULL;
+
+    return &block_fs->mmap_data[ data_start ];
+  }
+}
+
+
+
 #ifdef ENABLE_CACHE
 
 static void block_fs_clear_cache_node( block_fs_type * block_fs , file_node_type * node ) {
@@ -841,6 +1192,7 @@ static void block_fs_update_cache_node( block_fs_type * block_fs, file_node_type
 
 static void block_fs_preload( block_fs_type * block_fs ) {
   if ((block_fs->max_cache_size > 0) && (block_fs->data_stream != NULL) && (block_fs->max_total_cache_size > 0)) {
+    block_fs_install_sorted_index( block_fs );
     void * buffer = util_malloc( block_fs->max_cache_size );
     hash_iter_type * index_iter = hash_iter_alloc( block_fs->index );
 
@@ -975,18 +1327,41 @@ static void block_fs_build_index( block_fs_type * block_fs , long_vector_type *
 
 
 /**
-   Load an index for (slightly) faster mounting of the filesystem. The
-   function starts be reading a header and check if the current index
-   file is applicable.
+   Load an index for faster mounting of the filesystem. The function
+   will first try to map a sorted index, and then fall back to the
+   old hash based index format. In both cases the header is checked to
+   see if the current index file is applicable.
 
    Will return true of the loading succedeed, and false if no index
    was loaded.
 */
 
 
+static bool block_fs_load_sorted_index( block_fs_type * block_fs , time_t data_mtime ) {
+  sorted_index_type * sorted_index = sorted_index_mmap( block_fs->index_file , data_mtime );
+  if (sorted_index == NULL)
+    return false;
+
+  {
+    const sorted_index_header_type * header = sorted_index->header;
+    for (int i=0; i < header->num_free_nodes; i++) {
+      file_node_type * file_node = sorted_index_record_alloc_file_node( &sorted_index->records[ header->num_active_nodes + i ] );
+      block_fs_install_node( block_fs , file_node );
+      block_fs_insert_free_node( block_fs , file_node );
+    }
+    block_fs->data_file_size = util_size_t_max( block_fs->data_file_size , header->data_file_size );
+  }
+  block_fs->sorted_index = sorted_index;
+  return true;
+}
+
+
 static bool block_fs_load_index( block_fs_type * block_fs ) {
   stat_type data_stat;
   if (fstat( block_fs->data_fd , &data_stat) == 0) {
+    if (block_fs_load_sorted_index( block_fs , data_stat.st_mtime ))
+      return true;
+
     FILE * stream = fopen( block_fs->index_file , "r");
     if (stream != NULL) {
       int    id          = util_fread_int( stream );
@@ -997,7 +1372,7 @@ static bool block_fs_load_index( block_fs_type * block_fs ) {
       fclose( stream );
 
       if ((id == INDEX_MAGIC_INT) &&               /* This is indeed an index file. */
-          (version == INDEX_FORMAT_VERSION) &&     /* The version on disk agrees with this version. */
+          (version == INDEX_FORMAT_VERSION_HASH) && /* The version on disk is the old hash based format. */
           (index_mtime == data_mtime)) {           /* The time stamp agrees with the time stamp of the data. */
 
         /* Read the whole index file in one single read operation. */
@@ -1079,9 +1454,14 @@ block_fs_type * block_fs_mount( const char * mount_file ,
       /* We build up the index & free_nodes_list based on the header/index information embedded in the datafile. */
       block_fs_open_data( block_fs , false );
       if (block_fs->data_stream != NULL) {
+        struct timespec start_time, end_time;
+
+        clock_gettime( CLOCK_MONOTONIC , &start_time );
         if (!block_fs_load_index( block_fs ))
           block_fs_build_index( block_fs , fix_nodes );
+        clock_gettime( CLOCK_MONOTONIC , &end_time );
 
+        block_fs->index_load_time = (end_time.tv_sec - start_time.tv_sec) + 1e-9 * (end_time.tv_nsec - start_time.tv_nsec);
         fclose(block_fs->data_stream);
       }
 
@@ -1168,7 +1548,8 @@ static file_node_type * block_fs_get_new_node( block_fs_type * block_fs , const
 
 
 bool block_fs_has_file__( const block_fs_type * block_fs , const char * filename) {
-  return hash_has_key( block_fs->index , filename );
+  file_node_type node_storage;
+  return (block_fs_lookup_node( block_fs , filename , &node_storage ) != NULL);
 }
 
 
@@ -1212,10 +1593,12 @@ double block_fs_get_fragmentation( const block_fs_type * block_fs ) {
 
 void block_fs_unlink_file( block_fs_type * block_fs , const char * filename) {
   block_fs_aquire_wlock( block_fs );
+  block_fs_install_sorted_index( block_fs );
 
   block_fs_unlink_file__( block_fs , filename );
   if (block_fs_get_fragmentation( block_fs ) > block_fs->fragmentation_limit)
     block_fs_rotate__( block_fs );
+  block_fs_mmap_sync( block_fs );
 
   block_fs_release_rwlock( block_fs );
 }
@@ -1362,12 +1745,14 @@ static void block_fs_fwrite_file_unlocked(block_fs_type * block_fs , const char
 void block_fs_fwrite_file(block_fs_type * block_fs , const char * filename , const void * ptr , size_t data_size) {
   block_fs_aquire_wlock( block_fs );
   {
+    block_fs_install_sorted_index( block_fs );
     block_fs_fwrite_file_unlocked( block_fs , filename , ptr , data_size );
 
     /* OKAY - this is going to take some time ... */
     if ((block_fs->free_size * 1.0 / block_fs->data_file_size) > block_fs->fragmentation_limit)
       block_fs_rotate__( block_fs );
 
+    block_fs_mmap_sync( block_fs );
   }
   block_fs_release_rwlock( block_fs );
 }
@@ -1400,11 +1785,16 @@ static void block_fs_fread__(block_fs_type * block_fs , const file_node_type * f
 #endif
 
   {
-    pthread_mutex_lock( &block_fs->io_lock );
-    block_fs_fseek_node_data( block_fs , file_node );
-    util_fread( ptr , 1 , read_bytes , block_fs->data_stream , __func__);
-    //file_node_verify_end_tag( file_node , block_fs->data_stream );
-    pthread_mutex_unlock( &block_fs->io_lock );
+    const char * data = block_fs_mmap_get_data( block_fs , file_node );
+    if (data != NULL)
+      memcpy( ptr , data , read_bytes );
+    else {
+      pthread_mutex_lock( &block_fs->io_lock );
+      block_fs_fseek_node_data( block_fs , file_node );
+      util_fread( ptr , 1 , read_bytes , block_fs->data_stream , __func__);
+      //file_node_verify_end_tag( file_node , block_fs->data_stream );
+      pthread_mutex_unlock( &block_fs->io_lock );
+    }
   }
 }
 
@@ -1416,7 +1806,8 @@ static void block_fs_fread__(block_fs_type * block_fs , const file_node_type * f
 void block_fs_fread_realloc_buffer( block_fs_type * block_fs , const char * filename , buffer_type * buffer) {
   block_fs_aquire_rlock( block_fs );
   {
-    file_node_type * node = (file_node_type*)hash_get( block_fs->index , filename);
+    file_node_type node_storage;
+    file_node_type * node = block_fs_get_node( block_fs , filename , &node_storage );
 
     buffer_clear( buffer );   /* Setting: content_size = 0; pos = 0;  */
     {
@@ -1434,11 +1825,16 @@ void block_fs_fread_realloc_buffer( block_fs_type * block_fs , const char * file
 #endif
 
       {
-        pthread_mutex_lock( &block_fs->io_lock );
-        block_fs_fseek_node_data(block_fs , node );
-        buffer_stream_fread( buffer , node->data_size , block_fs->data_stream );
-        //file_node_verify_end_tag( node , block_fs->data_stream );
-        pthread_mutex_unlock( &block_fs->io_lock );
+        const char * data = block_fs_mmap_get_data( block_fs , node );
+        if (data != NULL)
+          buffer_fwrite( buffer , data , 1 , node->data_size );
+        else {
+          pthread_mutex_lock( &block_fs->io_lock );
+          block_fs_fseek_node_data(block_fs , node );
+          buffer_stream_fread( buffer , node->data_size , block_fs->data_stream );
+          //file_node_verify_end_tag( node , block_fs->data_stream );
+          pthread_mutex_unlock( &block_fs->io_lock );
+        }
       }
 
     }
@@ -1453,6 +1849,111 @@ void block_fs_fread_realloc_buffer( block_fs_type * block_fs , const char * file
 
 
 
+/*
+  Reads the @size bytes starting at @offset in the content of
+  @filename into @buffer; this is used to pick one entry out of a
+  larger record without reading the complete record.
+*/
+
+void block_fs_fread_range( block_fs_type * block_fs , const char * filename , int offset , int size , buffer_type * buffer) {
+  block_fs_aquire_rlock( block_fs );
+  {
+    file_node_type node_storage;
+    file_node_type * node = block_fs_get_node( block_fs , filename , &node_storage );
+
+    if ((offset < 0) || (size < 0) || (offset + size > node->data_size))
+      util_abort("%s: the range [%d,%d) is outside the %d bytes stored in %s \n",__func__ , offset , offset + size , node->data_size , filename);
+
+    buffer_clear( buffer );
+    {
+      const char * data = block_fs_mmap_get_data( block_fs , node );
+      if (data != NULL)
+        buffer_fwrite( buffer , &data[offset] , 1 , size );
+      else {
+        pthread_mutex_lock( &block_fs->io_lock );
+        block_fs_fseek( block_fs , node->node_offset + node->data_offset + offset );
+        buffer_stream_fread( buffer , size , block_fs->data_stream );
+        pthread_mutex_unlock( &block_fs->io_lock );
+      }
+    }
+    buffer_rewind( buffer );
+  }
+  block_fs_release_rwlock( block_fs );
+}
+
+
+
+/*
+  Will return a read-only buffer with the content of 'filename'. When
+  the block_fs instance is in mmap mode the buffer wraps the data in
+  the memory mapping directly, without any copying; otherwise the data
+  is read into a newly allocated buffer.
+
+  In the mmap case the read lock is held until the view is released
+  with block_fs_free_buffer_view(); the calling scope must therefor
+  release the view as soon as possible, and must not write to the
+  same block_fs instance while holding it - that will deadlock. The
+  buffer must not be written to.
+*/
+
+buffer_type * block_fs_alloc_buffer_view( block_fs_type * block_fs , const char * filename ) {
+  block_fs_aquire_rlock( block_fs );
+  {
+    file_node_type node_storage;
+    file_node_type * node = block_fs_get_node( block_fs , filename , &node_storage );
+    const char * data     = block_fs_mmap_get_data( block_fs , node );
+
+    if (data != NULL)
+      return buffer_alloc_private_wrapper( (void *) data , node->data_size );
+  }
+  block_fs_release_rwlock( block_fs );
+
+  {
+    buffer_type * buffer = buffer_alloc( 100 );
+    block_fs_fread_realloc_buffer( block_fs , filename , buffer );
+    return buffer;
+  }
+}
+
+
+void block_fs_free_buffer_view( block_fs_type * block_fs , buffer_type * buffer ) {
+  const char * data = (const char *) buffer_get_data( buffer );
+
+  if ((block_fs->mmap_data != NULL) &&
+      (data >= block_fs->mmap_data) &&
+      (data < block_fs->mmap_data + block_fs->mmap_size)) {
+    buffer_free_container( buffer );
+    block_fs_release_rwlock( block_fs );
+  } else
+    buffer_free( buffer );
+}
+
+
+/*
+  Enable or disable the mmap read mode, see the documentation of
+  block_fs_mmap_get_data() and friends above.
+*/
+
+void block_fs_set_mmap( block_fs_type * block_fs , bool use_mmap ) {
+  pthread_rwlock_wrlock( &block_fs->rw_lock );
+  {
+    if (block_fs->data_stream != NULL)
+      fflush( block_fs->data_stream );
+
+    block_fs->use_mmap = use_mmap;
+    if (!use_mmap)
+      block_fs_munmap( block_fs );
+  }
+  pthread_rwlock_unlock( &block_fs->rw_lock );
+}
+
+
+bool block_fs_get_mmap( const block_fs_type * block_fs ) {
+  return block_fs->use_mmap;
+}
+
+
+
 /*
   This function will read all the data stored in 'filename' - it is
   the responsability of the calling scope that ptr is sufficiently
@@ -1464,7 +1965,8 @@ void block_fs_fread_realloc_buffer( block_fs_type * block_fs , const char * file
 void block_fs_fread_file( block_fs_type * block_fs , const char * filename , void * ptr) {
   block_fs_aquire_rlock( block_fs );
   {
-    file_node_type * node = (file_node_type*)hash_get( block_fs->index , filename);
+    file_node_type node_storage;
+    file_node_type * node = block_fs_get_node( block_fs , filename , &node_storage );
     block_fs_fread__( block_fs , node , ptr , node->data_size);
   }
   block_fs_release_rwlock( block_fs );
@@ -1476,7 +1978,8 @@ int block_fs_get_filesize( block_fs_type * block_fs , const char * filename) {
   int data_size;
   block_fs_aquire_rlock( block_fs );
   {
-    file_node_type * node = (file_node_type*)hash_get( block_fs->index , filename );
+    file_node_type node_storage;
+    file_node_type * node = block_fs_get_node( block_fs , filename , &node_storage );
     data_size = node->data_size;
   }
   block_fs_release_rwlock( block_fs );
@@ -1484,6 +1987,13 @@ int block_fs_get_filesize( block_fs_type * block_fs , const char * filename) {
 }
 
 
+/*
+  Will write the index in the sorted format described above. The
+  index is first written to a temporary file which is then renamed,
+  so that other processes which have the old index mapped are not
+  affected.
+*/
+
 static void block_fs_dump_index( block_fs_type * block_fs ) {
   if (block_fs->data_owner) {
     struct stat stat_buffer;
@@ -1491,43 +2001,68 @@ static void block_fs_dump_index( block_fs_type * block_fs ) {
     if (stat_return != 0)
       return;
     {
-      time_t data_mtime = stat_buffer.st_mtime;
-      FILE * index_stream = util_fopen( block_fs->index_file , "w");
-      util_fwrite_int( INDEX_MAGIC_INT , index_stream );
-      util_fwrite_int( INDEX_FORMAT_VERSION , index_stream );
-      util_fwrite_time_t( data_mtime , index_stream );
-
-      /* 1: Dumping the hash table of active nodes. */
+      char * tmp_file = util_alloc_sprintf("%s.tmp" , block_fs->index_file );
+      stringlist_type * keys = hash_alloc_stringlist( block_fs->index );
+      FILE * index_stream = util_fopen( tmp_file , "w");
+      sorted_index_header_type header;
+
+      stringlist_sort( keys , NULL );
+
+      memset( &header , 0 , sizeof header );
+      header.magic            = INDEX_MAGIC_INT;
+      header.version          = INDEX_FORMAT_VERSION;
+      header.data_mtime       = stat_buffer.st_mtime;
+      header.num_active_nodes = stringlist_get_size( keys );
+      header.num_free_nodes   = block_fs->num_free_nodes;
+      header.data_file_size   = block_fs->data_file_size;
+      header.string_size      = 0;
+      for (int i=0; i < stringlist_get_size( keys ); i++)
+        header.string_size += strlen( stringlist_iget( keys , i )) + 1;
+
+      util_fwrite( &header , sizeof header , 1 , index_stream , __func__ );
+
+      /* 1: Dumping the active nodes, sorted on filename. */
       {
-        hash_iter_type * index_iter = hash_iter_alloc( block_fs->index );
-
-        util_fwrite_int( hash_get_size( block_fs->index ) , index_stream);
-        while (!hash_iter_is_complete( index_iter )) {
-          const char * key = hash_iter_get_next_key( index_iter );
+        int64_t key_offset = 0;
+        for (int i=0; i < stringlist_get_size( keys ); i++) {
+          const char * key = stringlist_iget( keys , i );
           const file_node_type * file_node = (const file_node_type*)hash_get( block_fs->index , key );
 
-          util_fwrite_string( key , index_stream);
-          file_node_dump_index( file_node , index_stream );
+          sorted_index_record_fwrite( file_node , key_offset , index_stream );
+          key_offset += strlen( key ) + 1;
         }
-        hash_iter_free( index_iter );
       }
 
       /* 2: Dumping information about empty slots in the datafile. */
-      util_fwrite_int( block_fs->num_free_nodes , index_stream );
       {
         free_node_type * current = block_fs->free_nodes;
         while ( current != NULL) {
-          file_node_dump_index( current->file_node , index_stream );
+          sorted_index_record_fwrite( current->file_node , -1 , index_stream );
           current = current->next;
         }
       }
 
+      /* 3: The string table with all the filenames. */
+      for (int i=0; i < stringlist_get_size( keys ); i++) {
+        const char * key = stringlist_iget( keys , i );
+        util_fwrite( key , 1 , strlen( key ) + 1 , index_stream , __func__ );
+      }
+
       fclose( index_stream );
+      rename( tmp_file , block_fs->index_file );
+
+      stringlist_free( keys );
+      free( tmp_file );
     }
   }
 }
 
 
+double block_fs_get_index_load_time( const block_fs_type * block_fs ) {
+  return block_fs->index_load_time;
+}
+
+
 /**
    Close/synchronize the open file descriptors and free all memory
    related to the block_fs instance.
@@ -1542,10 +2077,15 @@ void block_fs_close( block_fs_type * block_fs , bool unlink_empty) {
   if (block_fs->data_owner)
     block_fs_aquire_wlock( block_fs );
 
+  block_fs_munmap( block_fs );
   if (block_fs->data_stream != NULL)
     fclose( block_fs->data_stream );
 
-  if (block_fs->data_owner)
+  /*
+    If the sorted index is still pending the filesystem has not been
+    modified since it was mounted, and the index on disk is up to date.
+  */
+  if (block_fs->data_owner && (block_fs->sorted_index == NULL))
     block_fs_dump_index( block_fs );
 
   if (block_fs->lock_fd > 0) {
@@ -1554,7 +2094,7 @@ void block_fs_close( block_fs_type * block_fs , bool unlink_empty) {
   }
 
   if (block_fs->data_owner) {
-    if ( unlink_empty && (hash_get_size( block_fs->index) == 0)) {
+    if ( unlink_empty && (hash_get_size( block_fs->index) == 0) && (block_fs->sorted_index == NULL)) {
       util_unlink_existing( block_fs->data_file );
       util_unlink_existing( block_fs->index_file );
       util_unlink_existing( block_fs->mount_file );
@@ -1570,6 +2110,8 @@ void block_fs_close( block_fs_type * block_fs , bool unlink_empty) {
   free( block_fs->mount_file );
 
   free_node_free_list( block_fs->free_nodes );
+  if (block_fs->sorted_index != NULL)
+    sorted_index_free( block_fs->sorted_index );
   hash_free( block_fs->index );
   vector_free( block_fs->file_nodes );
   free( block_fs );
@@ -1594,6 +2136,7 @@ static void block_fs_rotate__( block_fs_type * block_fs ) {
      Write a updated mount map where the version info has been bumped
      up with one; the new_fs will mount based on this mount_file.
   */
+  block_fs_install_sorted_index( block_fs );
   block_fs->version++;
   block_fs_fwrite_mount_info__( block_fs->mount_file , block_fs->version );
   {
@@ -1604,6 +2147,7 @@ static void block_fs_rotate__( block_fs_type * block_fs ) {
     char           * old_data_file     = util_alloc_string_copy( block_fs->data_file );
     char           * old_lock_file     = util_alloc_string_copy( block_fs->lock_file );
 
+    block_fs_munmap( block_fs );
     block_fs_reinit( block_fs );
     /**
         Now the block_fs pointers point to the new copy. Must use the
@@ -1767,6 +2311,7 @@ vector_type * block_fs_alloc_filelist( block_fs_type * block_fs  , const char *
   vector_type    * sort_vector = vector_alloc_new();
 
   /* Inserting the nodes from the index. */
+  block_fs_ensure_index( block_fs );
   block_fs_aquire_rlock( block_fs );
   {
     hash_iter_type * iter        = hash_iter_alloc( block_fs->index );
@@ -237,9 +237,22 @@ matrix_type * matrix_alloc_shared(const matrix_type * src , int row , int column
 
 
 matrix_type * matrix_alloc_view(double * data , int rows , int columns) {
+  return matrix_alloc_strided_view( data , rows , columns , 1 , rows );
+}
+
+
+/**
+   As matrix_alloc_view(), but with arbitrary strides. This is used to
+   wrap storage owned by somebody else - e.g. a numpy array - without
+   copying. The strides must satisfy the same constraints as for a
+   normal matrix, i.e. either the rows or the columns must be
+   contiguous blocks which do not overlap.
+*/
+
+matrix_type * matrix_alloc_strided_view(double * data , int rows , int columns , int row_stride , int column_stride) {
   matrix_type * matrix = matrix_alloc_empty();
 
-  matrix_init_header( matrix , rows , columns , 1 , rows);
+  matrix_init_header( matrix , rows , columns , row_stride , column_stride);
   matrix->data          = data;
   matrix->data_owner    = false;
 
@@ -393,6 +393,7 @@ void subst_list_insert_func(subst_list_type * subst_list , const char * func_nam
 
 void subst_list_clear( subst_list_type * subst_list ) {
   vector_clear( subst_list->string_data );
+  hash_clear( subst_list->map );
 }
 
 
@@ -451,6 +452,228 @@ static bool subst_list_replace_strings__(const subst_list_type * subst_list , bu
 
 
 
+/*****************************************************************/
+/*
+  Single pass substitution
+  ------------------------
+
+  The subst_list_replace_strings__() function above searches through
+  the whole buffer once for every key, which is O(keys x buffer size),
+  and shifts the tail of the buffer on every hit. In the common case
+  all the keys are on the form <KEY>, i.e. a '<' and a '>' with no
+  '<' or '>' in between, and none of the values contain a '<' or a
+  '>'. Then:
+
+    1. The occurences of the different keys can not overlap, so the
+       order of the substitutions does not matter.
+
+    2. A substitution can not create a new occurence of any key in
+       the inserted value.
+
+  A substitution can still create a new token across the boundaries
+  of the value when the tokens are nested; with the keys <IENS> -> 3
+  and <FILE_3> -> x the buffer <FILE_<IENS>> becomes <FILE_3> after
+  the first substitution, and x after the second. The single pass
+  scan skips the outer '<' and will never see <FILE_3>, so the buffer
+  must in addition not contain a '<' which is followed by another '<'
+  before the next '>'; see subst_list_has_nested_tokens().
+
+  The result of the repeated search-replace is then exactly the same
+  as replacing every <...> token with its value in one left to right
+  pass, where the value is looked up in the parent first, and the
+  buffer can be rendered in linear time. When the subst_list or the
+  buffer does not satisfy these conditions the plain search-replace is
+  used.
+*/
+
+
+/*
+  Returns a pointer to the start of the first <...> token in @string,
+  and sets @token_end to point to the character following the closing
+  '>'. Returns NULL if there are no more tokens.
+*/
+
+const char * subst_list_next_token( const char * string , const char ** token_end ) {
+  const char * token_start = strchr( string , '<' );
+
+  while (token_start != NULL) {
+    const char * delimiter = strpbrk( token_start + 1 , "<>" );
+    if (delimiter == NULL)
+      return NULL;
+
+    if ((delimiter[0] == '>') && (delimiter > token_start + 1)) {
+      *token_end = delimiter + 1;
+      return token_start;
+    }
+
+    if (delimiter[0] == '<')
+      token_start = delimiter;
+    else
+      token_start = strchr( delimiter + 1 , '<' );
+  }
+
+  return NULL;
+}
+
+
+/**
+   Will return true if @string contains a '<' which is followed by
+   another '<' before the next '>'; i.e. a '<' which is skipped by
+   subst_list_next_token() and can become the start of a new token
+   when the token following it is substituted.
+*/
+
+bool subst_list_has_nested_tokens( const char * string ) {
+  bool open = false;
+  const char * delimiter = strpbrk( string , "<>" );
+
+  while (delimiter != NULL) {
+    if (delimiter[0] == '<') {
+      if (open)
+        return true;
+      open = true;
+    } else
+      open = false;
+
+    delimiter = strpbrk( delimiter + 1 , "<>" );
+  }
+
+  return false;
+}
+
+
+static bool subst_list_is_token( const char * key ) {
+  const char * token_end;
+  const char * token_start = subst_list_next_token( key , &token_end );
+
+  return ((token_start == key) && (token_end[0] == '\0'));
+}
+
+
+/**
+   Will return true if all the string substitutions in the subst_list,
+   and the parents, can be carried out with one single pass over the
+   buffer; see the comment above.
+*/
+
+static bool subst_list_has_single_pass_strings( const subst_list_type * subst_list ) {
+  for (int index = 0; index < vector_get_size( subst_list->string_data ); index++) {
+    const subst_list_string_type * node = (const subst_list_string_type*)vector_iget_const( subst_list->string_data , index );
+    if (node->value != NULL) {
+      if (!subst_list_is_token( node->key ))
+        return false;
+
+      if (strpbrk( node->value , "<>" ) != NULL)
+        return false;
+    }
+  }
+
+  if (subst_list->parent != NULL)
+    return subst_list_has_single_pass_strings( subst_list->parent );
+
+  return true;
+}
+
+
+static bool subst_list_has_funcs( const subst_list_type * subst_list ) {
+  if (vector_get_size( subst_list->func_data ) > 0)
+    return true;
+
+  if (subst_list->parent != NULL)
+    return subst_list_has_funcs( subst_list->parent );
+
+  return false;
+}
+
+
+/**
+   Will return true if the complete update of subst_list_update_buffer()
+   can be carried out as one pass of token lookups with
+   subst_list_get_single_pass_value(); i.e. the string substitutions
+   are single pass and there are no functions to evaluate.
+*/
+
+bool subst_list_is_single_pass( const subst_list_type * subst_list ) {
+  return subst_list_has_single_pass_strings( subst_list ) && !subst_list_has_funcs( subst_list );
+}
+
+
+/**
+   Returns the value a single pass substitution will insert for the
+   token @key, or NULL if the token should be left as it is. The parent
+   is consulted first, in the same way as subst_list_replace_strings().
+*/
+
+const char * subst_list_get_single_pass_value( const subst_list_type * subst_list , const char * key ) {
+  if (subst_list->parent != NULL) {
+    const char * value = subst_list_get_single_pass_value( subst_list->parent , key );
+    if (value != NULL)
+      return value;
+  }
+
+  if (hash_has_key( subst_list->map , key )) {
+    const subst_list_string_type * node = (const subst_list_string_type*)hash_get( subst_list->map , key );
+    return node->value;
+  }
+
+  return NULL;
+}
+
+
+static bool subst_list_replace_strings_single_pass( const subst_list_type * subst_list , buffer_type * buffer ) {
+  const char * data     = (const char *) buffer_get_data( buffer );
+  size_t       size     = buffer_get_size( buffer );
+  const char * pos      = data;
+  const char * scan     = data;
+  bool         match    = false;
+  buffer_type * target  = NULL;
+  char * key            = NULL;
+  size_t key_size       = 0;
+
+  {
+    const char * token_end;
+    const char * token_start;
+    while ((token_start = subst_list_next_token( scan , &token_end )) != NULL) {
+      size_t token_size = token_end - token_start;
+      const char * value;
+
+      if (token_size + 1 > key_size) {
+        key_size = 2 * (token_size + 1);
+        key = (char*)util_realloc( key , key_size );
+      }
+      memcpy( key , token_start , token_size );
+      key[token_size] = '\0';
+
+      value = subst_list_get_single_pass_value( subst_list , key );
+      if (value != NULL) {
+        if (target == NULL)
+          target = buffer_alloc( size + 1024 );
+
+        buffer_fwrite( target , pos , 1 , token_start - pos );
+        buffer_fwrite( target , value , 1 , strlen( value ));
+        pos = token_end;
+        match = true;
+      }
+      scan = token_end;
+    }
+  }
+
+  if (match) {
+    /* The remaining content, including the terminating \0. */
+    buffer_fwrite( target , pos , 1 , (data + size) - pos );
+
+    buffer_clear( buffer );
+    buffer_fwrite( buffer , buffer_get_data( target ) , 1 , buffer_get_size( target ));
+    buffer_free( target );
+  }
+
+  free( key );
+  return match;
+}
+
+
+
+
 /**
    Updates the buffer inplace by evaluationg all the string functions
    in the subst_list. Last performing all the replacements in the
@@ -597,6 +820,10 @@ static bool subst_list_eval_funcs__(const subst_list_type * subst_list , buffer_
 
 static bool subst_list_replace_strings( const subst_list_type * subst_list , buffer_type * buffer ) {
   bool match = false;
+  if (subst_list_has_single_pass_strings( subst_list ) &&
+      !subst_list_has_nested_tokens( (const char *) buffer_get_data( buffer )))
+    return subst_list_replace_strings_single_pass( subst_list , buffer );
+
   if (subst_list->parent != NULL)
     match = subst_list_replace_strings( subst_list->parent , buffer );
 
@@ -618,7 +845,11 @@ static bool subst_list_replace_strings( const subst_list_type * subst_list , buf
 
 bool subst_list_update_buffer( const subst_list_type * subst_list , buffer_type * buffer ) {
   bool match1 = subst_list_replace_strings( subst_list , buffer );
-  bool match2 = subst_list_eval_funcs__( subst_list , buffer );
+  bool match2 = false;
+
+  if (subst_list_has_funcs( subst_list ))
+    match2 = subst_list_eval_funcs__( subst_list , buffer );
+
   return (match1 || match2);   // Funny construction to ensure to avoid fault short circuit.
 }
 
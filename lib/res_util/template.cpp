@@ -19,11 +19,13 @@
 #include <stdlib.h>
 #include <stdbool.h>
 #include <stdio.h>
+#include <string.h>
 
 #include <ert/util/ert_api_config.hpp>
 
 #include <ert/util/util.hpp>
 #include <ert/util/stringlist.hpp>
+#include <ert/util/buffer.hpp>
 
 #include <ert/res_util/subst_func.hpp>
 #include <ert/res_util/subst_list.hpp>
@@ -58,11 +60,39 @@ static char * template_load( const template_type * _template , const subst_list_
 
 
 
+/**
+   Compiles the internalized template by locating all the <...> tokens
+   once, so that every instantiation with single pass substitutions
+   can render the template in one linear pass without searching the
+   content again.
+*/
+
+static void template_compile( template_type * _template ) {
+  const char * token_start;
+  const char * token_end;
+  const char * pos = _template->template_buffer;
+
+  int_vector_reset( _template->token_offsets );
+  _template->max_token_length = 0;
+  while ((token_start = subst_list_next_token( pos , &token_end )) != NULL) {
+    int token_length = token_end - token_start;
+
+    int_vector_append( _template->token_offsets , token_start - _template->template_buffer );
+    int_vector_append( _template->token_offsets , token_end - _template->template_buffer );
+    _template->max_token_length = util_int_max( _template->max_token_length , token_length );
+    pos = token_end;
+  }
+  _template->nested_tokens = subst_list_has_nested_tokens( _template->template_buffer );
+}
+
+
+
 void template_set_template_file( template_type * _template , const char * template_file) {
   _template->template_file = util_realloc_string_copy( _template->template_file , template_file );
   if (_template->internalize_template) {
     free( _template->template_buffer );
     _template->template_buffer = template_load( _template , NULL );
+    template_compile( _template );
   }
 }
 
@@ -90,6 +120,9 @@ template_type * template_alloc( const char * template_file , bool internalize_te
   _template->template_file        = NULL;
   _template->internalize_template = internalize_template;
   _template->arg_string           = NULL;
+  _template->token_offsets        = int_vector_alloc( 0 , 0 );
+  _template->max_token_length     = 0;
+  _template->nested_tokens        = false;
   template_set_template_file( _template , template_file );
 
 #ifdef ERT_HAVE_REGEXP
@@ -109,6 +142,7 @@ void template_free( template_type * _template ) {
   free( _template->template_file );
   free( _template->template_buffer );
   free( _template->arg_string );
+  int_vector_free( _template->token_offsets );
 
 #ifdef ERT_HAVE_REGEXP
   regfree( &_template->start_regexp );
@@ -147,6 +181,67 @@ void template_free( template_type * _template ) {
 
 
 
+static bool template_is_single_pass( const template_type * template_ , const subst_list_type * arg_list ) {
+  if (!template_->internalize_template)
+    return false;
+
+  if (template_->nested_tokens)
+    return false;
+
+  if (!subst_list_is_single_pass( template_->arg_list ))
+    return false;
+
+  if ((arg_list != NULL) && !subst_list_is_single_pass( arg_list ))
+    return false;
+
+  return true;
+}
+
+
+/*
+  Renders the compiled template in one pass; this gives the same
+  result as the subst_list_update_string() calls with first the
+  internal arg_list and then @arg_list in template_instantiate(), see
+  the documentation of single pass substitution in subst_list.cpp.
+*/
+
+static char * template_alloc_single_pass( const template_type * template_ , const subst_list_type * arg_list ) {
+  const char * data    = template_->template_buffer;
+  int          length  = strlen( data );
+  buffer_type * buffer = buffer_alloc( length + 1024 );
+  char * key           = (char*)util_malloc( template_->max_token_length + 1 );
+  int pos              = 0;
+
+  for (int i = 0; i < int_vector_size( template_->token_offsets ); i += 2) {
+    int token_start = int_vector_iget( template_->token_offsets , i );
+    int token_end   = int_vector_iget( template_->token_offsets , i + 1 );
+    const char * value;
+
+    memcpy( key , &data[token_start] , token_end - token_start );
+    key[token_end - token_start] = '\0';
+
+    value = subst_list_get_single_pass_value( template_->arg_list , key );
+    if ((value == NULL) && (arg_list != NULL))
+      value = subst_list_get_single_pass_value( arg_list , key );
+
+    if (value != NULL) {
+      buffer_fwrite( buffer , &data[pos] , 1 , token_start - pos );
+      buffer_fwrite( buffer , value , 1 , strlen( value ));
+      pos = token_end;
+    }
+  }
+  buffer_fwrite( buffer , &data[pos] , 1 , length + 1 - pos );   /* Including the terminating \0 */
+  free( key );
+
+  {
+    char * char_buffer = (char*)buffer_get_data( buffer );
+    buffer_free_container( buffer );
+    return char_buffer;
+  }
+}
+
+
+
 void template_instantiate( const template_type * template_ , const char * __target_file , const subst_list_type * arg_list , bool override_symlink) {
   char * target_file = util_alloc_string_copy( __target_file );
 
@@ -156,15 +251,19 @@ void template_instantiate( const template_type * template_ , const char * __targ
 
   {
     char * char_buffer;
-    /* Loading the template - possibly expanding keys in the filename */
-    if (template_->internalize_template)
-      char_buffer = util_alloc_string_copy( template_->template_buffer);
-    else
-      char_buffer = template_load( template_ , arg_list );
-
-    /* Substitutions on the content. */
-    subst_list_update_string( template_->arg_list , &char_buffer );
-    if (arg_list != NULL) subst_list_update_string( arg_list , &char_buffer );
+    if (template_is_single_pass( template_ , arg_list ))
+      char_buffer = template_alloc_single_pass( template_ , arg_list );
+    else {
+      /* Loading the template - possibly expanding keys in the filename */
+      if (template_->internalize_template)
+        char_buffer = util_alloc_string_copy( template_->template_buffer);
+      else
+        char_buffer = template_load( template_ , arg_list );
+
+      /* Substitutions on the content. */
+      subst_list_update_string( template_->arg_list , &char_buffer );
+      if (arg_list != NULL) subst_list_update_string( arg_list , &char_buffer );
+    }
 
 
 #ifdef ERT_HAVE_REGEXP
@@ -17,10 +17,12 @@
 */
 #include <stdlib.h>
 #include <stdbool.h>
+#include <string.h>
 #include <sys/types.h>
 #include <unistd.h>
 
 
+#include <ert/util/buffer.hpp>
 #include <ert/util/test_util.hpp>
 #include <ert/util/test_work_area.hpp>
 #include <ert/res_util/block_fs.hpp>
@@ -98,9 +100,119 @@ void test_lock_conflict() {
 
 
 
+void test_mmap_read() {
+  ecl::util::TestArea ta("mmap");
+  block_fs_type * bfs = block_fs_mount( "test.mnt" , 1000 , 10000 , 0.67 , 10 , true , false , false );
+  int data1[100];
+  int data2[1000];
+
+  for (int i=0; i < 100; i++)
+    data1[i] = i;
+
+  for (int i=0; i < 1000; i++)
+    data2[i] = 2*i;
+
+  test_assert_false( block_fs_get_mmap( bfs ));
+  block_fs_set_mmap( bfs , true );
+  test_assert_true( block_fs_get_mmap( bfs ));
+
+  block_fs_fwrite_file( bfs , "data1" , data1 , sizeof data1 );
+  {
+    buffer_type * view = block_fs_alloc_buffer_view( bfs , "data1" );
+    test_assert_int_equal( buffer_get_size( view ) , sizeof data1 );
+    test_assert_int_equal( memcmp( buffer_get_data( view ) , data1 , sizeof data1) , 0 );
+    block_fs_free_buffer_view( bfs , view );
+  }
+
+  /* Writing beyond the current mapping must invalidate it. */
+  block_fs_fwrite_file( bfs , "data2" , data2 , sizeof data2 );
+  {
+    int read_data[1000];
+    buffer_type * buffer = buffer_alloc( 100 );
+
+    block_fs_fread_file( bfs , "data2" , read_data );
+    test_assert_int_equal( memcmp( read_data , data2 , sizeof data2) , 0 );
+
+    block_fs_fread_realloc_buffer( bfs , "data1" , buffer );
+    test_assert_int_equal( memcmp( buffer_get_data( buffer ) , data1 , sizeof data1) , 0 );
+    buffer_free( buffer );
+  }
+
+  block_fs_set_mmap( bfs , false );
+  {
+    buffer_type * view = block_fs_alloc_buffer_view( bfs , "data2" );
+    test_assert_int_equal( memcmp( buffer_get_data( view ) , data2 , sizeof data2) , 0 );
+    block_fs_free_buffer_view( bfs , view );
+  }
+  block_fs_close( bfs , true );
+}
+
+
+void test_sorted_index() {
+  ecl::util::TestArea ta("sorted_index");
+  {
+    block_fs_type * bfs = block_fs_mount( "test.mnt" , 1000 , 10000 , 0.67 , 10 , true , false , false );
+    for (int i=0; i < 100; i++) {
+      char * filename = util_alloc_sprintf("FILE.%d" , i);
+      block_fs_fwrite_file( bfs , filename , &i , sizeof i );
+      free( filename );
+    }
+    block_fs_unlink_file( bfs , "FILE.50" );
+    block_fs_close( bfs , false );
+  }
+
+  /* Read-only mount: served directly from the sorted index. */
+  {
+    block_fs_type * bfs = block_fs_mount( "test.mnt" , 1000 , 10000 , 0.67 , 10 , true , true , false );
+    test_assert_true( block_fs_get_index_load_time( bfs ) >= 0 );
+    test_assert_false( block_fs_has_file( bfs , "FILE.50" ));
+    test_assert_false( block_fs_has_file( bfs , "FILE.100" ));
+    for (int i=0; i < 100; i++) {
+      if (i != 50) {
+        char * filename = util_alloc_sprintf("FILE.%d" , i);
+        int value;
+        test_assert_true( block_fs_has_file( bfs , filename ));
+        test_assert_int_equal( block_fs_get_filesize( bfs , filename ) , sizeof value );
+        block_fs_fread_file( bfs , filename , &value );
+        test_assert_int_equal( value , i );
+        free( filename );
+      }
+    }
+    {
+      vector_type * files = block_fs_alloc_filelist( bfs , NULL , STRING_SORT , false );
+      test_assert_int_equal( vector_get_size( files ) , 99 );
+      vector_free( files );
+    }
+    block_fs_close( bfs , false );
+  }
+
+  /* Read-write mount: the index is installed on the first write. */
+  {
+    block_fs_type * bfs = block_fs_mount( "test.mnt" , 1000 , 10000 , 0.67 , 10 , true , false , false );
+    int value = 1000;
+    block_fs_fwrite_file( bfs , "FILE.0" , &value , sizeof value );
+    block_fs_fwrite_file( bfs , "FILE.50" , &value , sizeof value );
+    test_assert_true( block_fs_has_file( bfs , "FILE.99" ));
+    block_fs_close( bfs , false );
+  }
+  {
+    block_fs_type * bfs = block_fs_mount( "test.mnt" , 1000 , 10000 , 0.67 , 10 , true , true , false );
+    int value;
+    block_fs_fread_file( bfs , "FILE.50" , &value );
+    test_assert_int_equal( value , 1000 );
+    block_fs_fread_file( bfs , "FILE.0" , &value );
+    test_assert_int_equal( value , 1000 );
+    block_fs_fread_file( bfs , "FILE.99" , &value );
+    test_assert_int_equal( value , 99 );
+    block_fs_close( bfs , false );
+  }
+}
+
 
 int main(int argc , char ** argv) {
   test_readonly();
   test_lock_conflict();
+  test_mmap_read();
+  test_sorted_index();
   exit(0);
 }
@@ -22,6 +22,7 @@
 #include <ert/util/test_work_area.hpp>
 #include <ert/util/test_util.hpp>
 #include <ert/res_util/subst_list.hpp>
+#include <ert/res_util/template.hpp>
 
 
 void test_create() {
@@ -88,8 +89,176 @@ void test_filter_file2() {
 
 
 
+void test_next_token() {
+  const char * string = "<A> <<B>> <> <C <D>";
+  const char * token_end;
+  const char * token_start;
+
+  token_start = subst_list_next_token( string , &token_end );
+  test_assert_ptr_equal( token_start , string );
+  test_assert_ptr_equal( token_end , string + 3 );
+
+  token_start = subst_list_next_token( token_end , &token_end );
+  test_assert_ptr_equal( token_start , string + 5 );
+  test_assert_ptr_equal( token_end , string + 8 );
+
+  token_start = subst_list_next_token( token_end , &token_end );
+  test_assert_ptr_equal( token_start , string + 16 );
+  test_assert_ptr_equal( token_end , string + 19 );
+
+  test_assert_NULL( subst_list_next_token( token_end , &token_end ));
+}
+
+
+void test_single_pass() {
+  subst_list_type * parent = subst_list_alloc( NULL );
+  subst_list_type * subst_list = subst_list_alloc( parent );
+
+  subst_list_append_copy( parent , "<CASE>" , "parent_case" , NULL);
+  subst_list_append_copy( parent , "<IENS>" , "0" , NULL);
+  subst_list_append_copy( subst_list , "<IENS>" , "7" , NULL);
+  subst_list_append_copy( subst_list , "<ITER>" , "1" , NULL);
+  subst_list_append_ref( subst_list , "<UNSET>" , NULL , NULL);
+  test_assert_true( subst_list_is_single_pass( subst_list ));
+  test_assert_string_equal( "1" , subst_list_get_single_pass_value( subst_list , "<ITER>" ));
+  test_assert_string_equal( "0" , subst_list_get_single_pass_value( subst_list , "<IENS>" ));
+  test_assert_NULL( subst_list_get_single_pass_value( subst_list , "<UNSET>" ));
+  {
+    char * filtered = subst_list_alloc_filtered_string( subst_list , "<<CASE>> <IENS>-<ITER> <UNSET> <OTHER> <> <ITER" );
+    test_assert_string_equal( filtered , "<parent_case> 0-1 <UNSET> <OTHER> <> <ITER" );
+    free( filtered );
+  }
+  {
+    char * filtered = subst_list_alloc_filtered_string( subst_list , "No keys here" );
+    test_assert_string_equal( filtered , "No keys here" );
+    free( filtered );
+  }
+
+  /* A value with a '<' falls back to sequential search-replace. */
+  subst_list_append_copy( subst_list , "<PATH>" , "/run/<CASE>" , NULL);
+  test_assert_false( subst_list_is_single_pass( subst_list ));
+  {
+    char * filtered = subst_list_alloc_filtered_string( subst_list , "<PATH>/<ITER>" );
+    test_assert_string_equal( filtered , "/run/<CASE>/1" );
+    free( filtered );
+  }
+
+  subst_list_clear( subst_list );
+  test_assert_false( subst_list_has_key( subst_list , "<PATH>" ));
+  test_assert_true( subst_list_is_single_pass( subst_list ));
+
+  subst_list_free( subst_list );
+  subst_list_free( parent );
+}
+
+
+void test_single_pass_equal() {
+  const char * content = "A <KEY1> and <KEY2><KEY1> <KEY3> <KEY11> KEY1> <> <KEY";
+  const char * nested_content = "<FILE_<KEY1>> <<KEY3>> <<KEY2>>";
+  subst_list_type * single_pass = subst_list_alloc( NULL );
+  subst_list_type * sequential = subst_list_alloc( NULL );
+
+  for (int i = 1; i <= 3; i++) {
+    char * key = util_alloc_sprintf( "<KEY%d>" , i );
+    char * value = util_alloc_sprintf( "value%d" , i );
+    subst_list_append_copy( single_pass , key , value , NULL );
+    subst_list_append_copy( sequential , key , value , NULL );
+    free( key );
+    free( value );
+  }
+  /* Keys which only occur after the inner token has been substituted. */
+  subst_list_append_copy( single_pass , "<FILE_value1>" , "x" , NULL );
+  subst_list_append_copy( sequential , "<FILE_value1>" , "x" , NULL );
+  subst_list_append_copy( single_pass , "<value3>" , "y" , NULL );
+  subst_list_append_copy( sequential , "<value3>" , "y" , NULL );
+  subst_list_append_copy( sequential , "__NOT_A_TOKEN__" , "x" , NULL );
+  test_assert_true( subst_list_is_single_pass( single_pass ));
+  test_assert_false( subst_list_is_single_pass( sequential ));
+  {
+    char * filtered1 = subst_list_alloc_filtered_string( single_pass , content );
+    char * filtered2 = subst_list_alloc_filtered_string( sequential , content );
+    test_assert_string_equal( filtered1 , filtered2 );
+    test_assert_string_equal( filtered1 , "A value1 and value2value1 value3 <KEY11> KEY1> <> <KEY" );
+    free( filtered1 );
+    free( filtered2 );
+  }
+
+  test_assert_false( subst_list_has_nested_tokens( content ));
+  test_assert_true( subst_list_has_nested_tokens( nested_content ));
+  {
+    char * filtered1 = subst_list_alloc_filtered_string( single_pass , nested_content );
+    char * filtered2 = subst_list_alloc_filtered_string( sequential , nested_content );
+    test_assert_string_equal( filtered1 , filtered2 );
+    test_assert_string_equal( filtered1 , "x y <value2>" );
+    free( filtered1 );
+    free( filtered2 );
+  }
+  subst_list_free( single_pass );
+  subst_list_free( sequential );
+}
+
+
+void test_template() {
+  ecl::util::TestArea ta("template");
+  subst_list_type * global = subst_list_alloc( NULL );
+  subst_list_type * arg_list = subst_list_alloc( global );
+  {
+    FILE * stream = util_fopen("template" , "w");
+    fprintf(stream , "<ARG> <CASE> <IENS> <MISSING>\n");
+    fclose(stream);
+  }
+  subst_list_append_copy( global , "<CASE>" , "case" , NULL);
+  subst_list_append_copy( arg_list , "<IENS>" , "5" , NULL);
+  subst_list_append_copy( arg_list , "<ARG>" , "ignored" , NULL);
+  {
+    template_type * template_ = template_alloc( "template" , true , NULL );
+    template_add_arg( template_ , "<ARG>" , "arg" );
+
+    template_instantiate( template_ , "target<IENS>" , arg_list , false );
+    {
+      char * target_string = util_fread_alloc_file_content( "target5" , NULL );
+      test_assert_string_equal( target_string , "arg case 5 <MISSING>\n");
+      free( target_string );
+    }
+
+    template_add_arg( template_ , "<SEQ>" , "<IENS>" );
+    template_instantiate( template_ , "target_seq" , arg_list , false );
+    {
+      char * target_string = util_fread_alloc_file_content( "target_seq" , NULL );
+      test_assert_string_equal( target_string , "arg case 5 <MISSING>\n");
+      free( target_string );
+    }
+    template_free( template_ );
+  }
+  {
+    FILE * stream = util_fopen("nested_template" , "w");
+    fprintf(stream , "<FILE_<N>> <CASE>\n");
+    fclose(stream);
+  }
+  {
+    template_type * template_ = template_alloc( "nested_template" , true , NULL );
+    template_add_arg( template_ , "<N>" , "5" );
+    subst_list_append_copy( arg_list , "<FILE_5>" , "file5" , NULL);
+
+    template_instantiate( template_ , "nested_target" , arg_list , false );
+    {
+      char * target_string = util_fread_alloc_file_content( "nested_target" , NULL );
+      test_assert_string_equal( target_string , "file5 case\n");
+      free( target_string );
+    }
+    template_free( template_ );
+  }
+  subst_list_free( arg_list );
+  subst_list_free( global );
+}
+
+
 int main(int argc , char ** argv) {
   test_create();
   test_filter_file1();
   test_filter_file2();
+  test_next_token();
+  test_single_pass();
+  test_single_pass_equal();
+  test_template();
 }
@@ -64,7 +64,43 @@ void run() {
 
 
 
+void * square(void * arg) {
+  int * int_arg = (int *) arg;
+  int_arg[1] = int_arg[0] * int_arg[0];
+  return &int_arg[1];
+}
+
+
+void restart_and_statistics() {
+  int run_size = 4;
+  int job_size = 100;
+  int args[200];
+  thread_pool_type * tp = thread_pool_alloc( run_size , false );
+
+  for (int iter=0; iter < 3; iter++) {
+    thread_pool_restart( tp );
+    for (int i=0; i < job_size; i++) {
+      args[2*i] = i + iter;
+      thread_pool_add_job( tp , square , &args[2*i] );
+    }
+    thread_pool_join( tp );
+
+    for (int i=0; i < job_size; i++) {
+      int * return_value = (int *) thread_pool_iget_return_value( tp , i );
+      test_assert_int_equal( *return_value , (i + iter) * (i + iter));
+    }
+  }
+
+  test_assert_int_equal( thread_pool_get_task_count( tp ) , 3 * job_size );
+  test_assert_true( thread_pool_get_queue_wait_time( tp ) >= 0 );
+  test_assert_true( thread_pool_get_busy_time( tp ) >= 0 );
+  test_assert_true( thread_pool_try_join( tp , 1 ));
+  thread_pool_free( tp );
+}
+
+
 int main( int argc , char ** argv) {
   create_and_destroy();
   run();
+  restart_and_statistics();
 }
@@ -21,27 +21,29 @@
 #include <string.h>
 #include <stdlib.h>
 #include <stdio.h>
-#include <signal.h>
 #include <pthread.h>
 #include <unistd.h>
+#include <time.h>
 
 #include <ert/res_util/thread_pool.hpp>
-#include <ert/res_util/res_portability.hpp>
 
 #include <ert/util/util.hpp>
 #include <ert/util/type_macros.hpp>
 
 
 /**
-   This file implements a small thread_pool object based on
-   pthread_create() function calls. The characetristics of this
+   This file implements a small thread_pool object based on a fixed
+   set of persistent worker threads. The characetristics of this
    implementation is as follows:
 
-    1. The jobs are mangaged by a separate thread - dispatch_thread.
-    2. The new jobs are just appended to the queue, the
-       dispatch_thread sees them in the queue and dispatches them.
-    3. The dispatch thread manages a list of thread_pool_job_slot_type
-       instances - one slot for each actually running job.
+    1. The worker threads are created when the pool is allocated, and
+       live until the pool is freed.
+    2. The new jobs are appended to the queue and a waiting worker is
+       woken up with a condition variable; idle workers sleep on the
+       condition variable, i.e. there is no polling.
+    3. The pool keeps statistics of the number of jobs run, the time
+       the jobs have been waiting in the queue and the time the
+       workers have been busy running jobs.
 
    Example
    -------
@@ -86,7 +88,8 @@
 
   5. Optional: The thread pool will probably mainly be used only once,
      but after a join it is possible to reuse a thread pool, but then
-     you MUST call thread_pool_restart() before adding jobs again.
+     you MUST call thread_pool_restart() before adding jobs again. The
+     worker threads are reused.
 
 
   6. When you are really finished: thread_pool_free( tp );
@@ -101,81 +104,55 @@ typedef void * (start_func_ftype) (void *) ;
    Internal struct which is used as queue node.
 */
 typedef struct {
-  thread_pool_type * pool;                /* A back-reference to the thread_pool holding the queue. */
-  int                slot_index;          /* The index in the space [0,max_running) of the job slot where this job is running. */
-  int                queue_index;         /* The index of the current tp_arg in the queue. */
   void             * func_arg;            /* The arguments to this job - supplied by the calling scope. */
   start_func_ftype * func;                /* The function to call - supplied by the calling scope. */
   void             * return_value;
+  struct timespec    submit_time;         /* When the job was added to the queue. */
 } thread_pool_arg_type;
 
 
 
-/**
-   Internal struct used to keep track of the job slots.
-*/
-typedef struct {
-  pthread_t  thread;                /* The thread variable currently (or more correct:last) running. */
-  int        run_count;             /* The number of times this slot has been used - just to check whether the slot has been used AT ALL when/if joining. */
-  bool       running;               /* Is the job_slot running now?? */
-} thread_pool_job_slot_type;
-
-
-
 
 #define THREAD_POOL_TYPE_ID 71443207
 struct thread_pool_struct {
   UTIL_TYPE_ID_DECLARATION;
   thread_pool_arg_type      * queue;              /* The jobs to be executed are appended in this vector. */
   int                         queue_index;        /* The index of the next job to run. */
-  int                         queue_size;         /* The number of jobs in the queue - including those which are complete. [Should be protected / atomic / ... ] */
+  int                         queue_size;         /* The number of jobs in the queue - including those which are complete. */
   int                         queue_alloc_size;   /* The allocated size of the queue. */
+  int                         num_complete;       /* The number of jobs in the queue which have completed. */
+
+  int                         max_running;        /* The number of worker threads. */
+  bool                        accepting_jobs;     /* True|False whether the pool has been (re)started and not joined. */
+  bool                        shutdown;           /* Set when the pool is freed; the workers exit when the queue is empty. */
 
-  int                         max_running;        /* The max number of concurrently running jobs. */
-  bool                        join;               /* Flag set by the main thread to inform the dispatch thread that joining should start. */
-  bool                        accepting_jobs;     /* True|False whether the dispatch thread is running. */
+  pthread_t                 * workers;
+  pthread_mutex_t             mutex;              /* Protects the queue, the counters and the statistics. */
+  pthread_cond_t              work_cond;          /* Signaled when jobs are added, and on shutdown. */
+  pthread_cond_t              done_cond;          /* Signaled when all the jobs in the queue have completed. */
 
-  thread_pool_job_slot_type * job_slots;          /* A vector to @max_running job slots, each slot can be reused several times.*/
-  pthread_t                   dispatch_thread;
-  pthread_rwlock_t            queue_lock;
+  int                         task_count;         /* Statistics accumulated over the lifetime of the pool. */
+  double                      queue_wait_time;
+  double                      busy_time;
 };
 
 
 static UTIL_SAFE_CAST_FUNCTION( thread_pool , THREAD_POOL_TYPE_ID )
 
 
-/**
-   This function will grow the queue. It is called by the main thread
-   (i.e. the context of the calling scope), and the queue is read by
-   the dispatch_thread - i.e. access to the queue must be protected by
-   rwlock.
-*/
-
-static void thread_pool_resize_queue( thread_pool_type * pool, int queue_length ) {
-  pthread_rwlock_wrlock( &pool->queue_lock );
-  {
-    pool->queue            = (thread_pool_arg_type*)util_realloc( pool->queue , queue_length * sizeof * pool->queue );
-    pool->queue_alloc_size = queue_length;
-  }
-  pthread_rwlock_unlock( &pool->queue_lock );
+static double thread_pool_elapsed_time( const struct timespec * start_time , const struct timespec * end_time ) {
+  return (end_time->tv_sec - start_time->tv_sec) + 1e-9 * (end_time->tv_nsec - start_time->tv_nsec);
 }
 
 
 /**
-   This function updates an element in the queue, the function is
-   called by the executing threads, on the same time the main thread
-   might be resizing the thread, we therefor take a read lock during
-   execution of this function. (Write lock is not necessary because we
-   will not change the queue pointer itself, only something it points
-   to.)
+   This function will grow the queue. It is called by the main thread
+   (i.e. the context of the calling scope) with the mutex held.
 */
 
-static void thread_pool_iset_return_value( thread_pool_type * pool , int index , void * return_value) {
-  pthread_rwlock_rdlock( &pool->queue_lock );
-  {
-    pool->queue[ index ].return_value = return_value;
-  }
-  pthread_rwlock_unlock( &pool->queue_lock );
+static void thread_pool_resize_queue( thread_pool_type * pool, int queue_length ) {
+  pool->queue            = (thread_pool_arg_type*)util_realloc( pool->queue , queue_length * sizeof * pool->queue );
+  pool->queue_alloc_size = queue_length;
 }
 
 
@@ -185,121 +162,50 @@ void * thread_pool_iget_return_value( const thread_pool_type * pool , int queue_
 
 
 /**
-   The pthread_create() call which this is all about, does not start
-   the user supplied function. Instead it will start an instance of
-   this function, which will do some housekeeping before calling the
-   user supplied function.
+   This function is run by each of the worker threads. The worker
+   sleeps on the work_cond condition until there are jobs in the
+   queue, runs the job without holding the mutex and stores the return
+   value. The function returns when the pool is shut down and the
+   queue is empty.
 */
 
-static void * thread_pool_start_job( void * arg ) {
-  thread_pool_arg_type * tp_arg = (thread_pool_arg_type * ) arg;
-  thread_pool_type * tp         =  tp_arg->pool;
-  int slot_index                =  tp_arg->slot_index;
-  void * func_arg               =  tp_arg->func_arg;
-  start_func_ftype * func       =  tp_arg->func;
-  void * return_value;
-
-
-  return_value = func( func_arg );                  /* Starting the real external function */
-  tp->job_slots[ slot_index ].running = false;      /* We mark the job as completed. */
-  free( arg );
-
-  if (return_value != NULL)
-    thread_pool_iset_return_value( tp , tp_arg->queue_index , return_value);
-
-  return NULL;
-}
-
-
+static void * thread_pool_worker( void * arg ) {
+  thread_pool_type * tp = thread_pool_safe_cast( arg );
 
-/**
-   This function is run by the dispatch_thread. The thread will keep
-   an eye on the queue, and dispatch new jobs when there are free
-   slots available.
-*/
+  pthread_mutex_lock( &tp->mutex );
+  while (true) {
+    while (!tp->shutdown && (tp->queue_index == tp->queue_size))
+      pthread_cond_wait( &tp->work_cond , &tp->mutex );
 
-static void * thread_pool_main_loop( void * arg ) {
-  thread_pool_type * tp = thread_pool_safe_cast( arg );
-  {
-    const int usleep_init = 1000;  /* The sleep time when there are free slots available - but no jobs wanting to run. */
-    int internal_offset   = 0;     /* Keep track of the (index of) the last job slot fired off - minor time saving. */
-    while (true) {
-      if (tp->queue_size > tp->queue_index) {
-        /*
-           There are jobs in the queue which would like to run -
-           let us see if we can find a slot for them.
-        */
-        int counter     = 0;
-        bool slot_found = false;
-        do {
-          int slot_index = (counter + internal_offset) % tp->max_running;
-          thread_pool_job_slot_type * job_slot = &tp->job_slots[ slot_index ];
-          if (!job_slot->running) {
-            /* OK thread[slot_index] is ready to take this job.*/
-            thread_pool_arg_type * tp_arg;
-
-            /*
-               The queue might be updated by the main thread - we must
-               take a copy of the node we are interested in.
-            */
-            pthread_rwlock_rdlock( &tp->queue_lock );
-            tp_arg = (thread_pool_arg_type*)util_alloc_copy( &tp->queue[ tp->queue_index ] , sizeof * tp_arg );
-            pthread_rwlock_unlock( &tp->queue_lock );
-
-            tp_arg->slot_index = slot_index;
-            job_slot->running = true;
-            /*
-               Here is the actual pthread_create() call creating an
-               additional running thread.
-            */
-
-            /*Cleanup of previous run threads. Needed to avoid memory leak*/
-            if (job_slot->run_count > 0)
-              pthread_join(job_slot->thread, NULL);
-
-            pthread_create( &job_slot->thread , NULL , thread_pool_start_job , tp_arg );
-            job_slot->run_count += 1;
-            tp->queue_index++;
-            internal_offset += (counter + 1);
-            slot_found = true;
-          } else
-            counter++;
-        } while (!slot_found && (counter < tp->max_running));
-
-        if (!slot_found) {
-            res_yield();
-        }
-      } else
-        util_usleep(usleep_init);    /* There are no jobs wanting to run. */
-
-      /*****************************************************************/
-      /*
-        We exit explicitly from this loop when both conditions apply:
-
-         1. tp->join       == true              :  The calling scope has signaled that it will not submit more jobs.
-         2. tp->queue_size == tp->queue_index   :  This function has submitted all the jobs in the queue.
-      */
-      if ((tp->join) && (tp->queue_size == tp->queue_index))
-        break;
-    } /* End of while() loop */
-  }
+    if (tp->queue_index == tp->queue_size)
+      break;
 
-  /*
-     There are no more jobs in the queue, and the main scope has
-     signaled that join should start. Observe that we join only the
-     jobs corresponding to explicitly running job_slots; when a job
-     slot is used multiple times the first jobs run in the job_slot
-     will not be explicitly joined.
-  */
-  {
-    int i;
-    for (i=0; i < tp->max_running; i++) {
-      thread_pool_job_slot_type job_slot = tp->job_slots[i];
-      if (job_slot.run_count > 0)
-        pthread_join( job_slot.thread , NULL );
+    {
+      int queue_index          = tp->queue_index;
+      start_func_ftype * func  = tp->queue[ queue_index ].func;
+      void * func_arg          = tp->queue[ queue_index ].func_arg;
+      void * return_value;
+      struct timespec start_time , end_time;
+
+      tp->queue_index++;
+      clock_gettime( CLOCK_MONOTONIC , &start_time );
+      tp->queue_wait_time += thread_pool_elapsed_time( &tp->queue[ queue_index ].submit_time , &start_time );
+      pthread_mutex_unlock( &tp->mutex );
+
+      return_value = func( func_arg );                  /* Starting the real external function */
+      clock_gettime( CLOCK_MONOTONIC , &end_time );
+
+      pthread_mutex_lock( &tp->mutex );
+      tp->queue[ queue_index ].return_value = return_value;
+      tp->busy_time += thread_pool_elapsed_time( &start_time , &end_time );
+      tp->task_count++;
+      tp->num_complete++;
+      if (tp->num_complete == tp->queue_size)
+        pthread_cond_broadcast( &tp->done_cond );
     }
   }
-  /* When we are here all the jobs have completed. */
+  pthread_mutex_unlock( &tp->mutex );
+
   return NULL;
 }
 
@@ -307,9 +213,9 @@ static void * thread_pool_main_loop( void * arg ) {
 
 
 /**
-   This function initializes a couple of counters, and starts up the
-   dispatch thread. If the thread_pool should be reused after a join,
-   this function must be called before adding new jobs.
+   This function resets the queue, and opens the pool for new jobs. If
+   the thread_pool should be reused after a join, this function must be
+   called before adding new jobs.
 
    The functions thread_pool_restart() and thread_pool_join() should
    be joined up like open/close and malloc/free combinations.
@@ -318,97 +224,58 @@ static void * thread_pool_main_loop( void * arg ) {
 void thread_pool_restart( thread_pool_type * tp ) {
   if (tp->accepting_jobs)
     util_abort("%s: fatal error - tried restart already running thread pool\n",__func__);
+
+  pthread_mutex_lock( &tp->mutex );
   {
-    tp->join           = false;
     tp->queue_index    = 0;
     tp->queue_size     = 0;
-    {
-      int i;
-      for (i=0; i < tp->max_running; i++) {
-        tp->job_slots[i].run_count = 0;
-        tp->job_slots[i].running   = false;
-      }
-    }
-
-    /* Starting the dispatch thread. */
-    pthread_create( &tp->dispatch_thread , NULL , thread_pool_main_loop , tp );
+    tp->num_complete   = 0;
     tp->accepting_jobs = true;
   }
+  pthread_mutex_unlock( &tp->mutex );
 }
 
 
 
 /**
    This function is called by the calling scope when all the jobs have
-   been submitted, and we just wait for them to complete.
-
-   This function just sets the join switch to true - this again tells
-   the dispatch_thread to start the join process on the worker
-   threads.
+   been submitted, and we just wait for them to complete. The worker
+   threads are not stopped, they will wait for jobs after the pool has
+   been restarted.
 */
 
 void thread_pool_join(thread_pool_type * pool) {
-  pool->join = true;                               /* Signals to the main thread that joining can start. */
   if (pool->max_running > 0) {
-    pthread_join( pool->dispatch_thread , NULL );  /* Wait for the main thread to complete. */
+    pthread_mutex_lock( &pool->mutex );
+    while (pool->num_complete < pool->queue_size)
+      pthread_cond_wait( &pool->done_cond , &pool->mutex );
     pool->accepting_jobs = false;
+    pthread_mutex_unlock( &pool->mutex );
   }
 }
 
 /*
-  This will try to join the thread; if the manager thread has not
-  completed within @timeout_seconds the function will return false. If
-  the join fails the queue will be reset in a non-joining state and it
-  will be open for more jobs. Probably not in a 100% sane state.
+  This will wait for the jobs to complete; if they have not completed
+  within @timeout_seconds the function will return false. If the join
+  fails the pool will still be open for more jobs.
 */
 
 bool thread_pool_try_join(thread_pool_type * pool, int timeout_seconds) {
   bool join_ok = true;
 
-  pool->join = true;                               /* Signals to the main thread that joining can start. */
   if (pool->max_running > 0) {
-    time_t timeout_time = time( NULL );
-    util_inplace_forward_seconds_utc(&timeout_time , timeout_seconds );
-
-#ifdef HAVE_TIMEDJOIN
-
     struct timespec ts;
-    ts.tv_sec = timeout_time;
-    ts.tv_nsec = 0;
+    clock_gettime( CLOCK_REALTIME , &ts );
+    ts.tv_sec += timeout_seconds;
 
-    {
-      int join_return = pthread_timedjoin_np( pool->dispatch_thread , NULL , &ts);  /* Wait for the main thread to complete. */
-      if (join_return == 0)
-        pool->accepting_jobs = false;
-      else {
-        pool->join = false;
-        join_ok = false;
-      }
-    }
-
-#else
-
-    while(true) {
-        if (pthread_kill(pool->dispatch_thread, 0) == 0){
-            res_yield();
-        } else {
-            pthread_join(pool->dispatch_thread, NULL);
-            pool->accepting_jobs = false;
-            break;
-        }
-
-        time_t now = time(NULL);
-
-        if(util_difftime_seconds(now, timeout_time) <= 0) {
-            join_ok = false;
-            break;
-        }
+    pthread_mutex_lock( &pool->mutex );
+    while (join_ok && (pool->num_complete < pool->queue_size)) {
+      if (pthread_cond_timedwait( &pool->done_cond , &pool->mutex , &ts ) != 0)
+        join_ok = (pool->num_complete == pool->queue_size);
     }
-
-#endif
-
-
-
+    if (join_ok)
+      pool->accepting_jobs = false;
+    pthread_mutex_unlock( &pool->mutex );
   }
   return join_ok;
 }
@@ -417,21 +284,34 @@ bool thread_pool_try_join(thread_pool_type * pool, int timeout_seconds) {
 
 
 /**
-   max_running is the maximum number of concurrent threads. If
-   @start_queue is true the dispatch thread will start immediately. If
-   the function is called with @start_queue == false you must first
-   call thread_pool_restart() BEFORE you can start adding jobs.
+   max_running is the number of worker threads. If @start_queue is
+   true the pool will accept jobs immediately. If the function is
+   called with @start_queue == false you must first call
+   thread_pool_restart() BEFORE you can start adding jobs.
 */
 
 thread_pool_type * thread_pool_alloc(int max_running , bool start_queue) {
   thread_pool_type * pool = (thread_pool_type*)util_malloc( sizeof *pool );
   UTIL_TYPE_ID_INIT( pool , THREAD_POOL_TYPE_ID );
-  pool->job_slots         = (thread_pool_job_slot_type*)util_calloc( max_running , sizeof * pool->job_slots );
   pool->max_running       = max_running;
   pool->queue             = NULL;
+  pool->queue_index       = 0;
+  pool->queue_size        = 0;
+  pool->num_complete      = 0;
   pool->accepting_jobs    = false;
-  pthread_rwlock_init( &pool->queue_lock , NULL);
+  pool->shutdown          = false;
+  pool->task_count        = 0;
+  pool->queue_wait_time   = 0;
+  pool->busy_time         = 0;
+  pthread_mutex_init( &pool->mutex , NULL );
+  pthread_cond_init( &pool->work_cond , NULL );
+  pthread_cond_init( &pool->done_cond , NULL );
   thread_pool_resize_queue( pool  , 32 );
+
+  pool->workers = (pthread_t*)util_calloc( max_running , sizeof * pool->workers );
+  for (int i=0; i < max_running; i++)
+    pthread_create( &pool->workers[i] , NULL , thread_pool_worker , pool );
+
   if (start_queue)
     thread_pool_restart( pool );
   return pool;
@@ -444,23 +324,21 @@ void thread_pool_add_job(thread_pool_type * pool , start_func_ftype * start_func
     start_func( func_arg );
   else {
     if (pool->accepting_jobs) {
-      if (pool->queue_size == pool->queue_alloc_size)
-        thread_pool_resize_queue( pool , pool->queue_alloc_size * 2);
-
-      /*
-         The new job is added to the queue - the main thread is watching
-         the queue and will pick up the new job.
-      */
+      pthread_mutex_lock( &pool->mutex );
       {
         int queue_index = pool->queue_size;
 
-        pool->queue[ queue_index ].pool         = pool;
+        if (pool->queue_size == pool->queue_alloc_size)
+          thread_pool_resize_queue( pool , pool->queue_alloc_size * 2);
+
         pool->queue[ queue_index ].func_arg     = func_arg;
         pool->queue[ queue_index ].func         = start_func;
         pool->queue[ queue_index ].return_value = NULL;
-        pool->queue[ queue_index ].queue_index = queue_index;
+        clock_gettime( CLOCK_MONOTONIC , &pool->queue[ queue_index ].submit_time );
+        pool->queue_size++;
       }
-      pool->queue_size++;  /* <- This is shared between this thread and the dispatch thread */
+      pthread_cond_signal( &pool->work_cond );
+      pthread_mutex_unlock( &pool->mutex );
     } else
       util_abort("%s: thread_pool is not running - restart with thread_pool_restart()?? \n",__func__);
   }
@@ -469,14 +347,25 @@ void thread_pool_add_job(thread_pool_type * pool , start_func_ftype * start_func
 
 
 /*
-  Observe that this function does not join the worker threads,
-  i.e. you should call thread_pool_join() first (otherwise the thing
-  will go up in flames).
+  The worker threads are stopped when the pool is freed; jobs which are
+  still in the queue will be run to completion first, but you should
+  in general call thread_pool_join() before freeing the pool.
 */
 
 
 void thread_pool_free(thread_pool_type * pool) {
-  free( pool->job_slots );
+  pthread_mutex_lock( &pool->mutex );
+  pool->shutdown = true;
+  pthread_cond_broadcast( &pool->work_cond );
+  pthread_mutex_unlock( &pool->mutex );
+
+  for (int i=0; i < pool->max_running; i++)
+    pthread_join( pool->workers[i] , NULL );
+
+  pthread_cond_destroy( &pool->done_cond );
+  pthread_cond_destroy( &pool->work_cond );
+  pthread_mutex_destroy( &pool->mutex );
+  free( pool->workers );
   free( pool->queue );
   free(pool);
 }
@@ -485,3 +374,34 @@ int thread_pool_get_max_running( const thread_pool_type * pool ) {
   return pool->max_running;
 }
 
+
+/*
+  Statistics accumulated over the lifetime of the pool: the number of
+  jobs which have run, the total time (in seconds) the jobs have been
+  waiting in the queue before a worker picked them up, and the total
+  time the workers have been busy running jobs.
+*/
+
+int thread_pool_get_task_count( const thread_pool_type * pool ) {
+  int task_count;
+  pthread_mutex_lock( (pthread_mutex_t *) &pool->mutex );
+  task_count = pool->task_count;
+  pthread_mutex_unlock( (pthread_mutex_t *) &pool->mutex );
+  return task_count;
+}
+
+double thread_pool_get_queue_wait_time( const thread_pool_type * pool ) {
+  double queue_wait_time;
+  pthread_mutex_lock( (pthread_mutex_t *) &pool->mutex );
+  queue_wait_time = pool->queue_wait_time;
+  pthread_mutex_unlock( (pthread_mutex_t *) &pool->mutex );
+  return queue_wait_time;
+}
+
+double thread_pool_get_busy_time( const thread_pool_type * pool ) {
+  double busy_time;
+  pthread_mutex_lock( (pthread_mutex_t *) &pool->mutex );
+  busy_time = pool->busy_time;
+  pthread_mutex_unlock( (pthread_mutex_t *) &pool->mutex );
+  return busy_time;
+}
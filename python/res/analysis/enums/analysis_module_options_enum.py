@@ -23,12 +23,14 @@ class AnalysisModuleOptionsEnum(BaseCEnum):
     ANALYSIS_UPDATE_A = None
     ANALYSIS_SCALE_DATA = None
     ANALYSIS_ITERABLE = None
+    ANALYSIS_DIAGONAL_R = None
 
 AnalysisModuleOptionsEnum.addEnum("ANALYSIS_NEED_ED" , 1)
 AnalysisModuleOptionsEnum.addEnum("ANALYSIS_USE_A" , 4)
 AnalysisModuleOptionsEnum.addEnum("ANALYSIS_UPDATE_A" , 8)
 AnalysisModuleOptionsEnum.addEnum("ANALYSIS_SCALE_DATA" , 16)
 AnalysisModuleOptionsEnum.addEnum("ANALYSIS_ITERABLE" , 32)
+AnalysisModuleOptionsEnum.addEnum("ANALYSIS_DIAGONAL_R" , 64)
 
 
 
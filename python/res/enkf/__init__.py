@@ -39,10 +39,12 @@ from .node_id import NodeId
 from .enkf_linalg import EnkfLinalg
 from .util import TimeMap
 from .state_map import StateMap
+from .misfit_ensemble import MisfitEnsemble
 from .summary_key_set import SummaryKeySet
 from .summary_key_matcher import SummaryKeyMatcher
 from .custom_kw_config_set import CustomKWConfigSet
 from .enkf_fs import EnkfFs
+from .load_scheduler import LoadScheduler
 
 from .ert_workflow_list import ErtWorkflowList
 from .active_list import ActiveList
@@ -42,6 +42,10 @@ class AnalysisConfig(BaseCClass):
     _have_enough_realisations = ResPrototype("bool analysis_config_have_enough_realisations(analysis_config, int, int)")
     _get_max_runtime = ResPrototype("int analysis_config_get_max_runtime(analysis_config)")
     _set_max_runtime = ResPrototype("void analysis_config_set_max_runtime(analysis_config, int)")
+    _get_max_update_memory = ResPrototype("int analysis_config_get_max_update_memory(analysis_config)")
+    _set_max_update_memory = ResPrototype("void analysis_config_set_max_update_memory(analysis_config, int)")
+    _get_update_threads = ResPrototype("int analysis_config_get_update_threads(analysis_config)")
+    _set_update_threads = ResPrototype("void analysis_config_set_update_threads(analysis_config, int)")
     _get_stop_long_running = ResPrototype("bool analysis_config_get_stop_long_running(analysis_config)")
     _set_stop_long_running = ResPrototype("void analysis_config_set_stop_long_running(analysis_config, bool)")
     _get_active_module_name = ResPrototype("char* analysis_config_get_active_module_name(analysis_config)")
@@ -140,6 +144,20 @@ class AnalysisConfig(BaseCClass):
     def set_max_runtime(self, max_runtime):
         self._set_max_runtime(max_runtime)
 
+    def get_max_update_memory(self):
+        """ @rtype: int """
+        return self._get_max_update_memory()
+
+    def set_max_update_memory(self, max_update_memory):
+        self._set_max_update_memory(max_update_memory)
+
+    def get_update_threads(self):
+        """ @rtype: int """
+        return self._get_update_threads()
+
+    def set_update_threads(self, update_threads):
+        self._set_update_threads(update_threads)
+
     def free(self):
         self._free()
 
@@ -36,6 +36,7 @@ class FieldConfig(BaseCClass):
     _get_ny                    = ResPrototype("int    field_config_get_ny(field_config)")
     _get_nz                    = ResPrototype("int    field_config_get_nz(field_config)")
     _get_grid                  = ResPrototype("ecl_grid_ref field_config_get_grid(field_config)")
+    _alloc_global_index        = ResPrototype("int_vector_obj field_config_alloc_global_index(field_config)")
     _export_format             = ResPrototype("enkf_field_file_format_enum field_config_default_export_format(char*)", bind = False)
     _guess_filetype            = ResPrototype("enkf_field_file_format_enum field_config_guess_file_type(char*)", bind = False)
 
@@ -88,6 +89,11 @@ class FieldConfig(BaseCClass):
     def ijk_active(self, i, j, k):
         return self._ijk_active(i, j, k)
 
+    def global_index(self):
+        """Returns a numpy array with the global grid index of each element in
+        the data of the fields, see Field.numpyView()."""
+        return self._alloc_global_index().numpyCopy()
+
     def free(self):
         self._free()
 
@@ -14,11 +14,15 @@
 #  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
 #  for more details.
 import sys
+
+import numpy
+
 from res.enkf.enums import ErtImplType
 from cwrap import BaseCClass
 from res import ResPrototype
 from res.enkf import EnkfFs, NodeId
 from res.enkf.data import GenKw, GenData, CustomKW, Field, ExtParam
+from res.enkf.data.summary import Summary
 
 class EnkfNode(BaseCClass):
     TYPE_NAME = "enkf_node"
@@ -58,6 +62,56 @@ class EnkfNode(BaseCClass):
                 sys.stderr.write("** ERROR: Could not load realisation:%d - export failed" % iens)
 
 
+    @classmethod
+    def loadEnsembleArray(cls, config_node, fs, iens_list, report_step=0):
+        """
+        Loads the node for all the realizations in @iens_list and returns the
+        data stacked as a numpy array with shape (len(iens_list), size); the
+        rows of realizations which can not be loaded are NaN.
+
+        @rtype: numpy.ndarray
+        """
+        node = EnkfNode(config_node)
+        data = None
+        missing = []
+        for row, iens in enumerate(iens_list):
+            if not node.tryLoad(fs, NodeId(report_step, iens)):
+                missing.append(row)
+                continue
+
+            view = node.numpyView()
+            if data is None:
+                data = numpy.full((len(iens_list), len(view)), numpy.nan, dtype=view.dtype)
+            elif len(view) != data.shape[1]:
+                raise ValueError("Size mismatch for %s realization:%d - expected:%d got:%d" %
+                                 (config_node.getKey(), iens, data.shape[1], len(view)))
+            data[row, :] = view
+
+        if data is None:
+            data = numpy.full((len(iens_list), 0), numpy.nan)
+        return data
+
+
+    def numpyView(self, writable=False):
+        """
+        Returns a numpy array which shares storage with the data of the
+        node, see numpyView() of Field, GenData, GenKw and Summary.
+
+        @rtype: numpy.ndarray
+        """
+        impl_type = self.getImplType()
+        if impl_type == ErtImplType.FIELD:
+            return self.asField().numpyView(writable)
+        elif impl_type == ErtImplType.GEN_DATA:
+            return self.asGenData().numpyView(writable)
+        elif impl_type == ErtImplType.GEN_KW:
+            return self.asGenKw().numpyView(writable)
+        elif impl_type == ErtImplType.SUMMARY:
+            return self.as_summary().numpyView(writable)
+        else:
+            raise NotImplementedError("The numpyView method is not implemented for %s" % impl_type)
+
+
     def export(self , filename , file_type = None , arg = None):
         impl_type = self.getImplType()
         if impl_type == ErtImplType.FIELD:
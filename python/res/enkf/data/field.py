@@ -15,9 +15,12 @@
 #  for more details.
 import sys
 
+import numpy
+
 from cwrap import BaseCClass
 from res import ResPrototype
 from res.enkf.config import FieldConfig
+from res.util import numpy_view
 
 
 class Field(BaseCClass):
@@ -26,6 +29,10 @@ class Field(BaseCClass):
     _free           = ResPrototype("void field_free( field )")
     _ijk_get_double = ResPrototype("double field_ijk_get_double(field, int, int, int)")
     _export         = ResPrototype("void field_export(field, char* , fortio , enkf_field_file_format_enum , bool , char*)")
+    _get_data_ptr   = ResPrototype("void* field_get_data_ptr(field)")
+    _get_data_size  = ResPrototype("int   field_get_data_size(field)")
+    _sizeof_ctype   = ResPrototype("int   field_get_sizeof_ctype(field)")
+    _get_config     = ResPrototype("field_config_ref field_get_config(field)")
 
     def __init__(self):
         raise NotImplementedError("Class can not be instantiated directly!")
@@ -35,6 +42,44 @@ class Field(BaseCClass):
         return self._ijk_get_double(i, j, k)
 
 
+    def __len__(self):
+        return self._get_data_size()
+
+
+    def getConfig(self):
+        """ @rtype: FieldConfig """
+        return self._get_config().setParent(self)
+
+
+    def numpyView(self, writable=False):
+        """
+        Returns a numpy array which shares storage with the field; the
+        elements are ordered as the global indices from
+        FieldConfig.global_index(), normally only the active cells. The
+        array is read only unless @writable is True.
+
+        @rtype: numpy.ndarray
+        """
+        dtype = numpy.float32 if self._sizeof_ctype() == 4 else numpy.float64
+        return numpy_view(self._get_data_ptr(), len(self), dtype, self, writable)
+
+
+    def numpy3D(self, fill_value=numpy.nan):
+        """
+        Returns a copy of the field as a (nx, ny, nz) numpy array where
+        the cells which are not in the field are set to @fill_value.
+
+        @rtype: numpy.ndarray
+        """
+        config = self.getConfig()
+        nx, ny, nz = config.get_nx(), config.get_ny(), config.get_nz()
+        view = self.numpyView()
+
+        data = numpy.full(nx * ny * nz, fill_value, dtype=view.dtype)
+        data[config.global_index()] = view
+        return data.reshape((nx, ny, nz), order='F')
+
+
     def export(self , filename , file_type = None , init_file = None):
         output_transform = False
         if file_type is None:
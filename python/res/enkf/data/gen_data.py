@@ -1,6 +1,9 @@
+import numpy
+
 from cwrap import BaseCClass
 from ecl.util.util import DoubleVector
 from res import ResPrototype
+from res.util import numpy_view
 
 
 class GenData(BaseCClass):
@@ -11,6 +14,8 @@ class GenData(BaseCClass):
     _iget        = ResPrototype("double gen_data_iget_double(gen_data , int)");
     _export      = ResPrototype("void   gen_data_export(gen_data , char*, gen_data_file_format_type, fortio)")
     _export_data = ResPrototype("void   gen_data_export_data(gen_data , double_vector)")
+    _get_data_ptr = ResPrototype("void*  gen_data_get_data_ptr(gen_data)")
+    _sizeof_ctype = ResPrototype("int    gen_data_get_sizeof_ctype(gen_data)")
 
     def __init__(self):
         c_ptr = self._alloc()
@@ -45,6 +50,17 @@ class GenData(BaseCClass):
         self._export_data( data )
         return data
 
+    def numpyView(self, writable=False):
+        """
+        Returns a numpy array which shares storage with the GenData; the
+        array is invalid when new data is loaded. The array is read only
+        unless @writable is True.
+
+        @rtype: numpy.ndarray
+        """
+        dtype = numpy.float32 if self._sizeof_ctype() == 4 else numpy.float64
+        return numpy_view(self._get_data_ptr(), len(self), dtype, self, writable)
+
     def __getitem__( self, idx ):
         """Returns an item, or a list if idx is a slice.
         Note: When idx is a slice it does not return a new GenData!
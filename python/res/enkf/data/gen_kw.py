@@ -18,9 +18,12 @@ import os.path
 from cwrap import BaseCClass, CFILE
 import numbers
 
+import numpy
+
 from ecl.util.util import DoubleVector
 from res import ResPrototype
 from res.enkf.config import GenKwConfig
+from res.util import numpy_view
 
 
 class GenKw(BaseCClass):
@@ -38,6 +41,7 @@ class GenKw(BaseCClass):
     _has_key           = ResPrototype("bool   gen_kw_data_has_key(gen_kw, char*)")
     _ecl_write         = ResPrototype("void   gen_kw_ecl_write(gen_kw,    char* , char* , void*)")
     _iget_key          = ResPrototype("char*  gen_kw_get_name(gen_kw, int)")
+    _get_data_ptr      = ResPrototype("void*  gen_kw_get_data_ref(gen_kw)")
 
 
     def __init__(self, gen_kw_config):
@@ -139,6 +143,17 @@ class GenKw(BaseCClass):
         return self._has_key(item)
 
 
+    def numpyView(self, writable=False):
+        """
+        Returns a numpy array which shares storage with the GenKw, i.e.
+        the untransformed values. The array is read only unless
+        @writable is True.
+
+        @rtype: numpy.ndarray
+        """
+        return numpy_view(self._get_data_ptr(), len(self), numpy.float64, self, writable)
+
+
     def free(self):
         self._free()
 
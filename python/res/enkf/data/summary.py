@@ -13,8 +13,11 @@
 #
 #  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
 #  for more details.
+import numpy
+
 from cwrap import BaseCClass
 from res import ResPrototype
+from res.util import numpy_view
 
 
 class Summary(BaseCClass):
@@ -23,6 +26,7 @@ class Summary(BaseCClass):
     _free        = ResPrototype("void    summary_free(summary)")
     _iget_value  = ResPrototype("double  summary_get(summary, int)")
     _length      = ResPrototype("int     summary_length(summary)")
+    _get_data_ptr = ResPrototype("void*  summary_get_data_ptr(summary)")
 
 
     def __init__(self, config):
@@ -54,6 +58,18 @@ class Summary(BaseCClass):
         return self[report_step]
 
 
+    def numpyView(self, writable=False):
+        """
+        Returns a numpy array with the values of all the report steps
+        which shares storage with the Summary; the array is invalid when
+        the summary grows. The array is read only unless @writable is
+        True.
+
+        @rtype: numpy.ndarray
+        """
+        return numpy_view(self._get_data_ptr(), len(self), numpy.float64, self, writable)
+
+
     @property
     def config(self):
         return self._config
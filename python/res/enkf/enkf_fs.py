@@ -36,11 +36,15 @@ class EnkfFs(BaseCClass):
     _is_read_only         = ResPrototype("bool  enkf_fs_is_read_only(enkf_fs)")
     _is_running           = ResPrototype("bool  enkf_fs_is_running(enkf_fs)")
     _fsync                = ResPrototype("void  enkf_fs_fsync(enkf_fs)")
+    _set_mmap             = ResPrototype("void  enkf_fs_set_mmap(enkf_fs, bool)")
+    _get_mmap             = ResPrototype("bool  enkf_fs_get_mmap(enkf_fs)")
+    _get_mount_time       = ResPrototype("double enkf_fs_get_mount_time(enkf_fs)")
     _create               = ResPrototype("enkf_fs_ref   enkf_fs_create_fs(char* , enkf_fs_type_enum , void* , bool)", bind = False)
     _get_time_map         = ResPrototype("time_map_ref  enkf_fs_get_time_map(enkf_fs)")
     _get_state_map        = ResPrototype("state_map_ref enkf_fs_get_state_map(enkf_fs)")
     _summary_key_set      = ResPrototype("summary_key_set_ref enkf_fs_get_summary_key_set(enkf_fs)")
     _config_kw_config_set = ResPrototype("custom_kw_config_set_ref enkf_fs_get_custom_kw_config_set(enkf_fs)")
+    _get_misfit_ensemble  = ResPrototype("misfit_ensemble_ref enkf_fs_get_misfit_ensemble(enkf_fs)")
 
     def __init__(self, mount_point):
         c_ptr = self._mount(mount_point)
@@ -69,6 +73,10 @@ class EnkfFs(BaseCClass):
         """ @rtype: StateMap """
         return self._get_state_map().setParent(self)
 
+    def getMisfitEnsemble(self):
+        """ @rtype: MisfitEnsemble """
+        return self._get_misfit_ensemble().setParent(self)
+
     def getCaseName(self):
         """ @rtype: str """
         return self._get_case_name()
@@ -77,6 +85,25 @@ class EnkfFs(BaseCClass):
         """ @rtype: bool """
         return self._is_read_only()
 
+    def setMmapRead(self, use_mmap):
+        """
+        When enabled the block_fs storage files are memory mapped and
+        the stored nodes are deserialized directly from the mapping,
+        instead of being read into an intermediate buffer.
+        """
+        self._set_mmap(use_mmap)
+
+    def getMmapRead(self):
+        """ @rtype: bool """
+        return self._get_mmap()
+
+    def getMountTime(self):
+        """
+        The wall time in seconds it took to mount this case.
+        @rtype: float
+        """
+        return self._get_mount_time()
+
     def refCount(self):
         return self._get_refcount()
 
@@ -1,5 +1,6 @@
 import os.path
 import re
+import threading
 
 from cwrap import BaseCClass
 from ecl.util.util import StringList, BoolVector
@@ -11,38 +12,200 @@ def naturalSortKey(s, _nsre=re.compile('([0-9]+)')):
     return [int(text) if text.isdigit() else text.lower() for text in re.split(_nsre, s)]
 
 class FileSystemRotator(object):
-    def __init__(self, capacity):
+    """
+    Keeps the mounted file systems in least recently used order. When
+    a new file system is added and the rotator is above capacity, or
+    above the optional memory budget, the least recently used file
+    systems which are not pinned are evicted. The evicted file systems
+    are synced and unmounted in a background thread, so the caller does
+    not have to wait for that; a case which is remounted while its
+    unmount is still in progress will wait for the unmount to complete.
+
+    The memory usage of a file system is estimated from the size of the
+    storage index files, which is what is held in memory for a mounted
+    case; the estimate is only computed the first time a case is added.
+
+    The rotator can be used from several threads; all the bookkeeping is
+    done while holding an internal lock.
+    """
+
+    def __init__(self, capacity, memory_budget=None):
         super(FileSystemRotator, self).__init__()
         self._capacity = capacity
         """:type: int"""
+        self._memory_budget = memory_budget
+        """:type: int"""
         self._fs_list = []
         """:type: list of str"""
         self._fs_map = {}
         """:type: dict[str, EnkfFs]"""
+        self._memory_usage = {}
+        """:type: dict[str, int]"""
+        self._memory_estimates = {}
+        """:type: dict[str, int]"""
+        self._pinned = set()
+        """:type: set of str"""
+        self._pending_umount = {}
+        """:type: dict[str, threading.Thread]"""
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def __len__(self):
-        return len(self._fs_list)
+        with self._lock:
+            return len(self._fs_list)
 
     def addFileSystem(self, file_system, full_name):
-        if self.atCapacity():
-            self.dropOldestFileSystem()
+        memory_usage = self._getMemoryEstimate(full_name)
+        with self._lock:
+            self._misses += 1
+            self._fs_list.append(full_name)
+            self._fs_map[full_name] = file_system
+            self._memory_usage[full_name] = memory_usage
+            self._evict(keep=full_name)
+
+    def touch(self, full_name):
+        """ Registers a cache hit and marks the file system as most recently used. """
+        with self._lock:
+            self._hits += 1
+            if full_name in self._fs_map:
+                self._fs_list.remove(full_name)
+                self._fs_list.append(full_name)
+
+    def _getMemoryEstimate(self, full_name):
+        with self._lock:
+            if full_name in self._memory_estimates:
+                return self._memory_estimates[full_name]
+
+        # The walk over the case is done without holding the lock.
+        usage = self._estimateMemoryUsage(full_name)
+        with self._lock:
+            return self._memory_estimates.setdefault(full_name, usage)
+
+    @staticmethod
+    def _estimateMemoryUsage(full_name):
+        usage = 0
+        for path, _, files in os.walk(full_name):
+            for filename in files:
+                if filename.endswith(".index"):
+                    usage += os.path.getsize(os.path.join(path, filename))
+        return usage
+
+    def getMemoryUsage(self):
+        """ @rtype: int """
+        with self._lock:
+            return sum(self._memory_usage.values())
 
-        self._fs_list.append(full_name)
-        self._fs_map[full_name] = file_system
+    def _aboveLimit(self):
+        if len(self._fs_list) > self._capacity:
+            return True
 
-    def dropOldestFileSystem(self):
-        if len(self._fs_list) > 0:
-            case_name = self._fs_list[0]
-            fs = self._fs_map[case_name]
-            del self._fs_list[0]
-            del self._fs_map[case_name]
+        if self._memory_budget is not None:
+            return sum(self._memory_usage.values()) > self._memory_budget
+
+        return False
+
+    def _evict(self, keep=None):
+        while self._aboveLimit():
+            candidates = [name for name in self._fs_list if name not in self._pinned and name != keep]
+            if len(candidates) == 0:
+                break
+            self._drop(candidates[0])
+
+    def _reapUmounts(self):
+        for name, umount_thread in list(self._pending_umount.items()):
+            if not umount_thread.is_alive():
+                del self._pending_umount[name]
+
+    def _drop(self, case_name):
+        fs = self._fs_map[case_name]
+        self._fs_list.remove(case_name)
+        del self._fs_map[case_name]
+        del self._memory_usage[case_name]
+        self._pinned.discard(case_name)
+        self._evictions += 1
+
+        self._reapUmounts()
+        umount_thread = threading.Thread(target=self._umount, args=(fs,))
+        umount_thread.daemon = True
+        self._pending_umount[case_name] = umount_thread
+        umount_thread.start()
+
+    @staticmethod
+    def _umount(fs):
+        fs.fsync()
+        # The current case is owned by enkf_main, we only hold a reference.
+        if not fs.isReference():
+            fs.umount()
+
+    def waitForUmount(self, full_name=None):
+        """
+        Waits for the background unmount of full_name to complete; if
+        full_name is None waits for all pending unmounts.
+        """
+        with self._lock:
+            self._reapUmounts()
+            if full_name is None:
+                names = list(self._pending_umount.keys())
+            else:
+                names = [full_name] if full_name in self._pending_umount else []
+            umount_threads = [self._pending_umount.pop(name) for name in names]
 
+        for umount_thread in umount_threads:
+            umount_thread.join()
+
+    def dropOldestFileSystem(self):
+        """ Drops the least recently used file system which is not pinned. """
+        with self._lock:
+            candidates = [name for name in self._fs_list if name not in self._pinned]
+            if len(candidates) > 0:
+                self._drop(candidates[0])
+
+    def pin(self, full_name):
+        """ A pinned file system will not be evicted; it must be mounted. """
+        with self._lock:
+            if not full_name in self._fs_map:
+                raise KeyError("The file system: %s is not mounted" % full_name)
+            self._pinned.add(full_name)
+
+    def unpin(self, full_name):
+        with self._lock:
+            self._pinned.discard(full_name)
+            self._evict()
+
+    def isPinned(self, full_name):
+        with self._lock:
+            return full_name in self._pinned
+
+    def setCapacity(self, capacity, memory_budget=None):
+        if capacity < 1:
+            raise ValueError("The capacity must be at least one - got: %d" % capacity)
+        with self._lock:
+            self._capacity = capacity
+            self._memory_budget = memory_budget
+            self._evict()
+
+    def getCapacity(self):
+        return self._capacity
+
+    def getMemoryBudget(self):
+        return self._memory_budget
+
+    def getStatistics(self):
+        """ @rtype: dict[str, int] """
+        with self._lock:
+            return {"hits": self._hits,
+                    "misses": self._misses,
+                    "evictions": self._evictions}
 
     def atCapacity(self):
-        return len(self._fs_list) == self._capacity
+        with self._lock:
+            return len(self._fs_list) >= self._capacity
 
     def __contains__(self, full_case_name):
-        return full_case_name in self._fs_list
+        with self._lock:
+            return full_case_name in self._fs_map
 
     def __get_fs(self, name):
         fs = self._fs_map[name]
@@ -50,18 +213,22 @@ class FileSystemRotator(object):
 
     def __getitem__(self, case):
         """ @rtype: EnkfFs """
-        if isinstance(case, str):
-            return self.__get_fs(case)
-        elif isinstance(case, int) and 0 <= case < len(self):
-            case_name = self._fs_list[case]
-            return self.__get_fs(case_name)
-        else:
-            raise IndexError("Value '%s' is not a proper index or case name." % case)
+        with self._lock:
+            if isinstance(case, str):
+                return self.__get_fs(case)
+            elif isinstance(case, int) and 0 <= case < len(self._fs_list):
+                case_name = self._fs_list[case]
+                return self.__get_fs(case_name)
+            else:
+                raise IndexError("Value '%s' is not a proper index or case name." % case)
 
 
     def umountAll(self):
-        while len(self._fs_list) > 0:
-            self.dropOldestFileSystem()
+        with self._lock:
+            self._pinned.clear()
+            while len(self._fs_list) > 0:
+                self._drop(self._fs_list[0])
+        self.waitForUmount()
 
 
 
@@ -94,10 +261,11 @@ class EnkfFsManager(BaseCClass):
 
     DEFAULT_CAPACITY = 5
 
-    def __init__(self, enkf_main, capacity=DEFAULT_CAPACITY):
+    def __init__(self, enkf_main, capacity=DEFAULT_CAPACITY, memory_budget=None):
         """
         @type enkf_main: res.enkf.EnKFMain
         @type capacity: int
+        @type memory_budget: int
         """
         # enkf_main should be an EnKFMain, get the _RealEnKFMain object
         real_enkf_main = enkf_main.parent()
@@ -107,7 +275,9 @@ class EnkfFsManager(BaseCClass):
             parent=real_enkf_main ,
             is_reference=True)
 
-        self._fs_rotator = FileSystemRotator(capacity)
+        self._fs_rotator = FileSystemRotator(capacity, memory_budget)
+        self._fs_lock = threading.RLock()
+        self._current_case = None
         self._mount_root = real_enkf_main.getMountPoint()
 
         self._fs_type = real_enkf_main.getModelConfig().getFSType()
@@ -136,17 +306,20 @@ class EnkfFsManager(BaseCClass):
 
         full_case_name = self._createFullCaseName(mount_root, case_name)
 
-        if not full_case_name in self._fs_rotator:
-            if not EnkfFs.exists(full_case_name):
-                if self._fs_rotator.atCapacity():
-                    self._fs_rotator.dropOldestFileSystem()
-
-                EnkfFs.createFileSystem(full_case_name, self._fs_type, self._fs_arg)
+        # Serializes the lookup and the mount, so two threads asking for
+        # the same case will not both mount it.
+        with self._fs_lock:
+            if full_case_name in self._fs_rotator:
+                self._fs_rotator.touch(full_case_name)
+            else:
+                self._fs_rotator.waitForUmount(full_case_name)
+                if not EnkfFs.exists(full_case_name):
+                    EnkfFs.createFileSystem(full_case_name, self._fs_type, self._fs_arg)
 
-            new_fs = EnkfFs(full_case_name)
-            self._fs_rotator.addFileSystem(new_fs, full_case_name)
+                new_fs = EnkfFs(full_case_name)
+                self._fs_rotator.addFileSystem(new_fs, full_case_name)
 
-        fs = self._fs_rotator[full_case_name]
+            fs = self._fs_rotator[full_case_name]
 
         return fs
 
@@ -181,16 +354,71 @@ class EnkfFsManager(BaseCClass):
         """ Returns the currently selected file system
         @rtype: EnkfFs
         """
-        current_fs = self._get_current_fs()
-        case_name = current_fs.getCaseName()
-        full_name = self._createFullCaseName(self._mount_root, case_name)
+        with self._fs_lock:
+            current_fs = self._get_current_fs()
+            case_name = current_fs.getCaseName()
+            full_name = self._createFullCaseName(self._mount_root, case_name)
+
+            if full_name in self._fs_rotator:
+                self._fs_rotator.touch(full_name)
+            else:
+                self._fs_rotator.addFileSystem(current_fs, full_name)
+
+            # The current case is always kept mounted.
+            if self._current_case != full_name:
+                if self._current_case is not None:
+                    self._fs_rotator.unpin(self._current_case)
+                self._fs_rotator.pin(full_name)
+                self._current_case = full_name
+
+            return self._fs_rotator[full_name]
+
+    def pinFileSystem(self, case_name, mount_root=None):
+        """
+        Mounts the case, if it is not already mounted, and keeps it
+        mounted until unpinFileSystem() is called. Typically used for
+        the target case of an update.
+
+        @type case_name: str
+        @rtype: EnkfFs
+        """
+        fs = self.getFileSystem(case_name, mount_root)
+        if mount_root is None:
+            mount_root = self._mount_root
+        self._fs_rotator.pin(self._createFullCaseName(mount_root, case_name))
+        return fs
+
+    def unpinFileSystem(self, case_name, mount_root=None):
+        """ @type case_name: str """
+        if mount_root is None:
+            mount_root = self._mount_root
+        self._fs_rotator.unpin(self._createFullCaseName(mount_root, case_name))
+
+    def setCapacity(self, capacity, memory_budget=None):
+        """
+        Sets the maximum number of mounted cases, and optionally an
+        upper limit for the estimated memory usage in bytes.
+
+        @type capacity: int
+        @type memory_budget: int
+        """
+        self._fs_rotator.setCapacity(capacity, memory_budget)
 
-        if not full_name in self._fs_rotator:
-            self._fs_rotator.addFileSystem(current_fs, full_name)
+    def getCapacity(self):
+        """ @rtype: int """
+        return self._fs_rotator.getCapacity()
+
+    def getCacheStatistics(self):
+        """
+        The number of hits, misses and evictions in the cache of
+        mounted cases.
 
-        return self.getFileSystem(case_name, self._mount_root)
+        @rtype: dict[str, int]
+        """
+        return self._fs_rotator.getStatistics()
 
     def umount(self):
+        self._current_case = None
         self._fs_rotator.umountAll()
 
 
@@ -15,6 +15,7 @@
 #  for more details.
 import sys
 import ctypes, warnings
+import threading
 from os.path import isfile
 
 from cwrap import BaseCClass
@@ -195,6 +196,8 @@ class _RealEnKFMain(BaseCClass):
     _export_field_with_fs = ResPrototype("bool enkf_main_export_field_with_fs(enkf_main, char*, char*, bool_vector, enkf_field_file_format_enum, int, enkf_fs_manager)")
     _load_from_forward_model = ResPrototype("int enkf_main_load_from_forward_model_from_gui(enkf_main, int, bool_vector, enkf_fs)")
     _load_from_run_context = ResPrototype("int enkf_main_load_from_run_context_from_gui(enkf_main, ert_run_context, enkf_fs)")
+    _load_from_run_context_with_scheduler = ResPrototype("int enkf_main_load_from_run_context_with_scheduler(enkf_main, ert_run_context, enkf_fs, load_scheduler)")
+    _alloc_load_scheduler = ResPrototype("load_scheduler_obj enkf_main_alloc_load_scheduler(enkf_main)")
     _create_run_path = ResPrototype("void enkf_main_create_run_path(enkf_main , ert_run_context)")
     _icreate_run_path = ResPrototype("void enkf_main_icreate_run_path(enkf_main , run_arg, enkf_init_mode_enum)")
     _submit_simulation = ResPrototype("void enkf_main_isubmit_job(enkf_main , run_arg, job_queue)")
@@ -403,9 +406,48 @@ class _RealEnKFMain(BaseCClass):
         """Returns the number of loaded realizations"""
         return self._load_from_forward_model(iteration, realization, fs)
     
-    def loadFromRunContext(self, run_context, fs):
-        """Returns the number of loaded realizations"""
-        return self._load_from_run_context(run_context, fs)
+    def createLoadScheduler(self):
+        """Returns a LoadScheduler configured with LOAD_IO_THREADS and
+        LOAD_CPU_THREADS. @rtype: LoadScheduler"""
+        return self._alloc_load_scheduler()
+
+    def loadFromRunContext(self, run_context, fs, callback=None, scheduler=None, poll_interval=0.25):
+        """Returns the number of loaded realizations.
+
+        When @callback is given the load runs in a separate thread, and
+        callback(scheduler) is called every @poll_interval seconds while
+        loading, and once when the load is complete; the LoadScheduler
+        gives the progress and the per realization load times. An
+        exception raised by the load is re-raised in the calling thread.
+        A scheduler can be reused, its progress is reset for each load.
+        """
+        if callback is None and scheduler is None:
+            return self._load_from_run_context(run_context, fs)
+
+        if scheduler is None:
+            scheduler = self.createLoadScheduler()
+
+        if callback is None:
+            return self._load_from_run_context_with_scheduler(run_context, fs, scheduler)
+
+        result = {}
+
+        def load():
+            try:
+                result["loaded"] = self._load_from_run_context_with_scheduler(run_context, fs, scheduler)
+            except Exception as e:
+                result["error"] = e
+
+        load_thread = threading.Thread(target=load)
+        load_thread.start()
+        while load_thread.is_alive():
+            callback(scheduler)
+            load_thread.join(poll_interval)
+        callback(scheduler)
+
+        if "error" in result:
+            raise result["error"]
+        return result["loaded"]
 
     def initRun(self, run_context):
         self._init_run(run_context)
@@ -7,6 +7,7 @@ from .gen_data_observation_collector import GenDataObservationCollector
 from .misfit_collector import MisfitCollector
 from .custom_kw_collector import CustomKWCollector
 from .arg_loader import ArgLoader
+from .export_engine import ExportEngine
 
 __all__ = ["DesignMatrixReader",
            "SummaryCollector",
@@ -16,5 +17,6 @@ __all__ = ["DesignMatrixReader",
            "CustomKWCollector",
            "GenDataCollector", 
            "GenDataObservationCollector",
-           "ArgLoader"]
+           "ArgLoader",
+           "ExportEngine"]
 
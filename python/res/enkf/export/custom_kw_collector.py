@@ -27,14 +27,16 @@ class CustomKWCollector(object):
 
 
     @staticmethod
-    def loadAllCustomKWData(ert, case_name, keys=None):
+    def loadAllCustomKWData(ert, case_name, keys=None, fs=None):
         """
         @type ert: EnKFMain
         @type case_name: str
         @type keys: list of str
+        @type fs: EnkfFs
         @rtype: DataFrame
         """
-        fs = ert.getEnkfFsManager().getFileSystem(case_name)
+        if fs is None:
+            fs = ert.getEnkfFsManager().getFileSystem(case_name)
 
         realizations = fs.realizationList(RealizationStateEnum.STATE_HAS_DATA | RealizationStateEnum.STATE_INITIALIZED)
 
@@ -0,0 +1,265 @@
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+import numpy
+import pandas
+from pandas import DataFrame, MultiIndex
+
+from res.enkf.key_manager import KeyManager
+from .summary_collector import SummaryCollector
+from .gen_kw_collector import GenKwCollector
+from .gen_data_collector import GenDataCollector
+from .custom_kw_collector import CustomKWCollector
+from .misfit_collector import MisfitCollector
+
+
+class ExportEngine(object):
+    """
+    The ExportEngine loads many keys from one case and splits the work
+    over a pool of worker threads. All the heavy lifting happens in the
+    C library, which releases the GIL while reading from storage, and the
+    block_fs read path only serializes the actual fread, so the reads
+    from the different workers will run concurrently.
+
+    Separate processes can not be used as workers because the EnKFMain
+    instance, and the mounted file systems, can not be shared between
+    processes.
+
+    The keys are split in contiguous chunks, one per worker, and the
+    results are assembled in the same key order as the input list.
+    """
+
+    def __init__(self, ert, num_workers=None):
+        """
+        @type ert: res.enkf.EnKFMain
+        @type num_workers: int
+        """
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count()
+
+        if num_workers < 1:
+            raise ValueError("The number of workers must be at least one - got: %d" % num_workers)
+
+        self._ert = ert
+        self._num_workers = num_workers
+        self._key_manager = KeyManager(ert)
+
+    def getNumWorkers(self):
+        """ @rtype: int """
+        return self._num_workers
+
+    def _partition(self, count):
+        """ @rtype: list of (int, int) """
+        num_chunks = min(self._num_workers, count)
+        chunks = []
+        for chunk_index in range(num_chunks):
+            start = (count * chunk_index) // num_chunks
+            stop = (count * (chunk_index + 1)) // num_chunks
+            chunks.append((start, stop))
+
+        return chunks
+
+    def _map(self, func, count):
+        chunks = self._partition(count)
+        if len(chunks) <= 1:
+            return [func(chunk) for chunk in chunks]
+
+        pool = ThreadPool(len(chunks))
+        try:
+            return pool.map(func, chunks)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _getFileSystem(self, case_name):
+        # The case is mounted from the calling thread and the fs is
+        # handed to the workers, they never go through the fs manager.
+        return self._ert.getEnkfFsManager().getFileSystem(case_name)
+
+    @staticmethod
+    def _filterKeys(keys, valid_keys):
+        if keys is None:
+            return list(valid_keys)
+
+        valid_keys = set(valid_keys)
+        return [key for key in keys if key in valid_keys] # ignore keys that doesn't exist
+
+    def loadSummaryData(self, case_name, keys=None):
+        """
+        Same result as SummaryCollector.loadAllSummaryData().
+
+        @type case_name: str
+        @type keys: list of str
+        @rtype: DataFrame
+        """
+        fs = self._getFileSystem(case_name)
+
+        time_map = fs.getTimeMap()
+        dates = [time_map[index].datetime() for index in range(1, len(time_map))]
+        realizations = SummaryCollector.createActiveList(self._ert, fs)
+        summary_keys = self._filterKeys(keys, self._key_manager.summaryKeys())
+
+        shape = (len(summary_keys), len(realizations), len(dates))
+        summary_array = numpy.empty(shape=shape, dtype=numpy.float64)
+        active_array = numpy.empty(shape=shape, dtype=numpy.bool_)
+
+        def load(chunk):
+            start, stop = chunk
+            SummaryCollector.loadSummaryArray(self._ert, fs, summary_keys[start:stop], realizations, len(dates),
+                                              summary_array[start:stop], active_array[start:stop])
+
+        self._map(load, len(summary_keys))
+
+        summary_array = summary_array.reshape(len(summary_keys), len(realizations) * len(dates))
+        multi_index = MultiIndex.from_product([realizations, dates], names=["Realization", "Date"])
+        return DataFrame(data=numpy.transpose(summary_array), index=multi_index, columns=summary_keys)
+
+    def loadGenKwData(self, case_name, keys=None):
+        """
+        Same result as GenKwCollector.loadAllGenKwData().
+
+        @type case_name: str
+        @type keys: list of str
+        @rtype: DataFrame
+        """
+        fs = self._getFileSystem(case_name)
+        gen_kw_keys = self._filterKeys(keys, self._key_manager.genKwKeys())
+
+        def load(chunk):
+            start, stop = chunk
+            return GenKwCollector.loadAllGenKwData(self._ert, case_name, gen_kw_keys[start:stop], fs=fs)
+
+        frames = self._map(load, len(gen_kw_keys))
+        if len(frames) == 0:
+            return GenKwCollector.loadAllGenKwData(self._ert, case_name, [], fs=fs)
+
+        return pandas.concat(frames, axis=1)
+
+    def loadCustomKWData(self, case_name, keys=None):
+        """
+        Same result as CustomKWCollector.loadAllCustomKWData().
+
+        @type case_name: str
+        @type keys: list of str
+        @rtype: DataFrame
+        """
+        fs = self._getFileSystem(case_name)
+        custom_kw_keys = self._filterKeys(keys, self._key_manager.customKwKeys())
+
+        def load(chunk):
+            start, stop = chunk
+            return CustomKWCollector.loadAllCustomKWData(self._ert, case_name, custom_kw_keys[start:stop], fs=fs)
+
+        frames = self._map(load, len(custom_kw_keys))
+        if len(frames) == 0:
+            return CustomKWCollector.loadAllCustomKWData(self._ert, case_name, [], fs=fs)
+
+        return pandas.concat(frames, axis=1)[custom_kw_keys]
+
+    def loadMisfitData(self, case_name):
+        """
+        Same result as MisfitCollector.loadAllMisfitData(); the
+        observations are distributed over the workers.
+
+        @type case_name: str
+        @rtype: DataFrame
+        """
+        fs = self._getFileSystem(case_name)
+
+        realizations = MisfitCollector.createActiveList(self._ert, fs)
+        misfit_keys = MisfitCollector.getAllMisfitKeys(self._ert, sort_keys=False)
+        observations = [obs_vector for obs_vector in self._ert.getObservations()]
+
+        misfit_array = numpy.empty(shape=(len(misfit_keys), len(realizations)), dtype=numpy.float64)
+
+        def load(chunk):
+            start, stop = chunk
+            for column_index in range(start, stop):
+                obs_vector = observations[column_index]
+                for realization_index, realization_number in enumerate(realizations):
+                    misfit_array[column_index][realization_index] = obs_vector.getTotalChi2(fs, realization_number)
+
+        self._map(load, len(observations))
+        misfit_array[len(misfit_keys) - 1] = numpy.sum(misfit_array[:len(observations)], axis=0)
+
+        misfit_data = DataFrame(data=numpy.transpose(misfit_array), index=realizations, columns=misfit_keys)
+        misfit_data.index.name = "Realization"
+
+        return misfit_data
+
+    def loadGenData(self, case_name, keys):
+        """
+        Loads several GEN_DATA keys of the form KEY@report_step. The
+        frames from GenDataCollector.loadGenData() are assembled into
+        one DataFrame where the rows are indexed with (key, data index)
+        and the realizations run along the columns.
+
+        @type case_name: str
+        @type keys: list of str
+        @rtype: DataFrame
+        """
+        fs = self._getFileSystem(case_name)
+        gen_data_keys = self._filterKeys(keys, self._key_manager.genDataKeys())
+
+        def load(chunk):
+            start, stop = chunk
+            frames = []
+            for gen_data_key in gen_data_keys[start:stop]:
+                key, report_step = gen_data_key.split("@")
+                frames.append(GenDataCollector.loadGenData(self._ert, case_name, key, int(report_step), fs=fs))
+            return frames
+
+        frames = [frame for chunk_frames in self._map(load, len(gen_data_keys)) for frame in chunk_frames]
+        if len(frames) == 0:
+            return DataFrame()
+
+        return pandas.concat(frames, keys=gen_data_keys, names=["Key", "Index"])
+
+    def loadCaseData(self, case_name, keys=None):
+        """
+        Loads GEN_KW, CUSTOM_KW, misfit and summary data for one case
+        and joins them into one DataFrame indexed with the realization
+        number, and the date when summary data is included. If the keys
+        argument is given only the listed keys are loaded; misfit keys
+        are included if any MISFIT: key is listed.
+
+        @type case_name: str
+        @type keys: list of str
+        @rtype: DataFrame
+        """
+        key_manager = self._key_manager
+        load_misfit = keys is None or any(key_manager.isMisfitKey(key) for key in keys)
+
+        case_data = self.loadGenKwData(case_name, keys)
+
+        custom_kw_data = self.loadCustomKWData(case_name, keys)
+        if not custom_kw_data.empty:
+            case_data = case_data.join(custom_kw_data, how='outer')
+
+        if load_misfit:
+            misfit_data = self.loadMisfitData(case_name)
+            if keys is not None:
+                misfit_data = misfit_data[self._filterKeys(keys, misfit_data.columns)]
+
+            if not misfit_data.empty:
+                case_data = case_data.join(misfit_data, how='outer')
+
+        summary_data = self.loadSummaryData(case_name, keys)
+        if not summary_data.empty:
+            case_data = case_data.join(summary_data, how='outer')
+
+        return case_data
+
+    def exportCaseData(self, case_name, output_file, keys=None):
+        """
+        Will load the case data with loadCaseData() and write it as CSV
+        to output_file.
+
+        @type case_name: str
+        @type output_file: str
+        @type keys: list of str
+        @rtype: DataFrame
+        """
+        case_data = self.loadCaseData(case_name, keys)
+        case_data.to_csv(output_file)
+        return case_data
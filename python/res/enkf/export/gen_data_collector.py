@@ -9,18 +9,20 @@ from ecl.util.util import BoolVector
 class GenDataCollector(object):
 
     @staticmethod
-    def loadGenData(ert, case_name, key, report_step):
+    def loadGenData(ert, case_name, key, report_step, fs=None):
         """@type ert: EnKFMain
         @type case_name: str
         @type key: str
         @type report_step: int
+        @type fs: EnkfFs
         @rtype: DataFrame
 
         In the returned dataframe the realisation index runs along the
         rows, and the gen_data element index runs vertically along the
         columns.
         """
-        fs = ert.getEnkfFsManager().getFileSystem(case_name)
+        if fs is None:
+            fs = ert.getEnkfFsManager().getFileSystem(case_name)
         realizations = fs.realizationList( RealizationStateEnum.STATE_HAS_DATA )
         config_node = ert.ensembleConfig().getNode(key)
         gen_data_config = config_node.getModelConfig()
@@ -25,14 +25,16 @@ class GenKwCollector(object):
         return key_manager.genKwKeys()
 
     @staticmethod
-    def loadAllGenKwData(ert, case_name, keys=None):
+    def loadAllGenKwData(ert, case_name, keys=None, fs=None):
         """
         @type ert: EnKFMain
         @type case_name: str
         @type keys: list of str
+        @type fs: EnkfFs
         @rtype: DataFrame
         """
-        fs = ert.getEnkfFsManager().getFileSystem(case_name)
+        if fs is None:
+            fs = ert.getEnkfFsManager().getFileSystem(case_name)
 
         realizations = GenKwCollector.createActiveList(ert, fs)
 
@@ -39,10 +39,24 @@ class MisfitCollector(object):
         misfit_array.fill(numpy.nan)
         misfit_array[misfit_sum_index] = 0.0
 
-        for column_index, obs_vector in enumerate(ert.getObservations()):
+        # The totals are read from the misfit ensemble of the case when it
+        # is valid for the current observations; the chi2 is only evaluated
+        # for the realizations which are missing data in the misfit ensemble.
+        enkf_obs = ert.getObservations()
+        misfit_ensemble = fs.getMisfitEnsemble()
+        if not misfit_ensemble.isValid(enkf_obs, ert.getEnsembleSize(), ert.getHistoryLength()):
+            misfit_ensemble = None
+
+        for column_index, obs_vector in enumerate(enkf_obs):
+            obs_key = obs_vector.getObservationKey()
 
             for realization_index, realization_number in enumerate(realizations):
-                misfit = obs_vector.getTotalChi2(fs, realization_number)
+                misfit = numpy.nan
+                if misfit_ensemble is not None:
+                    misfit = misfit_ensemble.getTotalChi2(obs_key, realization_number)
+
+                if numpy.isnan(misfit):
+                    misfit = obs_vector.getTotalChi2(fs, realization_number)
 
                 misfit_array[column_index][realization_index] = misfit
                 misfit_array[misfit_sum_index][realization_index] += misfit
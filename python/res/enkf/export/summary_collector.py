@@ -23,6 +23,39 @@ class SummaryCollector(object):
         key_manager = KeyManager(ert)
         return key_manager.summaryKeys()
 
+    @staticmethod
+    def loadSummaryArray(ert, fs, summary_keys, realizations, num_steps, data=None, active=None):
+        """
+        Bulk load of summary data into numpy arrays of shape
+        (len(summary_keys), len(realizations), num_steps), where step j
+        corresponds to report step j + 1. The data and active arrays can
+        optionally be supplied by the caller; the filled arrays are
+        returned as the tuple (data, active). Inactive values are NaN.
+
+        @type ert: EnKFMain
+        @type fs: EnkfFs
+        @type summary_keys: list of str
+        @type realizations: list of int
+        @type num_steps: int
+        @rtype: (numpy.ndarray, numpy.ndarray)
+        """
+        shape = (len(summary_keys), len(realizations), num_steps)
+        if data is None:
+            data = numpy.empty(shape=shape, dtype=numpy.float64)
+
+        if active is None:
+            active = numpy.empty(shape=shape, dtype=numpy.bool_)
+
+        if data.shape != shape or active.shape != shape:
+            raise ValueError("The data and active arrays must have shape %s" % str(shape))
+
+        for key_index, key in enumerate(summary_keys):
+            ensemble_config_node = ert.ensembleConfig().getNode(key)
+            EnsemblePlotData.loadSummaryBuffer(ensemble_config_node, fs, realizations,
+                                               data[key_index], active[key_index], step1=1)
+
+        return data, active
+
     @staticmethod
     def loadAllSummaryData(ert, case_name, keys=None):
         """
@@ -41,25 +74,8 @@ class SummaryCollector(object):
         if keys is not None:
             summary_keys = [key for key in keys if key in summary_keys] # ignore keys that doesn't exist
 
-        summary_array = numpy.empty(shape=(len(summary_keys), len(realizations) * len(dates)), dtype=numpy.float64)
-        summary_array.fill(numpy.nan)
-
-        for key_index, key in enumerate(summary_keys):
-            ensemble_config_node = ert.ensembleConfig().getNode(key)
-            ensemble_data = EnsemblePlotData(ensemble_config_node, fs)
-            summary_row = summary_array[key_index]
-
-            for realization_index, realization_number in enumerate(realizations):
-                realization_vector = ensemble_data[realization_number]
-                column_index = realization_index * len(dates)
-
-                for index in range(1, len(realization_vector)):
-                    if realization_vector.isActive(index):
-                        # assert time_map[index] == realization_vector.getTime(index)
-                        # assert time_map[index].datetime() == dates[index - 1]
-                        value = realization_vector.getValue(index)
-                        summary_row[column_index + index - 1] = value
-
+        summary_array, _ = SummaryCollector.loadSummaryArray(ert, fs, summary_keys, realizations, len(dates))
+        summary_array = summary_array.reshape(len(summary_keys), len(realizations) * len(dates))
 
         multi_index = MultiIndex.from_product([realizations, dates], names=["Realization", "Date"])
         summary_data = DataFrame(data=numpy.transpose(summary_array), index=multi_index, columns=summary_keys)
@@ -0,0 +1,89 @@
+#  Copyright (C) 2019  Equinor ASA, Norway.
+#
+#  The file 'load_scheduler.py' is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+from cwrap import BaseCClass
+from res import ResPrototype
+
+
+class LoadScheduler(BaseCClass):
+    """Limits how many realizations are reading forward model results (io)
+    and internalizing them (cpu) at the same time while loading, and keeps
+    track of the progress and the time each realization spent in the two
+    phases. The progress can be queried from another thread while the
+    load is running, see EnKFMain.loadFromRunContext().
+    """
+    TYPE_NAME = "load_scheduler"
+
+    _alloc             = ResPrototype("void* load_scheduler_alloc(int, int, int)", bind=False)
+    _free              = ResPrototype("void  load_scheduler_free(load_scheduler)")
+    _get_ens_size      = ResPrototype("int   load_scheduler_get_ens_size(load_scheduler)")
+    _get_io_threads    = ResPrototype("int   load_scheduler_get_io_threads(load_scheduler)")
+    _get_cpu_threads   = ResPrototype("int   load_scheduler_get_cpu_threads(load_scheduler)")
+    _get_num_jobs      = ResPrototype("int   load_scheduler_get_num_jobs(load_scheduler)")
+    _get_num_complete  = ResPrototype("int   load_scheduler_get_num_complete(load_scheduler)")
+    _iget_complete     = ResPrototype("bool  load_scheduler_iget_complete(load_scheduler, int)")
+    _iget_io_time      = ResPrototype("double load_scheduler_iget_io_time(load_scheduler, int)")
+    _iget_cpu_time     = ResPrototype("double load_scheduler_iget_cpu_time(load_scheduler, int)")
+
+    def __init__(self, ens_size, io_threads, cpu_threads):
+        if io_threads <= 0 or cpu_threads <= 0:
+            raise ValueError("The number of io and cpu threads must be positive")
+
+        c_ptr = self._alloc(ens_size, io_threads, cpu_threads)
+        super(LoadScheduler, self).__init__(c_ptr)
+
+    def __len__(self):
+        return self._get_ens_size()
+
+    def getIoThreads(self):
+        """ @rtype: int """
+        return self._get_io_threads()
+
+    def getCpuThreads(self):
+        """ @rtype: int """
+        return self._get_cpu_threads()
+
+    def getNumJobs(self):
+        """Number of realizations which have been scheduled for loading. @rtype: int"""
+        return self._get_num_jobs()
+
+    def getNumComplete(self):
+        """Number of realizations which have been loaded. @rtype: int"""
+        return self._get_num_complete()
+
+    def isComplete(self, iens):
+        """ @rtype: bool """
+        return self._iget_complete(self._check_index(iens))
+
+    def getLoadTimes(self, iens):
+        """Returns the time in seconds realization @iens spent reading
+        results and internalizing them, as a tuple (io_time, cpu_time).
+        """
+        iens = self._check_index(iens)
+        return (self._iget_io_time(iens), self._iget_cpu_time(iens))
+
+    def _check_index(self, iens):
+        ens_size = len(self)
+        if not 0 <= iens < ens_size:
+            raise IndexError("Invalid realization:%d - ensemble size:%d" % (iens, ens_size))
+        return iens
+
+    def free(self):
+        self._free()
+
+    def __repr__(self):
+        return self._create_repr('io_threads=%d, cpu_threads=%d, complete=%d/%d' %
+                                 (self.getIoThreads(), self.getCpuThreads(),
+                                  self.getNumComplete(), self.getNumJobs()))
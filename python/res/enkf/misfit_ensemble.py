@@ -0,0 +1,50 @@
+#  Copyright (C) 2019  Equinor ASA, Norway.
+#
+#  The file 'misfit_ensemble.py' is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+from cwrap import BaseCClass
+from res import ResPrototype
+
+
+class MisfitEnsemble(BaseCClass):
+    TYPE_NAME = "misfit_ensemble"
+
+    _is_valid       = ResPrototype("bool   misfit_ensemble_is_valid(misfit_ensemble, enkf_obs, int, int)")
+    _get_ens_size   = ResPrototype("int    misfit_ensemble_get_ens_size(misfit_ensemble)")
+    _get_total_chi2 = ResPrototype("double misfit_ensemble_get_total_chi2(misfit_ensemble, char*, int)")
+
+    def __init__(self):
+        raise NotImplementedError("Class can not be instantiated directly!")
+
+    def isValid(self, enkf_obs, ens_size, history_length):
+        """
+        Whether the misfit ensemble has been calculated from the given
+        observations, ensemble size and history length.
+
+        @type enkf_obs: EnkfObs
+        @rtype: bool
+        """
+        return self._is_valid(enkf_obs, ens_size, history_length)
+
+    def __len__(self):
+        return self._get_ens_size()
+
+    def getTotalChi2(self, obs_key, iens):
+        """
+        The chi2 of the observation summed over all report steps; nan if
+        the data of the realization was not available for all steps.
+
+        @rtype: float
+        """
+        return self._get_total_chi2(obs_key, iens)
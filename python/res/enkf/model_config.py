@@ -31,6 +31,10 @@ class ModelConfig(BaseCClass):
     _get_forward_model           = ResPrototype("forward_model_ref model_config_get_forward_model(model_config)")
     _get_max_internal_submit     = ResPrototype("int   model_config_get_max_internal_submit(model_config)")
     _set_max_internal_submit     = ResPrototype("void  model_config_set_max_internal_submit(model_config, int)")
+    _get_load_io_threads         = ResPrototype("int   model_config_get_load_io_threads(model_config)")
+    _set_load_io_threads         = ResPrototype("void  model_config_set_load_io_threads(model_config, int)")
+    _get_load_cpu_threads        = ResPrototype("int   model_config_get_load_cpu_threads(model_config)")
+    _set_load_cpu_threads        = ResPrototype("void  model_config_set_load_cpu_threads(model_config, int)")
     _get_runpath_as_char         = ResPrototype("char* model_config_get_runpath_as_char(model_config)")
     _select_runpath              = ResPrototype("bool  model_config_select_runpath(model_config, char*)")
     _set_runpath                 = ResPrototype("void  model_config_set_runpath(model_config, char*)")
@@ -84,6 +88,20 @@ class ModelConfig(BaseCClass):
     def set_max_internal_submit(self, max_value):
         self._get_max_internal_submit(max_value)
 
+    def get_load_io_threads(self):
+        """ @rtype: int """
+        return self._get_load_io_threads()
+
+    def set_load_io_threads(self, load_io_threads):
+        self._set_load_io_threads(load_io_threads)
+
+    def get_load_cpu_threads(self):
+        """ @rtype: int """
+        return self._get_load_cpu_threads()
+
+    def set_load_cpu_threads(self, load_cpu_threads):
+        self._set_load_cpu_threads(load_cpu_threads)
+
     def getForwardModel(self):
         """ @rtype: ForwardModel """
         return self._get_forward_model().setParent(self)
@@ -36,6 +36,8 @@ class ObsData(BaseCClass):
     _add_block     = ResPrototype("obs_block_ref obs_data_add_block(obs_data , char* , int , matrix , bool)")
     _allocdObs     = ResPrototype("matrix_obj obs_data_allocdObs(obs_data)")
     _allocR        = ResPrototype("matrix_obj obs_data_allocR(obs_data)")
+    _alloc_diagR   = ResPrototype("matrix_obj obs_data_alloc_diagR(obs_data)")
+    _has_diagonal_R = ResPrototype("bool  obs_data_has_diagonal_R(obs_data)")
     _allocD        = ResPrototype("matrix_obj obs_data_allocD(obs_data , matrix , matrix)")
     _allocE        = ResPrototype("matrix_obj obs_data_allocE(obs_data , rng , int)")
 
@@ -82,6 +84,21 @@ class ObsData(BaseCClass):
         """ @rtype: Matrix """
         return self._allocR()
 
+    def hasDiagonalR(self):
+        """ @rtype: bool """
+        return self._has_diagonal_R()
+
+    def createDiagonalR(self):
+        """
+        The diagonal of R as an active_size x 1 matrix; only valid when
+        hasDiagonalR() is True.
+
+        @rtype: Matrix
+        """
+        if not self.hasDiagonalR():
+            raise ValueError("The observation errors are correlated - use createR()")
+        return self._alloc_diagR()
+
     def createD(self , E , S):
         """ @rtype: Matrix """
         return self._allocD(E , S)
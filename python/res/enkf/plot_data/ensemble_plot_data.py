@@ -1,8 +1,10 @@
+import ctypes
+import numpy
 from cwrap import BaseCClass
 from res import ResPrototype
 from res.enkf.config import EnkfConfigNode
 from res.enkf.enkf_fs import EnkfFs
-from ecl.util.util import BoolVector
+from ecl.util.util import BoolVector, IntVector
 
 
 class EnsemblePlotData(BaseCClass):
@@ -13,6 +15,7 @@ class EnsemblePlotData(BaseCClass):
     _size  = ResPrototype("int   enkf_plot_data_get_size(ensemble_plot_data)")
     _get   = ResPrototype("ensemble_plot_data_vector_ref enkf_plot_data_iget(ensemble_plot_data, int)")
     _free  = ResPrototype("void  enkf_plot_data_free(ensemble_plot_data)")
+    _load_summary_buffer = ResPrototype("void enkf_plot_data_load_summary_buffer(enkf_config_node, enkf_fs, int_vector, int, int, double*, bool*)", bind = False)
 
 
     def __init__(self, ensemble_config_node, file_system=None, user_index=None, input_mask=None):
@@ -47,6 +50,47 @@ class EnsemblePlotData(BaseCClass):
             cur += 1
 
 
+    @classmethod
+    def loadSummaryBuffer(cls, ensemble_config_node, file_system, realizations, data, active, step1=0):
+        """
+        Will load the summary vectors of all the given realizations in
+        one call. The data and active arguments should be C contiguous
+        numpy arrays of shape (len(realizations), num_steps) and dtype
+        float64 and bool respectively; element [i, j] is filled with the
+        value for realizations[i] at report step step1 + j. Inactive
+        elements are set to NaN in the data array.
+
+        @type ensemble_config_node: EnkfConfigNode
+        @type file_system: EnkfFs
+        @type realizations: list of int
+        @type data: numpy.ndarray
+        @type active: numpy.ndarray
+        """
+        assert isinstance(ensemble_config_node, EnkfConfigNode)
+        assert isinstance(file_system, EnkfFs)
+
+        if data.dtype != numpy.float64 or not data.flags["C_CONTIGUOUS"] or not data.flags["WRITEABLE"]:
+            raise ValueError("The data buffer must be a writeable, C contiguous array of float64")
+
+        if active.dtype != numpy.bool_ or not active.flags["C_CONTIGUOUS"] or not active.flags["WRITEABLE"]:
+            raise ValueError("The active buffer must be a writeable, C contiguous array of bool")
+
+        if data.ndim != 2 or data.shape != active.shape or data.shape[0] != len(realizations):
+            raise ValueError("The data and active buffers must have shape (%d, num_steps)" % len(realizations))
+
+        iens_list = IntVector()
+        for iens in realizations:
+            iens_list.append(iens)
+
+        cls._load_summary_buffer(ensemble_config_node,
+                                 file_system,
+                                 iens_list,
+                                 step1,
+                                 data.shape[1],
+                                 data.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+                                 active.ctypes.data_as(ctypes.POINTER(ctypes.c_bool)))
+
+
     def free(self):
         self._free()
 
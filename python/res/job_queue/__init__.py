@@ -91,4 +91,5 @@ from .workflow_joblist import WorkflowJoblist
 from .workflow import Workflow
 from .workflow_runner import WorkflowRunner
 
+from .message_sender import MessageSender
 from .job_manager import JobManager, assert_file_executable
@@ -24,12 +24,11 @@ import time
 import subprocess
 import socket
 import pwd
-import requests
 import json
 import imp
 from ecl import EclVersion
 from res import ResVersion
-from res.job_queue import ForwardModelStatus, ForwardModelJobStatus
+from res.job_queue import ForwardModelStatus, ForwardModelJobStatus, MessageSender
 from sys import version as sys_version
 
 def redirect(file, fd, open_mode):
@@ -126,6 +125,7 @@ class JobManager(object):
 
     DEFAULT_UMASK =  0
     sleep_time    =  10  # Time to sleep before exiting the script - to let the disks sync up.
+    flush_timeout =  10  # Max time to wait for queued log messages to be posted before exiting; the rest are spooled.
 
 
 
@@ -136,6 +136,7 @@ class JobManager(object):
         self._log_url = log_url
         if log_url is None:
             self._log_url = error_url
+        self._message_senders = {}
         self._data_root = None
         self.global_environment = None
         self.global_update_path = None
@@ -158,8 +159,8 @@ class JobManager(object):
         ecl_v = EclVersion()
         res_v = ResVersion()
         logged_fields= {"status": "init",
-                        "python_sys_path": map(pad_nonexisting, sys.path),
-                        "pythonpath": map(pad_nonexisting, os.environ.get('PYTHONPATH', '').split(':')),
+                        "python_sys_path": list(map(pad_nonexisting, sys.path)),
+                        "pythonpath": list(map(pad_nonexisting, os.environ.get('PYTHONPATH', '').split(':'))),
                         "res_version": res_v.versionString(),
                         "ecl_version": ecl_v.versionString(),
                         "LSB_ID": os_info.get('LSB_ID', ''),
@@ -314,6 +315,7 @@ class JobManager(object):
         with open(self.OK_file, "w") as f:
             f.write("All jobs complete %02d:%02d:%02d \n" % (now.tm_hour, now.tm_min, now.tm_sec))
         self.postMessage(extra_fields={"status" : "OK"})
+        self.flushMessages()
         time.sleep(self.sleep_time)   # Let the disks sync up
 
 
@@ -402,7 +404,28 @@ class JobManager(object):
         return P
 
 
+    def _getMessageSender(self, url):
+        if url not in self._message_senders:
+            self._message_senders[url] = MessageSender(url)
+        return self._message_senders[url]
+
+    def flushMessages(self, timeout=None):
+        """
+        Waits for the queued log messages to be posted, or spooled. The
+        messages which are still undelivered after @timeout seconds are
+        spooled by the MessageSender before returning.
+        """
+        if timeout is None:
+            timeout = self.flush_timeout
+        for sender in self._message_senders.values():
+            sender.flush(timeout)
+
     def postMessage(self, job=None, extra_fields={}, url=None):
+        """
+        The message is posted asynchronously by a MessageSender, this
+        method will not block even if the log endpoint is slow or
+        unreachable.
+        """
         if url is None:
             url=self._log_url
         if job:
@@ -430,21 +453,7 @@ class JobManager(object):
                 sys.stderr.write('\nAbove error log NOT submitted.')
                 sys.stderr.flush()
             else:
-                data = json.dumps(payload)
-                #Disabling proxies
-                proxies = {
-                    "http": None,
-                    "https": None,
-                }
-                res = requests.post(url, timeout=3,
-                              headers={"Content-Type": "application/json"},
-                                    data=data,proxies=proxies)
-                # sys.stdout.write("Response status %s\n"%res.status_code)
-                # sys.stdout.write("Request url %s\n"%res.url)
-                # sys.stdout.write("Response headers %s\n"%res.headers)
-                # sys.stdout.write("Response content %s\n"%res.content)
-                # sys.stdout.write("Writing payload: %s\n"%payload)
-                # sys.stdout.write("Writing data: %s\n"%data)
+                self._getMessageSender(url).post(payload)
         except:
             pass
 
@@ -472,6 +481,7 @@ class JobManager(object):
         std_err_out = self.extract_stderr_stdout(job)
         std_err_out.update({"status": "exit","finished": True, "error_msg": error_msg, "exit_status": exit_status, "error": True})
         self.postMessage(job=job, extra_fields=std_err_out) #Posts to new logstash
+        self.flushMessages()
         pgid = os.getpgid(os.getpid())
         os.killpg(pgid, signal.SIGKILL)
 
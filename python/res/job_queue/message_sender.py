@@ -0,0 +1,231 @@
+#  Copyright (C) 2019  Equinor ASA, Norway.
+#
+#  The file 'message_sender.py' is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+
+import atexit
+import gzip
+import io
+import json
+import os
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+import requests
+
+
+class MessageSender(object):
+    """
+    Posts the status messages from the forward model to the log
+    endpoint from a background thread, so that the forward model is
+    never blocked by a slow or unreachable endpoint.
+
+    The messages are collected in batches of at most @batch_size
+    messages, or whatever has arrived within @batch_interval seconds,
+    and posted as one gzip compressed JSON list. A failed post is
+    retried @max_retries times with exponential backoff starting at
+    @backoff seconds; if the endpoint is still unreachable the batch is
+    appended to the @spool_file, one JSON message per line, and the
+    spooled messages are posted again together with the next batch
+    which gets through. The messages which have not been delivered when
+    flush() times out are spooled, so nothing is lost when the process
+    exits; a batch which was being posted at the time may end up being
+    posted twice.
+    """
+
+    # Disabling proxies
+    PROXIES = {"http": None, "https": None}
+
+    def __init__(self, url, batch_size=32, batch_interval=1.0, timeout=3,
+                 max_retries=3, backoff=0.5, spool_file="LOG_SPOOL"):
+        if batch_size < 1:
+            raise ValueError("The batch size must be at least one - got: %d" % batch_size)
+
+        self._url = url
+        self._batch_size = batch_size
+        self._batch_interval = batch_interval
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._spool_file = os.path.abspath(spool_file) if spool_file else None
+
+        self._queue = queue.Queue()
+        self._pending = None
+        self._posted_count = 0
+        self._spooled_count = 0
+        self._lock = threading.Lock()
+        self._spool_lock = threading.Lock()
+
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def post(self, payload):
+        """
+        Queues the @payload dictionary for posting; returns immediately.
+        The payload is serialized here, i.e. a payload which can not be
+        serialized to JSON will raise a TypeError in the calling thread.
+        """
+        self._queue.put(json.dumps(payload))
+
+    def flush(self, timeout=10):
+        """
+        Waits until all the queued messages have been posted or spooled,
+        or until @timeout seconds have passed. Returns True if the queue
+        was emptied; on timeout the undelivered messages are spooled
+        before returning False.
+        """
+        end_time = time.time() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    break
+                self._queue.all_tasks_done.wait(remaining)
+            else:
+                return True
+
+        self._spoolUndelivered()
+        return False
+
+    def getStatistics(self):
+        """ @rtype: dict """
+        with self._lock:
+            return {"posted": self._posted_count,
+                    "spooled": self._spooled_count,
+                    "queued": self._queue.qsize()}
+
+    def _nextBatch(self):
+        batch = [self._queue.get()]
+        end_time = time.time() + self._batch_interval
+        while len(batch) < self._batch_size:
+            remaining = end_time - time.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    @staticmethod
+    def _compress(messages):
+        data = ("[" + ",".join(messages) + "]").encode("utf-8")
+        buffer_ = io.BytesIO()
+        with gzip.GzipFile(fileobj=buffer_, mode="wb") as gzip_file:
+            gzip_file.write(data)
+        return buffer_.getvalue()
+
+    def _send(self, messages):
+        data = self._compress(messages)
+        headers = {"Content-Type": "application/json",
+                   "Content-Encoding": "gzip"}
+
+        delay = self._backoff
+        for attempt in range(self._max_retries + 1):
+            if attempt > 0:
+                time.sleep(delay)
+                delay *= 2
+            try:
+                response = requests.post(self._url, timeout=self._timeout, headers=headers,
+                                         data=data, proxies=self.PROXIES)
+                if response.status_code < 400:
+                    return True
+            except Exception:
+                pass
+
+        return False
+
+    def _loadSpool(self):
+        messages = []
+        with self._spool_lock:
+            if self._spool_file and os.path.isfile(self._spool_file):
+                with open(self._spool_file, "r") as spool:
+                    for line in spool:
+                        line = line.strip()
+                        if line:
+                            messages.append(line)
+        return messages
+
+    def _dropSpooled(self, count):
+        # Messages may have been spooled by flush() while the first
+        # @count were being posted; only those are removed.
+        with self._spool_lock:
+            with open(self._spool_file, "r") as spool:
+                lines = [line for line in spool if line.strip()]
+
+            if len(lines) > count:
+                with open(self._spool_file, "w") as spool:
+                    spool.writelines(lines[count:])
+            else:
+                os.unlink(self._spool_file)
+
+    def _spool(self, messages):
+        if self._spool_file:
+            with self._spool_lock:
+                with open(self._spool_file, "a") as spool:
+                    for message in messages:
+                        spool.write(message + "\n")
+
+        with self._lock:
+            self._spooled_count += len(messages)
+
+    def _spoolUndelivered(self):
+        with self._lock:
+            messages = self._pending or []
+            self._pending = None
+
+        while True:
+            try:
+                messages.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+            self._queue.task_done()
+
+        if messages:
+            self._spool(messages)
+
+    def _run(self):
+        while True:
+            batch = self._nextBatch()
+            with self._lock:
+                self._pending = list(batch)
+            try:
+                spooled = self._loadSpool()
+                sent = self._send(spooled + batch)
+                with self._lock:
+                    # None if flush() has spooled the batch in the meantime.
+                    pending = self._pending
+                    self._pending = None
+
+                if sent:
+                    if spooled:
+                        self._dropSpooled(len(spooled))
+                    with self._lock:
+                        self._posted_count += len(spooled) + len(batch)
+                elif pending is not None:
+                    self._spool(batch)
+            except Exception:
+                pass
+            finally:
+                with self._lock:
+                    self._pending = None
+                for _ in batch:
+                    self._queue.task_done()
@@ -65,9 +65,16 @@ class JobQueue(BaseCClass):
     _submit_complete      = ResPrototype("void job_queue_submit_complete( job_queue )")
     _iget_sim_start       = ResPrototype("time_t job_queue_iget_sim_start( job_queue , int)")
     _get_active_size      = ResPrototype("int  job_queue_get_active_size( job_queue )")
+    _add_job              = ResPrototype("int  job_queue_add_job( job_queue , char* , void* , void* , void* , void* , int , char* , char* , int , void*)")
     _get_pause            = ResPrototype("bool job_queue_get_pause(job_queue)")
     _set_pause_on         = ResPrototype("void job_queue_set_pause_on(job_queue)")
     _set_pause_off        = ResPrototype("void job_queue_set_pause_off(job_queue)")
+    _sweep_count          = ResPrototype("int    job_queue_get_sweep_count(job_queue)")
+    _sweep_time           = ResPrototype("double job_queue_get_sweep_time(job_queue)")
+    _max_sweep_time       = ResPrototype("double job_queue_get_max_sweep_time(job_queue)")
+    _transition_count     = ResPrototype("int    job_queue_get_transition_count(job_queue)")
+    _transition_latency   = ResPrototype("double job_queue_get_transition_latency(job_queue)")
+    _max_transition_latency = ResPrototype("double job_queue_get_max_transition_latency(job_queue)")
 
     # The return type of the job_queue_iget_job_status should really
     # be the enum job_status_type_enum, but I just did not manage to
@@ -118,6 +125,19 @@ class JobQueue(BaseCClass):
         self.start( blocking=False )
 
 
+    def add_job(self, run_cmd, run_path, job_name, argv=(), num_cpu=1):
+        """
+        Adds a job which runs @run_cmd with the arguments @argv in
+        @run_path, without any callbacks. Returns the queue index of the
+        job.
+        """
+        c_argv = (ctypes.c_char_p * max(1, len(argv)))()
+        for index, arg in enumerate(argv):
+            c_argv[index] = arg.encode("utf-8")
+
+        return self._add_job(run_cmd, None, None, None, None, num_cpu, run_path, job_name, len(argv), c_argv)
+
+
     def kill_job(self, queue_index):
         """
         Will kill job nr @index.
@@ -237,6 +257,21 @@ class JobQueue(BaseCClass):
     def set_pause_off(self):
         self._set_pause_off( )
 
+    def getStatistics(self):
+        """
+        Statistics for the status sweeps of the queue; the latencies
+        are measured in seconds from the status change was notified by
+        the driver until it was handled by the queue.
+
+        @rtype: dict
+        """
+        return {"sweep_count": self._sweep_count(),
+                "sweep_time": self._sweep_time(),
+                "max_sweep_time": self._max_sweep_time(),
+                "transition_count": self._transition_count(),
+                "transition_latency": self._transition_latency(),
+                "max_transition_latency": self._max_transition_latency()}
+
     def free(self):
         self._free( )
 
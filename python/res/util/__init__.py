@@ -25,5 +25,6 @@ from .res_log import ResLog
 from .ui_return import UIReturn
 from .path_format import PathFormat
 from .matrix import Matrix
+from .numpy_view import numpy_view
 from .stat import quantile, quantile_sorted, polyfit
 from .cthread_pool import CThreadPool, startCThreadPool
@@ -29,6 +29,9 @@ class CThreadPool(BaseCClass):
     _free    = ResPrototype("void thread_pool_free(thread_pool)")
     _add_job = ResPrototype("void thread_pool_add_job(thread_pool, void*, void*)")
     _join    = ResPrototype("void thread_pool_join(thread_pool)")
+    _task_count      = ResPrototype("int    thread_pool_get_task_count(thread_pool)")
+    _queue_wait_time = ResPrototype("double thread_pool_get_queue_wait_time(thread_pool)")
+    _busy_time       = ResPrototype("double thread_pool_get_busy_time(thread_pool)")
 
     def __init__(self, pool_size, start=True):
         c_ptr = self._alloc(pool_size, start)
@@ -59,6 +62,18 @@ class CThreadPool(BaseCClass):
     def join(self):
         self._join()
 
+    def getStatistics(self):
+        """
+        Statistics accumulated over the lifetime of the pool; the times
+        are the total number of seconds the tasks have been waiting in
+        the queue and running.
+
+        @rtype: dict
+        """
+        return {"task_count": self._task_count(),
+                "queue_wait_time": self._queue_wait_time(),
+                "busy_time": self._busy_time()}
+
     def free(self):
         self.join()
         self._free()
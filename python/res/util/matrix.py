@@ -28,6 +28,10 @@
 # choice.
 
 
+import ctypes
+
+import numpy
+
 from cwrap import BaseCClass,CFILE
 from res import ResPrototype
 
@@ -53,6 +57,10 @@ class Matrix(BaseCClass):
     _fprint            = ResPrototype("void matrix_fprintf(matrix, char*, FILE)")
     _random_init       = ResPrototype("void matrix_random_init(matrix, rng)")
     _dump_csv          = ResPrototype("void matrix_dump_csv(matrix, char*)")
+    _get_data          = ResPrototype("void*  matrix_get_data(matrix)")
+    _row_stride        = ResPrototype("int matrix_get_row_stride(matrix)")
+    _column_stride     = ResPrototype("int matrix_get_column_stride(matrix)")
+    _alloc_strided_view = ResPrototype("matrix_obj matrix_alloc_strided_view(void*, int, int, int, int)" , bind = False)
 
     # Requires BLAS. If the library does not have the
     # matrix_alloc_matmul() function the prototype will have _func =
@@ -83,6 +91,83 @@ class Matrix(BaseCClass):
     def copy(self):
         return self._copy( )
 
+    @classmethod
+    def fromNumpy(cls, array):
+        """
+        Creates a Matrix from a two dimensional numpy array. When the
+        array is float64 and column major, e.g. Fortran ordered, the
+        Matrix will share the storage with the array; otherwise a column
+        major copy of the array is made first, as the BLAS and LAPACK
+        based functions only support column major matrices. The Matrix
+        keeps a reference to the array.
+
+        @type array: numpy.ndarray
+        @rtype: Matrix
+        """
+        array = numpy.asanyarray(array)
+        if array.ndim != 2:
+            raise ValueError("Expected a two dimensional array - got %d dimensions" % array.ndim)
+
+        rows, columns = array.shape
+        if rows < 1 or columns < 1:
+            raise ValueError("Can not create a Matrix with shape: %s" % str(array.shape))
+
+        if not cls._compatibleArray(array):
+            array = numpy.asfortranarray(array, dtype=numpy.float64)
+
+        row_stride = array.strides[0] // array.itemsize
+        column_stride = array.strides[1] // array.itemsize
+        matrix = cls._alloc_strided_view(array.ctypes.data, rows, columns, row_stride, column_stride)
+        matrix._numpy_data = array
+        return matrix
+
+    @staticmethod
+    def _compatibleArray(array):
+        if array.dtype != numpy.float64 or not array.flags.aligned or not array.flags.writeable:
+            return False
+
+        rows, columns = array.shape
+        row_stride, column_stride = array.strides
+        if row_stride <= 0 or column_stride <= 0:
+            return False
+
+        if row_stride % array.itemsize or column_stride % array.itemsize:
+            return False
+
+        # Column major; the elements of a column are contiguous.
+        row_stride //= array.itemsize
+        column_stride //= array.itemsize
+        return row_stride == 1 and column_stride >= rows
+
+    def numpyView(self):
+        """
+        Returns a numpy array which shares storage with the Matrix, i.e.
+        changes in the array are visible in the Matrix and vice versa.
+        The array keeps a reference to the Matrix; observe that the
+        array will be invalid if the Matrix is resized.
+
+        @rtype: numpy.ndarray
+        """
+        rows, columns = self.dims()
+        if rows == 0 or columns == 0:
+            return numpy.empty(shape=(rows, columns), dtype=numpy.float64)
+
+        row_stride = self._row_stride()
+        column_stride = self._column_stride()
+        size = (rows - 1) * row_stride + (columns - 1) * column_stride + 1
+
+        storage = (ctypes.c_double * size).from_address(self._get_data())
+        storage._matrix = self
+        itemsize = ctypes.sizeof(ctypes.c_double)
+        return numpy.ndarray(shape=(rows, columns), dtype=numpy.float64, buffer=storage,
+                             strides=(row_stride * itemsize, column_stride * itemsize))
+
+    def __array__(self, dtype=None):
+        view = self.numpyView()
+        if dtype is None:
+            return view
+        return view.astype(dtype)
+
     @classmethod
     def identity(cls, dim):
         """Returns a dim x dim identity matrix."""
@@ -108,10 +193,9 @@ class Matrix(BaseCClass):
 
     def __str__(self):
         s = ""
-        for i in range(self.rows()):
+        for row in self.numpyView():
             s += "["
-            for j in range(self.columns()):
-                d = self._iget(i, j)
+            for d in row:
                 s += "%6.3g " % d
             s += "]\n"
         return s
@@ -0,0 +1,44 @@
+#  Copyright (C) 2019  Equinor ASA, Norway.
+#
+#  The file 'numpy_view.py' is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+import ctypes
+
+import numpy
+
+_CTYPES = {numpy.dtype(numpy.float32): ctypes.c_float,
+           numpy.dtype(numpy.float64): ctypes.c_double,
+           numpy.dtype(numpy.int32): ctypes.c_int}
+
+
+def numpy_view(address, size, dtype, owner, writable=False):
+    """
+    Returns a one dimensional numpy array of @size elements of @dtype
+    which shares the storage at @address, which is owned by the C
+    object @owner. The array keeps a reference to @owner; observe that
+    the array is invalid if the C storage is reallocated, e.g. when new
+    data is loaded into the owner.
+
+    @rtype: numpy.ndarray
+    """
+    dtype = numpy.dtype(dtype)
+    if size == 0 or not address:
+        array = numpy.empty(shape=(0,), dtype=dtype)
+    else:
+        storage = (_CTYPES[dtype] * size).from_address(address)
+        storage._owner = owner
+        array = numpy.ndarray(shape=(size,), dtype=dtype, buffer=storage)
+
+    array.flags.writeable = writable
+    return array
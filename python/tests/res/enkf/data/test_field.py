@@ -0,0 +1,44 @@
+import numpy
+
+from tests import ResTest, equinor_test
+from res.test import ErtTestContext
+
+from res.enkf.data import EnkfNode
+from res.enkf import NodeId
+
+
+@equinor_test()
+class FieldTest(ResTest):
+    def setUp(self):
+        self.config_file = self.createTestPath("Equinor/config/obs_testing/config")
+
+    def test_numpy_view(self):
+        with ErtTestContext("field_numpy_view", self.config_file) as test_context:
+            ert = test_context.getErt()
+            fs = ert.getEnkfFsManager().getCurrentFileSystem()
+            data_node = EnkfNode(ert.ensembleConfig()["PERMX"])
+            self.assertTrue(data_node.tryLoad(fs, NodeId(0, 0)))
+
+            field = data_node.asField()
+            config = field.getConfig()
+            nx, ny = config.get_nx(), config.get_ny()
+            global_index = config.global_index()
+
+            view = field.numpyView()
+            self.assertEqual(view.shape, (len(field),))
+            self.assertFalse(view.flags.writeable)
+            with self.assertRaises(ValueError):
+                view[0] = 0
+
+            for index in range(0, len(field), 97):
+                g = global_index[index]
+                i, j, k = g % nx, (g // nx) % ny, g // (nx * ny)
+                self.assertEqual(float(view[index]), field.ijk_get_double(i, j, k))
+
+            self.assertTrue(numpy.array_equal(data_node.numpyView(), view))
+
+            writable = field.numpyView(writable=True)
+            g = global_index[0]
+            writable[0] = 1.5
+            self.assertEqual(field.ijk_get_double(g % nx, (g // nx) % ny, g // (nx * ny)), 1.5)
+            self.assertEqual(view[0], 1.5)
@@ -1,3 +1,5 @@
+import numpy
+
 from ecl.util.util import BoolVector
 from tests import ResTest, equinor_test
 from res.test import ErtTestContext
@@ -24,3 +26,41 @@ class GenDataTest(ResTest):
             data = gen_data.getData()
 
             self.assertEqual(len(data) , 2560)
+
+    def test_numpy_view(self):
+        with ErtTestContext("gen_data_numpy_view", self.config_file) as test_context:
+            ert = test_context.getErt()
+            fs = ert.getEnkfFsManager().getCurrentFileSystem()
+            data_node = EnkfNode(ert.ensembleConfig().getNode("TIMESHIFT"))
+            self.assertTrue(data_node.tryLoad(fs, NodeId(60, 0)))
+
+            gen_data = data_node.asGenData()
+            view = gen_data.numpyView()
+            self.assertEqual(view.shape, (len(gen_data),))
+            self.assertFalse(view.flags.writeable)
+            for index in range(len(gen_data)):
+                self.assertEqual(float(view[index]), gen_data[index])
+
+            self.assertTrue(numpy.array_equal(data_node.numpyView(), view))
+
+            writable = gen_data.numpyView(writable=True)
+            writable[0] = 1.5
+            self.assertEqual(gen_data[0], 1.5)
+            self.assertEqual(view[0], 1.5)
+
+    def test_load_ensemble_array(self):
+        with ErtTestContext("gen_data_ensemble_array", self.config_file) as test_context:
+            ert = test_context.getErt()
+            fs = ert.getEnkfFsManager().getCurrentFileSystem()
+            config_node = ert.ensembleConfig().getNode("TIMESHIFT")
+            iens_list = list(range(ert.getEnsembleSize()))
+
+            data = EnkfNode.loadEnsembleArray(config_node, fs, iens_list, report_step=60)
+            self.assertEqual(data.shape[0], len(iens_list))
+
+            data_node = EnkfNode(config_node)
+            for row, iens in enumerate(iens_list):
+                if data_node.tryLoad(fs, NodeId(60, iens)):
+                    self.assertTrue(numpy.array_equal(data[row], data_node.asGenData().numpyView()))
+                else:
+                    self.assertTrue(numpy.all(numpy.isnan(data[row])))
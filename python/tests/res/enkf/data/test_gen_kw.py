@@ -1,4 +1,7 @@
 import os.path
+
+import numpy
+
 from res.enkf.data import GenKw
 from res.enkf.config import GenKwConfig
 from ecl.util.test import TestAreaContext
@@ -93,6 +96,27 @@ class GenKwTest(ResTest):
             self.assertEqual(gen_kw["MULTFLT3"] , 2)
 
 
+    def test_gen_kw_numpy_view(self):
+        with TestAreaContext("enkf/data/gen_kwt"):
+
+            (gen_kw_config , gen_kw) = create_gen_kw()
+            gen_kw.setValues([0,1,2])
+
+            view = gen_kw.numpyView()
+            self.assertEqual(view.dtype, numpy.float64)
+            self.assertEqual(view.shape, (3,))
+            self.assertEqual(list(view), [0,1,2])
+            with self.assertRaises(ValueError):
+                view[0] = 10
+
+            gen_kw[1] = 5
+            self.assertEqual(view[1], 5)
+
+            view = gen_kw.numpyView(writable=True)
+            view[2] = 7
+            self.assertEqual(gen_kw[2], 7)
+
+
 
 
 
@@ -1,11 +1,15 @@
 import os.path
 import json
 
+import numpy
+
 from ecl.util.test.ecl_mock import createEclSum
-from res.enkf.data import Summary
+from res.enkf import ErtImplType, NodeId
+from res.enkf.data import Summary, EnkfNode
 from res.enkf.config import SummaryConfig
+from res.test import ErtTestContext
 from ecl.util.test import TestAreaContext
-from tests import ResTest
+from tests import ResTest, equinor_test
 
 
 
@@ -15,6 +19,54 @@ class SummaryTest(ResTest):
         config = SummaryConfig("WWCT:OP_5")
         summary = Summary(config)
         self.assertEqual(len(summary), 0)
+        self.assertEqual(summary.numpyView().shape, (0,))
 
         with self.assertRaises(IndexError):
             v = summary[100]
+
+
+@equinor_test()
+class SummaryDataTest(ResTest):
+    def setUp(self):
+        self.config_file = self.createTestPath("Equinor/config/with_data/config")
+
+    def test_numpy_view(self):
+        with ErtTestContext("summary_numpy_view", self.config_file) as test_context:
+            ert = test_context.getErt()
+            fs = ert.getEnkfFsManager().getCurrentFileSystem()
+            key = ert.ensembleConfig().getKeylistFromImplType(ErtImplType.SUMMARY)[0]
+            data_node = EnkfNode(ert.ensembleConfig().getNode(key))
+            self.assertTrue(data_node.tryLoad(fs, NodeId(0, 0)))
+
+            summary = data_node.as_summary()
+            view = summary.numpyView()
+            self.assertTrue(len(summary) > 0)
+            self.assertEqual(view.shape, (len(summary),))
+            self.assertFalse(view.flags.writeable)
+            for index in range(len(summary)):
+                self.assertEqual(view[index], summary[index])
+
+            self.assertTrue(numpy.array_equal(data_node.numpyView(), view))
+
+            writable = summary.numpyView(writable=True)
+            writable[0] = 1.5
+            self.assertEqual(summary[0], 1.5)
+            self.assertEqual(view[0], 1.5)
+
+    def test_load_ensemble_array(self):
+        with ErtTestContext("summary_ensemble_array", self.config_file) as test_context:
+            ert = test_context.getErt()
+            fs = ert.getEnkfFsManager().getCurrentFileSystem()
+            key = ert.ensembleConfig().getKeylistFromImplType(ErtImplType.SUMMARY)[0]
+            config_node = ert.ensembleConfig().getNode(key)
+            iens_list = list(range(ert.getEnsembleSize()))
+
+            data = EnkfNode.loadEnsembleArray(config_node, fs, iens_list)
+            self.assertEqual(data.shape[0], len(iens_list))
+
+            data_node = EnkfNode(config_node)
+            for row, iens in enumerate(iens_list):
+                if data_node.tryLoad(fs, NodeId(0, iens)):
+                    self.assertTrue(numpy.array_equal(data[row], data_node.numpyView()))
+                else:
+                    self.assertTrue(numpy.all(numpy.isnan(data[row])))
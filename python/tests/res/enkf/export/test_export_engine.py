@@ -0,0 +1,74 @@
+import os
+import pandas
+
+from tests import ResTest
+from res.test import ErtTestContext
+
+from res.enkf.export import (ExportEngine, SummaryCollector, GenKwCollector,
+                             MisfitCollector, GenDataCollector)
+
+
+class ExportEngineTest(ResTest):
+
+    def setUp(self):
+        os.environ["TZ"] = "CET" # The ert_statoil case was generated in CET
+        self.config = self.createTestPath("local/snake_oil/snake_oil.ert")
+
+    def test_create(self):
+        with ErtTestContext("python/enkf/export/export_engine_create", self.config) as context:
+            ert = context.getErt()
+
+            with self.assertRaises(ValueError):
+                ExportEngine(ert, num_workers=0)
+
+            engine = ExportEngine(ert, num_workers=3)
+            self.assertEqual(engine.getNumWorkers(), 3)
+            self.assertEqual(engine._partition(7), [(0, 2), (2, 4), (4, 7)])
+            self.assertEqual(engine._partition(2), [(0, 1), (1, 2)])
+            self.assertEqual(engine._partition(0), [])
+
+    def test_same_result_as_collectors(self):
+        with ErtTestContext("python/enkf/export/export_engine", self.config) as context:
+            ert = context.getErt()
+
+            summary_data = SummaryCollector.loadAllSummaryData(ert, "default_0")
+            gen_kw_data = GenKwCollector.loadAllGenKwData(ert, "default_0")
+            misfit_data = MisfitCollector.loadAllMisfitData(ert, "default_0")
+
+            for num_workers in [1, 4]:
+                engine = ExportEngine(ert, num_workers=num_workers)
+
+                pandas.testing.assert_frame_equal(engine.loadSummaryData("default_0"), summary_data)
+                pandas.testing.assert_frame_equal(engine.loadGenKwData("default_0"), gen_kw_data)
+                pandas.testing.assert_frame_equal(engine.loadMisfitData("default_0"), misfit_data)
+
+            engine = ExportEngine(ert, num_workers=2)
+            data = engine.loadSummaryData("default_0", ["WWCT:OP1", "NO_SUCH_KEY", "FOPR"])
+            self.assertEqual(list(data.columns), ["WWCT:OP1", "FOPR"])
+            self.assertFloatEqual(data["FOPR"][0]["2010-01-10"], 0.118963)
+
+    def test_load_case_data(self):
+        with ErtTestContext("python/enkf/export/export_engine_case", self.config) as context:
+            ert = context.getErt()
+            engine = ExportEngine(ert, num_workers=4)
+
+            keys = ["SNAKE_OIL_PARAM:OP1_OCTAVES", "MISFIT:TOTAL", "FOPR"]
+            result = engine.loadCaseData("default_1", keys)
+
+            self.assertEqual(sorted(result.columns), sorted(keys))
+            self.assertFloatEqual(result["SNAKE_OIL_PARAM:OP1_OCTAVES"][0]["2010-01-10"], 3.947766)
+            self.assertFloatEqual(result["MISFIT:TOTAL"][24]["2015-06-23"], 1714.662370)
+
+            output_file = "export_engine.csv"
+            engine.exportCaseData("default_1", output_file, keys)
+            self.assertTrue(os.path.isfile(output_file))
+
+    def test_load_gen_data(self):
+        with ErtTestContext("python/enkf/export/export_engine_gen_data", self.config) as context:
+            ert = context.getErt()
+            engine = ExportEngine(ert, num_workers=2)
+
+            data = engine.loadGenData("default_0", ["SNAKE_OIL_OPR_DIFF@199", "SNAKE_OIL_WPR_DIFF@199"])
+            expected = GenDataCollector.loadGenData(ert, "default_0", "SNAKE_OIL_WPR_DIFF", 199)
+
+            pandas.testing.assert_frame_equal(data.loc["SNAKE_OIL_WPR_DIFF"], expected, check_names=False)
@@ -1,3 +1,5 @@
+import pandas
+
 from tests import ResTest
 from res.test import ErtTestContext
 
@@ -23,3 +25,23 @@ class MisfitCollectorTest(ResTest):
 
             with self.assertRaises(KeyError):
                 realization_60 = data.loc[60]
+
+
+    def test_misfit_collector_misfit_ensemble(self):
+        with ErtTestContext("python/enkf/export/misfit_collector_ensemble", self.config) as context:
+            ert = context.getErt()
+            fs = ert.getEnkfFsManager().getFileSystem("default_0")
+            misfit_ensemble = fs.getMisfitEnsemble()
+            self.assertFalse(misfit_ensemble.isValid(ert.getObservations(), ert.getEnsembleSize(), ert.getHistoryLength()))
+            data = MisfitCollector.loadAllMisfitData(ert, "default_0")
+
+            init_misfit_job = self.createSharePath("ert/workflows/jobs/internal/config/INIT_MISFIT_TABLE")
+            context.installWorkflowJob("INIT_MISFIT_TABLE_JOB", init_misfit_job)
+            self.assertTrue(context.runWorkflowJob("INIT_MISFIT_TABLE_JOB"))
+            self.assertTrue(misfit_ensemble.isValid(ert.getObservations(), ert.getEnsembleSize(), ert.getHistoryLength()))
+
+            obs_vector = ert.getObservations()["FOPR"]
+            self.assertEqual(misfit_ensemble.getTotalChi2("FOPR", 0), obs_vector.getTotalChi2(fs, 0))
+
+            ensemble_data = MisfitCollector.loadAllMisfitData(ert, "default_0")
+            pandas.testing.assert_frame_equal(data, ensemble_data)
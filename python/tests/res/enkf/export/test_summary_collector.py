@@ -1,4 +1,5 @@
 import os
+import numpy
 from tests import ResTest
 from res.test import ErtTestContext
 
@@ -34,3 +35,30 @@ class SummaryCollectorTest(ResTest):
 
             with self.assertRaises(KeyError):
                 data["FOPR"]
+
+    def test_load_summary_array(self):
+        with ErtTestContext("python/enkf/export/summary_collector_array", self.config) as context:
+            ert = context.getErt()
+            fs = ert.getEnkfFsManager().getFileSystem("default_0")
+            realizations = SummaryCollector.createActiveList(ert, fs)
+            num_steps = len(fs.getTimeMap()) - 1
+            keys = ["FOPR", "WWCT:OP2"]
+
+            data, active = SummaryCollector.loadSummaryArray(ert, fs, keys, realizations, num_steps)
+            self.assertEqual(data.shape, (2, len(realizations), num_steps))
+            self.assertEqual(active.shape, data.shape)
+            self.assertTrue(numpy.all(numpy.isnan(data[~active])))
+
+            frame = SummaryCollector.loadAllSummaryData(ert, "default_0", keys)
+            for key_index, key in enumerate(keys):
+                values = frame[key].values.reshape(len(realizations), num_steps)
+                numpy.testing.assert_array_equal(values, data[key_index])
+
+            buffer = numpy.zeros(shape=(2, len(realizations), num_steps), dtype=numpy.float64)
+            mask = numpy.zeros(shape=buffer.shape, dtype=numpy.bool_)
+            result, _ = SummaryCollector.loadSummaryArray(ert, fs, keys, realizations, num_steps, buffer, mask)
+            self.assertIs(result, buffer)
+            numpy.testing.assert_array_equal(buffer, data)
+
+            with self.assertRaises(ValueError):
+                SummaryCollector.loadSummaryArray(ert, fs, keys, realizations, num_steps + 1, buffer, mask)
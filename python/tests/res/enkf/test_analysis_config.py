@@ -64,6 +64,22 @@ class AnalysisConfigTest(ResTest):
             ac.setGlobalStdScaling(0.77)
             self.assertFloatEqual(ac.getGlobalStdScaling(), 0.77)
 
+    def test_max_update_memory(self):
+        with TestAreaContext("analysis_config_init_test") as work_area:
+            work_area.copy_directory(self.case_directory)
+            ac = AnalysisConfig(self.case_file)
+            self.assertEqual(ac.get_max_update_memory(), 0)
+            ac.set_max_update_memory(512)
+            self.assertEqual(ac.get_max_update_memory(), 512)
+
+    def test_update_threads(self):
+        with TestAreaContext("analysis_config_init_test") as work_area:
+            work_area.copy_directory(self.case_directory)
+            ac = AnalysisConfig(self.case_file)
+            self.assertEqual(ac.get_update_threads(), 0)
+            ac.set_update_threads(16)
+            self.assertEqual(ac.get_update_threads(), 16)
+
     def test_init(self):
         with TestAreaContext("analysis_config_init_test") as work_area:
             work_area.copy_directory(self.case_directory)
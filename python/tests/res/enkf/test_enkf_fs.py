@@ -5,6 +5,7 @@ from res.test import ErtTestContext
 
 from res.enkf import EnkfFs
 from res.enkf import EnKFMain
+from res.enkf import EnkfNode, NodeId
 from res.enkf.enums import EnKFFSType
 
 
@@ -26,6 +27,7 @@ class EnKFFSTest(ResTest):
             self.assertTrue(EnkfFs.exists(self.mount_point))
             fs = EnkfFs(self.mount_point)
             self.assertEqual(1, fs.refCount())
+            self.assertTrue(fs.getMountTime() >= 0)
             fs.umount()
 
             self.assertFalse(EnkfFs.exists("newFS"))
@@ -49,9 +51,52 @@ class EnKFFSTest(ResTest):
             self.assertTrue( isinstance( new_fs , EnkfFs ))
 
 
-
     def test_throws(self):
         with self.assertRaises(Exception):
             fs = EnkfFs("/does/not/exist")
 
 
+
+class EnKFFSMmapTest(ResTest):
+
+    def _load_values(self, config_node, fs, iens):
+        node = EnkfNode(config_node)
+        node.load(fs, NodeId(0, iens))
+        gen_kw = node.asGenKw()
+        return [gen_kw[index] for index in range(len(gen_kw))]
+
+
+    def _store_values(self, config_node, fs, iens, scale):
+        node = EnkfNode(config_node)
+        node.load(fs, NodeId(0, iens))
+        gen_kw = node.asGenKw()
+        for index in range(len(gen_kw)):
+            gen_kw[index] = scale * (index + 1)
+        node.save(fs, NodeId(0, iens))
+        return [gen_kw[index] for index in range(len(gen_kw))]
+
+
+    def test_mmap_read(self):
+        config = self.createTestPath("local/snake_oil/snake_oil.ert")
+        with ErtTestContext("mmap_read", config) as context:
+            ert = context.getErt()
+            fs = ert.getEnkfFsManager().getFileSystem("default_0")
+            config_node = ert.ensembleConfig()["SNAKE_OIL_PARAM"]
+            self.assertFalse(fs.getMmapRead())
+
+            stored = self._store_values(config_node, fs, 0, 0.25)
+            unchanged = self._load_values(config_node, fs, 1)
+
+            fs.setMmapRead(True)
+            self.assertTrue(fs.getMmapRead())
+            self.assertEqual(stored, self._load_values(config_node, fs, 0))
+            self.assertEqual(unchanged, self._load_values(config_node, fs, 1))
+
+            # A node stored while the storage is mapped must be visible
+            # to the following mapped reads.
+            stored = self._store_values(config_node, fs, 1, 0.5)
+            self.assertEqual(stored, self._load_values(config_node, fs, 1))
+
+            fs.setMmapRead(False)
+            self.assertFalse(fs.getMmapRead())
+            self.assertEqual(stored, self._load_values(config_node, fs, 1))
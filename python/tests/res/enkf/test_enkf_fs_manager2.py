@@ -1,5 +1,6 @@
 import sys
 import os
+import threading
 from tests import ResTest
 from res.test import ErtTestContext
 
@@ -46,3 +47,68 @@ class EnKFFSManagerTest2(ResTest):
                 fs = fsm.getFileSystem(fs_name)
                 self.assertEqual(EnkfFsManager.DEFAULT_CAPACITY, fsm.getFileSystemCount())
 
+
+
+    def test_lru(self):
+        with ErtTestContext("enkf_fs_manager_lru_test", self.config_file) as testContext:
+            ert = testContext.getErt()
+            fsm = ert.getEnkfFsManager()
+            fsm.setCapacity(2)
+            self.assertEqual(2, fsm.getCapacity())
+
+            fsm.getFileSystem("fs_a")
+            fsm.getFileSystem("fs_b")
+            fsm.getFileSystem("fs_a")
+            fsm.getFileSystem("fs_c")
+
+            # fs_b was least recently used and should have been evicted.
+            self.assertTrue(fsm.isCaseMounted("fs_a"))
+            self.assertFalse(fsm.isCaseMounted("fs_b"))
+            self.assertTrue(fsm.isCaseMounted("fs_c"))
+            self.assertEqual({"hits": 1, "misses": 3, "evictions": 1}, fsm.getCacheStatistics())
+
+            # Remounting a case which is being unmounted in the background.
+            fsm.getFileSystem("fs_b")
+            self.assertTrue(fsm.isCaseMounted("fs_b"))
+            self.assertFalse(fsm.isCaseMounted("fs_a"))
+
+            fsm.pinFileSystem("fs_b")
+            for index in range(4):
+                fsm.getFileSystem("fs_fill_%d" % index)
+            self.assertTrue(fsm.isCaseMounted("fs_b"))
+            self.assertEqual(2, fsm.getFileSystemCount())
+
+            fsm.unpinFileSystem("fs_b")
+            fsm.getFileSystem("fs_d")
+            self.assertFalse(fsm.isCaseMounted("fs_b"))
+
+            with self.assertRaises(ValueError):
+                fsm.setCapacity(0)
+
+
+    def test_concurrent_access(self):
+        with ErtTestContext("enkf_fs_manager_concurrent_test", self.config_file) as testContext:
+            ert = testContext.getErt()
+            fsm = ert.getEnkfFsManager()
+            fsm.setCapacity(2)
+            errors = []
+
+            def mount(thread_index):
+                try:
+                    for i in range(20):
+                        fs = fsm.getFileSystem("fs_concurrent_%d" % ((thread_index + i) % 4))
+                        self.assertIsNotNone(fs)
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=mount, args=(index,)) for index in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual([], errors)
+            self.assertEqual(2, fsm.getFileSystemCount())
+            stats = fsm.getCacheStatistics()
+            self.assertEqual(80, stats["hits"] + stats["misses"])
+            self.assertEqual(stats["misses"] - 2, stats["evictions"])
@@ -1,6 +1,9 @@
+from ctypes import ArgumentError
+
 from tests import ResTest, equinor_test
 from res.test import ErtTestContext
 
+from res.enkf import LoadScheduler
 from res.enkf.enums.realization_state_enum import RealizationStateEnum
 from ecl.util.util import BoolVector
 
@@ -68,3 +71,56 @@ class LoadResultsManuallyTest(ResTest):
             self.assertEqual(25, len(expected))
             self.assertEqual(25, len(realisations))
 
+    def test_load_results_with_progress(self):
+        with ErtTestContext("manual_load_test", self.config_file) as test_context:
+            ert = test_context.getErt()
+            load_into = ert.getEnkfFsManager().getFileSystem("A1")
+            load_from = ert.getEnkfFsManager().getFileSystem("default")
+
+            ert.getEnkfFsManager().switchFileSystem(load_from)
+            realisations = BoolVector(default_value=True, initial_size=25)
+            realisations[7] = False
+
+            run_context = ert.getRunContextENSEMPLE_EXPERIMENT(load_into,
+                                                               realisations)
+            scheduler = LoadScheduler(25, 2, 4)
+            progress = []
+            loaded = ert.loadFromRunContext(run_context, load_into,
+                                            callback=lambda s: progress.append(s.getNumComplete()),
+                                            scheduler=scheduler)
+
+            self.assertEqual(24, loaded)
+            self.assertEqual(24, scheduler.getNumJobs())
+            self.assertEqual(24, progress[-1])
+            self.assertEqual(sorted(progress), progress)
+            self.assertFalse(scheduler.isComplete(7))
+            self.assertTrue(scheduler.isComplete(0))
+            io_time, cpu_time = scheduler.getLoadTimes(0)
+            self.assertTrue(io_time > 0)
+            self.assertTrue(cpu_time > 0)
+
+            loaded = ert.loadFromRunContext(run_context, load_into, scheduler=scheduler)
+            self.assertEqual(24, loaded)
+            self.assertEqual(24, scheduler.getNumJobs())
+            self.assertEqual(24, scheduler.getNumComplete())
+
+    def test_created_load_scheduler(self):
+        with ErtTestContext("manual_load_test", self.config_file) as test_context:
+            ert = test_context.getErt()
+            scheduler = ert.createLoadScheduler()
+
+            self.assertEqual(25, len(scheduler))
+            self.assertFalse(scheduler.isComplete(0))
+            with self.assertRaises(IndexError):
+                scheduler.isComplete(25)
+
+    def test_load_error_raised_in_calling_thread(self):
+        with ErtTestContext("manual_load_test", self.config_file) as test_context:
+            ert = test_context.getErt()
+            load_into = ert.getEnkfFsManager().getFileSystem("A1")
+            progress = []
+
+            with self.assertRaises(ArgumentError):
+                ert.loadFromRunContext("not a run context", load_into,
+                                       callback=lambda s: progress.append(s.getNumComplete()))
+            self.assertTrue(len(progress) > 0)
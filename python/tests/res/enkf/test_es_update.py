@@ -53,6 +53,38 @@ class ESUpdateTest(ResTest):
                 self.assertNotEqual(sim_gen_kw[index], target_gen_kw[index])
 
 
+    def _update_params(self, case_name, max_update_memory):
+        config = self.createTestPath("local/snake_oil/snake_oil.ert")
+        with ErtTestContext(case_name, config) as context:
+            ert = context.getErt()
+            ert.analysisConfig().set_max_update_memory(max_update_memory)
+            es_update = ESUpdate( ert )
+            fsm = ert.getEnkfFsManager()
+
+            sim_fs = fsm.getFileSystem("default_0")
+            target_fs = fsm.getFileSystem("target")
+            run_context = ErtRunContext.ensemble_smoother_update( sim_fs, target_fs )
+            es_update.smootherUpdate( run_context )
+
+            conf = ert.ensembleConfig()["SNAKE_OIL_PARAM"]
+            target_node = EnkfNode( conf )
+            params = []
+            for iens in range(ert.getEnsembleSize()):
+                target_node.load(target_fs, NodeId(0, iens))
+                gen_kw = target_node.asGenKw()
+                params.append([gen_kw[index] for index in range(len(gen_kw))])
+            return params
+
+
+    def test_update_max_memory(self):
+        # The update with MAX_UPDATE_MEMORY goes through the blocked
+        # serialize -> A*X -> deserialize loop; the stored parameters
+        # should be bit identical to those of the full update.
+        full_params = self._update_params("update_full_test", 0)
+        blocked_params = self._update_params("update_blocked_test", 1)
+        self.assertEqual(full_params, blocked_params)
+
+
     def test_localization(self):
         config = self.createTestPath("local/snake_oil/snake_oil.ert")
         with ErtTestContext("localization_test", config) as context:
@@ -122,3 +122,19 @@ class ModelConfigTest(ResTest):
             self.assertFalse( ecl_config.active( ) )
             self.assertEqual( "JOBNAME%d" , model_config.getJobnameFormat( ))
 
+
+
+    def test_load_threads(self):
+        case_directory = self.createTestPath("local/simple_config")
+        with TestAreaContext("test_load_threads") as work_area:
+            work_area.copy_directory(case_directory)
+
+            res_config = ResConfig(config=self.config_both)
+            model_config = res_config.model_config
+            self.assertEqual(0, model_config.get_load_io_threads())
+            self.assertEqual(0, model_config.get_load_cpu_threads())
+
+            model_config.set_load_io_threads(4)
+            model_config.set_load_cpu_threads(8)
+            self.assertEqual(4, model_config.get_load_io_threads())
+            self.assertEqual(8, model_config.get_load_cpu_threads())
@@ -35,6 +35,16 @@ class ObsDataTest(ResTest):
         R = obs_data.createR()
         self.assertEqual( (2,2) , R.dims() )
 
+        self.assertTrue( obs_data.hasDiagonalR() )
+        diagR = obs_data.createDiagonalR()
+        self.assertEqual( (2,1) , diagR.dims() )
+        self.assertEqual( diagR[0,0] , R[0,0] )
+        self.assertEqual( diagR[1,0] , R[1,1] )
+
+        obs_data.scaleRMatrix( diagR )
+        self.assertFloatEqual( diagR[0,0] , 1 )
+        self.assertFloatEqual( diagR[1,0] , 1 )
+
         with self.assertRaises(IndexError):
             obs_data[10]
 
@@ -26,3 +26,17 @@ class SummaryKeyMatcherTest(ResTest):
         self.assertTrue(matcher.isRequired("FOPT"))
         self.assertFalse(matcher.isRequired("FGIR"))
         self.assertFalse(matcher.isRequired("TCPU"))
+
+    def test_patterns(self):
+        matcher = SummaryKeyMatcher()
+        for key in ["WOPR:*", "W?PR:OP_1", "*:OP_5", "BPR:[1-3],1,1", "FOPT"]:
+            matcher.addSummaryKey(key)
+
+        self.assertTrue("WOPR:OP_2" in matcher)
+        self.assertTrue("WWPR:OP_1" in matcher)
+        self.assertFalse("WWPR:OP_2" in matcher)
+        self.assertTrue("GGPR:OP_5" in matcher)
+        self.assertTrue("BPR:2,1,1" in matcher)
+        self.assertFalse("BPR:4,1,1" in matcher)
+        self.assertFalse("FOPTH" in matcher)
+        self.assertFalse("WOPR" in matcher)
@@ -1,4 +1,8 @@
-from res.job_queue import JobStatusType
+import os
+import time
+
+from ecl.util.test import TestAreaContext
+from res.job_queue import JobStatusType, JobQueue, LocalDriver
 from tests import ResTest
 
 
@@ -8,4 +12,44 @@ class JobQueueTest(ResTest):
         source_path = "lib/include/ert/job_queue/job_status.hpp"
         self.assertEnumIsFullyDefined(JobStatusType, "job_status_type", source_path)
 
+    def testStatistics(self):
+        driver = LocalDriver(max_running=1)
+        queue = JobQueue(driver)
+
+        stats = queue.getStatistics()
+        self.assertEqual(stats["transition_count"], 0)
+        self.assertEqual(stats["transition_latency"], 0)
+        self.assertTrue(stats["sweep_count"] >= 0)
+        self.assertTrue(stats["max_sweep_time"] >= 0)
+
+        queue.submit_complete()
+
+    def testLocalDriverNotifications(self):
+        with TestAreaContext("job_queue_local_driver"):
+            driver = LocalDriver(max_running=2)
+            queue = JobQueue(driver, size=3)
+            # A second queue registered with the same driver must not take
+            # the notifications away from the first one.
+            other_queue = JobQueue(driver)
+
+            for index in range(3):
+                queue.add_job("/bin/sleep", os.getcwd(), "JOB_%d" % index, ["0.2"])
+
+            end_time = time.time() + 30
+            while time.time() < end_time:
+                if all(queue.getJobStatus(index) == JobStatusType.JOB_QUEUE_SUCCESS for index in range(3)):
+                    break
+                time.sleep(0.05)
+
+            for index in range(3):
+                self.assertEqual(queue.getJobStatus(index), JobStatusType.JOB_QUEUE_SUCCESS)
+
+            # Every job goes to running and done; with notifications each
+            # transition is handled well before the one second fallback
+            # timeout of the queue loop.
+            stats = queue.getStatistics()
+            self.assertTrue(stats["transition_count"] >= 6)
+            self.assertTrue(stats["sweep_count"] > 0)
+            self.assertTrue(stats["max_transition_latency"] < 0.5)
 
+            other_queue.submit_complete()
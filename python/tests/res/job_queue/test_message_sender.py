@@ -0,0 +1,115 @@
+import gzip
+import io
+import json
+import os
+import threading
+import time
+
+try:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+except ImportError:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+
+from ecl.util.test import TestAreaContext
+from res.job_queue import MessageSender
+from tests import ResTest
+
+
+class LogEndpoint(object):
+    """
+    Local stand-in for the log endpoint; records the messages of every
+    post, and answers with @status_code.
+    """
+
+    def __init__(self):
+        self.posts = []
+        self.status_code = 200
+        self.delay = 0
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                body = self.rfile.read(length)
+                time.sleep(endpoint.delay)
+                if endpoint.status_code == 200:
+                    with gzip.GzipFile(fileobj=io.BytesIO(body)) as gzip_file:
+                        endpoint.posts.append(json.loads(gzip_file.read().decode("utf-8")))
+                self.send_response(endpoint.status_code)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self._server = HTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:%d" % self._server.server_address[1]
+
+    def messages(self):
+        return [message for post in self.posts for message in post]
+
+    def shutdown(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class MessageSenderTest(ResTest):
+
+    def setUp(self):
+        self.endpoint = LogEndpoint()
+
+    def tearDown(self):
+        self.endpoint.shutdown()
+
+    def test_batched_post(self):
+        with TestAreaContext("message_sender_batch"):
+            sender = MessageSender(self.endpoint.url, batch_size=10, batch_interval=0.5)
+            for index in range(25):
+                sender.post({"index": index})
+
+            self.assertTrue(sender.flush(10))
+            self.assertEqual([message["index"] for message in self.endpoint.messages()], list(range(25)))
+            self.assertTrue(len(self.endpoint.posts) < 25)
+            self.assertEqual(sender.getStatistics()["posted"], 25)
+
+            with self.assertRaises(TypeError):
+                sender.post({"value": object()})
+
+            with self.assertRaises(ValueError):
+                MessageSender(self.endpoint.url, batch_size=0)
+
+    def test_spool_when_unreachable(self):
+        with TestAreaContext("message_sender_spool"):
+            sender = MessageSender(self.endpoint.url, batch_interval=0.1, max_retries=1,
+                                   backoff=0.01, spool_file="LOG_SPOOL")
+            self.endpoint.status_code = 503
+            sender.post({"index": 0})
+            sender.post({"index": 1})
+            self.assertTrue(sender.flush(10))
+            self.assertTrue(os.path.isfile("LOG_SPOOL"))
+            self.assertEqual(sender.getStatistics()["spooled"], 2)
+
+            self.endpoint.status_code = 200
+            sender.post({"index": 2})
+            self.assertTrue(sender.flush(10))
+            self.assertEqual([message["index"] for message in self.endpoint.messages()], [0, 1, 2])
+            self.assertFalse(os.path.isfile("LOG_SPOOL"))
+
+    def test_spool_on_flush_timeout(self):
+        with TestAreaContext("message_sender_flush_timeout"):
+            sender = MessageSender(self.endpoint.url, batch_size=2, batch_interval=0.1, timeout=3,
+                                   max_retries=0, spool_file="LOG_SPOOL")
+            self.endpoint.delay = 1.0
+            for index in range(5):
+                sender.post({"index": index})
+
+            self.assertFalse(sender.flush(0.2))
+            with open("LOG_SPOOL") as spool:
+                spooled = [json.loads(line)["index"] for line in spool]
+            self.assertEqual(spooled, list(range(5)))
+            self.assertEqual(sender.getStatistics()["queued"], 0)
@@ -45,3 +45,18 @@ class CThreadPoolTest(ResTest):
 
         pool.join()
         self.assertEqual(arg.value, task_count)
+
+    def test_statistics(self):
+        pool = CThreadPool(4, start=True)
+        job = CThreadPool.lookupCFunction(TEST_LIB, "thread_pool_test_func1")
+        arg = ctypes.c_int(0)
+
+        N = 64
+        for i in range(N):
+            pool.addTask(job, ctypes.byref(arg))
+        pool.join()
+
+        stats = pool.getStatistics()
+        self.assertEqual(stats["task_count"], N)
+        self.assertTrue(stats["queue_wait_time"] >= 0)
+        self.assertTrue(stats["busy_time"] >= 0)
@@ -1,3 +1,5 @@
+import numpy
+
 from ecl.util.util import RandomNumberGenerator
 from ecl.util.enums import RngAlgTypeEnum, RngInitModeEnum
 from ecl.util.test import TestAreaContext
@@ -248,3 +250,58 @@ class MatrixTest(ResTest):
                     self.assertEqual(elt, 1)
                 else:
                     self.assertEqual(elt, 0)
+
+    def test_numpy_view(self):
+        m = Matrix(3, 2)
+        m[2, 1] = 7
+        view = m.numpyView()
+        self.assertEqual(view.shape, (3, 2))
+        self.assertEqual(view[2, 1], 7)
+
+        view[0, 1] = 3
+        self.assertEqual(m[0, 1], 3)
+
+        sub = m.subCopy(1, 0, 2, 2)
+        self.assertTrue(numpy.array_equal(numpy.asarray(sub), view[1:, :]))
+
+    def test_from_numpy(self):
+        array = numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], order="F")
+        m = Matrix.fromNumpy(array)
+        self.assertEqual(m.dims(), (2, 3))
+        self.assertEqual(m[1, 2], 6)
+
+        # The storage is shared with the array.
+        m[0, 0] = 10
+        self.assertEqual(array[0, 0], 10)
+        self.assertTrue(numpy.array_equal(m.numpyView(), array))
+
+        # A C ordered array is copied to column major storage.
+        array = numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], order="C")
+        m = Matrix.fromNumpy(array)
+        self.assertEqual(m.dims(), (2, 3))
+        self.assertEqual(m[1, 2], 6)
+        m[0, 0] = 10
+        self.assertEqual(array[0, 0], 1)
+
+        int_array = numpy.array([[1, 2], [3, 4]])
+        m = Matrix.fromNumpy(int_array)
+        self.assertEqual(m[1, 0], 3)
+        m[1, 0] = 0
+        self.assertEqual(int_array[1, 0], 3)
+
+        m = Matrix.fromNumpy(numpy.arange(12.0).reshape(3, 4)[::2, ::3])
+        self.assertEqual(m.dims(), (2, 2))
+        self.assertEqual(m[1, 1], 11)
+
+        with self.assertRaises(ValueError):
+            Matrix.fromNumpy(numpy.zeros(5))
+
+    def test_from_numpy_matmul(self):
+        a = numpy.array([[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]], order="C")
+        b = numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], order="C")
+
+        m = Matrix.matmul(Matrix.fromNumpy(a), Matrix.fromNumpy(b))
+        self.assertTrue(numpy.array_equal(m.numpyView(), numpy.dot(a, b)))
+
+        m = Matrix.matmul(Matrix.fromNumpy(a.T), Matrix.fromNumpy(b.T))
+        self.assertTrue(numpy.array_equal(m.numpyView(), numpy.dot(a.T, b.T)))
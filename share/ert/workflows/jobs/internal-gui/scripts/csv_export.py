@@ -11,7 +11,7 @@ except ImportError:
 
 
 from res.enkf import ErtPlugin, CancelPluginException
-from res.enkf.export import SummaryCollector, GenKwCollector, MisfitCollector, DesignMatrixReader, CustomKWCollector
+from res.enkf.export import DesignMatrixReader, ExportEngine
 from ert_gui.ertwidgets.customdialog import CustomDialog
 from ert_gui.ertwidgets.listeditbox import ListEditBox
 from ert_gui.ertwidgets.models.path_model import PathModel
@@ -93,6 +93,7 @@ class CSVExportJob(ErtPlugin):
                 raise UserWarning("The design matrix is not a file!")
 
         data = pandas.DataFrame()
+        engine = ExportEngine(self.ert())
 
         for index, case in enumerate(cases):
             case = case.strip()
@@ -108,9 +109,9 @@ class CSVExportJob(ErtPlugin):
             else:
                 iteration_number = index
 
-            case_data = GenKwCollector.loadAllGenKwData(self.ert(), case)
+            case_data = engine.loadGenKwData(case)
 
-            custom_kw_data = CustomKWCollector.loadAllCustomKWData(self.ert(), case)
+            custom_kw_data = engine.loadCustomKWData(case)
             if not custom_kw_data.empty:
                 case_data = case_data.join(custom_kw_data, how='outer')
 
@@ -119,11 +120,11 @@ class CSVExportJob(ErtPlugin):
                 if not design_matrix_data.empty:
                     case_data = case_data.join(design_matrix_data, how='outer')
 
-            misfit_data = MisfitCollector.loadAllMisfitData(self.ert(), case)
+            misfit_data = engine.loadMisfitData(case)
             if not misfit_data.empty:
                 case_data = case_data.join(misfit_data, how='outer')
 
-            summary_data = SummaryCollector.loadAllSummaryData(self.ert(), case)
+            summary_data = engine.loadSummaryData(case)
             if not summary_data.empty:
                 case_data = case_data.join(summary_data, how='outer')
             else: